@@ -5,6 +5,9 @@ from typing import Union, Dict, List, Optional
 
 from p_models.battle_pokemon import BattlePokemon
 from .get_state_vector import get_state  # 이것도 나중에 구현 필요
+from utils.battle_logger import get_logger
+
+logger = get_logger(__name__)
 
 rl_model: Optional[tf.keras.Model] = None
 
@@ -15,9 +18,9 @@ def load_rl_model():
         rl_model = tf.keras.models.load_model("model/converted/final_keras/model.h5")
         # TODO: 에러 트래킹 필요 
         # TODO: 모델 루트 수정 필요
-        print("✅ RL 모델 로딩 완료")
+        logger.debug("✅ RL 모델 로딩 완료")
     except:
-        print("모델 로드 실패")
+        logger.debug("모델 로드 실패")
         raise Exception("RL 모델이 로딩되지 않았습니다.")
 
 def get_action_from_state(state: List[float]) -> int:
@@ -53,7 +56,7 @@ def get_switch_target_index(current_index: int, switch_action_index: int) -> int
     candidates = [i for i in all_indexes if i != current_index]
     
     if switch_action_index < 0 or switch_action_index >= len(candidates):
-        print("get_switch_target_index: 유효하지 않은 교체 행동 인덱스")
+        logger.debug("get_switch_target_index: 유효하지 않은 교체 행동 인덱스")
         return 0
     return candidates[switch_action_index]
 
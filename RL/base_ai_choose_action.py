@@ -6,7 +6,11 @@ from utils.type_relation import calculate_type_effectiveness
 from utils.battle_logics.apply_before_damage import apply_offensive_ability_effect_before_damage
 from utils.battle_logics.get_best_switch_index import get_best_switch_index
 from utils.battle_logics.rank_effect import calculate_rank_effect
+from context.battle_store import BattleStore, store
 import random
+from utils.battle_logger import get_logger
+
+logger = get_logger(__name__)
 
 def type_effectiveness(attacker_types: List[str], defender_types: List[str]) -> float:
         return max(calculate_type_effectiveness(atk, defender_types) for atk in attacker_types)
@@ -20,7 +24,8 @@ def base_ai_choose_action(
     public_env: Dict,
     enemy_env: Dict,
     my_env: Dict,
-    add_log: callable
+    add_log: callable,
+    battle_store: Optional[BattleStore] = store
 ) -> Union[MoveInfo, Dict[str, Union[str, int]], None]:
     """AI가 행동을 선택하는 기본 로직
     
@@ -34,6 +39,7 @@ def base_ai_choose_action(
         enemy_env: 상대방 환경 정보
         my_env: 내 환경 정보
         add_log: 로그 추가 함수
+        battle_store: 교체 대상/특성 계산에 사용할 배틀 스토어
     
     Returns:
         선택된 행동 (기술 사용 또는 교체)
@@ -43,7 +49,7 @@ def base_ai_choose_action(
     opponent_team = enemy_team if side == 'my' else my_team
     my_pokemon = mine_team[active_my if side == 'my' else active_enemy]
     enemy_pokemon = opponent_team[active_enemy if side == 'my' else active_my]
-    print(f"{side}의 포켓몬: {my_pokemon.base.name}")
+    logger.debug("%s의 포켓몬: %s", side, my_pokemon.base.name)
     
     # 속도 계산
     user_speed = (enemy_pokemon.base.speed * 
@@ -132,7 +138,7 @@ def base_ai_choose_action(
 
         for move in usable_moves:
             stab = 1.5 if move.type in my_pokemon.base.types else 1.0
-            rate = apply_offensive_ability_effect_before_damage(move, side)
+            rate = apply_offensive_ability_effect_before_damage(move, side, battle_store=battle_store)
             effectiveness = calculate_type_effectiveness(move.type, enemy_pokemon.base.types)
             
             base_power = move.power or 0
@@ -267,7 +273,7 @@ def base_ai_choose_action(
     is_user_high_hp = user_hp_ratio > 0.8
     is_attack_reinforced = (mine_team[active_index].rank['attack'] > 1 or 
                         mine_team[active_index].rank['sp_attack'] > 1)
-    switch_index = get_best_switch_index(side)
+    switch_index = get_best_switch_index(side, battle_store=battle_store)
 
     # 0. is_charging일 경우
     if my_pokemon.is_charging and my_pokemon.charging_move:
@@ -276,7 +282,7 @@ def base_ai_choose_action(
     # 0-1. 행동불능 상태일 경우
     if my_pokemon.cannot_move:
         add_log(f"😵 {my_pokemon.base.name}은 아직 회복되지 않아 움직이지 못한다!")
-        print(f"😵 {my_pokemon.base.name}은 아직 회복되지 않아 움직이지 못한다!")
+        logger.debug("😵 %s은 아직 회복되지 않아 움직이지 못한다!", my_pokemon.base.name)
         return best_move if side == 'my' else None # 원래 None이였는데, 오류때문에 일단 기술 뱉어내도록. 
     # battle_seqenence에서 처리. 
 
@@ -302,15 +308,15 @@ def base_ai_choose_action(
 
         if prioritized:
             add_log(f"⚡ {side}는 막타를 노려 빠른 포켓몬을 꺼냈다")
-            print(f"⚡ {side}는 막타를 노려 빠른 포켓몬을 꺼냈다")
+            logger.debug("⚡ %s는 막타를 노려 빠른 포켓몬을 꺼냈다", side)
             return {"type": "switch", "index": prioritized['index']}
         elif switch_index != -1:  # 빠른 포켓몬은 없지만 교체할 수 있는 포켓몬이 있는 경우
             add_log(f"⚡ {side}는 상성이 좋은 포켓몬을 내보냈다")
-            print(f"⚡ {side}는 상성이 좋은 포켓몬을 내보냈다")
+            logger.debug("⚡ %s는 상성이 좋은 포켓몬을 내보냈다", side)
             return {"type": "switch", "index": switch_index}
         else:  # 교체할 수 있는 포켓몬이 없는 경우
             add_log(f"😱 {side}는 교체할 포켓몬이 없어 최후의 발악을 시도한다!")
-            print(f"😱 {side}는 교체할 포켓몬이 없어 최후의 발악을 시도한다!")
+            logger.debug("😱 %s는 교체할 포켓몬이 없어 최후의 발악을 시도한다!", side)
             return best_move
 
     # === 2. 플레이어가 더 빠를 경우 ===
@@ -318,7 +324,7 @@ def base_ai_choose_action(
         if user_to_ai > 1 and not (ai_to_user > 1):  # ai가 확실히 불리
             if is_user_very_low_hp and priority_move:
                 add_log(f"🦅 {side}는 상대 포켓몬의 빈틈을 포착하여 선공기 사용!")
-                print(f"🦅 {side}는 상대 포켓몬의 빈틈을 포착하여 선공기 사용!")
+                logger.debug("🦅 %s는 상대 포켓몬의 빈틈을 포착하여 선공기 사용!", side)
                 return priority_move
                 
             if roll < 0.3 and counter_move and is_ai_high_hp:
@@ -331,89 +337,89 @@ def base_ai_choose_action(
                     (counter_move.name == '미러코트' and enemy_sp_atk > enemy_atk) or
                     (counter_move.name == '메탈버스트')):
                     add_log(f"🛡️ {side}는 반사 기술 {counter_move.name} 사용 시도!")
-                    print(f"🛡️ {side}는 반사 기술 {counter_move.name} 사용 시도!")
+                    logger.debug("🛡️ %s는 반사 기술 %s 사용 시도!", side, counter_move.name)
                     return counter_move
 
             if roll < 0.4 and speed_up_move and ai_hp_ratio > 0.5:
                 add_log(f"🦅 {side}는 상대의 맞교체 또는 랭크업을 예측하고 스피드 상승을 시도!")
-                print(f"🦅 {side}는 상대의 맞교체 또는 랭크업을 예측하고 스피드 상승을 시도!")
+                logger.debug("🦅 %s는 상대의 맞교체 또는 랭크업을 예측하고 스피드 상승을 시도!", side)
                 return speed_up_move
 
             if roll < 0.5 and speed_down_move and ai_hp_ratio > 0.5:
                 add_log(f"🦅 {side}는 상대의 스피드 감소를 시도!")
-                print(f"🦅 {side}는 상대의 스피드 감소를 시도!")
+                logger.debug("🦅 %s는 상대의 스피드 감소를 시도!", side)
                 return speed_down_move
 
             if roll < 0.6 and has_switch_option and switch_index != -1:
                 if is_all_slower and not has_good_matchup:
                     add_log(f"🤔 {side}는 교체해도 의미 없다고 판단하고 체력 보존을 택했다")
-                    print(f"🤔 {side}는 교체해도 의미 없다고 판단하고 체력 보존을 택했다")
+                    logger.debug("🤔 %s는 교체해도 의미 없다고 판단하고 체력 보존을 택했다", side)
                     return best_move
                 else:
                     add_log(f"🐢 {side}는 느리고 불리하므로 교체 선택")
-                    print(f"🐢 {side}는 느리고 불리하므로 교체 선택")
+                    logger.debug("🐢 %s는 느리고 불리하므로 교체 선택", side)
                     return {"type": "switch", "index": switch_index}
 
             add_log(f"🥊 {side}는 최고 위력기를 선택")
-            print(f"🥊 {side}는 최고 위력기를 선택")
+            logger.debug("🥊 %s는 최고 위력기를 선택", side)
             return best_move
 
         elif ai_to_user > 1 and not (user_to_ai > 1):  # ai가 느리지만 상성 확실히 유리
             if screen_moves and (is_ai_faster or is_ai_high_hp):
                 add_log(f"🛡️ {side}는 방어용 스크린을 설치한다!")
-                print(f"🛡️ {side}는 방어용 스크린을 설치한다!")
+                logger.debug("🛡️ %s는 방어용 스크린을 설치한다!", side)
                 return screen_moves
 
             if roll < 0.2 and is_ai_low_hp and has_switch_option:
                 if switch_index != -1:
                     add_log(f"🐢 {side}는 느리고 상성은 유리하지만 체력이 낮아 교체를 시도한다!")
-                    print(f"🐢 {side}는 느리고 상성은 유리하지만 체력이 낮아 교체를 시도한다!")
+                    logger.debug("🐢 %s는 느리고 상성은 유리하지만 체력이 낮아 교체를 시도한다!", side)
                     return {"type": "switch", "index": switch_index}
 
             if speed_up_move and is_ai_high_hp:
                 add_log(f"🐢 {side}는 느리지만 상성이 유리하고 체력이 높아 스피드 상승을 시도한다!")
-                print(f"🐢 {side}는 느리지만 상성이 유리하고 체력이 높아 스피드 상승을 시도한다!")
+                logger.debug("🐢 %s는 느리지만 상성이 유리하고 체력이 높아 스피드 상승을 시도한다!", side)
                 return speed_up_move
 
             if roll < 0.1 and is_ai_high_hp and has_switch_option and uturn_move:
                 add_log(f"🐢 {side}는 상성은 유리하지만 상대의 교체를 예상하고 유턴을 사용한다!")
-                print(f"🐢 {side}는 상성은 유리하지만 상대의 교체를 예상하고 유턴을 사용한다!")
+                logger.debug("🐢 %s는 상성은 유리하지만 상대의 교체를 예상하고 유턴을 사용한다!", side)
                 return uturn_move
 
             if roll < 0.4:
                 add_log(f"🥊 {side}는 상성 우위를 살려 가장 강한 기술로 공격한다!")
-                print(f"🥊 {side}는 상성 우위를 살려 가장 강한 기술로 공격한다!")
+                logger.debug("🥊 %s는 상성 우위를 살려 가장 강한 기술로 공격한다!", side)
                 return best_move
 
             if roll < 0.6 and support_move:
                 add_log(f"🤸‍♀️ {side}는 변화를 시도한다!")
-                print(f"🤸‍♀️ {side}는 변화를 시도한다!")
+                logger.debug("🤸\u200d♀️ %s는 변화를 시도한다!", side)
                 return support_move
 
             if roll < 0.7 and has_switch_option:
                 if switch_index != -1:
                     add_log(f"🛼 {side}는 상대의 교체를 예상하고 맞교체한다!")
-                    print(f"🛼 {side}는 상대의 교체를 예상하고 맞교체한다!")
+                    logger.debug("🛼 %s는 상대의 교체를 예상하고 맞교체한다!", side)
                     return {"type": "switch", "index": switch_index}
 
             add_log(f"🥊 {side}는 예측샷으로 최고 위력기를 사용한다!")
-            print(f"🥊 {side}는 예측샷으로 최고 위력기를 사용한다!")
+            logger.debug("🥊 %s는 예측샷으로 최고 위력기를 사용한다!", side)
             return best_move
 
         else:  # 느리고 상성 같은 경우
             if screen_moves and (is_ai_faster or is_ai_high_hp):
                 add_log(f"🛡️ {side}는 방어용 스크린을 설치한다!")
-                print(f"🛡️ {side}는 방어용 스크린을 설치한다!")
+                logger.debug("🛡️ %s는 방어용 스크린을 설치한다!", side)
                 return screen_moves
 
             if is_ai_high_hp and speed_up_move:
                 add_log(f"🦅 {side}는 스피드 상승을 시도한다!")
-                print(f"🦅 {side}는 스피드 상승을 시도한다!")
+                logger.debug("🦅 %s는 스피드 상승을 시도한다!", side)
                 return speed_up_move
 
             if is_ai_high_hp and user_hp_ratio < 0.5:
                 add_log(f"🥊 {side}는 상대의 체력이 적고 상성이 같아서 가장 강한 기술로 공격한다!")
-                print(f"🥊 {side}는 상대의 체력이 적고 상성이 같아서 가장 강한 기술로 공격한다!")
+                logger.debug("🥊 %s는 상대의 체력이 적고 상성이 같아서 가장 강한 기술로 공격한다!", side)
                 return best_move
 
             if roll < 0.2 and counter_move and is_ai_high_hp:
@@ -426,69 +432,69 @@ def base_ai_choose_action(
                     (counter_move.name == '미러코트' and enemy_sp_atk > enemy_atk) or
                     (counter_move.name == '메탈버스트')):
                     add_log(f"🛡️ {side}는 반사 기술 {counter_move.name} 사용 시도!")
-                    print(f"🛡️ {side}는 반사 기술 {counter_move.name} 사용 시도!")
+                    logger.debug("🛡️ %s는 반사 기술 %s 사용 시도!", side, counter_move.name)
                     return counter_move
 
             if roll < 0.2 and has_switch_option:
                 if switch_index != -1:
                     add_log(f"🐢 {side}는 상성이 같지만 느려서 상대에게 유리한 포켓몬으로 교체한다!")
-                    print(f"🐢 {side}는 상성이 같지만 느려서 상대에게 유리한 포켓몬으로 교체한다!")
+                    logger.debug("🐢 %s는 상성이 같지만 느려서 상대에게 유리한 포켓몬으로 교체한다!", side)
                     return {"type": "switch", "index": switch_index}
 
             add_log(f"🥊 {side}는 상성이 같아서 가장 강한 기술로 공격한다!")
-            print(f"🥊 {side}는 상성이 같아서 가장 강한 기술로 공격한다!")
+            logger.debug("🥊 %s는 상성이 같아서 가장 강한 기술로 공격한다!", side)
             return best_move
 
     # === 3. AI가 더 빠를 경우 ===
     if ai_to_user > 1 and not (user_to_ai > 1):  # ai가 상성상 확실히 유리
         if screen_moves and (is_ai_faster or is_ai_high_hp):
             add_log(f"🛡️ {side}는 방어용 스크린을 설치한다!")
-            print(f"🛡️ {side}는 방어용 스크린을 설치한다!")
+            logger.debug("🛡️ %s는 방어용 스크린을 설치한다!", side)
             return screen_moves
 
         if roll < 0.5 and is_ai_high_hp and attack_up_move:
             add_log(f"🦅 {side}는 빠르므로 공격 상승 기술 사용!")
-            print(f"🦅 {side}는 빠르므로 공격 상승 기술 사용!")
+            logger.debug("🦅 %s는 빠르므로 공격 상승 기술 사용!", side)
             return attack_up_move
 
         if not is_ai_high_hp and is_attack_reinforced:
             add_log(f"🥊 {side}는 강화된 공격력으로 공격!")
-            print(f"🥊 {side}는 강화된 공격력으로 공격!")
+            logger.debug("🥊 %s는 강화된 공격력으로 공격!", side)
             return best_move
 
         if is_user_low_hp:  # 막타치기 로직
             add_log(f"🦅 {side}는 상대 포켓몬의 빈틈을 포착!")
-            print(f"🦅 {side}는 상대 포켓몬의 빈틈을 포착!")
+            logger.debug("🦅 %s는 상대 포켓몬의 빈틈을 포착!", side)
             return best_move
 
         if is_ai_low_hp and heal_move:
             add_log(f"➕ {side}는 빠르지만 체력이 낮으므로 회복 기술 사용!")
-            print(f"➕ {side}는 빠르지만 체력이 낮으므로 회복 기술 사용!")
+            logger.debug("➕ %s는 빠르지만 체력이 낮으므로 회복 기술 사용!", side)
             return heal_move
 
         if roll < 0.1 and has_switch_option and switch_index != -1:
             add_log(f"🛼 {side}는 상대 교체 예상하고 맞교체")
-            print(f"🛼 {side}는 상대 교체 예상하고 맞교체")
+            logger.debug("🛼 %s는 상대 교체 예상하고 맞교체", side)
             return {"type": "switch", "index": switch_index}
 
         if roll < 0.2 and support_move:
             add_log(f"🤸‍♀️ {side}는 변화 기술 사용")
-            print(f"🤸‍♀️ {side}는 변화 기술 사용")
+            logger.debug("🤸\u200d♀️ %s는 변화 기술 사용", side)
             return support_move
 
         add_log(f"🥊 {side}는 가장 강한 기술로 공격")
-        print(f"🥊 {side}는 가장 강한 기술로 공격")
+        logger.debug("🥊 %s는 가장 강한 기술로 공격", side)
         return best_move
 
     elif not (ai_to_user > 1) and user_to_ai > 1:  # ai가 빠르고 상성은 확실히 불리
         if screen_moves and (is_ai_faster or is_ai_high_hp):
             add_log(f"🛡️ {side}는 방어용 스크린을 설치한다!")
-            print(f"🛡️ {side}는 방어용 스크린을 설치한다!")
+            logger.debug("🛡️ %s는 방어용 스크린을 설치한다!", side)
             return screen_moves
 
         if is_user_low_hp:
             add_log(f"🦅 {side}는 상대 포켓몬의 빈틈을 포착!")
-            print(f"🦅 {side}는 상대 포켓몬의 빈틈을 포착!")
+            logger.debug("🦅 %s는 상대 포켓몬의 빈틈을 포착!", side)
             return best_move
 
         if roll < 0.2 and counter_move and is_ai_high_hp:
@@ -501,90 +507,90 @@ def base_ai_choose_action(
                 (counter_move.name == '미러코트' and enemy_sp_atk > enemy_atk) or
                 (counter_move.name == '메탈버스트')):
                 add_log(f"🛡️ {side}는 반사 기술 {counter_move.name} 사용 시도!")
-                print(f"🛡️ {side}는 반사 기술 {counter_move.name} 사용 시도!")
+                logger.debug("🛡️ %s는 반사 기술 %s 사용 시도!", side, counter_move.name)
                 return counter_move
 
         if uturn_move and has_switch_option:
             add_log(f"🛼 {side}는 빠르지만 불리하므로 유턴으로 교체!")
-            print(f"🛼 {side}는 빠르지만 불리하므로 유턴으로 교체!")
+            logger.debug("🛼 %s는 빠르지만 불리하므로 유턴으로 교체!", side)
             return uturn_move
 
         if is_ai_low_hp:
             add_log(f"🥊 {side}는 일단은 강하게 공격!")
-            print(f"🥊 {side}는 일단은 강하게 공격!")
+            logger.debug("🥊 %s는 일단은 강하게 공격!", side)
             return best_move
 
         if roll < 0.15 and support_move:
             add_log(f"🤸‍♀️ {side}는 변화 기술을 사용")
-            print(f"🤸‍♀️ {side}는 변화 기술을 사용")
+            logger.debug("🤸\u200d♀️ %s는 변화 기술을 사용", side)
             return support_move
 
         if roll < 0.25 and (has_switch_option or is_ai_low_hp):
             if switch_index != -1:
                 add_log(f"🛼 {side}는 빠르지만 상성상 유리한 포켓몬이 있으므로 교체")
-                print(f"🛼 {side}는 빠르지만 상성상 유리한 포켓몬이 있으므로 교체")
+                logger.debug("🛼 %s는 빠르지만 상성상 유리한 포켓몬이 있으므로 교체", side)
                 return {"type": "switch", "index": switch_index}
 
         add_log(f"🥊 {side}는 가장 강한 공격 시도")
-        print(f"🥊 {side}는 가장 강한 공격 시도")
+        logger.debug("🥊 %s는 가장 강한 공격 시도", side)
         return best_move
 
     elif ai_to_user > 1 and user_to_ai > 1:  # 서로가 약점을 찌르는 경우
         if screen_moves and (is_ai_faster or is_ai_high_hp):
             add_log(f"🛡️ {side}는 방어용 스크린을 설치한다!")
-            print(f"🛡️ {side}는 방어용 스크린을 설치한다!")
+            logger.debug("🛡️ %s는 방어용 스크린을 설치한다!", side)
             return screen_moves
 
         if roll < 0.1 and is_ai_high_hp and attack_up_move:
             add_log(f"🏋️‍♂️ {side}는 빠르므로 공격 상승 기술 사용!")
-            print(f"🏋️‍♂️ {side}는 빠르므로 공격 상승 기술 사용!")
+            logger.debug("🏋️\u200d♂️ %s는 빠르므로 공격 상승 기술 사용!", side)
             return attack_up_move
 
         if is_user_low_hp:  # 막타치기 로직
             add_log(f"🦅 {side}는 상대 포켓몬의 빈틈을 포착!")
-            print(f"🦅 {side}는 상대 포켓몬의 빈틈을 포착!")
+            logger.debug("🦅 %s는 상대 포켓몬의 빈틈을 포착!", side)
             return best_move
 
         if is_ai_low_hp and heal_move:
             add_log(f"➕ {side}는 빠르지만 체력이 낮으므로 회복 기술 사용!")
-            print(f"➕ {side}는 빠르지만 체력이 낮으므로 회복 기술 사용!")
+            logger.debug("➕ %s는 빠르지만 체력이 낮으므로 회복 기술 사용!", side)
             return heal_move
 
         if roll < 0.1 and has_switch_option and switch_index != -1:
             add_log(f"🛼 {side}는 상대 교체 예상하고 맞교체")
-            print(f"🛼 {side}는 상대 교체 예상하고 맞교체")
+            logger.debug("🛼 %s는 상대 교체 예상하고 맞교체", side)
             return {"type": "switch", "index": switch_index}
 
         if roll < 0.2 and support_move:
             add_log(f"🤸‍♀️ {side}는 변화 기술 사용")
-            print(f"🤸‍♀️ {side}는 변화 기술 사용")
+            logger.debug("🤸\u200d♀️ %s는 변화 기술 사용", side)
             return support_move
 
         add_log(f"🥊 {side}는 가장 강한 기술로 공격")
-        print(f"🥊 {side}는 가장 강한 기술로 공격")
+        logger.debug("🥊 %s는 가장 강한 기술로 공격", side)
         return best_move
 
     else:  # 특별한 상성 없을 때
         if screen_moves and (is_ai_faster or is_ai_high_hp):
             add_log(f"🛡️ {side}는 방어용 스크린을 설치한다!")
-            print(f"🛡️ {side}는 방어용 스크린을 설치한다!")
+            logger.debug("🛡️ %s는 방어용 스크린을 설치한다!", side)
             return screen_moves
 
         if is_user_low_hp:
             add_log(f"🦅 {side}는 상대 포켓몬의 빈틈을 포착!")
-            print(f"🦅 {side}는 상대 포켓몬의 빈틈을 포착!")
+            logger.debug("🦅 %s는 상대 포켓몬의 빈틈을 포착!", side)
             return best_move
 
         if is_ai_high_hp and attack_up_move:
             add_log(f"🏋️‍♂️ {side}는 공격 상승 기술 사용")
-            print(f"🏋️‍♂️ {side}는 공격 상승 기술 사용")
+            logger.debug("🏋️\u200d♂️ %s는 공격 상승 기술 사용", side)
             return attack_up_move
 
         if roll < 0.15 and has_switch_option and switch_index != -1:
             add_log(f"🦅 {side}는 빠르지만 상대의 약점을 찌르기 위해 상대에게 유리한 포켓몬으로 교체")
-            print(f"🦅 {side}는 빠르지만 상대의 약점을 찌르기 위해 상대에게 유리한 포켓몬으로 교체")
+            logger.debug("🦅 %s는 빠르지만 상대의 약점을 찌르기 위해 상대에게 유리한 포켓몬으로 교체", side)
             return {"type": "switch", "index": switch_index}
 
         add_log(f"🥊 {side}는 더 빠르기에 가장 강한 공격 시도")
-        print(f"🥊 {side}는 더 빠르기에 가장 강한 공격 시도")
+        logger.debug("🥊 %s는 더 빠르기에 가장 강한 공격 시도", side)
         return best_move 
\ No newline at end of file
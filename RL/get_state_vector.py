@@ -1,10 +1,11 @@
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from context.battle_environment import IndividualBattleEnvironment, PublicBattleEnvironment
-from context.duration_store import duration_store
+from context.duration_store import DurationStore, duration_store
 from context.battle_store import BattleStore, BattleStoreState, store, SideType
 from p_models.battle_pokemon import BattlePokemon
+from p_models.status import STATUS_BIT
 
 # =============================
 # State Vector Length Calculation (Total: 1153)
@@ -146,7 +147,7 @@ def reflect_one_hot(turns, length=6):
     return arr
 
 # --- Main state vector function ---
-def get_pokemon_vector(pokemon: BattlePokemon, side: SideType) -> np.ndarray:
+def get_pokemon_vector(pokemon: BattlePokemon, side: SideType, duration_store: Optional[DurationStore] = duration_store) -> np.ndarray:
     vec = []
     # species (정수 / 1000.0)
     vec.append(pokemon.base.id / 1000.0 if hasattr(pokemon.base, 'id') else 0)
@@ -179,19 +180,18 @@ def get_pokemon_vector(pokemon: BattlePokemon, side: SideType) -> np.ndarray:
         vec.extend(rank_one_hot(rank))
     # volatile effects (8)
     vfx = ['혼란','풀죽음','사슬묶기','소리기술사용불가','하품','교체불가','조이기','멸망의노래']
+    status_bits = pokemon.status.bits
     for eff in vfx:
-        vec.append(1.0 if eff in pokemon.status else 0.0)
+        vec.append(1.0 if status_bits & STATUS_BIT[eff] else 0.0)
     # status (7)
     sfx = ['독','맹독','마비','화상','잠듦','얼음','기절']
     for eff in sfx:
         if eff == '기절':
             vec.append(1.0 if pokemon.current_hp == 0 else 0.0)
         else:
-            vec.append(1.0 if eff in pokemon.status else 0.0)
+            vec.append(1.0 if status_bits & STATUS_BIT[eff] else 0.0)
     # sleep counter (4 one-hot)
-    sleep_list = duration_store.get_effects(side)
-    sleep_effect = next((e for e in sleep_list if e['name'] == "잠듦"), None)
-    vec.extend(sleep_counter_one_hot(sleep_effect['remaining_turn'] if sleep_effect else 0))
+    vec.extend(sleep_counter_one_hot(duration_store.remaining_turn(side, "잠듦")))
     # first turn (1)
     vec.append(1.0 if pokemon.is_first_turn else 0.0)
     # must recharge (1)
@@ -226,9 +226,9 @@ def get_pokemon_vector(pokemon: BattlePokemon, side: SideType) -> np.ndarray:
     #print(f"Pokemon vector length: {len(vec)}")
     return np.array(vec, dtype=np.float32)
 
-def get_side_field_vector(side: SideType) -> np.ndarray:
+def get_side_field_vector(side: SideType, battle_store: Optional[BattleStore] = store, duration_store: Optional[DurationStore] = duration_store) -> np.ndarray:
     vec = []
-    state: BattleStoreState = store.get_state()
+    state: BattleStoreState = battle_store.get_state()
     side_env: IndividualBattleEnvironment = state["my_env"] if side == "my" else state["enemy_env"]
     # stealth rock (1)
     vec.append(1.0 if "스텔스록" in side_env.trap else 0.0)
@@ -248,16 +248,12 @@ def get_side_field_vector(side: SideType) -> np.ndarray:
     elif "맹독압정" in side_env.trap:
         toxic_spikes = 2
     vec.extend(toxic_spikes_one_hot(toxic_spikes))
-    sc_list = duration_store.get_effects(side)
-    reflect_effect = next((e for e in sc_list if e['name'] == "리플렉터"), None)
-    screen_effect = next((e for e in sc_list if e['name'] == "빛의장막"), None)
-    veil_effect = next((e for e in sc_list if e['name'] == "오로라베일"), None)
     # reflect (6 one-hot)
-    vec.extend(reflect_one_hot(reflect_effect['remaining_turn'] if reflect_effect else 0))
+    vec.extend(reflect_one_hot(duration_store.remaining_turn(side, "리플렉터")))
     # light screen (6 one-hot)
-    vec.extend(reflect_one_hot(screen_effect['remaining_turn'] if screen_effect else 0))
+    vec.extend(reflect_one_hot(duration_store.remaining_turn(side, "빛의장막")))
     # aurora veil (6 one-hot)
-    vec.extend(reflect_one_hot(veil_effect['remaining_turn'] if veil_effect else 0))
+    vec.extend(reflect_one_hot(duration_store.remaining_turn(side, "오로라베일")))
     #print(f"Side field vector length: {len(vec)}")
     return np.array(vec, dtype=np.float32)
 
@@ -284,7 +280,8 @@ def get_state(
     turn: int,
     my_effects: List[Dict],
     enemy_effects: List[Dict],
-    for_opponent: bool = False
+    for_opponent: bool = False,
+    duration_store: Optional[DurationStore] = duration_store
 ) -> np.ndarray:
     vec = []
     # --- Battle global state ---
@@ -316,13 +313,13 @@ def get_state(
                 break
     vec.extend(room_one_hot(room_turns))
     # --- Side field state (my, enemy) ---
-    vec.extend(get_side_field_vector('my'))
-    vec.extend(get_side_field_vector('enemy'))
+    vec.extend(get_side_field_vector('my', battle_store=store, duration_store=duration_store))
+    vec.extend(get_side_field_vector('enemy', battle_store=store, duration_store=duration_store))
     # --- Pokemon state (my 3, enemy 3) ---
     for i in range(3):
-        vec.extend(get_pokemon_vector(my_team[i], "my") if i < len(my_team) else np.zeros_like(get_pokemon_vector(BattlePokemon(), "my")))
+        vec.extend(get_pokemon_vector(my_team[i], "my", duration_store=duration_store) if i < len(my_team) else np.zeros_like(get_pokemon_vector(BattlePokemon(), "my", duration_store=duration_store)))
     for i in range(3):
-        vec.extend(get_pokemon_vector(enemy_team[i], "enemy") if i < len(enemy_team) else np.zeros_like(get_pokemon_vector(BattlePokemon(), "enemy")))
+        vec.extend(get_pokemon_vector(enemy_team[i], "enemy", duration_store=duration_store) if i < len(enemy_team) else np.zeros_like(get_pokemon_vector(BattlePokemon(), "enemy", duration_store=duration_store)))
     
     # --- Active Pokemon Move Types (18 * 4) ---
     active_pokemon = my_team[active_my]
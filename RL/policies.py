@@ -0,0 +1,52 @@
+# RL/policies.py
+"""
+YakemonEnv용 행동 정책: env -> 행동 번호 (0-3 기술, 4-5 교체)
+
+오프라인 데이터 생성(generate_dataset.py)과 rollout 평가(RL/rollout_evaluator.py)가 같이 쓴다.
+"""
+from typing import Callable, Dict
+
+import numpy as np
+
+from env.battle_env import YakemonEnv
+from RL.base_ai_choose_action import base_ai_choose_action
+
+
+def random_policy(env: YakemonEnv) -> int:
+    return int(np.random.choice(np.flatnonzero(env.get_action_mask())))
+
+
+def base_ai_policy(env: YakemonEnv) -> int:
+    """내 쪽도 base_ai_choose_action으로 고르고 env.step의 행동 번호로 바꾼다"""
+    store = env.battle_store
+    active_my = store.get_active_index("my")
+    action = base_ai_choose_action(
+        side="my",
+        my_team=env.my_team,
+        enemy_team=env.enemy_team,
+        active_my=active_my,
+        active_enemy=store.get_active_index("enemy"),
+        public_env=env.public_env.__dict__,
+        enemy_env=env.enemy_env.__dict__,
+        my_env=env.my_env.__dict__,
+        add_log=store.add_log,
+        battle_store=store
+    )
+    mask = env.get_action_mask()
+    if isinstance(action, dict):
+        # step()은 교체 가능한 포켓몬 목록의 순서(4, 5)로 교체 대상을 고른다
+        available_indices = [i for i in range(len(env.my_team)) if i != active_my and env.my_team[i].current_hp > 0]
+        if action["index"] in available_indices and mask[4 + available_indices.index(action["index"])]:
+            return 4 + available_indices.index(action["index"])
+    elif action is not None:
+        for i, move in enumerate(env.my_team[active_my].base.moves[:4]):
+            if move.name == action.name and mask[i]:
+                return i
+    # 행동 불가(None) 등 매핑할 수 없으면 가능한 첫 행동 (행동 불가 상태에서는 어떤 행동이든 무시됨)
+    return int(np.flatnonzero(mask)[0])
+
+
+POLICIES: Dict[str, Callable[[YakemonEnv], int]] = {
+    "base_ai": base_ai_policy,
+    "random": random_policy,
+}
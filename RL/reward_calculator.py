@@ -4,6 +4,9 @@ from p_models.pokemon_info import PokemonInfo
 from p_models.battle_pokemon import BattlePokemon
 from utils.battle_logics.calculate_order import calculate_speed
 from context.battle_store import store
+from utils.battle_logger import get_logger
+
+logger = get_logger(__name__)
 
 def calculate_reward(
     my_team: list[BattlePokemon],
@@ -67,7 +70,9 @@ def calculate_reward(
     # print(f"reward_calculator: target_pokemon.received_damage: {target_pokemon.received_damage}")
 
     # battle_store에서 pre_damage_list 가져오기
-    pre_damage_list = store.get_pre_damage_list() if battle_store else []
+    pre_damage_list = battle_store.get_pre_damage_list() if battle_store else []
+    # 스피드 계산(날씨 특성)에 쓸 스토어. 넘겨받지 못했으면 전역 store
+    speed_store = battle_store if battle_store is not None else store
 
     # 학습 단계에 따른 가중치 계산
     #episode = battle_store.episode if hasattr(battle_store, 'episode') else 0
@@ -88,148 +93,148 @@ def calculate_reward(
         # damage_calculator.py에서 계산된 was_effective와 was_null 값 사용
         was_effective = result.get('was_effective', 0)
         was_null = result.get('was_null', False)
-        print(f"was_effective: {was_effective}")
-        if calculate_speed(current_pokemon) > calculate_speed(target_pokemon):
+        logger.info("was_effective: %s", was_effective)
+        if calculate_speed(current_pokemon, battle_store=speed_store) > calculate_speed(target_pokemon, battle_store=speed_store):
             reward += 0.5
             if not is_monte_carlo:
-                print(f"Good switch: Agent is faster than enemy! Reward: {reward}")
-            else: print(f"Agent is faster than enemy! Reward: {reward}")
+                logger.info("Good switch: Agent is faster than enemy! Reward: %s", reward)
+            else: logger.info("Agent is faster than enemy! Reward: %s", reward)
         if agent_to_ai > 1 and ai_to_agent < 1:
             reward += 1.5
             if not is_monte_carlo:
-                print(f"Good switch: Agent to AI is way stronger! Reward: {reward}")
-            else: print(f"Agent to AI is way stronger! Reward: {reward}")
+                logger.info("Good switch: Agent to AI is way stronger! Reward: %s", reward)
+            else: logger.info("Agent to AI is way stronger! Reward: %s", reward)
         elif agent_to_ai > 1 and ai_to_agent == 1:
             reward += 0.5
             if not is_monte_carlo:
-                print(f"Good switch: Agent to AI is stronger! Reward: {reward}")
-            else: print(f"Agent to AI is stronger! Reward: {reward}")
+                logger.info("Good switch: Agent to AI is stronger! Reward: %s", reward)
+            else: logger.info("Agent to AI is stronger! Reward: %s", reward)
         elif agent_to_ai < 1 and ai_to_agent > 1:
             reward -= 3.0
             if not is_monte_carlo:
-                print(f"Bad switch: AI to Agent is way stronger! Reward: {reward}")
-            else: print(f"AI to Agent is way stronger! Reward: {reward}")
+                logger.info("Bad switch: AI to Agent is way stronger! Reward: %s", reward)
+            else: logger.info("AI to Agent is way stronger! Reward: %s", reward)
         elif agent_to_ai < 1 and ai_to_agent == 1:
             reward -= 1.5
             if not is_monte_carlo:
-                print(f"Bad switch: AI to Agent is stronger! Reward: {reward}")
-            else: print(f"AI to Agent is stronger! Reward: {reward}")
+                logger.info("Bad switch: AI to Agent is stronger! Reward: %s", reward)
+            else: logger.info("AI to Agent is stronger! Reward: %s", reward)
         if was_null:
             reward += 1.5  # 효과 없는 공격에 대한 보상
             if not is_monte_carlo:
-                print(f"Good switch: Immune to attack! Reward: {reward}")
-            else: print(f"Immune to attack! Reward: {reward}")
+                logger.info("Good switch: Immune to attack! Reward: %s", reward)
+            else: logger.info("Immune to attack! Reward: %s", reward)
         elif was_effective == 2:  # 4배 이상 데미지
             reward -= 3.0  # 매우 큰 페널티
             if not is_monte_carlo:
-                print(f"Bad switch: Switched into 4x weakness! Reward: {reward}")
-            else: print(f"Switched into 4x weakness! Reward: {reward}")
+                logger.info("Bad switch: Switched into 4x weakness! Reward: %s", reward)
+            else: logger.info("Switched into 4x weakness! Reward: %s", reward)
         elif was_effective == 1:  # 2배 데미지
             reward -= 2.0  # 적당한 페널티
             if not is_monte_carlo:
-                print(f"Bad switch: Switched into 2x weakness! Reward: {reward}")
-            else: print(f"Switched into 2x weakness! Reward: {reward}")
+                logger.info("Bad switch: Switched into 2x weakness! Reward: %s", reward)
+            else: logger.info("Switched into 2x weakness! Reward: %s", reward)
         elif was_effective == -1:  # 1/2 데미지
             reward += 0.3 # 적당한 보상
             if not is_monte_carlo:
-                print(f"Good switch: Resistant to 1/2 damage! Reward: {reward}")
-            else: print(f"Resistant to 1/2 damage! Reward: {reward}")
+                logger.info("Good switch: Resistant to 1/2 damage! Reward: %s", reward)
+            else: logger.info("Resistant to 1/2 damage! Reward: %s", reward)
         elif was_effective == -2:  # 1/4 데미지
             reward += 0.6  # 매우 큰 보상
             if not is_monte_carlo:
-                print(f"Good switch: Resistant to 1/4 damage! Reward: {reward}")
-            else: print(f"Resistant to 1/4 damage! Reward: {reward}")
+                logger.info("Good switch: Resistant to 1/4 damage! Reward: %s", reward)
+            else: logger.info("Resistant to 1/4 damage! Reward: %s", reward)
     # 교체가 아니라 싸운 경우
     elif action < 4:
         # damage_calculator.py에서 계산된 was_effective와 was_null 값 사용
         was_effective = outcome.get('was_effective', 0)
         was_null = outcome.get('was_null', False)
-        print(f"was_effective: {was_effective}")
+        logger.info("was_effective: %s", was_effective)
         if was_null:
             reward -= 2.5  # 효과 없는 공격에 대한 보상
             if not is_monte_carlo:
-                print(f"Bad Attack: Immune to attack... Reward: {reward}")
-            else: print(f"Immune to attack... Reward: {reward}")
+                logger.info("Bad Attack: Immune to attack... Reward: %s", reward)
+            else: logger.info("Immune to attack... Reward: %s", reward)
         elif was_effective == 2:  # 4배 이상 데미지
             reward += 2.0  # 매우 큰 리워드
             if not is_monte_carlo:
-                print(f"Good Attack: Attacked to 4x effectiveness! Reward: {reward}")
-            else: print(f"Attacked to 4x effectiveness! Reward: {reward}")
+                logger.info("Good Attack: Attacked to 4x effectiveness! Reward: %s", reward)
+            else: logger.info("Attacked to 4x effectiveness! Reward: %s", reward)
         elif was_effective == 1:  # 2배 데미지
             reward += 1.5  # 적당한 리워드
             if not is_monte_carlo:
-                print(f"Good Attack: Attacked to 2x effectiveness! Reward: {reward}")
-            else: print(f"Attacked to 2x effectiveness! Reward: {reward}")
+                logger.info("Good Attack: Attacked to 2x effectiveness! Reward: %s", reward)
+            else: logger.info("Attacked to 2x effectiveness! Reward: %s", reward)
         elif was_effective == -1:  # 1/2 데미지
             reward -= 1.5 # 적당한 페널티
             if not is_monte_carlo:
-                print(f"Bad Attack: Attacked to 1/2 effectiveness! Reward: {reward}")
-            else: print(f"Attacked to 1/2 effectiveness! Reward: {reward}")
+                logger.info("Bad Attack: Attacked to 1/2 effectiveness! Reward: %s", reward)
+            else: logger.info("Attacked to 1/2 effectiveness! Reward: %s", reward)
         elif was_effective == -2:  # 1/4 데미지
             reward -= 2.0  # 매우 큰 페널티
             if not is_monte_carlo:
-                print(f"Bad Attack: Attacked to 1/4 effectiveness! Reward: {reward}")
-            else: print(f"Attacked to 1/4 effectiveness! Reward: {reward}")
+                logger.info("Bad Attack: Attacked to 1/4 effectiveness! Reward: %s", reward)
+            else: logger.info("Attacked to 1/4 effectiveness! Reward: %s", reward)
         # 포켓몬이 행동할 수 없는 경우 리워드 계산하지 않음 (선공을 맞고 기절한 경우는 제외)
         if my_post_pokemon.cannot_move is not None and my_post_pokemon.cannot_move == True:
             if not is_monte_carlo:
-                print("Pokemon couldn't move, skipping reward calculation")
+                logger.info("Pokemon couldn't move, skipping reward calculation")
         # 속이기, 만나자마자 잘못 사용했을 경우 
         if my_post_pokemon.used_move is not None and my_post_pokemon.used_move.first_turn_only and my_post_pokemon.is_first_turn is False:
             reward -= 5.0
             if not is_monte_carlo:
-                print("Bad choice: Used a first turn only move out of turn")
-            else: print(f"Penalty: Used a first turn only move out of turn")
+                logger.info("Bad choice: Used a first turn only move out of turn")
+            else: logger.info("Penalty: Used a first turn only move out of turn")
         # 이전 포켓몬이 공격 못하고 죽었을 때
         if (my_post_pokemon.used_move is None and (my_post_pokemon.base.name != current_pokemon.base.name)
             and (target_pokemon.used_move is not None and not target_pokemon.used_move.exile)):
-            print("이전 포켓몬이 공격 못하고 쓰러졌거나 교체하자마자 쓰러짐")
+            logger.info("이전 포켓몬이 공격 못하고 쓰러졌거나 교체하자마자 쓰러짐")
             # 공격 못하고 죽음 
             reward -= 5.0
         # 공격, 특수공격 랭크업 기술 쓰고 살아있을 때 (상대보다 빠른 조건)
         if (my_post_pokemon.used_move is not None and my_post_pokemon.used_move.effects and any(effect.chance == 1.0 and effect.stat_change and any(sc.stat == 'attack' or sc.stat == 'special_attack' for sc in effect.stat_change) for effect in my_post_pokemon.used_move.effects)
-            and my_post_pokemon.base.name == current_pokemon.base.name and calculate_speed(current_pokemon) > calculate_speed(target_pokemon)):
+            and my_post_pokemon.base.name == current_pokemon.base.name and calculate_speed(current_pokemon, battle_store=speed_store) > calculate_speed(target_pokemon, battle_store=speed_store)):
             reward += 2.5
             if not is_monte_carlo:
-                print(f"Good choice: Used a rank change (attack/sp_attack) move to increase stats! Reward: {reward}")
-            else: print(f"Used a rank change (attack/sp_attack) move to increase stats! Reward: {reward}")
+                logger.info("Good choice: Used a rank change (attack/sp_attack) move to increase stats! Reward: %s", reward)
+            else: logger.info("Used a rank change (attack/sp_attack) move to increase stats! Reward: %s", reward)
         # 스피드 랭크업 기술 쓰고 스피드 추월했을 경우 
-        if (calculate_speed(my_post_pokemon) < calculate_speed(enemy_post_pokemon) and calculate_speed(current_pokemon) > calculate_speed(target_pokemon)
+        if (calculate_speed(my_post_pokemon, battle_store=speed_store) < calculate_speed(enemy_post_pokemon, battle_store=speed_store) and calculate_speed(current_pokemon, battle_store=speed_store) > calculate_speed(target_pokemon, battle_store=speed_store)
             and my_post_pokemon.base.name == current_pokemon.base.name and enemy_post_pokemon.base.name == target_pokemon.base.name
             and my_post_pokemon.used_move is not None and my_post_pokemon.used_move.effects and any(effect.chance == 1.0 and effect.stat_change and any(sc.stat == 'speed' for sc in effect.stat_change) for effect in my_post_pokemon.used_move.effects)):
             reward += 3.0
             if not is_monte_carlo:
-                print(f"Good choice: Used a speed rank change move to overtake the enemy! Reward: {reward}")
-            else: print(f"Used a speed rank change move to overtake the enemy! Reward: {reward}")
+                logger.info("Good choice: Used a speed rank change move to overtake the enemy! Reward: %s", reward)
+            else: logger.info("Used a speed rank change move to overtake the enemy! Reward: %s", reward)
         # 상대 쓰러뜨렸으면 리워드 증가
         if (current_pokemon.dealt_damage == enemy_post_pokemon.current_hp or my_post_pokemon.dealt_damage == enemy_post_pokemon.current_hp
             or (current_pokemon.base.name == my_post_pokemon.base.name and current_pokemon.used_move is not None and not current_pokemon.used_move.u_turn and
                 current_pokemon.dealt_damage is not None and current_pokemon.dealt_damage > 0 and (target_pokemon.received_damage is None or target_pokemon.received_damage == 0))):
             reward += 6.0
             if not is_monte_carlo:
-                print(f"Good choice: Used a move to defeat the enemy! Reward: {reward}")
-            else: print(f"Used a move to defeat the enemy! Reward: {reward}")
+                logger.info("Good choice: Used a move to defeat the enemy! Reward: %s", reward)
+            else: logger.info("Used a move to defeat the enemy! Reward: %s", reward)
         # 상대 때리면 리워드 증가 
         if current_pokemon.dealt_damage and enemy_post_pokemon.current_hp != 0:
             reward += (current_pokemon.dealt_damage / enemy_post_pokemon.base.hp) * 1.2
-            print(f"dealt_damage: {current_pokemon.dealt_damage}")
-            print(f"enemy_post_pokemon.base.hp: {enemy_post_pokemon.base.hp}")
-            print(f"hit! : {reward}")
+            logger.info("dealt_damage: %s", current_pokemon.dealt_damage)
+            logger.info("enemy_post_pokemon.base.hp: %s", enemy_post_pokemon.base.hp)
+            logger.info("hit! : %s", reward)
         # 내가 먼저 선공, 상대의 후공으로 기절했을 때
         elif ((my_post_pokemon.base.name != current_pokemon.base.name) and (current_pokemon.used_move == None) and (enemy_post_pokemon.base.name == target_pokemon.base.name)
             and my_post_pokemon.used_move is not None and not my_post_pokemon.used_move.u_turn and target_pokemon.received_damage is not None):
             reward += (target_pokemon.received_damage / target_pokemon.base.hp) * 0.3
-            print(f"received_damage (fallback): {target_pokemon.received_damage}")
-            print(f"enemy_post_pokemon.base.hp: {enemy_post_pokemon.base.hp}")
-            print(f"hit(fallback) : {reward}")
+            logger.info("received_damage (fallback): %s", target_pokemon.received_damage)
+            logger.info("enemy_post_pokemon.base.hp: %s", enemy_post_pokemon.base.hp)
+            logger.info("hit(fallback) : %s", reward)
             
         # 유턴 기술로 때렸을 때
         elif ((my_post_pokemon.base.name != current_pokemon.base.name) and (current_pokemon.used_move == None) and (enemy_post_pokemon.base.name == target_pokemon.base.name)
             and my_post_pokemon.used_move is not None and my_post_pokemon.used_move.u_turn and target_pokemon.received_damage is not None):
             reward += (target_pokemon.received_damage / target_pokemon.base.hp) * 0.2
-            print(f"received_damage (u_turn): {target_pokemon.received_damage}")
-            print(f"enemy_post_pokemon.base.hp: {enemy_post_pokemon.base.hp}")
-            print(f"hit(u_turn) : {reward}")
+            logger.info("received_damage (u_turn): %s", target_pokemon.received_damage)
+            logger.info("enemy_post_pokemon.base.hp: %s", enemy_post_pokemon.base.hp)
+            logger.info("hit(u_turn) : %s", reward)
         # 기술은 썼는데 데미지 못주고 죽음
         elif ((my_post_pokemon.base.name != current_pokemon.base.name) and (current_pokemon.used_move == None) and (enemy_post_pokemon.base.name == target_pokemon.base.name)
             and my_post_pokemon.used_move is not None and target_pokemon.received_damage is None):
@@ -237,8 +242,8 @@ def calculate_reward(
             if my_post_pokemon.used_move.effects and any(effect.chance == 1.0 and effect.stat_change and any(sc.target == 'self' for sc in effect.stat_change) for effect in my_post_pokemon.used_move.effects):
                 reward -= 2.5  # 스탯 상승 기술 사용 후 바로 기절한 경우 페널티
                 if not is_monte_carlo:
-                    print(f"Bad choice: Used stat boost move ({my_post_pokemon.used_move.name}) but fainted immediately!")
-                else: print(f"Penalty for using stat boost move and fainting: {reward}")
+                    logger.info("Bad choice: Used stat boost move (%s) but fainted immediately!", my_post_pokemon.used_move.name)
+                else: logger.info("Penalty for using stat boost move and fainting: %s", reward)
         # 상태이상 기술 중복 사용 시 페널티
         if (my_post_pokemon.used_move is not None and my_post_pokemon.used_move.effects 
             and was_null is True
@@ -246,8 +251,8 @@ def calculate_reward(
             and any(effect.status in target_pokemon.status for effect in my_post_pokemon.used_move.effects)):
             reward -= 3.0  # 상태이상 기술 중복 사용 시 페널티  
             if not is_monte_carlo:
-                print(f"Bad choice: Used status condition move ({my_post_pokemon.used_move.name}) but Enemy already has status condition!")
-            else: print(f"Penalty for using status condition move in duplicate: {reward}")
+                logger.info("Bad choice: Used status condition move (%s) but Enemy already has status condition!", my_post_pokemon.used_move.name)
+            else: logger.info("Penalty for using status condition move in duplicate: %s", reward)
         """
         # 스탯 상승 기술 사용 후 바로 기절한 경우 (위력 없음)
         elif ((my_post_pokemon.base.name != current_pokemon.base.name) and (current_pokemon.used_move == None) and (enemy_post_pokemon.base.name == target_pokemon.base.name)
@@ -274,8 +279,8 @@ def calculate_reward(
                         if has_demerit_with_same_damage:
                             reward += 0.5  # 리워드 증가
                             if not is_monte_carlo:
-                                print(f"Good choice: Used a move without demerit effects! Reward: {reward}")
-                            else: print(f"Used a move without demerit effects! Reward: {reward}")
+                                logger.info("Good choice: Used a move without demerit effects! Reward: %s", reward)
+                            else: logger.info("Used a move without demerit effects! Reward: %s", reward)
                     
                     # demerit_effects 조건이 동일한 경우, effects가 있는 기술을 사용하면 리워드 증가
                     if effect == 1:  # effects가 있고 데미지가 0보다 큰 기술
@@ -286,8 +291,8 @@ def calculate_reward(
                         if has_same_demerit_without_effect:
                             reward += 0.5  # 리워드 증가
                             if not is_monte_carlo:
-                                print(f"Good choice: Used a move with effects! Reward: {reward}")
-                            else: print(f"Used a move with effects! Reward: {reward}")
+                                logger.info("Good choice: Used a move with effects! Reward: %s", reward)
+                            else: logger.info("Used a move with effects! Reward: %s", reward)
 
     # # 승리/패배에 따른 보상 (가장 중요한 요소)
     # if done:
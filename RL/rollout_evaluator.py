@@ -0,0 +1,190 @@
+# RL/rollout_evaluator.py
+"""
+몬테카를로 rollout으로 현재 상태의 행동들을 평가한다
+
+각 행동마다 num_rollouts개의 시드로 depth 스텝까지 진행해 할인 보상 합의 평균 / 분산을 구한다.
+- 첫 스텝만 평가할 행동(과 주어진 상대 행동)을 쓰고, 이후 스텝은 rollout_policy와 env 기본 상대로 진행한다.
+- 모든 행동이 같은 시드 목록을 쓰므로(common random numbers) 행동 간 차이에서 운의 영향이 줄어든다.
+- workers > 0이면 env를 한 번 pickle해서 프로세스 풀에 시드 묶음별로 나눠 보낸다.
+  workers = 0이면 현재 프로세스에서 snapshot() / restore()로 돌리고 전역 random 상태도 되돌린다.
+analytic_scores는 rollout 없이 기술 행동을 데미지 분포로 바로 평가한다 (난수 없음).
+"""
+import multiprocessing as mp
+import pickle
+import random
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+from env.battle_env import YakemonEnv
+from RL.policies import POLICIES
+from utils.battle_logger import set_silent
+from utils.battle_logics.damage_distribution import move_distributions
+
+
+class ActionScores(NamedTuple):
+    actions: np.ndarray  # (행동 수,) 평가한 행동 번호
+    mean: np.ndarray     # (행동 수,) 보상 합 평균
+    var: np.ndarray      # (행동 수,) 보상 합 분산
+    count: int           # 행동당 rollout 수 (analytic_scores는 0)
+
+    def score(self, action: int) -> float:
+        return float(self.mean[list(self.actions).index(action)])
+
+    def best_action(self) -> int:
+        return int(self.actions[int(np.argmax(self.mean))])
+
+
+def rollout(
+    env: YakemonEnv,
+    action: int,
+    depth: int = 1,
+    gamma: float = 1.0,
+    policy: Callable[[YakemonEnv], int] = POLICIES["base_ai"],
+    enemy_action=7,
+    is_always_hit: bool = False,
+    random_enemy: bool = False,
+) -> float:
+    """env를 그대로 진행시키며 depth 스텝(또는 배틀 종료)까지의 할인 보상 합을 반환"""
+    total, discount = 0.0, 1.0
+    for step in range(depth):
+        if step > 0:
+            action, enemy_action = policy(env), 7
+        _, reward, done, _ = env.step_sync(
+            action, enemy_action=enemy_action, is_always_hit=is_always_hit, test=random_enemy, is_monte_carlo=True
+        )
+        total += discount * reward
+        discount *= gamma
+        if done:
+            break
+    return total
+
+
+def analytic_scores(env: YakemonEnv, is_always_hit: bool = False) -> ActionScores:
+    """
+    rollout 없이 가능한 기술 행동(0~3)을 데미지 분포(utils/battle_logics/damage_distribution.py)로 평가한다
+    mean은 상대 현재 포켓몬 최대 체력 대비 기대 데미지, var는 그 분산. 교체 행동은 넣지 않는다.
+    """
+    store, durations = env.battle_store, env.duration_store
+    mask = env.get_action_mask()
+    distributions = move_distributions("my", is_always_hit, store, durations)
+    actions = [a for a in range(min(4, len(distributions))) if mask[a]]
+    defender = store.get_team("enemy")[store.get_active_index("enemy")]
+    max_hp = max(1, defender.base.hp)
+    return ActionScores(
+        np.array(actions, dtype=np.int64),
+        np.array([distributions[a].expected / max_hp for a in actions]),
+        np.array([distributions[a].variance / max_hp ** 2 for a in actions]),
+        0,
+    )
+
+
+def _rollout_batch(env: YakemonEnv, actions: Sequence[int], seeds: Sequence[int], config: Dict) -> np.ndarray:
+    """(행동 수, 시드 수) 보상 합. 매 rollout마다 시작 상태로 복원하고 random / np.random을 시드로 맞춘다"""
+    policy = POLICIES[config["policy"]] if isinstance(config["policy"], str) else config["policy"]
+    snapshot = env.snapshot()
+    returns = np.zeros((len(actions), len(seeds)), dtype=np.float64)
+    try:
+        for j, seed in enumerate(seeds):
+            for i, action in enumerate(actions):
+                env.restore(snapshot)
+                random.seed(seed)
+                np.random.seed(seed)
+                returns[i, j] = rollout(
+                    env, action, config["depth"], config["gamma"], policy, config["enemy_action"],
+                    config["is_always_hit"], config["random_enemy"],
+                )
+    finally:
+        env.restore(snapshot)
+    return returns
+
+
+def _worker_init(quiet: bool) -> None:
+    if quiet:
+        set_silent()
+
+
+def _worker_run(env_bytes: bytes, actions: List[int], seeds: List[int], config: Dict) -> np.ndarray:
+    return _rollout_batch(pickle.loads(env_bytes), actions, seeds, config)
+
+
+class RolloutEvaluator:
+    """
+    evaluate(env)로 행동별 rollout 보상 평균 / 분산(ActionScores)을 구한다
+
+    rollout_policy는 POLICIES의 이름이나 env -> 행동 번호 함수 (workers > 0이면 pickle 가능한 최상위 함수).
+    풀은 처음 evaluate할 때 만들고 close()(또는 with 블록 종료)로 닫는다.
+    """
+
+    def __init__(
+        self,
+        num_rollouts: int = 8,
+        depth: int = 1,
+        gamma: float = 1.0,
+        workers: int = 0,
+        rollout_policy: Union[str, Callable[[YakemonEnv], int]] = "base_ai",
+        is_always_hit: bool = False,
+        random_enemy: bool = False,
+        seed: Optional[int] = None,
+        quiet: bool = True,
+    ):
+        if num_rollouts < 1 or depth < 1:
+            raise ValueError(f"num_rollouts와 depth는 1 이상이어야 합니다: {num_rollouts}, {depth}")
+        self.num_rollouts = num_rollouts
+        self.depth = depth
+        self.gamma = gamma
+        self.workers = workers
+        self.rollout_policy = rollout_policy
+        self.is_always_hit = is_always_hit
+        self.random_enemy = random_enemy
+        self.quiet = quiet
+        self.rng = np.random.default_rng(seed)
+        self._pool = None
+
+    def evaluate(self, env: YakemonEnv, actions: Optional[Sequence[int]] = None, enemy_action=7) -> ActionScores:
+        """actions를 주지 않으면 env.get_action_mask()의 가능한 행동을 모두 평가한다. env 상태는 바뀌지 않는다"""
+        if actions is None:
+            actions = np.flatnonzero(env.get_action_mask())
+        actions = [int(a) for a in dict.fromkeys(int(a) for a in actions)]
+        seeds = [int(s) for s in self.rng.integers(0, 2**31 - 1, size=self.num_rollouts)]
+        config = {
+            "policy": self.rollout_policy,
+            "depth": self.depth,
+            "gamma": self.gamma,
+            "enemy_action": enemy_action,
+            "is_always_hit": self.is_always_hit,
+            "random_enemy": self.random_enemy,
+        }
+
+        if self.workers > 0:
+            env_bytes = pickle.dumps(env)
+            chunks = [chunk.tolist() for chunk in np.array_split(seeds, min(self.workers, len(seeds)))]
+            results = self._get_pool().starmap(_worker_run, [(env_bytes, actions, chunk, config) for chunk in chunks])
+            returns = np.concatenate(results, axis=1)
+        else:
+            # rollout이 전역 random을 시드로 덮어쓰므로 학습 쪽 난수 흐름을 되돌려 둔다
+            random_state, np_state = random.getstate(), np.random.get_state()
+            try:
+                returns = _rollout_batch(env, actions, seeds, config)
+            finally:
+                random.setstate(random_state)
+                np.random.set_state(np_state)
+
+        return ActionScores(np.array(actions), returns.mean(axis=1), returns.var(axis=1), len(seeds))
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = mp.Pool(self.workers, initializer=_worker_init, initargs=(self.quiet,))
+        return self._pool
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self) -> "RolloutEvaluator":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,97 @@
+# RL/state_codec.py
+"""
+리플레이 버퍼용 상태 벡터 압축
+
+1237차원 상태는 거의 전부 0/1 원핫이고 실수값은 61칸뿐이다
+(턴, 포켓몬마다 종족/특성/기술 4개 id, 차징/고정/마지막/사용불가 기술 id).
+0/1 칸은 비트로 묶어(uint8) 저장하고 실수 칸만 float32로 따로 저장한다.
+float32 한 줄(4948바이트)이 391바이트가 되며, 복원 결과는 원래 벡터와 비트 단위로 같다.
+"""
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from RL.state_encoder import (
+    POKEMON_DIM, POKEMON_OFFSET, STATE_DIM, _P_FLAGS, _P_MOVES
+)
+
+# 포켓몬 구간 안의 실수 칸: 종족 id, 특성 id, 기술 id 4개, 차징 / 고정 / 마지막 사용 / 사용불가 기술 id
+_POKEMON_SCALAR_OFFSETS = (0, 1) + tuple(range(_P_MOVES, _P_MOVES + 4)) + (
+    _P_FLAGS + 3, _P_FLAGS + 10, _P_FLAGS + 11, _P_FLAGS + 15
+)
+SCALAR_INDICES = np.array(
+    [0] + [POKEMON_OFFSET + slot * POKEMON_DIM + k for slot in range(6) for k in _POKEMON_SCALAR_OFFSETS],
+    dtype=np.intp
+)
+
+
+class StateCodec:
+    """
+    상태 배치 (N, state_dim) <-> (비트 배열 (N, packed_bytes) uint8, 실수 배열 (N, 실수 칸 수) float32)
+
+    scalar_indices 밖의 칸은 0 또는 1이어야 한다. 아니면 encode가 ValueError를 낸다.
+    """
+
+    def __init__(self, state_dim: int = STATE_DIM, scalar_indices: Sequence[int] = SCALAR_INDICES):
+        self.state_dim = state_dim
+        self.scalar_indices = np.asarray(scalar_indices, dtype=np.intp)
+        binary_mask = np.ones(state_dim, dtype=bool)
+        binary_mask[self.scalar_indices] = False
+        self.binary_indices = np.flatnonzero(binary_mask)
+        self.packed_bytes = (len(self.binary_indices) + 7) // 8
+
+    @property
+    def bytes_per_state(self) -> int:
+        return self.packed_bytes + 4 * len(self.scalar_indices)
+
+    def allocate(self, size: int) -> "PackedStateArray":
+        """리플레이 버퍼가 obs 배열 대신 쓸 저장소"""
+        return PackedStateArray(size, self)
+
+    def encode(self, states) -> Tuple[np.ndarray, np.ndarray]:
+        states = np.asarray(states, dtype=np.float32)
+        if states.shape[-1] != self.state_dim:
+            raise ValueError(f"상태 차원이 {self.state_dim}이 아닙니다: {states.shape}")
+        binary = states[..., self.binary_indices]
+        if ((binary != 0) & (binary != 1)).any():
+            raise ValueError("0/1이 아닌 값이 비트 칸에 있습니다.")
+        bits = np.packbits(binary.astype(np.uint8), axis=-1)
+        return bits, states[..., self.scalar_indices]
+
+    def decode(self, bits: np.ndarray, scalars: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        if out is None:
+            out = np.empty(bits.shape[:-1] + (self.state_dim,), dtype=np.float32)
+        out[..., self.binary_indices] = np.unpackbits(bits, axis=-1, count=len(self.binary_indices))
+        out[..., self.scalar_indices] = scalars
+        return out
+
+
+class PackedStateArray:
+    """
+    (size, state_dim) float32 배열 대신 쓰는 압축 저장소
+
+    arr[i] = state / arr[indices] 인덱싱을 지원하므로 리플레이 버퍼의 obs 배열 자리에 그대로 넣을 수 있다.
+    읽을 때는 항상 새 float32 배열로 복원해서 돌려준다.
+    """
+
+    def __init__(self, size: int, codec: Optional[StateCodec] = None):
+        self.codec = codec if codec is not None else StateCodec()
+        self.bits = np.zeros((size, self.codec.packed_bytes), dtype=np.uint8)
+        self.scalars = np.zeros((size, len(self.codec.scalar_indices)), dtype=np.float32)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.bits), self.codec.state_dim
+
+    @property
+    def nbytes(self) -> int:
+        return self.bits.nbytes + self.scalars.nbytes
+
+    def __len__(self) -> int:
+        return len(self.bits)
+
+    def __setitem__(self, index, states) -> None:
+        self.bits[index], self.scalars[index] = self.codec.encode(states)
+
+    def __getitem__(self, index) -> np.ndarray:
+        return self.codec.decode(self.bits[index], self.scalars[index])
@@ -0,0 +1,485 @@
+# RL/state_encoder.py
+"""
+미리 할당한 float32 버퍼에 상태 벡터를 증분으로 기록하는 인코더
+
+get_state()와 같은 1237차원 벡터를 만들지만 매번 리스트를 새로 만들지 않는다.
+벡터를 구간(전역 / 사이드 필드 2개 / 포켓몬 6마리 / 액티브 기술 타입)으로 나누고,
+구간마다 그 값을 결정하는 입력을 키로 기억해 두었다가 키가 바뀐 구간만 다시 쓴다.
+결과는 get_state()와 비트 단위로 같다.
+
+get_state_batch()는 여러 배틀을 (N, 1237) 배열로 한 번에 인코딩한다.
+"""
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from context.battle_context import BattleContext
+from context.battle_environment import IndividualBattleEnvironment, PublicBattleEnvironment
+from context.battle_store import BattleStore, BattleStoreState, SideType
+from context.duration_store import DurationStore, duration_store
+from p_models.status import STATUS_NAMES
+
+# --- 구간 길이 / 오프셋 (get_state_vector.py 상단의 계산과 동일) ---
+GLOBAL_DIM = 51
+SIDE_DIM = 26
+POKEMON_DIM = 177
+MOVE_TYPES_DIM = 18 * 4
+
+SIDE_OFFSETS = {"my": GLOBAL_DIM, "enemy": GLOBAL_DIM + SIDE_DIM}
+POKEMON_OFFSET = GLOBAL_DIM + 2 * SIDE_DIM
+MOVE_TYPES_OFFSET = POKEMON_OFFSET + 6 * POKEMON_DIM
+STATE_DIM = MOVE_TYPES_OFFSET + MOVE_TYPES_DIM  # 1237
+
+WEATHERS = ['쾌청', '비', '모래바람', '싸라기눈']
+FIELDS = ['그래스필드', '사이코필드', '미스트필드', '일렉트릭필드']
+TYPE_INDEX = {
+    "노말": 0, "불": 1, "물": 2, "풀": 3, "전기": 4, "얼음": 5, "격투": 6, "독": 7, "땅": 8,
+    "비행": 9, "에스퍼": 10, "벌레": 11, "바위": 12, "고스트": 13, "드래곤": 14, "악": 15, "강철": 16, "페어리": 17,
+}
+POSITION_INDEX = {"없음": 0, "하늘": 1, "바다": 2, "땅": 3, "공허": 4}
+RANK_STATS = ['attack', 'defense', 'sp_attack', 'sp_defense', 'speed', 'accuracy', 'dodge']
+VOLATILE_STATUS = ['혼란', '풀죽음', '사슬묶기', '소리기술사용불가', '하품', '교체불가', '조이기', '멸망의노래']
+MAIN_STATUS = ['독', '맹독', '마비', '화상', '잠듦', '얼음']
+HP_BINS = np.linspace(0, 1, 8).tolist()
+# 휘발성 8칸 + 주요 상태이상 6칸은 벡터에서 이어져 있다. 칸마다 BattlePokemon.status.bits의 비트 번호
+_STATUS_SHIFTS = np.array([STATUS_NAMES.index(name) for name in VOLATILE_STATUS + MAIN_STATUS])
+
+# 포켓몬 구간 내부 오프셋
+_P_MOVES = 2
+_P_PP = 6
+_P_TYPES = 26
+_P_HP = 44
+_P_RANK = 51
+_P_VOLATILE = 142
+_P_STATUS = 150
+_P_SLEEP = 157
+_P_FLAGS = 161
+
+
+def _public_effect_turns(duration_store: DurationStore, name: str) -> int:
+    # get_state()와 같은 방식으로 남은 턴을 찾는다
+    for effect in duration_store.get_effects('public'):
+        if getattr(effect, 'name', None) == name:
+            return getattr(effect, 'remaining_turn', 0)
+    return 0
+
+
+def _turn_index(turns: int) -> int:
+    # weather_one_hot / room_one_hot / reflect_one_hot: 1~5턴이면 해당 칸, 아니면 0번 칸
+    return turns if 1 <= turns <= 5 else 0
+
+
+def _pp_bin(pp, max_pp) -> int:
+    if max_pp == 0:
+        return 0
+    ratio = pp / max_pp
+    if ratio < 0.25:
+        return 1
+    elif ratio < 0.5:
+        return 2
+    elif ratio < 0.75:
+        return 3
+    return 4
+
+
+def _global_values(public_env: PublicBattleEnvironment, turn: int, duration_store: DurationStore) -> tuple:
+    """전역 구간을 결정하는 값: (턴, 날씨, 날씨 남은 턴, 필드, 트릭룸 남은 턴)"""
+    weather = getattr(public_env, 'weather', None)
+    field = getattr(public_env, 'field', None)
+    room = getattr(public_env, 'room', None)
+    weather_turns = _public_effect_turns(duration_store, weather) if weather in WEATHERS else 0
+    room_turns = _public_effect_turns(duration_store, '트릭룸') if room == '트릭룸' else 0
+    return min(turn, 30), weather, weather_turns, field, room_turns
+
+
+def _side_field_values(side_env: IndividualBattleEnvironment, side: SideType, duration_store: DurationStore) -> tuple:
+    """사이드 필드 구간을 결정하는 값: (스텔스록, 압정뿌리기, 독압정, 리플렉터, 빛의장막, 오로라베일)"""
+    trap = side_env.trap
+    spikes = 0
+    if "압정뿌리기" in trap:
+        spikes = 1
+    elif "압정뿌리기2" in trap:
+        spikes = 2
+    elif "압정뿌리기3" in trap:
+        spikes = 3
+    toxic_spikes = 0
+    if "독압정" in trap:
+        toxic_spikes = 1
+    elif "맹독압정" in trap:
+        toxic_spikes = 2
+    return (
+        "스텔스록" in trap, spikes, toxic_spikes,
+        duration_store.remaining_turn(side, "리플렉터"), duration_store.remaining_turn(side, "빛의장막"),
+        duration_store.remaining_turn(side, "오로라베일"),
+    )
+
+
+class StateEncoder:
+    """
+    get_state()의 증분 버전
+
+    encode()가 반환하는 배열은 내부 버퍼의 뷰이므로 다음 encode() 호출 때 덮어써진다.
+    리플레이 버퍼 등에 보관하려면 복사해서 사용한다.
+    """
+
+    def __init__(self):
+        self._buffer = np.zeros(STATE_DIM, dtype=np.float32)
+        self._global_key = None
+        self._side_keys: Dict[str, tuple] = {}
+        self._pokemon_keys: List[Optional[tuple]] = [None] * 6
+        self._move_types_key = None
+
+    def reset(self) -> None:
+        """캐시된 키를 모두 버려 다음 encode()에서 전체를 다시 쓴다"""
+        self._global_key = None
+        self._side_keys = {}
+        self._pokemon_keys = [None] * 6
+        self._move_types_key = None
+
+    def encode(
+        self,
+        store: BattleStore,
+        my_team: List,
+        enemy_team: List,
+        active_my: int,
+        active_enemy: int,
+        public_env: PublicBattleEnvironment,
+        my_env: IndividualBattleEnvironment,
+        enemy_env: IndividualBattleEnvironment,
+        turn: int,
+        my_effects: List[Dict],
+        enemy_effects: List[Dict],
+        for_opponent: bool = False,
+        duration_store: Optional[DurationStore] = duration_store
+    ) -> np.ndarray:
+        """get_state()와 같은 인자를 받아 (1237,) float32 뷰를 반환"""
+        self._encode_global(public_env, turn, duration_store)
+        state: BattleStoreState = store.get_state()
+        for side in ("my", "enemy"):
+            side_env = state["my_env"] if side == "my" else state["enemy_env"]
+            self._encode_side(side, side_env, duration_store)
+        for side_index, (side, team) in enumerate((("my", my_team), ("enemy", enemy_team))):
+            sleep_turns = duration_store.remaining_turn(side, "잠듦")
+            for i in range(3):
+                slot = side_index * 3 + i
+                self._encode_pokemon(slot, team[i] if i < len(team) else None, sleep_turns)
+        self._encode_move_types(my_team[active_my])
+        return self._buffer.view()
+
+    # --- 구간별 인코딩 ---
+    def _encode_global(self, public_env: PublicBattleEnvironment, turn: int, duration_store: DurationStore) -> None:
+        key = _global_values(public_env, turn, duration_store)
+        if key == self._global_key:
+            return
+        self._global_key = key
+        _, weather, weather_turns, field, room_turns = key
+
+        out = self._buffer[:GLOBAL_DIM]
+        out[:] = 0.0
+        out[0] = min(turn, 30) / 30.0
+        # weather (4종 × 6 one-hot)
+        for k, w in enumerate(WEATHERS):
+            out[1 + k * 6 + (_turn_index(weather_turns) if weather == w else 0)] = 1.0
+        # field (4종 × 5 one-hot), 해당 필드가 아니면 "없음"(4번 칸)
+        for k, f in enumerate(FIELDS):
+            out[25 + k * 5 + (k if field == f else 4)] = 1.0
+        # room (6 one-hot)
+        out[45 + _turn_index(room_turns)] = 1.0
+
+    def _encode_side(self, side: SideType, side_env: IndividualBattleEnvironment, duration_store: DurationStore) -> None:
+        key = _side_field_values(side_env, side, duration_store)
+        if key == self._side_keys.get(side):
+            return
+        self._side_keys[side] = key
+
+        stealth_rock, spikes, toxic_spikes, reflect, screen, veil = key
+        offset = SIDE_OFFSETS[side]
+        out = self._buffer[offset:offset + SIDE_DIM]
+        out[:] = 0.0
+        out[0] = 1.0 if stealth_rock else 0.0
+        out[1 + spikes] = 1.0
+        out[5 + toxic_spikes] = 1.0
+        out[8 + _turn_index(reflect)] = 1.0
+        out[14 + _turn_index(screen)] = 1.0
+        out[20 + _turn_index(veil)] = 1.0
+
+    def _encode_pokemon(self, slot: int, pokemon, sleep_turns: int) -> None:
+        key = self._pokemon_key(pokemon, sleep_turns) if pokemon is not None else None
+        if key is not None and key == self._pokemon_keys[slot]:
+            return
+        self._pokemon_keys[slot] = key
+
+        offset = POKEMON_OFFSET + slot * POKEMON_DIM
+        out = self._buffer[offset:offset + POKEMON_DIM]
+        out[:] = 0.0
+        if pokemon is None:
+            return
+
+        base = pokemon.base
+        moves = base.moves[:4]
+        out[0] = base.id / 1000.0 if hasattr(base, 'id') else 0
+        ab = base.ability
+        out[1] = (ab.id if ab and hasattr(ab, 'id') else 0) / 120.0
+        for i in range(4):
+            if i < len(moves):
+                out[_P_MOVES + i] = moves[i].id / 253.0
+                out[_P_PP + i * 5 + _pp_bin(pokemon.pp.get(moves[i].name, 0), moves[i].pp)] = 1.0
+            else:
+                out[_P_PP + i * 5] = 1.0
+        for t in base.types:
+            if t in TYPE_INDEX:
+                out[_P_TYPES + TYPE_INDEX[t]] = 1.0
+        # HP (7 one-hot): np.digitize(right=True)와 같은 구간 규칙
+        hp_ratio = pokemon.current_hp / base.hp if base.hp > 0 else 0
+        hp_index = bisect_left(HP_BINS, hp_ratio) - 1
+        if 0 <= hp_index < 7:
+            out[_P_HP + hp_index] = 1.0
+        for k, stat in enumerate(RANK_STATS):
+            rank_index = int(pokemon.rank.get(stat, 0)) + 6
+            if 0 <= rank_index < 13:
+                out[_P_RANK + k * 13 + rank_index] = 1.0
+        status_bits = pokemon.status.bits
+        if status_bits:
+            out[_P_VOLATILE:_P_VOLATILE + len(_STATUS_SHIFTS)] = (status_bits >> _STATUS_SHIFTS) & 1
+        if pokemon.current_hp == 0:
+            out[_P_STATUS + 6] = 1.0
+        if 1 <= sleep_turns < 4:
+            out[_P_SLEEP + sleep_turns] = 1.0
+        out[_P_FLAGS] = 1.0 if pokemon.is_first_turn else 0.0
+        out[_P_FLAGS + 1] = 1.0 if pokemon.cannot_move else 0.0
+        out[_P_FLAGS + 2] = 1.0 if pokemon.is_charging else 0.0
+        out[_P_FLAGS + 3] = pokemon.charging_move.id if pokemon.charging_move else 254
+        out[_P_FLAGS + 4] = 1.0 if pokemon.is_active else 0.0
+        out[_P_FLAGS + 5 + POSITION_INDEX.get(pokemon.position if pokemon.position else '없음', 0)] = 1.0
+        out[_P_FLAGS + 10] = pokemon.locked_move.id if pokemon.locked_move else 254
+        out[_P_FLAGS + 11] = pokemon.used_move.id if pokemon.used_move else 254
+        out[_P_FLAGS + 12] = 1.0 if pokemon.had_missed else 0.0
+        out[_P_FLAGS + 13] = 1.0 if pokemon.had_rank_up else 0.0
+        damage = pokemon.received_damage if pokemon.received_damage is not None else 0
+        out[_P_FLAGS + 14] = 1.0 if damage > 0 else 0.0
+        out[_P_FLAGS + 15] = pokemon.un_usable_move.id if pokemon.un_usable_move else 254
+
+    @staticmethod
+    def _pokemon_key(pokemon, sleep_turns: int) -> tuple:
+        # 포켓몬 구간의 값을 결정하는 입력 전부 (같으면 구간 내용도 같다)
+        base = pokemon.base
+        moves = base.moves[:4]
+        ab = base.ability
+        return (
+            getattr(base, 'id', None), ab.id if ab and hasattr(ab, 'id') else 0, tuple(base.types), base.hp,
+            tuple((m.id, m.pp, pokemon.pp.get(m.name, 0)) for m in moves),
+            pokemon.current_hp,
+            tuple(pokemon.rank.get(stat, 0) for stat in RANK_STATS),
+            tuple(pokemon.status),
+            sleep_turns,
+            pokemon.is_first_turn, pokemon.cannot_move, pokemon.is_charging, pokemon.is_active,
+            pokemon.charging_move.id if pokemon.charging_move else None,
+            pokemon.position,
+            pokemon.locked_move.id if pokemon.locked_move else None,
+            pokemon.used_move.id if pokemon.used_move else None,
+            pokemon.had_missed, pokemon.had_rank_up,
+            pokemon.received_damage,
+            pokemon.un_usable_move.id if pokemon.un_usable_move else None,
+        )
+
+    def _encode_move_types(self, pokemon) -> None:
+        key = tuple(move.type for move in pokemon.base.moves[:4])
+        if key == self._move_types_key:
+            return
+        self._move_types_key = key
+
+        out = self._buffer[MOVE_TYPES_OFFSET:]
+        out[:] = 0.0
+        for i, move_type in enumerate(key):
+            if move_type in TYPE_INDEX:
+                out[i * 18 + TYPE_INDEX[move_type]] = 1.0
+
+
+# ---------------------------------------------------------------------------
+# 여러 배틀을 한 번에 인코딩
+
+_HP_BINS_ARRAY = np.asarray(HP_BINS)
+
+# 포켓몬 1마리당 한 레코드. 객체 속성은 여기로 한 번만 모으고 원핫 변환은 numpy로 한꺼번에 한다
+POKEMON_DTYPE = np.dtype([
+    ("present", np.bool_),
+    ("species", np.int64),
+    ("ability", np.int64),
+    ("n_moves", np.int64),
+    ("move_id", np.int64, (4,)),
+    ("pp", np.int64, (4,)),
+    ("max_pp", np.int64, (4,)),
+    ("type_bits", np.int64),
+    ("current_hp", np.float64),
+    ("max_hp", np.float64),
+    ("rank", np.int64, (7,)),
+    ("status_bits", np.int64),  # BattlePokemon.status.bits 그대로
+    ("sleep_turns", np.int64),
+    ("position", np.int64),
+    ("flags", np.bool_, (7,)),  # first turn, must recharge, preparing, active, had missed, had rank up, received damage
+    ("move_ref", np.int64, (4,)),  # charging / locked / last used / unusable move id (없으면 254)
+])
+
+
+def _pokemon_record(pokemon, sleep_turns: int) -> tuple:
+    base = pokemon.base
+    moves = base.moves[:4]
+    ab = base.ability
+    type_bits = 0
+    for t in base.types:
+        if t in TYPE_INDEX:
+            type_bits |= 1 << TYPE_INDEX[t]
+    padding = [0] * (4 - len(moves))
+    damage = pokemon.received_damage if pokemon.received_damage is not None else 0
+    return (
+        True,
+        base.id if hasattr(base, 'id') else 0,
+        ab.id if ab and hasattr(ab, 'id') else 0,
+        len(moves),
+        [m.id for m in moves] + padding,
+        [pokemon.pp.get(m.name, 0) for m in moves] + padding,
+        [m.pp for m in moves] + padding,
+        type_bits,
+        pokemon.current_hp,
+        base.hp,
+        [int(pokemon.rank.get(stat, 0)) for stat in RANK_STATS],
+        pokemon.status.bits,
+        sleep_turns,
+        POSITION_INDEX.get(pokemon.position if pokemon.position else '없음', 0),
+        [
+            bool(pokemon.is_first_turn), bool(pokemon.cannot_move), bool(pokemon.is_charging), bool(pokemon.is_active),
+            bool(pokemon.had_missed), bool(pokemon.had_rank_up), damage > 0,
+        ],
+        [
+            move.id if move else 254
+            for move in (pokemon.charging_move, pokemon.locked_move, pokemon.used_move, pokemon.un_usable_move)
+        ],
+    )
+
+
+_EMPTY_RECORD = np.zeros((), dtype=POKEMON_DTYPE).item()
+
+
+def _encode_pokemon_batch(records: np.ndarray) -> np.ndarray:
+    """(M,) POKEMON_DTYPE 레코드 -> (M, 177) 포켓몬 구간"""
+    m = len(records)
+    rows = np.arange(m)
+    out = np.zeros((m, POKEMON_DIM), dtype=np.float32)
+
+    out[:, 0] = records["species"] / 1000.0
+    out[:, 1] = records["ability"] / 120.0
+    move_valid = np.arange(4)[None, :] < records["n_moves"][:, None]
+    out[:, _P_MOVES:_P_MOVES + 4] = np.where(move_valid, records["move_id"] / 253.0, 0.0)
+    # PP (4 × 5 one-hot), _pp_bin과 같은 구간
+    max_pp = records["max_pp"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(max_pp == 0, 0.0, records["pp"] / np.where(max_pp == 0, 1, max_pp))
+    pp_bin = np.where(max_pp == 0, 0, 1 + (ratio >= 0.25) + (ratio >= 0.5) + (ratio >= 0.75))
+    pp_bin = np.where(move_valid, pp_bin, 0)
+    for i in range(4):
+        out[rows, _P_PP + i * 5 + pp_bin[:, i]] = 1.0
+    out[:, _P_TYPES:_P_TYPES + 18] = (records["type_bits"][:, None] >> np.arange(18)) & 1
+    # HP (7 one-hot): np.digitize(right=True)와 같은 구간 규칙
+    max_hp = records["max_hp"]
+    hp_ratio = np.where(max_hp > 0, records["current_hp"] / np.where(max_hp > 0, max_hp, 1), 0.0)
+    hp_index = np.searchsorted(_HP_BINS_ARRAY, hp_ratio, side="left") - 1
+    valid = (hp_index >= 0) & (hp_index < 7)
+    out[rows[valid], _P_HP + hp_index[valid]] = 1.0
+    rank_index = records["rank"] + 6
+    for k in range(len(RANK_STATS)):
+        valid = (rank_index[:, k] >= 0) & (rank_index[:, k] < 13)
+        out[rows[valid], _P_RANK + k * 13 + rank_index[valid, k]] = 1.0
+    out[:, _P_VOLATILE:_P_VOLATILE + len(_STATUS_SHIFTS)] = (records["status_bits"][:, None] >> _STATUS_SHIFTS) & 1
+    out[:, _P_STATUS + 6] = records["current_hp"] == 0
+    sleep = records["sleep_turns"]
+    valid = (sleep >= 1) & (sleep < 4)
+    out[rows[valid], _P_SLEEP + sleep[valid]] = 1.0
+    flags = records["flags"]
+    move_ref = records["move_ref"]
+    out[:, _P_FLAGS:_P_FLAGS + 3] = flags[:, 0:3]
+    out[:, _P_FLAGS + 3] = move_ref[:, 0]
+    out[:, _P_FLAGS + 4] = flags[:, 3]
+    out[rows, _P_FLAGS + 5 + records["position"]] = 1.0
+    out[:, _P_FLAGS + 10] = move_ref[:, 1]
+    out[:, _P_FLAGS + 11] = move_ref[:, 2]
+    out[:, _P_FLAGS + 12:_P_FLAGS + 15] = flags[:, 4:7]
+    out[:, _P_FLAGS + 15] = move_ref[:, 3]
+
+    out[~records["present"]] = 0.0
+    return out
+
+
+def get_state_batch(contexts: Sequence[BattleContext], turns: Sequence[int]) -> np.ndarray:
+    """
+    여러 배틀의 상태 벡터를 한 번에 만든다.
+
+    Args:
+        contexts: 배틀별 BattleContext (팀, 액티브 포켓몬, 필드, 효과를 각 컨텍스트의 스토어에서 읽는다)
+        turns: 배틀별 턴 (YakemonEnv.turn). battle_store의 turn은 갱신되지 않으므로 반드시 넘긴다
+
+    Returns:
+        (N, 1237) float32. 각 행은 같은 배틀에 대한 get_state() 결과와 같다.
+    """
+    n = len(contexts)
+    out = np.zeros((n, STATE_DIM), dtype=np.float32)
+    if n == 0:
+        return out
+    rows = np.arange(n)
+
+    global_values = np.zeros((n, 4), dtype=np.int64)  # 턴, 날씨 코드(-1: 없음), 날씨 남은 턴, 필드 코드(-1: 없음)
+    room_turns = np.zeros(n, dtype=np.int64)
+    side_values = np.zeros((n, 2, 6), dtype=np.int64)
+    move_types = np.full((n, 4), -1, dtype=np.int64)
+    records = np.empty(n * 6, dtype=POKEMON_DTYPE)
+
+    for b, context in enumerate(contexts):
+        battle_store, duration_store = context.battle_store, context.duration_store
+        state: BattleStoreState = battle_store.get_state()
+        clipped_turn, weather, weather_turns, field, room = _global_values(state["public_env"], turns[b], duration_store)
+        global_values[b] = (
+            clipped_turn,
+            WEATHERS.index(weather) if weather in WEATHERS else -1,
+            weather_turns,
+            FIELDS.index(field) if field in FIELDS else -1,
+        )
+        room_turns[b] = room
+        for s, side in enumerate(("my", "enemy")):
+            side_values[b, s] = _side_field_values(state["my_env"] if side == "my" else state["enemy_env"], side, duration_store)
+            sleep_turns = duration_store.remaining_turn(side, "잠듦")
+            team = battle_store.get_team(side)
+            for i in range(3):
+                records[b * 6 + s * 3 + i] = _pokemon_record(team[i], sleep_turns) if i < len(team) else _EMPTY_RECORD
+        active = battle_store.get_team("my")[battle_store.get_active_index("my")]
+        for i, move in enumerate(active.base.moves[:4]):
+            move_types[b, i] = TYPE_INDEX.get(move.type, -1)
+
+    # --- 전역 ---
+    out[:, 0] = global_values[:, 0] / 30.0
+    weather_code, weather_turns, field_code = global_values[:, 1], global_values[:, 2], global_values[:, 3]
+    weather_index = np.where((weather_turns >= 1) & (weather_turns <= 5), weather_turns, 0)
+    room_index = np.where((room_turns >= 1) & (room_turns <= 5), room_turns, 0)
+    for k in range(len(WEATHERS)):
+        out[rows, 1 + k * 6 + np.where(weather_code == k, weather_index, 0)] = 1.0
+    for k in range(len(FIELDS)):
+        out[rows, 25 + k * 5 + np.where(field_code == k, k, 4)] = 1.0
+    out[rows, 45 + room_index] = 1.0
+
+    # --- 사이드 필드 ---
+    screen_index = np.where((side_values[:, :, 3:] >= 1) & (side_values[:, :, 3:] <= 5), side_values[:, :, 3:], 0)
+    for s, side in enumerate(("my", "enemy")):
+        offset = SIDE_OFFSETS[side]
+        out[:, offset] = side_values[:, s, 0]
+        out[rows, offset + 1 + side_values[:, s, 1]] = 1.0
+        out[rows, offset + 5 + side_values[:, s, 2]] = 1.0
+        for k in range(3):
+            out[rows, offset + 8 + k * 6 + screen_index[:, s, k]] = 1.0
+
+    # --- 포켓몬 (my 3, enemy 3) ---
+    out[:, POKEMON_OFFSET:MOVE_TYPES_OFFSET] = _encode_pokemon_batch(records).reshape(n, 6 * POKEMON_DIM)
+
+    # --- 액티브 포켓몬 기술 타입 ---
+    for i in range(4):
+        valid = move_types[:, i] >= 0
+        out[rows[valid], MOVE_TYPES_OFFSET + i * 18 + move_types[valid, i]] = 1.0
+    return out
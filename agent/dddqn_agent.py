@@ -69,8 +69,11 @@ class DDDQNAgent:
         - 이는 학습의 안정성을 높이고 Q값의 과대 추정을 방지하는 역할
     - memory_size: 리플레이 버퍼 크기 (기본값: 50000)
     - batch_size: 배치 크기 (기본값: 128)
+    - dedup_frames: True면 리플레이 버퍼에 state를 한 번씩만 저장 (기본값: False)
+    - state_codec: 리플레이 버퍼의 state 비트 압축 코덱 (기본값: None, RL.state_codec.StateCodec)
+    - replay_dir: 리플레이 버퍼를 memmap 파일로 둘 디렉터리, save() 때 함께 기록 (기본값: None)
     """
-    def __init__(self, state_dim, action_dim, learning_rate, gamma, epsilon_start, epsilon_end, epsilon_decay, target_update, memory_size, batch_size):
+    def __init__(self, state_dim, action_dim, learning_rate, gamma, epsilon_start, epsilon_end, epsilon_decay, target_update, memory_size, batch_size, dedup_frames=False, state_codec=None, replay_dir=None):
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         self.state_dim = state_dim
         self.action_dim = action_dim
@@ -90,7 +93,7 @@ class DDDQNAgent:
         self.optimizer = optim.Adam(self.policy_net.parameters(), lr=learning_rate)
         
         # 경험 리플레이 버퍼
-        self.memory = ReplayBuffer(memory_size)
+        self.memory = ReplayBuffer(memory_size, dedup_frames=dedup_frames, state_codec=state_codec, storage_dir=replay_dir)
         self.batch_size = batch_size
         
         # 타겟 네트워크 업데이트 관련
@@ -175,7 +178,31 @@ class DDDQNAgent:
                 mask[4 + i] = 0
         
         return mask
-    
+
+    def select_actions(self, states, action_masks, use_target=False):
+        """
+        YakemonVecEnv용 배치 ε-greedy 행동 선택. N개의 상태를 한 번의 forward로 처리합니다.
+
+        Args:
+            states: (N, state_dim) 상태 배열
+            action_masks: (N, action_dim) 가능한 행동 마스크 (YakemonVecEnv.step/reset 반환값)
+        """
+        action_masks = np.asarray(action_masks)
+        with torch.no_grad():
+            states = torch.as_tensor(np.asarray(states), dtype=torch.float32, device=self.device)
+            network = self.target_net if use_target else self.policy_net
+            q_values = network(states).cpu().numpy()
+
+        # 불가능한 행동은 select_action과 같은 값으로 마스킹
+        q_values[action_masks == 0] = float(-10)
+        actions = q_values.argmax(axis=1)
+
+        # 배틀별로 epsilon 확률만큼 가능한 행동 중 랜덤 선택
+        for i in np.nonzero(np.random.random(len(actions)) < self.epsilon)[0]:
+            valid_actions = np.flatnonzero(action_masks[i])
+            actions[i] = np.random.choice(valid_actions) if len(valid_actions) > 0 else 0
+        return actions
+
     def store_transition(self, state, action, reward, next_state, done):
         """경험을 리플레이 버퍼에 저장합니다."""
         experience = Experience(state, action, reward, next_state, done)
@@ -200,28 +227,37 @@ class DDDQNAgent:
         """탐험률을 감소시킵니다."""
         self.epsilon = max(self.epsilon_end, self.epsilon * self.epsilon_decay)
 
-    def train(self):
+    def train(self, batch=None):
         """
         네트워크를 학습합니다.
         리플레이 버퍼에 최소 배치 크기(batch_size) 이상의 샘플이 있을 때만 학습을 수행합니다.
         
+        Args:
+            batch: 리플레이 버퍼 대신 쓸 배치 (utils.offline_loader.ShardStreamLoader가 만드는
+                states / actions / rewards / next_states / dones dict). 주면 버퍼 크기와 상관없이 학습합니다.
+        
         Returns:
             float: 학습 손실값. 학습이 수행되지 않은 경우 0.0을 반환합니다.
         """
         # 최소 배치 크기 이상의 샘플이 있는지 확인
-        if len(self.memory) < self.batch_size:
+        if batch is None and len(self.memory) < self.batch_size:
             return 0.0
         
         try:
             # 배치 샘플링
-            states, actions, rewards, next_states, dones = self.memory.sample(self.batch_size)
+            if batch is None:
+                states, actions, rewards, next_states, dones = self.memory.sample(self.batch_size)
+            else:
+                states, actions, rewards, next_states, dones = (
+                    batch["states"], batch["actions"], batch["rewards"], batch["next_states"], batch["dones"]
+                )
             
-            # 텐서 변환
-            state_batch = torch.FloatTensor(states).to(self.device)
-            action_batch = torch.LongTensor(actions).to(self.device)
-            reward_batch = torch.FloatTensor(rewards).clamp(-50, 50).to(self.device)  # reward clipping 범위 확대
-            next_state_batch = torch.FloatTensor(next_states).to(self.device)
-            done_batch = torch.FloatTensor(dones).to(self.device)
+            # 텐서 변환 (pinned 텐서면 non_blocking으로 복사)
+            state_batch = torch.as_tensor(states, dtype=torch.float32).to(self.device, non_blocking=True)
+            action_batch = torch.as_tensor(actions, dtype=torch.long).to(self.device, non_blocking=True)
+            reward_batch = torch.as_tensor(rewards, dtype=torch.float32).to(self.device, non_blocking=True).clamp(-50, 50)  # reward clipping 범위 확대
+            next_state_batch = torch.as_tensor(next_states, dtype=torch.float32).to(self.device, non_blocking=True)
+            done_batch = torch.as_tensor(dones, dtype=torch.float32).to(self.device, non_blocking=True)
             
             # 디버그 정보 출력
             print(f"\nDebug - Batch Info:")
@@ -305,6 +341,8 @@ class DDDQNAgent:
             'epsilon': self.epsilon,
             'steps': self.steps
         }, path)
+        # replay_dir을 쓰면 리플레이 버퍼도 이 시점 상태로 기록
+        self.memory.flush()
         print(f"Model saved to {path}")
 
     def load(self, path: str) -> None:
@@ -0,0 +1,245 @@
+# agent/mcts_agent.py
+"""
+배틀 시뮬레이터(YakemonEnv.step_sync -> battle_sequence)를 모델로 쓰는 동시 행동 MCTS (decoupled UCT)
+
+- 노드마다 내 행동 / 상대 행동 통계를 따로 두고 두 쪽이 각자 독립적으로 행동을 고른다.
+  내 쪽은 네트워크 Q값의 softmax를 prior로 쓰는 PUCT, 상대 쪽은 내 보상을 최소화하는 UCT(균등 prior).
+- 노드는 env.state_hash()(context/state_key.py의 Zobrist 해시)로 transposition table에 저장한다. 데미지 난수 때문에 같은 (내 행동, 상대 행동)에서도
+  다른 자식으로 갈 수 있는데, 실제로 도착한 상태의 키로 노드를 찾으므로 그대로 처리된다.
+- 잎 평가는 leaf_batch개 playout을 virtual loss로 모아 네트워크 forward 한 번으로 한다.
+  잎 가치는 가능한 행동 중 최대 Q값 (DuelingDQN / rainbow Network 모두 forward가 Q값을 반환).
+- 탐색 예산은 playout 수(num_playouts)와 시간(time_budget, 초) 중 먼저 닿는 쪽.
+
+search() 후 env와 전역 random 상태는 탐색 전으로 돌아간다.
+"""
+import random
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+from env.battle_env import YakemonEnv
+
+
+def enemy_actions(env: YakemonEnv) -> List:
+    """상대가 현재 고를 수 있는 행동 (battle_sequence에 넘기는 형식: 기술 MoveInfo / 교체 dict)"""
+    active = env.battle_store.get_active_index("enemy")
+    pokemon = env.enemy_team[active]
+    actions = [move for move in pokemon.base.moves[:4] if pokemon.pp.get(move.name, 0) > 0]
+    actions += [
+        {"type": "switch", "index": i}
+        for i, p in enumerate(env.enemy_team)
+        if i != active and p.current_hp > 0
+    ]
+    return actions or [pokemon.base.moves[0]]
+
+
+class _Node:
+    """decoupled 노드: 내 행동 / 상대 행동마다 방문 수와 보상 합"""
+
+    def __init__(self, my_actions: np.ndarray, enemy_options: List):
+        self.my_actions = my_actions
+        self.enemy_actions = enemy_options
+        self.prior = np.full(len(my_actions), 1.0 / len(my_actions))
+        self.expanded = False
+        self.n = 0
+        self.my_n = np.zeros(len(my_actions))
+        self.my_w = np.zeros(len(my_actions))
+        self.enemy_n = np.zeros(len(enemy_options))
+        self.enemy_w = np.zeros(len(enemy_options))
+
+
+class _MinMax:
+    """트리에서 본 보상 합 범위로 Q값을 [0, 1]로 정규화 (보상 크기와 탐색 상수를 분리)"""
+
+    def __init__(self):
+        self.low, self.high = float("inf"), float("-inf")
+
+    def update(self, value: float) -> None:
+        self.low, self.high = min(self.low, value), max(self.high, value)
+
+    def normalize(self, values: np.ndarray) -> np.ndarray:
+        if self.high > self.low:
+            return (values - self.low) / (self.high - self.low)
+        return np.full_like(values, 0.5)
+
+
+class SearchResult(NamedTuple):
+    my_action: int              # 가장 많이 방문한 내 행동 (env.step 행동 번호)
+    enemy_action: object        # 가장 많이 방문한 상대 행동 (step의 enemy_action으로 그대로 사용 가능)
+    my_actions: np.ndarray      # 루트에서 가능한 내 행동
+    my_visits: np.ndarray       # 내 행동별 방문 수 (학습 target 정책으로 사용 가능)
+    enemy_actions: List
+    enemy_visits: np.ndarray
+    value: float                # 루트 평균 보상 합
+    playouts: int
+
+
+class MCTSAgent:
+    """
+    Args:
+        network: 상태 (N, state_dim) -> Q값 (N, 6) 모듈. None이면 prior는 균등, 잎 가치는 0
+        num_playouts: 수마다 playout 수 (None이면 time_budget만 사용)
+        time_budget: 수마다 탐색 시간(초)
+        leaf_batch: 네트워크 한 번에 평가할 잎 수
+        max_depth: playout 최대 턴 수 (넘으면 그 상태를 잎으로 평가)
+        c_puct: 탐색 상수
+        prior_temperature: prior = softmax(Q / temperature)
+        max_nodes: transposition table이 이보다 커지면 비운다
+    """
+
+    def __init__(
+        self,
+        network: Optional[nn.Module] = None,
+        num_playouts: Optional[int] = 200,
+        time_budget: Optional[float] = None,
+        leaf_batch: int = 16,
+        max_depth: int = 10,
+        gamma: float = 0.95,
+        c_puct: float = 1.5,
+        prior_temperature: float = 1.0,
+        max_nodes: int = 200_000,
+        device: Optional[torch.device] = None,
+    ):
+        if num_playouts is None and time_budget is None:
+            raise ValueError("num_playouts와 time_budget 중 하나는 지정해야 합니다")
+        self.network = network
+        self.num_playouts = num_playouts
+        self.time_budget = time_budget
+        self.leaf_batch = leaf_batch
+        self.max_depth = max_depth
+        self.gamma = gamma
+        self.c_puct = c_puct
+        self.prior_temperature = prior_temperature
+        self.max_nodes = max_nodes
+        self.device = device or (next(network.parameters()).device if network is not None else torch.device("cpu"))
+        self.table: Dict[int, _Node] = {}
+
+    def clear(self) -> None:
+        self.table.clear()
+
+    def __call__(self, env: YakemonEnv) -> int:
+        """env -> 행동 번호 정책 (generate_dataset.py의 policy로 사용 가능)"""
+        return self.search(env).my_action
+
+    def search(self, env: YakemonEnv) -> SearchResult:
+        if len(self.table) > self.max_nodes:
+            self.clear()
+        random_state, np_state = random.getstate(), np.random.get_state()
+        root_snapshot = env.snapshot()
+        try:
+            state = env._get_state()
+            root = self._node(env, env.state_hash())
+            if not root.expanded:
+                self._evaluate([([], root, state, env.get_action_mask())])
+            stats = _MinMax()
+            start = time.perf_counter()
+            playouts = 0
+            while not self._budget_spent(playouts, start):
+                batch = min(self.leaf_batch, self.num_playouts - playouts) if self.num_playouts else self.leaf_batch
+                leaves = []
+                for _ in range(batch):
+                    env.restore(root_snapshot)
+                    leaves.append(self._descend(env, root, stats))
+                self._evaluate(leaves, stats)
+                playouts += batch
+        finally:
+            env.restore(root_snapshot)
+            random.setstate(random_state)
+            np.random.set_state(np_state)
+
+        my_best = int(np.argmax(root.my_n))
+        enemy_best = int(np.argmax(root.enemy_n))
+        total = root.my_n.sum()
+        return SearchResult(
+            my_action=int(root.my_actions[my_best]),
+            enemy_action=root.enemy_actions[enemy_best],
+            my_actions=root.my_actions.copy(),
+            my_visits=root.my_n.copy(),
+            enemy_actions=list(root.enemy_actions),
+            enemy_visits=root.enemy_n.copy(),
+            value=float(root.my_w.sum() / total) if total else 0.0,
+            playouts=playouts,
+        )
+
+    def _budget_spent(self, playouts: int, start: float) -> bool:
+        if self.num_playouts is not None and playouts >= self.num_playouts:
+            return True
+        return self.time_budget is not None and time.perf_counter() - start >= self.time_budget
+
+    def _node(self, env: YakemonEnv, key: int) -> _Node:
+        node = self.table.get(key)
+        if node is None:
+            node = _Node(np.flatnonzero(env.get_action_mask()), enemy_actions(env))
+            self.table[key] = node
+        return node
+
+    def _select(self, node: _Node, stats: _MinMax) -> Tuple[int, int]:
+        sqrt_n = np.sqrt(node.n + 1)
+        my_q = np.where(node.my_n > 0, stats.normalize(node.my_w / np.maximum(node.my_n, 1)), 0.0)
+        my_score = my_q + self.c_puct * node.prior * sqrt_n / (1 + node.my_n)
+        # 상대는 내 보상을 낮추는 쪽을 고른다
+        enemy_q = np.where(node.enemy_n > 0, 1.0 - stats.normalize(node.enemy_w / np.maximum(node.enemy_n, 1)), 0.0)
+        enemy_score = enemy_q + self.c_puct * sqrt_n / (len(node.enemy_actions) * (1 + node.enemy_n))
+        return int(np.argmax(my_score)), int(np.argmax(enemy_score))
+
+    def _descend(self, env: YakemonEnv, root: _Node, stats: _MinMax):
+        """
+        root에서 잎까지 내려가고 (path, 펼칠 노드, 잎 상태, 잎 행동 마스크)를 반환.
+        방문 수는 내려가면서 미리 더해 두어(virtual loss) 같은 배치의 다른 playout이 다른 길로 가게 한다.
+        """
+        path = []
+        node = root
+        visited = {id(root)}
+        for _ in range(self.max_depth):
+            my_i, enemy_i = self._select(node, stats)
+            node.n += 1
+            node.my_n[my_i] += 1
+            node.enemy_n[enemy_i] += 1
+            state, reward, done, _ = env.step_sync(
+                int(node.my_actions[my_i]), enemy_action=node.enemy_actions[enemy_i], is_monte_carlo=True
+            )
+            path.append((node, my_i, enemy_i, reward))
+            if done:
+                return path, None, None, None
+            child = self._node(env, env.state_hash())
+            # 처음 온 노드이거나 이번 playout에서 이미 지난 노드(같은 국면으로 돌아온 경우)면 잎
+            if not child.expanded or id(child) in visited:
+                return path, (None if child.expanded else child), state, env.get_action_mask()
+            visited.add(id(child))
+            node = child
+        return path, None, state, env.get_action_mask()
+
+    def _evaluate(self, leaves, stats: Optional[_MinMax] = None) -> None:
+        """잎 상태를 한 번에 평가해 노드를 펼치고(prior) 가치를 path를 따라 역전파"""
+        evaluated = [i for i, leaf in enumerate(leaves) if leaf[2] is not None]
+        values = np.zeros(len(leaves))
+        if evaluated:
+            q = self._q_values(np.stack([leaves[i][2] for i in evaluated]))
+            for row, i in enumerate(evaluated):
+                _, node, _, mask = leaves[i]
+                legal = np.flatnonzero(mask)
+                values[i] = q[row, legal].max()
+                if node is not None and not node.expanded:
+                    logits = q[row, node.my_actions] / self.prior_temperature
+                    prior = np.exp(logits - logits.max())
+                    node.prior = prior / prior.sum()
+                    node.expanded = True
+
+        if stats is None:
+            return
+        for (path, _, _, _), value in zip(leaves, values):
+            ret = value
+            for node, my_i, enemy_i, reward in reversed(path):
+                ret = reward + self.gamma * ret
+                node.my_w[my_i] += ret
+                node.enemy_w[enemy_i] += ret
+                stats.update(ret)
+
+    def _q_values(self, states: np.ndarray) -> np.ndarray:
+        if self.network is None:
+            return np.zeros((len(states), 6))
+        with torch.no_grad():
+            return self.network(torch.as_tensor(states, dtype=torch.float32, device=self.device)).cpu().numpy()
@@ -2,7 +2,7 @@ import math
 import os
 import random
 from collections import deque
-from typing import Deque, Dict, List, Tuple
+from typing import Deque, Dict, List, Optional, Tuple
 
 import gymnasium as gym
 from gymnasium.spaces import MultiDiscrete
@@ -15,6 +15,7 @@ import torch.optim as optim
 from IPython.display import clear_output
 from torch.nn.utils import clip_grad_norm_
 
+from utils.replay_buffer import FrameStore, ReplayFiles, allocate_states
 from .segment_tree import MinSegmentTree, SumSegmentTree
 
 class ReplayBuffer:
@@ -26,15 +27,38 @@ class ReplayBuffer:
         size: int, 
         batch_size: int,
         n_step: int,
-        gamma: float
+        gamma: float,
+        dedup_frames: bool = False,
+        state_codec=None,
+        storage_dir: Optional[str] = None,
+        shared_frames: Optional[FrameStore] = None,
     ):
-        self.obs_buf = np.zeros([size, obs_dim], dtype=np.float32)
-        self.next_obs_buf = np.zeros([size, obs_dim], dtype=np.float32)
-        self.acts_buf = np.zeros([size], dtype=np.float32)
-        self.rews_buf = np.zeros([size], dtype=np.float32)
-        self.done_buf = np.zeros(size, dtype=np.float32)
+        # dedup_frames: obs를 FrameStore에 한 번씩만 저장 (n-step next_obs는 n칸 뒤 obs를 참조)
+        # state_codec: obs를 비트 압축해서 저장 (RL.state_codec.StateCodec)
+        # storage_dir: 배열을 memmap 파일로 두고 flush() 시점부터 이어서 사용
+        # shared_frames: 같은 slot에 같은 obs를 쓰는 다른 버퍼의 FrameStore와 obs 배열을 공유 (dedup_frames일 때)
+        if storage_dir is not None and (dedup_frames or state_codec is not None):
+            raise ValueError("storage_dir은 dedup_frames / state_codec과 함께 쓸 수 없습니다.")
+        self.frame_store = FrameStore(
+            size, horizon=max(n_step, 1), state_codec=state_codec, shared_frames=shared_frames
+        ) if dedup_frames else None
+        self.files = ReplayFiles(storage_dir, size) if storage_dir is not None else None
         self.max_size, self.batch_size = size, batch_size
         self.ptr, self.size, = 0, 0
+        if self.files is not None:
+            self.obs_buf = self.files.array("obs", (obs_dim,), np.float32)
+            self.next_obs_buf = self.files.array("next_obs", (obs_dim,), np.float32)
+            self.acts_buf = self.files.array("actions", dtype=np.float32)
+            self.rews_buf = self.files.array("rewards", dtype=np.float32)
+            self.done_buf = self.files.array("dones", dtype=np.float32)
+            self.ptr, self.size = self.files.get("ptr", 0), self.files.get("size", 0)
+        else:
+            if self.frame_store is None:
+                self.obs_buf = allocate_states(size, np.zeros(obs_dim), state_codec)
+                self.next_obs_buf = allocate_states(size, np.zeros(obs_dim), state_codec)
+            self.acts_buf = np.zeros([size], dtype=np.float32)
+            self.rews_buf = np.zeros([size], dtype=np.float32)
+            self.done_buf = np.zeros(size, dtype=np.float32)
         
         # for N-step Learning
         self.n_step_buffer = deque(maxlen=n_step)
@@ -62,8 +86,11 @@ class ReplayBuffer:
         )
         obs, act = self.n_step_buffer[0][:2]
         
-        self.obs_buf[self.ptr] = obs
-        self.next_obs_buf[self.ptr] = next_obs
+        if self.frame_store is not None:
+            self.frame_store.write(self.ptr, obs, next_obs)
+        else:
+            self.obs_buf[self.ptr] = obs
+            self.next_obs_buf[self.ptr] = next_obs
         self.acts_buf[self.ptr] = act
         self.rews_buf[self.ptr] = rew
         self.done_buf[self.ptr] = done
@@ -76,8 +103,8 @@ class ReplayBuffer:
         idxs = np.random.choice(self.size, size=self.batch_size, replace=False)
 
         return dict(
-            obs=self.obs_buf[idxs],
-            next_obs=self.next_obs_buf[idxs],
+            obs=self._obs(idxs),
+            next_obs=self._next_obs(idxs),
             acts=self.acts_buf[idxs],
             rews=self.rews_buf[idxs],
             done=self.done_buf[idxs],
@@ -90,8 +117,8 @@ class ReplayBuffer:
     ) -> Dict[str, np.ndarray]:
         # for N-step Learning
         return dict(
-            obs=self.obs_buf[idxs],
-            next_obs=self.next_obs_buf[idxs],
+            obs=self._obs(idxs),
+            next_obs=self._next_obs(idxs),
             acts=self.acts_buf[idxs],
             rews=self.rews_buf[idxs],
             done=self.done_buf[idxs],
@@ -112,6 +139,24 @@ class ReplayBuffer:
 
         return rew, next_obs, done
 
+    def _header_values(self) -> Dict:
+        return dict(ptr=self.ptr, size=self.size)
+
+    def flush(self) -> None:
+        """storage_dir을 쓰는 경우 배열과 ptr / size를 디스크에 기록 (n_step_buffer는 저장하지 않음)"""
+        if self.files is not None:
+            self.files.save(**self._header_values())
+
+    def _obs(self, idxs) -> np.ndarray:
+        if self.frame_store is not None:
+            return self.frame_store.obs(idxs)
+        return self.obs_buf[idxs]
+
+    def _next_obs(self, idxs) -> np.ndarray:
+        if self.frame_store is not None:
+            return self.frame_store.next_obs(idxs)
+        return self.next_obs_buf[idxs]
+
     def __len__(self) -> int:
         return self.size
 
@@ -135,13 +180,16 @@ class PrioritizedReplayBuffer(ReplayBuffer):
         alpha: float,
         n_step: int,
         gamma: float,
-        prior_eps: float
+        prior_eps: float,
+        dedup_frames: bool = False,
+        state_codec=None,
+        storage_dir: Optional[str] = None
     ):
         """Initialization."""
         assert alpha >= 0
         
         super(PrioritizedReplayBuffer, self).__init__(
-            obs_dim, size, batch_size, n_step, gamma
+            obs_dim, size, batch_size, n_step, gamma, dedup_frames, state_codec, storage_dir
         )
         self.max_priority, self.tree_ptr = 1.0, 0
         self.alpha = alpha
@@ -156,9 +204,17 @@ class PrioritizedReplayBuffer(ReplayBuffer):
         self.min_tree = MinSegmentTree(tree_capacity)
         
         # Initialize all priorities to max_priority
-        for i in range(self.max_size):
-            self.sum_tree[i] = self.max_priority ** self.alpha
-            self.min_tree[i] = self.max_priority ** self.alpha
+        if self.files is not None:
+            # 잎 값(priority ** alpha)을 파일에도 두고, 다시 열 때 트리를 그 값으로 재구성
+            self.max_priority = self.files.get("max_priority", self.max_priority)
+            self.tree_ptr = self.files.get("tree_ptr", self.tree_ptr)
+            self.priorities = self.files.array("priorities", dtype=np.float64, fill=self.max_priority ** self.alpha)
+            leaves = np.asarray(self.priorities)
+        else:
+            self.priorities = None
+            leaves = np.full(self.max_size, self.max_priority ** self.alpha)
+        self.sum_tree.update_batch(np.arange(self.max_size), leaves)
+        self.min_tree.update_batch(np.arange(self.max_size), leaves)
 
     def store(
         self, 
@@ -174,29 +230,26 @@ class PrioritizedReplayBuffer(ReplayBuffer):
         if transition:
             self.sum_tree[self.tree_ptr] = self.max_priority ** self.alpha
             self.min_tree[self.tree_ptr] = self.max_priority ** self.alpha
+            if self.priorities is not None:
+                self.priorities[self.tree_ptr] = self.max_priority ** self.alpha
             self.tree_ptr = (self.tree_ptr + 1) % self.max_size
         
         return transition
 
-    def _sample_proportional(self) -> List[int]:
+    def _sample_proportional(self) -> np.ndarray:
         """Sample indices based on proportions."""
-        indices = []
         p_total = self.sum_tree.sum(0, len(self) - 1)
         if p_total <= 0:  # Handle case where sum is zero or negative
             p_total = self.max_priority ** self.alpha * len(self)
             
         segment = p_total / self.batch_size
         
-        for i in range(self.batch_size):
-            a = segment * i
-            b = segment * (i + 1)
-            upperbound = random.uniform(a, b)
-            idx = self.sum_tree.retrieve(upperbound)
-            # Ensure index is within valid range
-            idx = min(idx, len(self) - 1)
-            indices.append(idx)
-            
-        return indices
+        # 구간 [segment * i, segment * (i + 1))마다 하나씩 뽑아 한 번에 retrieve
+        a = segment * np.arange(self.batch_size)
+        upperbounds = np.random.uniform(a, a + segment)
+        indices = self.sum_tree.retrieve_batch(upperbounds)
+        # Ensure index is within valid range
+        return np.minimum(indices, len(self) - 1)
 
     def sample_batch(self, beta: float = 0.4) -> Dict[str, np.ndarray]:
         """Sample a batch of experiences."""
@@ -205,15 +258,12 @@ class PrioritizedReplayBuffer(ReplayBuffer):
         
         indices = self._sample_proportional()
         
-        # Ensure all indices are within valid range
-        indices = [min(idx, len(self) - 1) for idx in indices]
-        
-        obs = self.obs_buf[indices]
-        next_obs = self.next_obs_buf[indices]
+        obs = self._obs(indices)
+        next_obs = self._next_obs(indices)
         acts = self.acts_buf[indices]
         rews = self.rews_buf[indices]
         done = self.done_buf[indices]
-        weights = np.array([self._calculate_weight(i, beta) for i in indices])
+        weights = self._calculate_weights(indices, beta)
         
         return dict(
             obs=obs,
@@ -229,27 +279,35 @@ class PrioritizedReplayBuffer(ReplayBuffer):
         """Update priorities of sampled transitions."""
         assert len(indices) == len(priorities)
 
+        indices = np.asarray(indices, dtype=np.int64)
         # Ensure all priorities are positive
-        priorities = np.maximum(priorities, self.prior_eps)
+        priorities = np.maximum(np.asarray(priorities, dtype=np.float64).reshape(-1), self.prior_eps)
+        assert ((0 <= indices) & (indices < len(self))).all()
         
-        for idx, priority in zip(indices, priorities):
-            assert 0 <= idx < len(self)
-            self.sum_tree[idx] = priority ** self.alpha
-            self.min_tree[idx] = priority ** self.alpha
-            self.max_priority = max(self.max_priority, priority)
+        self.sum_tree.update_batch(indices, priorities ** self.alpha)
+        self.min_tree.update_batch(indices, priorities ** self.alpha)
+        if self.priorities is not None:
+            self.priorities[indices] = priorities ** self.alpha
+        self.max_priority = max(self.max_priority, float(priorities.max()))
+
+    def _header_values(self) -> Dict:
+        return dict(super()._header_values(), max_priority=self.max_priority, tree_ptr=self.tree_ptr)
             
     def _calculate_weight(self, idx: int, beta: float):
         """Calculate the weight of the experience at idx."""
-        # get max weight
-        p_min = self.min_tree.min() / self.sum_tree.sum()
+        return float(self._calculate_weights(np.array([idx]), beta)[0])
+
+    def _calculate_weights(self, indices: np.ndarray, beta: float) -> np.ndarray:
+        """Calculate the weights of the experiences at indices."""
+        # get max weight (전체 합 / 최솟값은 트리 루트에 캐시되어 있음)
+        p_total = self.sum_tree.sum()
+        p_min = self.min_tree.min() / p_total
         max_weight = (p_min * len(self)) ** (-beta)
         
         # calculate weights
-        p_sample = self.sum_tree[idx] / self.sum_tree.sum()
-        weight = (p_sample * len(self)) ** (-beta)
-        weight = weight / max_weight
-        
-        return weight
+        p_sample = self.sum_tree.get_batch(indices) / p_total
+        weights = (p_sample * len(self)) ** (-beta)
+        return weights / max_weight
     
 
 class NoisyLinear(nn.Module):
@@ -444,6 +502,12 @@ class DQNAgent:
         n_step: int,
         # Learning rate
         learning_rate: float,
+        # obs를 한 번씩만 저장하는 리플레이 모드
+        dedup_frames: bool = False,
+        # obs 비트 압축 저장 (RL.state_codec.StateCodec)
+        state_codec=None,
+        # 리플레이 버퍼를 memmap 파일로 둘 디렉터리 (재시작 시 이어서 사용)
+        replay_dir: Optional[str] = None,
     ):
         """Initialization."""
         # 환경의 observation_space에서 상태 벡터 크기를 가져옴
@@ -472,8 +536,13 @@ class DQNAgent:
         # memory for 1-step Learning
         self.beta = beta
         self.prior_eps = prior_eps
+        # 기본 설정에서 memory는 n_step 창으로 저장한다 (memory_n보다 n-1칸 늦게 쓰인다).
+        # dedup_frames일 때는 memory_n과 프레임 배열을 공유하므로, 두 버퍼가 같은 slot에 같은 obs를 쓰도록 1-step으로 둔다
         self.memory = PrioritizedReplayBuffer(
-            obs_dim, memory_size, batch_size, alpha=alpha, gamma=gamma, prior_eps=prior_eps, n_step=n_step
+            obs_dim, memory_size, batch_size, alpha=alpha, gamma=gamma, prior_eps=prior_eps,
+            n_step=1 if dedup_frames else n_step,
+            dedup_frames=dedup_frames, state_codec=state_codec,
+            storage_dir=os.path.join(replay_dir, "memory") if replay_dir else None
         )
         
         # memory for N-step Learning
@@ -481,7 +550,11 @@ class DQNAgent:
         if self.use_n_step:
             self.n_step = n_step
             self.memory_n = ReplayBuffer(
-                obs_dim, memory_size, batch_size, n_step=n_step, gamma=gamma
+                obs_dim, memory_size, batch_size, n_step=n_step, gamma=gamma,
+                dedup_frames=dedup_frames, state_codec=state_codec,
+                storage_dir=os.path.join(replay_dir, "memory_n") if replay_dir else None,
+                # obs는 memory와 같으므로 프레임 배열을 한 벌만 둔다
+                shared_frames=self.memory.frame_store,
             )
         
         # Categorical DQN parameters
@@ -514,6 +587,12 @@ class DQNAgent:
         # 타겟 네트워크 업데이트 관련
         self.steps = 0
 
+    def flush_memory(self) -> None:
+        """replay_dir을 쓰는 경우 리플레이 버퍼를 디스크에 기록"""
+        self.memory.flush()
+        if self.use_n_step:
+            self.memory_n.flush()
+
     def _get_action_mask(self, store):
         """현재 상태에서 가능한 행동들의 마스크를 반환합니다."""
         mask = np.ones(6, dtype=np.int32)
@@ -598,8 +677,15 @@ class DQNAgent:
     
         return next_state, reward, done
 
-    def update_model(self) -> torch.Tensor:
-        """Update the model by gradient descent."""
+    def update_model(self, batch: Optional[Dict[str, torch.Tensor]] = None) -> torch.Tensor:
+        """Update the model by gradient descent.
+
+        batch를 주면 (utils.offline_loader.ShardStreamLoader의 states / actions / rewards / next_states / dones)
+        리플레이 버퍼 대신 그 배치로 1-step 손실만 학습하고 우선순위는 갱신하지 않는다.
+        """
+        if batch is not None:
+            return self._update_from_batch(batch)
+
         # PER needs beta to calculate weights
         samples = self.memory.sample_batch(self.beta)
         weights = torch.FloatTensor(
@@ -649,6 +735,28 @@ class DQNAgent:
 
         return loss.item()
         
+    def _update_from_batch(self, batch: Dict[str, torch.Tensor]) -> float:
+        """오프라인 배치로 한 번 학습 (가중치 1, n-step / PER 없이)"""
+        samples = dict(
+            obs=batch["states"], next_obs=batch["next_states"], acts=batch["actions"],
+            rews=batch["rewards"], done=batch["dones"],
+        )
+        loss = torch.mean(self._compute_dqn_loss(samples, self.gamma))
+
+        self.optimizer.zero_grad()
+        loss.backward()
+        clip_grad_norm_(self.dqn.parameters(), 10.0)
+        self.optimizer.step()
+
+        # NoisyNet: reset noise
+        self.dqn.reset_noise()
+        self.dqn_target.reset_noise()
+
+        self.steps += 1
+        if self.steps % self.target_update == 0:
+            self._target_hard_update()
+        return loss.item()
+
     async def train(self, num_frames: int, plotting_interval: int = 200):
         """Train the agent."""
         self.is_test = False
@@ -722,11 +830,13 @@ class DQNAgent:
     def _compute_dqn_loss(self, samples: Dict[str, np.ndarray], gamma: float) -> torch.Tensor:
         """Return categorical dqn loss."""
         device = self.device  # for shortening the following lines
-        state = torch.FloatTensor(samples["obs"]).to(device)
-        next_state = torch.FloatTensor(samples["next_obs"]).to(device)
-        action = torch.LongTensor(samples["acts"]).to(device)
-        reward = torch.FloatTensor(samples["rews"].reshape(-1, 1)).to(device)
-        done = torch.FloatTensor(samples["done"].reshape(-1, 1)).to(device)
+        # numpy 배열과 (pinned) 텐서 모두 받는다
+        state = torch.as_tensor(samples["obs"], dtype=torch.float32).to(device, non_blocking=True)
+        next_state = torch.as_tensor(samples["next_obs"], dtype=torch.float32).to(device, non_blocking=True)
+        action = torch.as_tensor(samples["acts"]).long().to(device, non_blocking=True)
+        reward = torch.as_tensor(samples["rews"], dtype=torch.float32).reshape(-1, 1).to(device, non_blocking=True)
+        done = torch.as_tensor(samples["done"], dtype=torch.float32).reshape(-1, 1).to(device, non_blocking=True)
+        batch_size = state.shape[0]
         
         # Categorical DQN algorithm
         delta_z = float(self.v_max - self.v_min) / (self.atom_size - 1)
@@ -735,7 +845,7 @@ class DQNAgent:
             # Double DQN
             next_action = self.dqn(next_state).argmax(1)
             next_dist = self.dqn_target.dist(next_state)
-            next_dist = next_dist[range(self.batch_size), next_action]
+            next_dist = next_dist[range(batch_size), next_action]
 
             t_z = reward + (1 - done) * gamma * self.support
             t_z = t_z.clamp(min=self.v_min, max=self.v_max)
@@ -745,10 +855,10 @@ class DQNAgent:
 
             offset = (
                 torch.linspace(
-                    0, (self.batch_size - 1) * self.atom_size, self.batch_size
+                    0, (batch_size - 1) * self.atom_size, batch_size
                 ).long()
                 .unsqueeze(1)
-                .expand(self.batch_size, self.atom_size)
+                .expand(batch_size, self.atom_size)
                 .to(self.device)
             )
 
@@ -762,7 +872,7 @@ class DQNAgent:
             proj_dist = proj_dist + 1e-6  # Add small epsilon to avoid zero values
 
         dist = self.dqn.dist(state)
-        log_p = torch.log(dist[range(self.batch_size), action] + 1e-6)  # Add small epsilon to avoid log(0)
+        log_p = torch.log(dist[range(batch_size), action] + 1e-6)  # Add small epsilon to avoid log(0)
         elementwise_loss = -(proj_dist * log_p).sum(1)
 
         return elementwise_loss
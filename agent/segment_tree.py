@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 """Segment tree for Prioritized Replay Buffer."""
 
-import operator
 from typing import Callable
 import numpy as np
 
@@ -12,10 +11,14 @@ class SegmentTree:
     Taken from OpenAI baselines github repository:
     https://github.com/openai/baselines/blob/master/baselines/common/segment_tree.py
 
+    트리는 numpy 배열 하나(크기 2 * capacity, 1번이 루트)에 저장한다.
+    루트 값이 곧 전체 구간 결과라 sum() / min()은 O(1)이고,
+    update_batch()는 잎을 한 번에 바꾼 뒤 부모 층을 numpy로 한 층씩 다시 계산한다.
+
     Attributes:
         capacity (int)
-        tree (list)
-        operation (function)
+        tree (np.ndarray)
+        operation (np.ufunc)
 
     """
 
@@ -24,7 +27,7 @@ class SegmentTree:
 
         Args:
             capacity (int)
-            operation (function)
+            operation (np.ufunc): 두 값(또는 배열)을 합치는 ufunc (np.add, np.minimum)
             init_value (float)
 
         """
@@ -32,34 +35,31 @@ class SegmentTree:
             capacity > 0 and capacity & (capacity - 1) == 0
         ), "capacity must be positive and a power of 2."
         self.capacity = capacity
-        self.tree = [init_value for _ in range(2 * capacity)]
+        self.tree = np.full(2 * capacity, init_value, dtype=np.float64)
         self.operation = operation
-
-    def _operate_helper(
-        self, start: int, end: int, node: int, node_start: int, node_end: int
-    ) -> float:
-        """Returns result of operation in segment."""
-        if start == node_start and end == node_end:
-            return self.tree[node]
-        mid = (node_start + node_end) // 2
-        if end <= mid:
-            return self._operate_helper(start, end, 2 * node, node_start, mid)
-        else:
-            if mid + 1 <= start:
-                return self._operate_helper(start, end, 2 * node + 1, mid + 1, node_end)
-            else:
-                return self.operation(
-                    self._operate_helper(start, mid, 2 * node, node_start, mid),
-                    self._operate_helper(mid + 1, end, 2 * node + 1, mid + 1, node_end),
-                )
+        self.init_value = init_value
 
     def operate(self, start: int = 0, end: int = 0) -> float:
         """Returns result of applying `self.operation`."""
         if end <= 0:
             end += self.capacity
         end -= 1
-
-        return self._operate_helper(start, end, 1, 0, self.capacity - 1)
+        if start == 0 and end == self.capacity - 1:
+            return float(self.tree[1])
+
+        # 아래에서 위로 올라가며 [start, end] 구간을 덮는 노드만 합친다
+        result = self.init_value
+        lo, hi = start + self.capacity, end + self.capacity + 1
+        while lo < hi:
+            if lo & 1:
+                result = self.operation(result, self.tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                result = self.operation(result, self.tree[hi])
+            lo //= 2
+            hi //= 2
+        return float(result)
 
     def __setitem__(self, idx: int, val: float):
         """Set value in tree."""
@@ -75,7 +75,22 @@ class SegmentTree:
         """Get real value in leaf node of tree."""
         assert 0 <= idx < self.capacity
 
-        return self.tree[self.capacity + idx]
+        return float(self.tree[self.capacity + idx])
+
+    def get_batch(self, indices) -> np.ndarray:
+        """여러 잎의 값을 한 번에 가져온다"""
+        return self.tree[self.capacity + np.asarray(indices, dtype=np.int64)]
+
+    def update_batch(self, indices, values):
+        """여러 잎을 한 번에 바꾼다 (같은 인덱스가 여러 번 있으면 마지막 값)"""
+        nodes = np.asarray(indices, dtype=np.int64) + self.capacity
+        if nodes.size == 0:
+            return
+        self.tree[nodes] = values
+        # 잎은 모두 같은 깊이라 한 층씩 올라가면 동시에 루트에 닿는다 (중복 부모는 같은 값을 다시 쓸 뿐)
+        while nodes[0] > 1:
+            nodes = nodes // 2
+            self.tree[nodes] = self.operation(self.tree[2 * nodes], self.tree[2 * nodes + 1])
 
 
 class SumSegmentTree(SegmentTree):
@@ -94,7 +109,7 @@ class SumSegmentTree(SegmentTree):
 
         """
         super(SumSegmentTree, self).__init__(
-            capacity=capacity, operation=operator.add, init_value=0.0
+            capacity=capacity, operation=np.add, init_value=0.0
         )
 
     def sum(self, start: int = 0, end: int = 0) -> float:
@@ -103,27 +118,28 @@ class SumSegmentTree(SegmentTree):
 
     def retrieve(self, upperbound: float) -> int:
         """Find the highest index `i` about upper bound in the tree"""
+        return int(self.retrieve_batch(np.array([upperbound], dtype=np.float64))[0])
+
+    def retrieve_batch(self, upperbounds) -> np.ndarray:
+        """retrieve()를 여러 upperbound에 대해 한 번에 (트리 깊이만큼의 numpy 연산)"""
+        upperbounds = np.array(upperbounds, dtype=np.float64)
         # Handle edge cases
-        if np.isnan(upperbound) or upperbound < 0:
-            upperbound = 0.0
-        total_sum = self.sum()
+        upperbounds[np.isnan(upperbounds) | (upperbounds < 0)] = 0.0
+        total_sum = self.tree[1]
         if total_sum <= 0:
-            return 0
-        upperbound = min(upperbound, total_sum)
+            return np.zeros(len(upperbounds), dtype=np.int64)
+        np.minimum(upperbounds, total_sum, out=upperbounds)
 
-        idx = 1
-        while idx < self.capacity:  # while non-leaf
+        idx = np.ones(len(upperbounds), dtype=np.int64)
+        while idx[0] < self.capacity:  # while non-leaf (모든 원소가 같은 깊이)
             left = 2 * idx
-            right = left + 1
-            if self.tree[left] > upperbound:
-                idx = 2 * idx
-            else:
-                upperbound -= self.tree[left]
-                idx = right
-        
+            left_value = self.tree[left]
+            go_left = left_value > upperbounds
+            upperbounds = np.where(go_left, upperbounds, upperbounds - left_value)
+            idx = np.where(go_left, left, left + 1)
+
         # Ensure the returned index is within valid range
-        leaf_idx = idx - self.capacity
-        return min(leaf_idx, self.capacity - 1)
+        return np.minimum(idx - self.capacity, self.capacity - 1)
 
 
 class MinSegmentTree(SegmentTree):
@@ -142,9 +158,9 @@ class MinSegmentTree(SegmentTree):
 
         """
         super(MinSegmentTree, self).__init__(
-            capacity=capacity, operation=min, init_value=float("inf")
+            capacity=capacity, operation=np.minimum, init_value=float("inf")
         )
 
     def min(self, start: int = 0, end: int = 0) -> float:
         """Returns min(arr[start], ...,  arr[end])."""
-        return super(MinSegmentTree, self).operate(start, end)
\ No newline at end of file
+        return super(MinSegmentTree, self).operate(start, end)
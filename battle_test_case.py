@@ -0,0 +1,42 @@
+# battle_test_case.py
+"""
+테스트 공용 베이스 클래스
+
+- SilentTestCase: 테스트 동안 시뮬레이터 로그를 끄고, seed가 있으면 random / np.random을 고정한다.
+- BattleTestCase: 독립 BattleContext로 만든 YakemonEnv를 reset한 상태로 준비한다.
+"""
+import random
+import unittest
+from typing import Optional
+
+import numpy as np
+
+from context.battle_context import BattleContext
+from env.battle_env import YakemonEnv
+from utils.battle_logger import set_silent
+
+
+class SilentTestCase(unittest.TestCase):
+    seed: Optional[int] = None
+
+    def setUp(self):
+        set_silent()
+        if self.seed is not None:
+            random.seed(self.seed)
+            np.random.seed(self.seed)
+
+    def tearDown(self):
+        set_silent(False)
+
+
+class BattleTestCase(SilentTestCase):
+    """self.env / self.state(reset 관측) / self.store / self.durations를 준비"""
+
+    seed = 0
+
+    def setUp(self):
+        super().setUp()
+        self.env = YakemonEnv(context=BattleContext())
+        self.state = self.env.reset()
+        self.store = self.env.battle_store
+        self.durations = self.env.duration_store
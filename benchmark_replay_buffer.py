@@ -0,0 +1,97 @@
+#%% [markdown]
+# 리플레이 버퍼 push / sample 처리량 측정
+# 사용법: python benchmark_replay_buffer.py --capacity 1000000 --state-dim 1237
+# (1M x 1237이면 state / next_state 배열만 약 10GB이므로 메모리가 부족하면 --state-dim을 줄여서 측정)
+
+#%%
+import argparse
+import random
+import time
+
+import numpy as np
+
+from utils.replay_buffer import ReplayBuffer
+
+
+class ListReplayBuffer:
+    """비교용: 이전 구현 (튜플 리스트 + pop(0), sample마다 np.array로 다시 쌓음)"""
+
+    def __init__(self, size):
+        self.buffer = []
+        self.max_size = size
+
+    def push(self, transition):
+        if len(self.buffer) >= self.max_size:
+            self.buffer.pop(0)
+        self.buffer.append(transition)
+
+    def sample(self, batch_size):
+        batch = random.sample(self.buffer, batch_size)
+        states, actions, rewards, next_states, dones = zip(*batch)
+        return np.array(states), np.array(actions), np.array(rewards), np.array(next_states), np.array(dones)
+
+    def __len__(self):
+        return len(self.buffer)
+
+
+def make_transitions(count, state_dim):
+    # 미리 만든 상태를 돌려 쓰며 transition 생성 (생성 비용은 측정에서 제외)
+    pool = np.random.random((256, state_dim)).astype(np.float32)
+    return [
+        (pool[i % 256], i % 6, float(i % 7) - 3.0, pool[(i + 1) % 256], i % 50 == 0)
+        for i in range(count)
+    ]
+
+
+def run(buffer, capacity, extra_pushes, samples, batch_size, state_dim):
+    results = {}
+    fill = make_transitions(capacity, state_dim)
+    start = time.perf_counter()
+    for transition in fill:
+        buffer.push(transition)
+    results["fill push/s"] = capacity / (time.perf_counter() - start)
+    del fill
+
+    # 가득 찬 상태에서의 push (오래된 transition 제거 비용 포함)
+    extra = make_transitions(extra_pushes, state_dim)
+    start = time.perf_counter()
+    for transition in extra:
+        buffer.push(transition)
+    results["full push/s"] = extra_pushes / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(samples):
+        buffer.sample(batch_size)
+    elapsed = time.perf_counter() - start
+    results["sample batch/s"] = samples / elapsed
+    results["sample transition/s"] = samples * batch_size / elapsed
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--capacity", type=int, default=1_000_000)
+    parser.add_argument("--state-dim", type=int, default=1237)
+    parser.add_argument("--extra-pushes", type=int, default=20_000)
+    parser.add_argument("--samples", type=int, default=2_000)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--skip-legacy", action="store_true", help="이전 리스트 구현 측정 생략")
+    parser.add_argument("--dedup-frames", action="store_true", help="state를 한 번씩만 저장하는 버퍼도 측정")
+    args = parser.parse_args()
+
+    random.seed(0)
+    np.random.seed(0)
+    buffers = [("ring", ReplayBuffer)]
+    if args.dedup_frames:
+        buffers.append(("ring-dedup", lambda size: ReplayBuffer(size, dedup_frames=True)))
+    if not args.skip_legacy:
+        buffers.append(("list", ListReplayBuffer))
+
+    print(f"capacity={args.capacity:,} state_dim={args.state_dim} batch_size={args.batch_size}")
+    for name, buffer_cls in buffers:
+        results = run(buffer_cls(args.capacity), args.capacity, args.extra_pushes, args.samples, args.batch_size, args.state_dim)
+        print(f"[{name}] " + ", ".join(f"{key}: {value:,.0f}" for key, value in results.items()))
+
+
+if __name__ == "__main__":
+    main()
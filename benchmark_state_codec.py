@@ -0,0 +1,79 @@
+#%% [markdown]
+# 상태 벡터 저장 방식별 메모리 / 처리량 비교 (float32 obs_buf vs 비트 압축)
+# 사용법: python benchmark_state_codec.py --capacity 200000 --episodes 20
+# 랜덤 행동으로 실제 배틀을 돌려 상태를 모은 뒤 capacity만큼 반복해서 채운다
+
+#%%
+import argparse
+import contextlib
+import io
+import random
+import time
+
+import numpy as np
+
+from context.battle_context import BattleContext
+from env.battle_env import YakemonEnv
+from RL.state_codec import StateCodec
+from RL.state_encoder import STATE_DIM
+
+
+def collect_states(episodes):
+    states = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        env = YakemonEnv(context=BattleContext())
+        for _ in range(episodes):
+            state = env.reset()
+            done = False
+            while not done:
+                states.append(np.array(state, dtype=np.float32))
+                state, _, done, _ = env.step_sync(random.randrange(6), test=True)
+    return np.stack(states)
+
+
+def run(storage, pool, capacity, samples, batch_size):
+    results = {}
+    start = time.perf_counter()
+    for i in range(capacity):
+        storage[i] = pool[i % len(pool)]
+    results["write state/s"] = capacity / (time.perf_counter() - start)
+
+    rng = np.random.default_rng(0)
+    batches = [rng.integers(0, capacity, batch_size) for _ in range(samples)]
+    start = time.perf_counter()
+    for indices in batches:
+        storage[indices]
+    elapsed = time.perf_counter() - start
+    results["sample batch/s"] = samples / elapsed
+    results["sample state/s"] = samples * batch_size / elapsed
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--capacity", type=int, default=200_000)
+    parser.add_argument("--episodes", type=int, default=20)
+    parser.add_argument("--samples", type=int, default=2_000)
+    parser.add_argument("--batch-size", type=int, default=64)
+    args = parser.parse_args()
+
+    random.seed(0)
+    pool = collect_states(args.episodes)
+    codec = StateCodec()
+    # 압축이 손실 없이 되는지 먼저 확인
+    restored = codec.decode(*codec.encode(pool))
+    assert restored.tobytes() == pool.tobytes()
+
+    storages = [
+        ("float32", np.zeros((args.capacity, STATE_DIM), dtype=np.float32)),
+        ("packed", codec.allocate(args.capacity)),
+    ]
+    print(f"states={len(pool):,} capacity={args.capacity:,} batch_size={args.batch_size}")
+    for name, storage in storages:
+        results = run(storage, pool, args.capacity, args.samples, args.batch_size)
+        line = ", ".join(f"{key}: {value:,.0f}" for key, value in results.items())
+        print(f"[{name}] {storage.nbytes / 2 ** 20:,.1f} MiB ({storage.nbytes // args.capacity} B/state), {line}")
+
+
+if __name__ == "__main__":
+    main()
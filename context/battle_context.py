@@ -0,0 +1,56 @@
+# context/battle_context.py
+from copy import deepcopy
+from typing import Optional
+
+from context.battle_store import BattleStore, store
+from context.duration_store import DurationStore, duration_store
+
+
+class BattleContext:
+    """
+    한 배틀의 BattleStore와 DurationStore를 함께 소유하는 객체.
+
+    배틀 로직 함수들은 battle_store=, duration_store= 인자로 이 두 스토어를 전달받기 때문에,
+    BattleContext마다 독립적인 배틀을 한 프로세스 안에서 여러 개 동시에 돌릴 수 있다.
+    """
+
+    def __init__(self, battle_store: Optional[BattleStore] = None, duration_store: Optional[DurationStore] = None):
+        self.battle_store: BattleStore = battle_store if battle_store is not None else BattleStore()
+        self.duration_store: DurationStore = (
+            duration_store if duration_store is not None else DurationStore(self.battle_store)
+        )
+        # 외부에서 받은 DurationStore도 만료 처리 시 이 컨텍스트의 BattleStore를 건드리도록 연결
+        self.duration_store.battle_store = self.battle_store
+
+    def copy(self) -> "BattleContext":
+        # 두 스토어를 한 번에 deepcopy해야 복사본의 DurationStore가 복사본의 BattleStore를 가리킨다
+        return deepcopy(self)
+
+    def snapshot(self) -> tuple:
+        # deepcopy 대신 바뀌는 값만 저장. 종족/기술 데이터는 참조로 공유한다
+        return self.battle_store.snapshot(), self.duration_store.snapshot()
+
+    def restore(self, snapshot: tuple) -> None:
+        battle_snapshot, duration_snapshot = snapshot
+        self.battle_store.restore(battle_snapshot)
+        self.duration_store.restore(duration_snapshot)
+
+    def state_key(self, extra=()) -> bytes:
+        """고정 길이 배틀 상태 키 (context/state_key.py)"""
+        return self.battle_store.key_tracker.key(self.battle_store, self.duration_store, extra)
+
+    def state_hash(self, extra=()) -> int:
+        """state_key()의 64비트 Zobrist 해시 (바뀐 부분만 다시 계산)"""
+        return self.battle_store.key_tracker.hash(self.battle_store, self.duration_store, extra)
+
+    def team_arrays(self, side):
+        """side 팀의 hp / pp / rank / status / flags 배열 뷰 (state_key.TeamArrays, 쓰기 금지 뷰)"""
+        return self.battle_store.key_tracker.team_arrays(side, self.battle_store, self.duration_store)
+
+    def reset_all(self) -> None:
+        self.battle_store.reset_all()
+        self.duration_store.reset_all()
+
+
+# 기존 전역 스토어를 감싸는 기본 컨텍스트 (스크립트/노트북 호환용)
+default_context = BattleContext(store, duration_store)
@@ -4,6 +4,10 @@ from copy import deepcopy
 from p_models.battle_pokemon import BattlePokemon
 from context.battle_environment import PublicBattleEnvironment, IndividualBattleEnvironment
 from context.form_check_wrapper import with_form_check
+from context.state_key import StateKeyTracker
+from utils.battle_logger import get_logger
+
+logger = get_logger(__name__)
 
 SideType = Literal["my", "enemy"]
 
@@ -37,42 +41,92 @@ class BattleStore:
             "switch_request": None,
             "pre_damage_list": [],
         }
+        # 배틀 상태 키 / Zobrist 해시 (context/state_key.py). 아래 변경 메서드가 바뀐 부분을 표시한다
+        self.key_tracker = StateKeyTracker()
+        # 기술 x 상대 포켓몬 예상 데미지 memo (utils/battle_logics/damage_matrix.py). 키에 입력값이 모두 들어 있어 복원 시 비울 필요 없음
+        self.damage_cache: Dict[tuple, float] = {}
         
     def copy(self) -> "BattleStore":
         return deepcopy(self)
 
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        deepcopy 없이 현재 배틀 상태를 저장 (몬테카를로 평가 등에서 restore()로 되돌릴 때 사용).
+        팀 리스트와 환경 객체는 그대로 두고 내용만 기억하므로, 다른 곳에서 같은 리스트를 참조해도 복원 후 일관성이 유지된다.
+        """
+        state = self.state
+        return {
+            "state": dict(state),
+            "teams": [
+                (state[key], list(state[key]), [pokemon.snapshot() for pokemon in state[key]])
+                for key in ("my_team", "enemy_team")
+            ],
+            "envs": [
+                (state[key], {k: v.copy() if isinstance(v, list) else v for k, v in state[key].__dict__.items()})
+                for key in ("public_env", "my_env", "enemy_env")
+            ],
+            "logs_len": len(state["logs"]),
+            "pre_damage_list": list(state["pre_damage_list"]),
+            "switch_request": dict(state["switch_request"]) if state["switch_request"] else state["switch_request"],
+            "key_tracker": self.key_tracker.snapshot(),
+        }
+
+    def restore(self, snapshot: Dict[str, Any]) -> None:
+        """snapshot() 시점의 상태로 되돌린다. 같은 스냅샷으로 여러 번 복원할 수 있다."""
+        self.state.clear()
+        self.state.update(snapshot["state"])
+        for team, members, pokemon_snapshots in snapshot["teams"]:
+            team[:] = members
+            for pokemon, pokemon_snapshot in zip(members, pokemon_snapshots):
+                pokemon.restore(pokemon_snapshot)
+        for env, env_state in snapshot["envs"]:
+            env.__dict__.update({k: v.copy() if isinstance(v, list) else v for k, v in env_state.items()})
+        del self.state["logs"][snapshot["logs_len"]:]
+        self.state["pre_damage_list"] = list(snapshot["pre_damage_list"])
+        if snapshot["switch_request"]:
+            self.state["switch_request"] = dict(snapshot["switch_request"])
+        self.key_tracker.restore(snapshot["key_tracker"])
+
     def set_my_team(self, team: List[BattlePokemon]) -> None:
         self.state["my_team"] = team
+        self.key_tracker.mark_team("my")
 
     def set_enemy_team(self, team: List[BattlePokemon]) -> None:
         self.state["enemy_team"] = team
+        self.key_tracker.mark_team("enemy")
         
     def set_active_index(self, side: SideType, index: int) -> None:
         if side == "my":
             self.state["active_my"] = index
         else:
             self.state["active_enemy"] = index
+        self.key_tracker.mark_active()
 
     def set_active_my(self, index: int) -> None:
         self.state["active_my"] = index
+        self.key_tracker.mark_active()
 
     def set_active_enemy(self, index: int) -> None:
         self.state["active_enemy"] = index
+        self.key_tracker.mark_active()
 
     def set_public_env(self, env_update: Dict[str, Any]) -> None:
         for key, value in env_update.items():
             if hasattr(self.state["public_env"], key):
                 setattr(self.state["public_env"], key, value)
+        self.key_tracker.mark_public()
 
     def set_my_env(self, env_update: Dict[str, Any]) -> None:
         for key, value in env_update.items():
             if hasattr(self.state["my_env"], key):
                 setattr(self.state["my_env"], key, value)
+        self.key_tracker.mark_env("my")
 
     def set_enemy_env(self, env_update: Dict[str, Any]) -> None:
         for key, value in env_update.items():
             if hasattr(self.state["enemy_env"], key):
                 setattr(self.state["enemy_env"], key, value)
+        self.key_tracker.mark_env("enemy")
 
     def update_pokemon(self, side: SideType, index: int, updater: Callable[[BattlePokemon], BattlePokemon]) -> None:
         if side not in ["my", "enemy"]:
@@ -83,6 +137,7 @@ class BattleStore:
         team = self.state[team_key]
         team[index] = updater(team[index])
         self.state[team_key] = team
+        self.key_tracker.mark_pokemon(side, index)
 
     def set_turn(self, turn: int) -> None:
         self.state["turn"] = turn
@@ -105,7 +160,7 @@ class BattleStore:
         self.state["enemy_roster"] = roster
 
     def reset_all(self) -> None:
-        print("battle_store: reset_all 호출")
+        logger.debug("battle_store: reset_all 호출")
         self.__init__()
 
     def get_state(self) -> Dict[str, Any]:
@@ -1,7 +1,10 @@
 # context/duration_store.py
 from copy import deepcopy
-from typing import TYPE_CHECKING, List, Dict, Literal, Optional, Callable
-from context.battle_store import store
+from typing import TYPE_CHECKING, List, Dict, Literal, Optional, Callable, Tuple
+from context.battle_store import BattleStore, store
+from utils.battle_logger import emit_event, get_logger
+
+logger = get_logger(__name__)
 
 # if TYPE_CHECKING:
 #     from utils.battle_logics.update_battle_pokemon import add_status
@@ -10,88 +13,121 @@ TimedEffect = Dict[str, any]
 SideType = Literal["my", "enemy", "public", "my_env", "enemy_env"]
 
 special_status = ["하품", "멸망의노래", "사슬묶기"]
+EFFECT_SIDES = ("my", "enemy", "public", "my_env", "enemy_env")
+
+
+def _side_key(side: SideType) -> str:
+    # get_effects()처럼 알 수 없는 side는 public으로 본다
+    return side if side in EFFECT_SIDES else "public"
+
+
+def _remove_identical(effects: List[TimedEffect], effect: TimedEffect) -> bool:
+    # dict 비교 없이 같은 객체인 항목만 뺀다
+    for i, item in enumerate(effects):
+        if item is effect:
+            del effects[i]
+            return True
+    return False
 
 class DurationStore:
-    def __init__(self):
+    def __init__(self, battle_store: Optional[BattleStore] = None):
+        # 효과 만료 시 포켓몬/환경을 되돌릴 대상 BattleStore (없으면 전역 store)
+        self.battle_store: BattleStore = battle_store if battle_store is not None else store
         self.my_effects: List[TimedEffect] = []
         self.enemy_effects: List[TimedEffect] = []
         self.public_effects: List[TimedEffect] = []
         self.my_env_effects: List[TimedEffect] = []
         self.enemy_env_effects: List[TimedEffect] = []
+        # (side, 효과 이름) -> 리스트에 있는 순서 그대로의 효과들. 효과 리스트를 바꾸는 메서드가 같이 갱신한다
+        self._index: Dict[Tuple[str, str], List[TimedEffect]] = {}
+        self._mark_changed()
     
     def copy(self) -> "DurationStore":
-        return deepcopy(self)
+        # 연결된 BattleStore는 복사하지 않고 그대로 공유
+        return deepcopy(self, {id(self.battle_store): self.battle_store})
     
+    def snapshot(self) -> List[List[TimedEffect]]:
+        """효과 리스트만 복사한 스냅샷 (effect dict는 remaining_turn이 바뀌므로 dict 단위로 복사)"""
+        return [[dict(effect) for effect in effects] for effects in self._effect_lists()]
+
+    def restore(self, snapshot: List[List[TimedEffect]]) -> None:
+        for effects, saved in zip(self._effect_lists(), snapshot):
+            effects[:] = [dict(effect) for effect in saved]
+        self._reindex()
+        self._mark_changed()
+
+    def _mark_changed(self) -> None:
+        """효과 목록이 바뀌었음을 배틀 상태 키에 표시 (context/state_key.py)"""
+        self.battle_store.key_tracker.mark_effects()
+
+    def _effect_lists(self) -> List[List[TimedEffect]]:
+        return [self.my_effects, self.enemy_effects, self.public_effects, self.my_env_effects, self.enemy_env_effects]
+
+    def _reindex(self) -> None:
+        """효과 리스트에서 (side, 이름) 색인을 다시 만든다 (리스트를 통째로 바꾼 뒤 호출)"""
+        index: Dict[Tuple[str, str], List[TimedEffect]] = {}
+        for side, effects in zip(EFFECT_SIDES, self._effect_lists()):
+            for effect in effects:
+                if isinstance(effect, dict):
+                    index.setdefault((side, effect["name"]), []).append(effect)
+        self._index = index
+
+    def find_effect(self, side: SideType, name: str, owner_index: Optional[int] = None) -> Optional[TimedEffect]:
+        """side 효과 중 이름이 name인 첫 효과 (owner_index를 주면 그 포켓몬의 효과). 리스트를 훑지 않고 색인으로 찾는다"""
+        bucket = self._index.get((_side_key(side), name))
+        if not bucket:
+            return None
+        if owner_index is None:
+            return bucket[0]
+        return next((e for e in bucket if e.get("owner_index") == owner_index), None)
+
+    def remaining_turn(self, side: SideType, name: str) -> int:
+        """find_effect(side, name)의 남은 턴 (없으면 0)"""
+        effect = self.find_effect(side, name)
+        return effect["remaining_turn"] if effect else 0
+
     def reset_all(self) -> None:
-        print("duration_store: reset_all 호출")
-        self.__init__()
+        logger.debug("duration_store: reset_all 호출")
+        self.__init__(self.battle_store)
         
     def add_effect(self, effect: TimedEffect, side: SideType):
         """효과 추가"""
+        self._mark_changed()
+        emit_event("effect_added", side=side, effect=effect["name"], remaining_turn=effect.get("remaining_turn"))
+        self._index.setdefault((_side_key(side), effect["name"]), []).append(effect)
         if side == "my":
             self.my_effects.append(effect)
-            print(f"my의 효과 추가: {effect['name']}")
+            logger.debug("my의 효과 추가: %s", effect['name'])
         elif side == "enemy":
             self.enemy_effects.append(effect)
-            print(f"enemy의 효과 추가: {effect['name']}")
+            logger.debug("enemy의 효과 추가: %s", effect['name'])
         elif side == "my_env":
             self.my_env_effects.append(effect)
-            print(f"my_env의 효과 추가: {effect['name']}")
+            logger.debug("my_env의 효과 추가: %s", effect['name'])
         elif side == "enemy_env":
             self.enemy_env_effects.append(effect)
-            print(f"enemy_env의 효과 추가: {effect['name']}")
+            logger.debug("enemy_env의 효과 추가: %s", effect['name'])
         else:
             self.public_effects.append(effect)
-            print(f"public의 효과 추가: {effect['name']}")
+            logger.debug("public의 효과 추가: %s", effect['name'])
             
     def remove_effect(self, effect: TimedEffect | str, side: SideType):
-        """효과 제거"""
+        """효과 제거 (이름이면 그 이름의 첫 효과, dict면 그 객체 자체). 색인 bucket에서 동일성으로 찾는다"""
+        key = (_side_key(side), effect if isinstance(effect, str) else effect["name"])
+        bucket = self._index.get(key)
+        if not bucket:
+            return
         if isinstance(effect, str):
-            eff = next((e for e in self.get_effects(side) if e["name"] == effect), None)
-            if not eff:
-                return
-            if side == "my":
-                if eff in self.my_effects:
-                    self.my_effects.remove(eff)
-                    print(f"my의 효과 제거: {eff['name']}")
-            elif side == "enemy":
-                if eff in self.enemy_effects:
-                    self.enemy_effects.remove(eff)
-                    print(f"enemy의 효과 제거: {eff['name']}")
-            elif side == "my_env":
-                if eff in self.my_env_effects:
-                    self.my_env_effects.remove(eff)
-                    print(f"my_env의 효과 제거: {eff['name']}")
-            elif side == "enemy_env":
-                if eff in self.enemy_env_effects:
-                    self.enemy_env_effects.remove(eff)
-                    print(f"enemy_env의 효과 제거: {eff['name']}")
-            else:
-                if eff in self.public_effects:
-                    self.public_effects.remove(eff)
-                    print(f"public의 효과 제거: {eff['name']}")
-        else:
-            if side == "my":
-                if effect in self.my_effects:
-                    self.my_effects.remove(effect)
-                    print(f"my의 효과 제거: {effect['name']}")
-            elif side == "enemy":
-                if effect in self.enemy_effects:
-                    self.enemy_effects.remove(effect)
-                    print(f"enemy의 효과 제거: {effect['name']}")
-            elif side == "my_env":
-                if effect in self.my_env_effects:
-                    self.my_env_effects.remove(effect)
-                    print(f"my_env의 효과 제거: {effect['name']}")
-            elif side == "enemy_env":
-                if effect in self.enemy_env_effects:
-                    self.enemy_env_effects.remove(effect)
-                    print(f"enemy_env의 효과 제거: {effect['name']}")
-            else:
-                if effect in self.public_effects:
-                    self.public_effects.remove(effect)
-                    print(f"public의 효과 제거: {effect['name']}")
-                
+            effect = bucket[0]
+        if not _remove_identical(bucket, effect):
+            return
+        if not bucket:
+            del self._index[key]
+        _remove_identical(self.get_effects(side), effect)
+        self._mark_changed()
+        emit_event("effect_removed", side=side, effect=effect["name"])
+        logger.debug("%s의 효과 제거: %s", _side_key(side), effect['name'])
+
     def get_effects(self, side: SideType) -> List[TimedEffect]:
         """효과 목록 반환"""
         if side == "my":
@@ -107,63 +143,68 @@ class DurationStore:
             
     def update_durations(self):
         """지속 시간 업데이트"""
+        self._mark_changed()
         for effects in [self.my_effects, self.enemy_effects, self.public_effects, self.my_env_effects, self.enemy_env_effects]:
             for effect in effects[:]:
                 if 'duration' in effect:
                     effect['duration'] -= 1
                     if effect['duration'] <= 0:
                         effects.remove(effect)
+        self._reindex()
                         
     def clear_effects(self):
         """모든 효과 제거"""
+        self._mark_changed()
         self.my_effects.clear()
         self.enemy_effects.clear()
         self.public_effects.clear()
         self.my_env_effects.clear()
         self.enemy_env_effects.clear()
+        self._index.clear()
 
     def decrement_turns(self):
+        self._mark_changed()
         expired = {"my": [], "enemy": [], "public": [], "my_env": [], "enemy_env": []}
 
         def dec(effects: List[TimedEffect], side: SideType):
             if len(effects) == 0:
                 return []
-            print(f"\n=== {side}의 효과 처리 시작 ===")
-            print(f"처리 전 효과 목록: {effects}")
+            logger.debug("\n=== %s의 효과 처리 시작 ===", side)
+            logger.debug("처리 전 효과 목록: %s", effects)
             new_list = []
             for e in effects:
                 if not isinstance(e, dict):
-                    print(f"dict가 아닌 효과 발견: {e}")
+                    logger.debug("dict가 아닌 효과 발견: %s", e)
                     continue
                 
-                print(f"처리 중인 효과: {e}")
+                logger.debug("처리 중인 효과: %s", e)
                 
                 if e["name"] in special_status:
-                    print(f"특수 상태 효과 처리: {e['name']}")
+                    logger.debug("특수 상태 효과 처리: %s", e['name'])
                     if self.decrement_special_effect(side, e["owner_index"], e["name"]):
                         expired[side].append(e["name"])
-                        print(f"특수 상태 효과 만료: {e['name']}")
+                        logger.debug("특수 상태 효과 만료: %s", e['name'])
                     new_list.append(e)
                 elif e["name"] == "잠듦" or e["name"] == "혼란":
-                    print(f"잠듦/혼란 효과 유지: {e['name']}")
+                    logger.debug("잠듦/혼란 효과 유지: %s", e['name'])
                     new_list.append(e)
                 else:
                     if "remaining_turn" not in e:
-                        print(f"remaining_turn이 없는 효과 발견: {e}")
+                        logger.debug("remaining_turn이 없는 효과 발견: %s", e)
                         continue
                         
                     e["remaining_turn"] -= 1
-                    print(f"남은 턴 감소: {e['name']} -> {e['remaining_turn']}턴")
+                    logger.debug("남은 턴 감소: %s -> %s턴", e['name'], e['remaining_turn'])
                     
                     if e["remaining_turn"] <= 0:
                         expired[side].append(e["name"])
-                        print(f"효과 만료: {e['name']}")
+                        logger.debug("효과 만료: %s", e['name'])
                     else:
                         new_list.append(e)
-                        print(f"효과 유지: {e['name']}")
+                        logger.debug("효과 유지: %s", e['name'])
             
-            print(f"처리 후 효과 목록: {new_list}")
-            print(f"=== {side}의 효과 처리 완료 ===\n")
+            logger.debug("처리 후 효과 목록: %s", new_list)
+            logger.debug("=== %s의 효과 처리 완료 ===\n", side)
             return new_list
 
         self.my_effects = dec(self.my_effects, "my")
@@ -171,18 +212,19 @@ class DurationStore:
         self.public_effects = dec(self.public_effects, "public")
         self.my_env_effects = dec(self.my_env_effects, "my_env")
         self.enemy_env_effects = dec(self.enemy_env_effects, "enemy_env")
+        self._reindex()
 
         # 날씨, 필드, 룸 리셋
         for effect in expired["public"]:
             if effect in ["쾌청", "비", "모래바람", "싸라기눈"]:
-                print(f"날씨 효과 만료: {effect}")
-                store.set_public_env({"weather": None})
+                logger.debug("날씨 효과 만료: %s", effect)
+                self.battle_store.set_public_env({"weather": None})
             elif effect in ["그래스필드", "미스트필드", "사이코필드", "일렉트릭필드"]:
-                print(f"필드 효과 만료: {effect}")
-                store.set_public_env({"field": None})
+                logger.debug("필드 효과 만료: %s", effect)
+                self.battle_store.set_public_env({"field": None})
             elif effect in ["트릭룸", "매직룸", "원더룸"]:
-                print(f"룸 효과 만료: {effect}")
-                store.set_public_env({"room": None})
+                logger.debug("룸 효과 만료: %s", effect)
+                self.battle_store.set_public_env({"room": None})
 
         return expired
 
@@ -194,9 +236,7 @@ class DurationStore:
             self.add_effect({**eff, "owner_index": to_idx}, side)
 
     def decrement_special_effect(self, side: SideType, index: int, status: str, on_expire: Optional[Callable[[], None]] = None) -> bool:
-        effects = self.get_effects(side)
-
-        effect = next((e for e in effects if e["name"] == status), None)
+        effect = self.find_effect(side, status)
         if not effect:
             return False
 
@@ -205,7 +245,7 @@ class DurationStore:
             self.remove_effect(effect, side)
             # 런타임에 import
             from utils.battle_logics.update_battle_pokemon import remove_status
-            store.update_pokemon(side, index, lambda p: remove_status(p, status))
+            self.battle_store.update_pokemon(side, index, lambda p: remove_status(p, status))
             if on_expire:
                 on_expire()
             return True
@@ -218,7 +258,7 @@ class DurationStore:
         # 런타임에 import
         from utils.battle_logics.update_battle_pokemon import add_status
         return self.decrement_special_effect(side, index, "하품", lambda: 
-            store.update_pokemon(side, index, lambda p: add_status(p, "잠듦", side))
+            self.battle_store.update_pokemon(side, index, lambda p: add_status(p, "잠듦", side, battle_store=self.battle_store, duration_store=self))
         )
 
     def decrement_confusion_turn(self, side: SideType, index: int):
@@ -229,8 +269,8 @@ class DurationStore:
 
     def decrement_disable_turn(self, side: SideType, index: int):
         return self.decrement_special_effect(side, index, "사슬묶기", lambda: (
-            store.update_pokemon(side, index, lambda p: p.copy_with(un_usable_move=None)),
-            store.add_log("사슬묶기 상태가 풀렸다!")
+            self.battle_store.update_pokemon(side, index, lambda p: p.copy_with(un_usable_move=None)),
+            self.battle_store.add_log("사슬묶기 상태가 풀렸다!")
         ))
 
 # 싱글톤으로 관리
@@ -3,6 +3,9 @@
 from typing import List, Callable, TypeVar, Any
 from copy import deepcopy
 from p_models.battle_pokemon import BattlePokemon
+from utils.battle_logger import get_logger
+
+logger = get_logger(__name__)
 
 T = TypeVar('T', bound=dict)
 
@@ -31,7 +34,7 @@ def with_form_check(config: Callable[[Callable[[T], None], Callable[[], T], Any]
                                 if poke.base.memorized_base:
                                     poke.base = deepcopy(poke.base.memorized_base)
                             poke.form_num = expected_form
-                            print(f"{poke.base.name}의 모습이 변했다! (expected_form: {expected_form})")
+                            logger.debug("%s의 모습이 변했다! (expected_form: %s)", poke.base.name, expected_form)
                     updated_team.append(poke)
                 return updated_team
 
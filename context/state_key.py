@@ -0,0 +1,355 @@
+# context/state_key.py
+"""
+배틀 상태의 고정 길이 키와 Zobrist 식 해시
+
+키는 int16 배열 하나(KEY_LENGTH칸)를 bytes로 만든 것이다.
+    포켓몬 6마리 × POKEMON_FIELDS   HP, PP[4], 랭크[8], 상태이상 비트, 플래그, 고정/차징/사용/봉인 기술 id, 위치, 종족, 특성, 타입 비트 ...
+    양쪽 개인 환경 × SIDE_ENV_FIELDS  트랩 비트, 스크린 비트, 대타, 탈
+    공용 환경 PUBLIC_FIELDS           날씨, 필드, 룸, 오라 비트, 재앙 비트
+    액티브 인덱스 2칸
+    효과 리스트 5개 × EFFECT_SLOTS     (이름, 대상, 남은 턴)을 한 칸에 묶어 정렬 (날씨/필드/스크린/상태이상의 남은 턴 포함)
+턴 수는 넣지 않는다 (같은 국면이면 턴이 달라도 같은 키).
+
+해시는 칸마다 splitmix64(위치, 값)를 XOR한 값이라, 바뀐 칸만 빼고 더해서 갱신할 수 있다.
+BattleStore / DurationStore의 변경 메서드(update_pokemon, set_*_env, set_active_index, add_effect ...)가
+StateKeyTracker에 바뀐 부분만 표시하고, key() / hash()를 부를 때 표시된 부분만 다시 계산한다.
+"""
+from typing import Dict, Iterable, List, NamedTuple, Sequence, get_args
+
+import numpy as np
+
+from p_models.move_info import PositionType, ScreenType, TrapType
+from p_models.rank_state import RankStat
+from p_models.status import STATUS_NAMES
+from p_models.types import FieldType, WeatherType
+
+
+def _literal_values(literal_type) -> List[str]:
+    """Optional[Literal[...]]의 값 목록"""
+    values = []
+    for arg in get_args(literal_type):
+        values.extend(get_args(arg) or ([arg] if isinstance(arg, str) else []))
+    return values
+
+
+STATUSES = list(STATUS_NAMES)
+RANK_STATS = list(get_args(RankStat))
+SCREENS = _literal_values(ScreenType)
+TRAPS = _literal_values(TrapType)
+POSITIONS = _literal_values(PositionType)
+WEATHERS = _literal_values(WeatherType)
+FIELDS = _literal_values(FieldType)
+ROOMS = ["트릭룸", "매직룸", "원더룸"]
+AURAS = ["페어리오라", "다크오라"]
+DISASTERS = ["재앙의검", "재앙의구슬", "재앙의그릇", "재앙의목간"]
+TYPES = [
+    "노말", "불", "물", "풀", "전기", "얼음", "격투", "독", "땅",
+    "비행", "에스퍼", "벌레", "바위", "고스트", "드래곤", "악", "강철", "페어리",
+]
+# 효과 이름 번호 (0은 빈 칸, 목록에 없는 이름은 마지막 번호 하나로 묶음)
+EFFECT_NAMES = STATUSES + SCREENS + WEATHERS + FIELDS + ROOMS
+EFFECT_INDEX = {name: i + 1 for i, name in enumerate(EFFECT_NAMES)}
+UNKNOWN_EFFECT = len(EFFECT_NAMES) + 1
+
+SIDES = ("my", "enemy")
+TEAM_SIZE = 3
+POKEMON_FIELDS = 29
+SIDE_ENV_FIELDS = 4
+PUBLIC_FIELDS = 5
+EFFECT_SLOTS = 8
+EFFECT_LISTS = ("my", "enemy", "public", "my_env", "enemy_env")
+
+POKEMON_OFFSET = 0
+SIDE_ENV_OFFSET = POKEMON_OFFSET + len(SIDES) * TEAM_SIZE * POKEMON_FIELDS
+PUBLIC_OFFSET = SIDE_ENV_OFFSET + len(SIDES) * SIDE_ENV_FIELDS
+ACTIVE_OFFSET = PUBLIC_OFFSET + PUBLIC_FIELDS
+EFFECT_OFFSET = ACTIVE_OFFSET + 2
+KEY_LENGTH = EFFECT_OFFSET + len(EFFECT_LISTS) * EFFECT_SLOTS  # 229칸 = 458바이트
+
+_INT16_MAX = np.iinfo(np.int16).max
+# 비트마스크(상태이상 21개, 타입 18개)는 int16 두 칸에 15비트씩 나눠 담는다
+# (16번째 비트를 쓰면 _clamp가 32767로 잘라 서로 다른 값이 같은 키가 된다)
+CHUNK_BITS = 15
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+
+
+def _bits(names: Iterable[str], table: Sequence[str]) -> int:
+    bits = 0
+    for name in names or ():
+        if name in table:
+            bits |= 1 << table.index(name)
+    return bits
+
+
+def _move_id(move) -> int:
+    if move is None:
+        return 0
+    if isinstance(move, str):  # 일부 로직은 기술 이름만 저장한다
+        return 1000 + (sum(map(ord, move)) % 1000)
+    return getattr(move, "id", 0) + 1
+
+
+def encode_pokemon(pokemon) -> List[int]:
+    """포켓몬 한 마리 -> POKEMON_FIELDS개 정수"""
+    base = pokemon.base
+    moves = base.moves[:4]
+    pp = [pokemon.pp.get(move.name, 0) for move in moves] + [0] * (4 - len(moves))
+    status = pokemon.status.bits  # STATUSES 순서 비트마스크
+    types = _bits(base.types, TYPES)
+    flags = (
+        pokemon.is_active, pokemon.is_protecting, pokemon.had_missed, pokemon.had_rank_up,
+        pokemon.is_charging, pokemon.is_first_turn, pokemon.cannot_move, pokemon.lost_type,
+        pokemon.substitute is not None,
+    )
+    return [
+        pokemon.current_hp, *pp,
+        *[pokemon.rank.get(stat, 0) for stat in RANK_STATS],
+        status & CHUNK_MASK, status >> CHUNK_BITS,
+        sum(int(bool(flag)) << k for k, flag in enumerate(flags)),
+        _move_id(pokemon.locked_move), pokemon.locked_move_turn or 0,
+        _move_id(pokemon.charging_move), _move_id(pokemon.used_move), _move_id(pokemon.un_usable_move),
+        POSITIONS.index(pokemon.position) + 1 if pokemon.position in POSITIONS else 0,
+        getattr(base, "id", 0), getattr(base.ability, "id", 0) + 1 if base.ability else 0,
+        types & CHUNK_MASK, types >> CHUNK_BITS,
+        pokemon.form_num or 0,
+        pokemon.received_damage or 0, pokemon.dealt_damage or 0,
+    ]
+
+
+def encode_side_env(env) -> List[int]:
+    screen = env.screen if isinstance(env.screen, (list, tuple)) else [env.screen]
+    return [_bits(env.trap, TRAPS), _bits(screen, SCREENS), int(bool(env.substitute)), int(bool(env.disguise))]
+
+
+def encode_public_env(env) -> List[int]:
+    return [
+        WEATHERS.index(env.weather) + 1 if env.weather in WEATHERS else 0,
+        FIELDS.index(env.field) + 1 if env.field in FIELDS else 0,
+        ROOMS.index(env.room) + 1 if env.room in ROOMS else 0,
+        _bits(env.aura, AURAS),
+        _bits(env.disaster, DISASTERS),
+    ]
+
+
+def _effect_code(effect: Dict) -> int:
+    owner = effect.get("owner_index")
+    owner = 0 if owner is None else min(owner + 1, 3)
+    remaining = max(0, min(effect.get("remaining_turn") or 0, 15))
+    return EFFECT_INDEX.get(effect["name"], UNKNOWN_EFFECT) << 6 | owner << 4 | remaining
+
+
+def encode_effects(effects: Sequence[Dict]) -> List[int]:
+    """효과 리스트 하나 -> EFFECT_SLOTS칸. 한 칸 = 이름 번호 << 6 | (대상 + 1) << 4 | 남은 턴(최대 15)"""
+    codes = sorted(_effect_code(e) for e in effects if isinstance(e, dict))
+    slots = codes[:EFFECT_SLOTS] + [0] * (EFFECT_SLOTS - len(codes))
+    for code in codes[EFFECT_SLOTS:]:  # 칸이 모자라면 마지막 칸에 섞는다
+        slots[-1] ^= code
+    return slots
+
+
+def zobrist(positions: np.ndarray, values: np.ndarray) -> int:
+    """칸 (위치, 값)마다 splitmix64 난수를 만들어 XOR"""
+    x = (positions.astype(np.uint64) << np.uint64(16)) | values.astype(np.uint16).astype(np.uint64)
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    x = x ^ (x >> np.uint64(31))
+    return int(np.bitwise_xor.reduce(x)) if len(x) else 0
+
+
+_MASK64 = (1 << 64) - 1
+
+
+def _mix(position: int, value: int) -> int:
+    """zobrist()의 한 칸짜리 파이썬 버전 (칸 몇 개만 더할 때 numpy 호출 비용을 피함)"""
+    x = ((position << 16) | (value & 0xFFFF)) + 0x9E3779B97F4A7C15 & _MASK64
+    x = (x ^ (x >> 30)) * 0xBF58476D1CE4E5B9 & _MASK64
+    x = (x ^ (x >> 27)) * 0x94D049BB133111EB & _MASK64
+    return x ^ (x >> 31)
+
+
+def _clamp(value: int) -> int:
+    return -_INT16_MAX if value < -_INT16_MAX else _INT16_MAX if value > _INT16_MAX else int(value)
+
+
+def _clip(values: List[int]) -> np.ndarray:
+    return np.asarray([_clamp(v) for v in values], dtype=np.int16)
+
+
+# 부분 이름: ("pokemon", side, index) / ("env", side) / "public" / "active" / "effects"
+_ALL_PARTS = (
+    [("pokemon", side, i) for side in SIDES for i in range(TEAM_SIZE)]
+    + [("env", side) for side in SIDES]
+    + ["public", "active", "effects"]
+)
+
+
+def _part_slice(part) -> slice:
+    if part == "public":
+        return slice(PUBLIC_OFFSET, PUBLIC_OFFSET + PUBLIC_FIELDS)
+    if part == "active":
+        return slice(ACTIVE_OFFSET, ACTIVE_OFFSET + 2)
+    if part == "effects":
+        return slice(EFFECT_OFFSET, KEY_LENGTH)
+    if part[0] == "env":
+        start = SIDE_ENV_OFFSET + SIDES.index(part[1]) * SIDE_ENV_FIELDS
+        return slice(start, start + SIDE_ENV_FIELDS)
+    start = POKEMON_OFFSET + (SIDES.index(part[1]) * TEAM_SIZE + part[2]) * POKEMON_FIELDS
+    return slice(start, start + POKEMON_FIELDS)
+
+
+def _encode_part(part, battle_store, duration_store) -> List[int]:
+    state = battle_store.state
+    if part == "public":
+        return encode_public_env(state["public_env"])
+    if part == "active":
+        return [state["active_my"], state["active_enemy"]]
+    if part == "effects":
+        out = []
+        for side in EFFECT_LISTS:
+            out += encode_effects(duration_store.get_effects(side))
+        return out
+    if part[0] == "env":
+        return encode_side_env(state[f"{part[1]}_env"])
+    team = state[f"{part[1]}_team"]
+    return encode_pokemon(team[part[2]]) if part[2] < len(team) else [0] * POKEMON_FIELDS
+
+
+_PART_SLICES = {part: _part_slice(part) for part in _ALL_PARTS}
+
+
+def full_key_array(battle_store, duration_store) -> np.ndarray:
+    """증분 갱신 없이 처음부터 계산한 키 배열 (검증용)"""
+    values = np.zeros(KEY_LENGTH, dtype=np.int16)
+    for part in _ALL_PARTS:
+        values[_part_slice(part)] = _clip(_encode_part(part, battle_store, duration_store))
+    return values
+
+
+# encode_pokemon 행 안에서 각 값의 열
+HP_COLUMN = 0
+PP_COLUMNS = slice(1, 5)
+RANK_COLUMNS = slice(5, 5 + len(RANK_STATS))
+STATUS_COLUMNS = slice(13, 15)
+FLAGS_COLUMN = 15
+FLAG_NAMES = (
+    "is_active", "is_protecting", "had_missed", "had_rank_up",
+    "is_charging", "is_first_turn", "cannot_move", "lost_type", "substitute",
+)
+
+
+class TeamArrays(NamedTuple):
+    """
+    한 팀의 hp / pp / rank / status / flags를 읽는 struct-of-arrays 뷰 (읽기 전용).
+    rows는 tracker.values를 복사 없이 (TEAM_SIZE, POKEMON_FIELDS)로 본 쓰기 금지 뷰이고, 포켓몬 객체에서 계산한 파생 값이다.
+    팀의 실제 상태는 여전히 BattlePokemon 객체가 가지고 있다.
+    """
+    rows: np.ndarray
+
+    @property
+    def hp(self) -> np.ndarray:
+        return self.rows[:, HP_COLUMN]
+
+    @property
+    def pp(self) -> np.ndarray:
+        return self.rows[:, PP_COLUMNS]
+
+    @property
+    def rank(self) -> np.ndarray:
+        return self.rows[:, RANK_COLUMNS]
+
+    @property
+    def status(self) -> np.ndarray:
+        """STATUSES 순서 비트마스크 (int32)"""
+        lo, hi = self.rows[:, STATUS_COLUMNS].astype(np.int32).T
+        return lo | (hi << CHUNK_BITS)
+
+    @property
+    def flags(self) -> np.ndarray:
+        """FLAG_NAMES 순서 비트"""
+        return self.rows[:, FLAGS_COLUMN]
+
+    def flag(self, name: str) -> np.ndarray:
+        return (self.rows[:, FLAGS_COLUMN] >> FLAG_NAMES.index(name)) & 1
+
+
+class StateKeyTracker:
+    """BattleStore가 소유. 변경 메서드는 mark_*()로 바뀐 부분만 표시하고 key() / hash()가 그 부분만 다시 계산한다"""
+
+    def __init__(self):
+        self.values = np.zeros(KEY_LENGTH, dtype=np.int16)
+        # 부분마다 마지막으로 계산한 값 (작은 튜플끼리 비교하는 편이 numpy 호출보다 빠르다)
+        self.rows = {part: (0,) * (_PART_SLICES[part].stop - _PART_SLICES[part].start) for part in _ALL_PARTS}
+        self._hash = zobrist(np.arange(KEY_LENGTH), self.values)
+        self.dirty = set(_ALL_PARTS)
+
+    def mark_pokemon(self, side: str, index: int) -> None:
+        self.dirty.add(("pokemon", side, index))
+
+    def mark_team(self, side: str) -> None:
+        self.dirty.update(("pokemon", side, i) for i in range(TEAM_SIZE))
+
+    def mark_env(self, side: str) -> None:
+        self.dirty.add(("env", side))
+
+    def mark_public(self) -> None:
+        self.dirty.add("public")
+
+    def mark_active(self) -> None:
+        self.dirty.add("active")
+
+    def mark_effects(self) -> None:
+        self.dirty.add("effects")
+
+    def mark_all(self) -> None:
+        self.dirty.update(_ALL_PARTS)
+
+    def refresh(self, battle_store, duration_store) -> None:
+        for part in self.dirty:
+            new = tuple(_clamp(v) for v in _encode_part(part, battle_store, duration_store))
+            old = self.rows[part]
+            if new == old:
+                continue
+            start = _PART_SLICES[part].start
+            for i, (a, b) in enumerate(zip(old, new)):
+                if a != b:
+                    self._hash ^= _mix(start + i, a) ^ _mix(start + i, b)
+            self.rows[part] = new
+            self.values[_PART_SLICES[part]] = new
+        self.dirty.clear()
+
+    def key(self, battle_store, duration_store, extra: Sequence[int] = ()) -> bytes:
+        """고정 길이 키 bytes. extra(예: env의 교체 횟수)는 뒤에 int16으로 붙인다"""
+        self.refresh(battle_store, duration_store)
+        if not extra:
+            return self.values.tobytes()
+        return self.values.tobytes() + _clip(list(extra)).tobytes()
+
+    def hash(self, battle_store, duration_store, extra: Sequence[int] = ()) -> int:
+        """64비트 Zobrist 해시. extra는 KEY_LENGTH 이후 칸으로 취급"""
+        self.refresh(battle_store, duration_store)
+        if not extra:
+            return self._hash
+        result = self._hash
+        for i, value in enumerate(extra):
+            result ^= _mix(KEY_LENGTH + i, _clamp(int(value)))
+        return result
+
+    def team_arrays(self, side: str, battle_store, duration_store) -> TeamArrays:
+        """side 팀의 hp / pp / rank / status / flags 배열 뷰. 바뀐 포켓몬 행만 다시 쓴 뒤 돌려준다"""
+        self.refresh(battle_store, duration_store)
+        start = POKEMON_OFFSET + SIDES.index(side) * TEAM_SIZE * POKEMON_FIELDS
+        rows = self.values[start:start + TEAM_SIZE * POKEMON_FIELDS].reshape(TEAM_SIZE, POKEMON_FIELDS)
+        # 뷰에 쓰면 key()는 바뀌는데 Zobrist 해시는 그대로라 캐시 키가 어긋난다
+        rows.flags.writeable = False
+        return TeamArrays(rows)
+
+    def snapshot(self) -> tuple:
+        return self.values.copy(), dict(self.rows), self._hash, set(self.dirty)
+
+    def restore(self, snapshot: tuple) -> None:
+        values, rows, hash_value, dirty = snapshot
+        self.values[:] = values
+        self.rows = dict(rows)
+        self._hash = hash_value
+        self.dirty = set(dirty)
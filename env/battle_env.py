@@ -1,5 +1,4 @@
 # env/battle_env.py
-import asyncio
 from copy import deepcopy
 import random
 import numpy as np
@@ -26,13 +25,16 @@ HYPERPARAMS = {
 
 # 절대 경로 import
 from p_data.mock_pokemon import create_mock_pokemon_list
-from RL.get_state_vector import get_state
+from RL.state_encoder import StateEncoder
 from RL.base_ai_choose_action import base_ai_choose_action
 from RL.reward_calculator import calculate_reward
-from utils.battle_logics.battle_sequence import battle_sequence, BattleAction, remove_fainted_pokemon
+from utils.battle_logics.battle_sequence import battle_sequence_sync, BattleAction, remove_fainted_pokemon_sync
 from context.battle_environment import PublicBattleEnvironment, IndividualBattleEnvironment
-from context.battle_store import store
-from context.duration_store import duration_store
+from context.battle_context import BattleContext, default_context
+from utils.battle_logger import emit_event, get_logger
+
+logger = get_logger(__name__)
+
 # from context.form_check_wrapper import with_form_check
 # from p_models.battle_pokemon import BattlePokemon
 # from p_models.move_info import MoveInfo
@@ -74,10 +76,15 @@ class YakemonEnv(gym.Env):
     """
     metadata = {'render.modes': ['human']}
 
-    def __init__(self):
+    def __init__(self, context: Optional[BattleContext] = None):
+        """
+        Args:
+            context: 이 환경이 사용할 BattleContext. 생략하면 전역 스토어를 감싼 default_context를 사용하고,
+                여러 환경을 동시에 돌릴 때는 환경마다 BattleContext()를 새로 만들어 넘긴다.
+        """
         super(YakemonEnv, self).__init__()
-        self._battle_sequence_lock = asyncio.Lock()
         self.pokemon_list = create_mock_pokemon_list()
+        self.state_encoder = StateEncoder()
         
         # 상태 공간 정의 (1237)
         self.observation_space = spaces.Box(
@@ -92,8 +99,9 @@ class YakemonEnv(gym.Env):
         self.action_space = spaces.MultiDiscrete([2] * 6)  # 각 행동이 가능하면 1, 불가능하면 0
         
         # 배틀 스토어와 환경 초기화
-        self.battle_store = store
-        self.duration_store = duration_store
+        self.context = context if context is not None else default_context
+        self.battle_store = self.context.battle_store
+        self.duration_store = self.context.duration_store
         self.public_env = PublicBattleEnvironment()
         self.my_env = IndividualBattleEnvironment()
         self.enemy_env = IndividualBattleEnvironment()
@@ -109,8 +117,10 @@ class YakemonEnv(gym.Env):
         self.reset()
         
     def __del__(self):
-        print("battle_env: __del__ 호출")
+        logger.debug("battle_env: __del__ 호출")
         # 각 속성이 존재하는지 확인 후 삭제
+        if hasattr(self, 'context'):
+            del self.context
         if hasattr(self, 'battle_store'):
             del self.battle_store
         if hasattr(self, 'duration_store'):
@@ -135,8 +145,6 @@ class YakemonEnv(gym.Env):
             del self.switch_count
         if hasattr(self, 'pokemon_list'):
             del self.pokemon_list
-        if hasattr(self, '_battle_sequence_lock'):
-            del self._battle_sequence_lock
         if hasattr(self, 'observation_space'):
             del self.observation_space
         if hasattr(self, 'action_space'):
@@ -145,6 +153,47 @@ class YakemonEnv(gym.Env):
     def copy(self) -> "YakemonEnv":
         return deepcopy(self)
 
+    def snapshot(self) -> Dict:
+        """
+        현재 배틀 상태 스냅샷. copy()와 달리 pokemon_list, gym space 등은 복사하지 않고
+        HP/PP/랭크/상태이상/효과 리스트/필드처럼 배틀 중 바뀌는 값만 저장한다.
+        """
+        return {
+            "context": self.context.snapshot(),
+            "teams": [(team, list(team)) for team in (self.my_team, self.enemy_team)],
+            "envs": [
+                (env, {k: v.copy() if isinstance(v, list) else v for k, v in env.__dict__.items()})
+                for env in (self.public_env, self.my_env, self.enemy_env)
+            ],
+            "turn": self.turn,
+            "done": self.done,
+            "switching_disabled": self.switching_disabled,
+            "switch_count": self.switch_count,
+        }
+
+    def restore(self, snapshot: Dict) -> None:
+        """snapshot() 시점으로 되돌린다 (같은 스냅샷으로 여러 번 복원 가능)"""
+        self.context.restore(snapshot["context"])
+        for team, members in snapshot["teams"]:
+            team[:] = members
+        for env, env_state in snapshot["envs"]:
+            env.__dict__.update({k: v.copy() if isinstance(v, list) else v for k, v in env_state.items()})
+        self.turn = snapshot["turn"]
+        self.done = snapshot["done"]
+        self.switching_disabled = snapshot["switching_disabled"]
+        self.switch_count = snapshot["switch_count"]
+
+    def state_key(self) -> bytes:
+        """
+        배틀 상태 키 (context/state_key.py) + env가 따로 가진 교체 제한 값.
+        턴 수는 포함하지 않는다. 캐시 / transposition table / 중복 제거의 키로 사용
+        """
+        return self.context.state_key((int(self.switching_disabled), self.switch_count))
+
+    def state_hash(self) -> int:
+        """state_key()의 64비트 Zobrist 해시"""
+        return self.context.state_hash((int(self.switching_disabled), self.switch_count))
+
     def reset(self, my_team=None, enemy_team=None):
         """
         환경 초기화
@@ -158,9 +207,8 @@ class YakemonEnv(gym.Env):
         # 만약 이미 BattlePokemon이면 변환하지 않음
         def ensure_battle_pokemon(poke):
             if isinstance(poke, BattlePokemon):
-                # PP 초기화
-                for move in poke.base.moves:
-                    poke.pp[move.name] = move.pp_max
+                # PP 초기화 (pp dict는 copy_with 사본과 공유될 수 있으므로 새로 만든다)
+                poke.pp = {**poke.pp, **{move.name: move.pp_max for move in poke.base.moves}}
                 return poke
             else:
                 return create_battle_pokemon(poke)
@@ -193,10 +241,11 @@ class YakemonEnv(gym.Env):
         self.battle_store.set_my_env(my_env.__dict__)
         self.battle_store.set_enemy_env(enemy_env.__dict__)
         
-        # 내부 환경 변수 업데이트
-        self.public_env = public_env
-        self.my_env = my_env
-        self.enemy_env = enemy_env
+        # 내부 환경 변수는 스토어의 환경 객체를 그대로 가리킨다 (배틀 로직이 바꾸는 객체와 상태 벡터가 읽는 객체를 같게)
+        state = self.battle_store.get_state()
+        self.public_env = state["public_env"]
+        self.my_env = state["my_env"]
+        self.enemy_env = state["enemy_env"]
         
         # 턴 초기화
         self.turn = 1
@@ -209,8 +258,8 @@ class YakemonEnv(gym.Env):
 
 
     def _get_state(self):
-        """현재 상태 벡터 반환"""
-        state_vector = get_state(
+        """현재 상태 벡터 반환 (인코더 버퍼의 복사본이므로 그대로 보관해도 된다)"""
+        state_vector = self.state_encoder.encode(
             store=self.battle_store,
             my_team=self.my_team,
             enemy_team=self.enemy_team,
@@ -221,13 +270,35 @@ class YakemonEnv(gym.Env):
             enemy_env=self.enemy_env,
             turn=self.turn,
             my_effects=self.duration_store.my_effects,
-            enemy_effects=self.duration_store.enemy_effects
+            enemy_effects=self.duration_store.enemy_effects,
+            duration_store=self.duration_store
         )
-        return state_vector
+        return state_vector.copy()
 
-    async def step(self, action: int, enemy_action: any = 7, is_always_hit:Optional[bool]=False, test: Optional[bool] = False, is_monte_carlo: Optional[bool] = False) -> Tuple[np.ndarray, float, bool, Dict]:
+    def get_action_mask(self) -> np.ndarray:
+        """
+        step()이 실제로 수행할 수 있는 행동 마스크 (6,) 반환
+        0-3: PP가 남은 기술, 4-5: 교체 가능한 포켓몬 순서대로 (available_indices[action - 4])
+        """
+        mask = np.zeros(6, dtype=np.int8)
+        current_index = self.battle_store.get_active_index("my")
+        current_pokemon = self.my_team[current_index]
+        for i, move in enumerate(current_pokemon.base.moves[:4]):
+            if current_pokemon.pp.get(move.name, 0) > 0:
+                mask[i] = 1
+
+        if not self.switching_disabled and self.switch_count < 6:
+            available_indices = [i for i in range(len(self.my_team)) if i != current_index and self.my_team[i].current_hp > 0]
+            mask[4:4 + min(len(available_indices), 2)] = 1
+
+        # 가능한 행동이 하나도 없으면 step()과 동일하게 첫 번째 기술로 진행
+        if not mask.any():
+            mask[0] = 1
+        return mask
+
+    def step_sync(self, action: int, enemy_action: any = 7, is_always_hit:Optional[bool]=False, test: Optional[bool] = False, is_monte_carlo: Optional[bool] = False) -> Tuple[np.ndarray, float, bool, Dict]:
         """
-        환경에서 한 스텝 진행
+        환경에서 한 스텝 진행 (동기 버전, 이벤트 루프 없이 바로 호출 가능)
         
         Args:
             action: 수행할 행동 (0-5)
@@ -249,29 +320,29 @@ class YakemonEnv(gym.Env):
             my_post_pokemon = self.my_team[self.battle_store.get_active_index('my')].copy_with()
             enemy_post_pokemon = self.enemy_team[self.battle_store.get_active_index('enemy')].copy_with()
             my_pokemon = self.my_team[self.battle_store.get_active_index('my')]
-            print('턴: ',self.turn)
-            print(f"현재 남은 내 포켓몬: {len(alive_my_pokemon)}")
-            print(f"현재 남은 상대 포켓몬: {len(alive_enemy_pokemon)}")
-            print(f"현재 내 포켓몬: {self.my_team[self.battle_store.get_active_index('my')].base.name}")
-            print(f"현재 상대 포켓몬: {self.enemy_team[self.battle_store.get_active_index('enemy')].base.name}")
+            logger.debug("턴:  %s", self.turn)
+            logger.debug("현재 남은 내 포켓몬: %s", len(alive_my_pokemon))
+            logger.debug("현재 남은 상대 포켓몬: %s", len(alive_enemy_pokemon))
+            logger.debug("현재 내 포켓몬: %s", self.my_team[self.battle_store.get_active_index('my')].base.name)
+            logger.debug("현재 상대 포켓몬: %s", self.enemy_team[self.battle_store.get_active_index('enemy')].base.name)
             
             # 교체가 비활성화된 상태에서 교체 행동을 시도한 경우
             if self.switching_disabled and action >= 4:
-                print("battle_env: 교체가 비활성화된 상태입니다.")
+                logger.debug("battle_env: 교체가 비활성화된 상태입니다.")
                 return current_state, -5.0, self.done, {"error": "switching_disabled"}
             
             # 교체 횟수가 6회를 초과한 경우
             if self.switch_count >= 6 and action >= 4:
-                print("battle_env: 최대 교체 횟수(6회)를 초과했습니다.")
+                logger.debug("battle_env: 최대 교체 횟수(6회)를 초과했습니다.")
                 return current_state, -10.0, self.done, {"error": "max_switches_exceeded"}
             
             # 행동 실행
             if my_pokemon.cannot_move:
-                print("battle_env: 행동 불가 상태")
+                logger.debug("battle_env: 행동 불가 상태")
                 battle_action = None
             elif action < 4:  # 기술 사용
                 move = self.my_team[self.battle_store.get_active_index("my")].base.moves[action]
-                print(f"내 기술: {move.name}")
+                logger.debug("내 기술: %s", move.name)
                 battle_action = move
             else:  # 포켓몬 교체
                 current_index = self.battle_store.get_active_index("my")
@@ -279,7 +350,7 @@ class YakemonEnv(gym.Env):
                 available_indices = [i for i in range(3) if i != current_index and self.my_team[i].current_hp > 0]
                 
                 if not available_indices:
-                    print("battle_env: 교체할 수 없습니다.")
+                    logger.debug("battle_env: 교체할 수 없습니다.")
                     self.switching_disabled = True  # 교체 비활성화 플래그 설정
                     return current_state, -5.0, self.done, {"error": "no_available_switch"}
                 
@@ -289,48 +360,48 @@ class YakemonEnv(gym.Env):
                 battle_action = {"type": "switch", "index": switch_index}
                 self.switch_count += 1  # 교체 횟수 증가
                 if not is_monte_carlo:
-                    print(f"내가 교체하려는 포켓몬: {self.my_team[switch_index].base.name}")
+                    logger.info("내가 교체하려는 포켓몬: %s", self.my_team[switch_index].base.name)
                     self.battle_store.add_log(f"내가 교체하려는 포켓몬: {self.my_team[switch_index].base.name}")
             
             # 배틀 시퀀스 실행
-            async with self._battle_sequence_lock:
-                try:
-                    if enemy_action == 7: # 기본값일 때 
-                        print("battle_env: enemy_action is not set, using base_ai_choose_action")
-                        enemy_action = base_ai_choose_action(
-                        side="enemy",
-                        my_team=self.my_team,
-                        enemy_team=self.enemy_team,
-                        active_my=self.battle_store.get_active_index("my"),
-                        active_enemy=self.battle_store.get_active_index("enemy"),
-                        public_env=self.public_env.__dict__,
-                        enemy_env=self.my_env.__dict__,
-                        my_env=self.enemy_env.__dict__,
-                        add_log=self.battle_store.add_log
-                    ) if not test else random_enemy_action(
-                        self.enemy_team, 
-                        self.battle_store.get_active_index("enemy")
-                        )
-                    
-                    # 교체와 기술이 동시에 실행되지 않도록 확인
-                    if isinstance(battle_action, dict) and battle_action["type"] == "switch" and isinstance(enemy_action, dict) and enemy_action["type"] == "switch":
-                        # 둘 다 교체하려는 경우, 랜덤하게 하나만 실행
-                        if random.random() < 0.5:
-                            enemy_action = self.enemy_team[self.battle_store.get_active_index("enemy")].base.moves[0]
-                    
-                    battle_result = await battle_sequence(
-                        my_action=battle_action,
-                        enemy_action=enemy_action,
-                        is_always_hit=is_always_hit,
-                        battle_store=self.battle_store,
-                        duration_store=self.duration_store,
-                        is_monte_carlo=is_monte_carlo
+            try:
+                if enemy_action == 7: # 기본값일 때 
+                    logger.debug("battle_env: enemy_action is not set, using base_ai_choose_action")
+                    enemy_action = base_ai_choose_action(
+                    side="enemy",
+                    my_team=self.my_team,
+                    enemy_team=self.enemy_team,
+                    active_my=self.battle_store.get_active_index("my"),
+                    active_enemy=self.battle_store.get_active_index("enemy"),
+                    public_env=self.public_env.__dict__,
+                    enemy_env=self.my_env.__dict__,
+                    my_env=self.enemy_env.__dict__,
+                    add_log=self.battle_store.add_log,
+                    battle_store=self.battle_store
+                ) if not test else random_enemy_action(
+                    self.enemy_team, 
+                    self.battle_store.get_active_index("enemy")
                     )
-                    result = battle_result["result"]
-                    outcome = battle_result["outcome"]
-                except Exception as e:
-                    print(f"Error during battle sequence: {str(e)}")
-                    return current_state, -5.0, True, {"error": "battle_sequence_error"}
+                
+                # 교체와 기술이 동시에 실행되지 않도록 확인
+                if isinstance(battle_action, dict) and battle_action["type"] == "switch" and isinstance(enemy_action, dict) and enemy_action["type"] == "switch":
+                    # 둘 다 교체하려는 경우, 랜덤하게 하나만 실행
+                    if random.random() < 0.5:
+                        enemy_action = self.enemy_team[self.battle_store.get_active_index("enemy")].base.moves[0]
+                
+                battle_result = battle_sequence_sync(
+                    my_action=battle_action,
+                    enemy_action=enemy_action,
+                    is_always_hit=is_always_hit,
+                    battle_store=self.battle_store,
+                    duration_store=self.duration_store,
+                    is_monte_carlo=is_monte_carlo
+                )
+                result = battle_result["result"]
+                outcome = battle_result["outcome"]
+            except Exception as e:
+                logger.error("Error during battle sequence: %s", str(e))
+                return current_state, -5.0, True, {"error": "battle_sequence_error"}
             
             # 쓰러진 포켓몬 처리
             active_my = self.battle_store.get_active_index("my")
@@ -363,12 +434,13 @@ class YakemonEnv(gym.Env):
                     my_post_pokemon=my_post_pokemon,
                     is_monte_carlo=is_monte_carlo
                 )
-                print(f"Reward in this step: {reward}")
+                logger.info("Reward in this step: %s", reward)
+                emit_event("step", turn=self.turn, action=action, reward=reward, done=self.done)
                 return next_state, reward, self.done, {}
             
             # 내 포켓몬이 쓰러졌는지 확인
             if self.my_team[active_my] and self.my_team[active_my].current_hp <= 0:
-                await remove_fainted_pokemon("my", battle_store=self.battle_store, duration_store=self.duration_store)
+                remove_fainted_pokemon_sync("my", battle_store=self.battle_store, duration_store=self.duration_store)
                 next_state = self._get_state()
                 reward = 0  # 교체만으로는 보상 없음
                 
@@ -377,7 +449,7 @@ class YakemonEnv(gym.Env):
                 enemy_team = self.battle_store.get_team("enemy")
                 if enemy_team and 0 <= active_enemy < len(enemy_team) and enemy_team[active_enemy] is not None:
                     if enemy_team[active_enemy].current_hp <= 0:
-                        await remove_fainted_pokemon("enemy", battle_store=self.battle_store, duration_store=self.duration_store)
+                        remove_fainted_pokemon_sync("enemy", battle_store=self.battle_store, duration_store=self.duration_store)
                         next_state = self._get_state()
                         reward = 0  # 교체만으로는 보상 없음
         
@@ -406,7 +478,8 @@ class YakemonEnv(gym.Env):
                 my_post_pokemon=my_post_pokemon,
                 is_monte_carlo=is_monte_carlo
             )
-            print(f"Reward in this step: {reward}")
+            logger.info("Reward in this step: %s", reward)
+            emit_event("step", turn=self.turn, action=action, reward=reward, done=self.done)
             # 턴 증가
             self.turn += 1
             
@@ -425,9 +498,13 @@ class YakemonEnv(gym.Env):
             return next_state, reward, self.done, info
             
         except Exception as e:
-            print(f"Error in step: {str(e)}")
+            logger.error("Error in step: %s", str(e))
             return current_state, -5.0, True, {"error": "step_error"}
 
+    async def step(self, action: int, enemy_action: any = 7, is_always_hit:Optional[bool]=False, test: Optional[bool] = False, is_monte_carlo: Optional[bool] = False) -> Tuple[np.ndarray, float, bool, Dict]:
+        """기존 async API. step_sync()와 동일"""
+        return self.step_sync(action, enemy_action=enemy_action, is_always_hit=is_always_hit, test=test, is_monte_carlo=is_monte_carlo)
+
     def check_game_end(self) -> bool:
         """게임 종료 조건 체크"""
         # 턴 제한 체크
@@ -445,12 +522,12 @@ class YakemonEnv(gym.Env):
     def render(self, mode='human'):
         """환경의 현재 상태를 시각화"""
         if mode == 'human':
-            print(f"\nTurn: {self.turn}")
-            print(f"My Pokemon: {self.my_team[self.battle_store.get_active_index('my')].name}")
-            print(f"HP: {self.my_team[self.battle_store.get_active_index('my')].hp:.1f}")
-            print(f"Enemy Pokemon: {self.enemy_team[self.battle_store.get_active_index('enemy')].name}")
-            print(f"HP: {self.enemy_team[self.battle_store.get_active_index('enemy')].hp:.1f}")
-            print(f"Public Environment: {self.public_env.get_state()}")
-            print(f"My Environment: {self.my_env.get_state()}")
-            print(f"Enemy Environment: {self.enemy_env.get_state()}")
-            print(f"Done: {self.done}\n")
\ No newline at end of file
+            logger.debug("\nTurn: %s", self.turn)
+            logger.debug("My Pokemon: %s", self.my_team[self.battle_store.get_active_index('my')].name)
+            logger.debug("HP: %.1f", self.my_team[self.battle_store.get_active_index('my')].hp)
+            logger.debug("Enemy Pokemon: %s", self.enemy_team[self.battle_store.get_active_index('enemy')].name)
+            logger.debug("HP: %.1f", self.enemy_team[self.battle_store.get_active_index('enemy')].hp)
+            logger.debug("Public Environment: %s", self.public_env.get_state())
+            logger.debug("My Environment: %s", self.my_env.get_state())
+            logger.debug("Enemy Environment: %s", self.enemy_env.get_state())
+            logger.debug("Done: %s\n", self.done)
\ No newline at end of file
@@ -0,0 +1,125 @@
+# env/vec_battle_env.py
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from context.battle_context import BattleContext
+from env.battle_env import YakemonEnv, HYPERPARAMS
+from RL.state_encoder import get_state_batch
+
+# (my_team, enemy_team)을 반환하는 팀 생성 함수 타입
+TeamSampler = Callable[[], Tuple[list, list]]
+
+
+class YakemonVecEnv:
+    """
+    N개의 배틀을 한 번에 진행하는 벡터화 환경
+
+    각 배틀은 자신만의 BattleContext를 가지므로 서로의 스토어를 건드리지 않는다.
+    step_sync() (async 버전은 step())는 (N,) 행동 배열을 받아 관측 (N, 1237), 행동 마스크 (N, 6), 보상 (N,), 종료 여부 (N,)를
+    한꺼번에 반환하고, 끝난 배틀은 그 자리에서 새 배틀로 리셋한다.
+    """
+
+    def __init__(self, num_envs: int, team_sampler: Optional[TeamSampler] = None):
+        if num_envs <= 0:
+            raise ValueError("num_envs는 1 이상이어야 합니다.")
+        self.num_envs = num_envs
+        self.team_sampler = team_sampler
+        self.envs: List[YakemonEnv] = [YakemonEnv(context=BattleContext()) for _ in range(num_envs)]
+        self.state_dim = HYPERPARAMS["state_dim"]
+        self.action_dim = HYPERPARAMS["action_dim"]
+
+    def _reset_env(self, index: int, my_team=None, enemy_team=None) -> np.ndarray:
+        if my_team is None and enemy_team is None and self.team_sampler is not None:
+            my_team, enemy_team = self.team_sampler()
+        return np.asarray(self.envs[index].reset(my_team=my_team, enemy_team=enemy_team), dtype=np.float32)
+
+    def reset(self, my_teams: Optional[Sequence[list]] = None, enemy_teams: Optional[Sequence[list]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        모든 배틀 초기화
+
+        Returns:
+            observations: (N, state_dim)
+            action_masks: (N, action_dim)
+        """
+        observations = np.zeros((self.num_envs, self.state_dim), dtype=np.float32)
+        for i in range(self.num_envs):
+            observations[i] = self._reset_env(
+                i,
+                my_team=my_teams[i] if my_teams is not None else None,
+                enemy_team=enemy_teams[i] if enemy_teams is not None else None,
+            )
+        return observations, self.get_action_masks()
+
+    def get_observations(self) -> np.ndarray:
+        """현재 모든 배틀의 상태 (N, state_dim)를 한 번에 인코딩"""
+        return get_state_batch([env.context for env in self.envs], turns=[env.turn for env in self.envs])
+
+    def get_action_masks(self) -> np.ndarray:
+        return np.stack([env.get_action_mask() for env in self.envs])
+
+    def step_sync(
+        self,
+        actions: np.ndarray,
+        enemy_actions: Optional[Sequence] = None,
+        is_always_hit: bool = False,
+        test: bool = False,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[Dict]]:
+        """
+        N개의 배틀을 한 스텝씩 진행
+
+        Args:
+            actions: (N,) 각 배틀에서 내가 수행할 행동 (0-5)
+            enemy_actions: 배틀별 상대 행동. 생략하면 YakemonEnv.step의 기본값(7, 기본 AI) 사용
+
+        Returns:
+            observations: (N, state_dim) 다음 상태. 끝난 배틀은 리셋된 새 배틀의 첫 상태
+            action_masks: (N, action_dim) 다음 상태에서의 행동 마스크
+            rewards: (N,)
+            dones: (N,)
+            infos: 배틀별 info. 끝난 배틀은 "terminal_observation"에 마지막 상태를 담는다
+        """
+        actions = np.asarray(actions).reshape(-1)
+        if len(actions) != self.num_envs:
+            raise ValueError(f"actions 길이({len(actions)})가 num_envs({self.num_envs})와 다릅니다.")
+
+        # 배틀 로직은 기다리는 I/O가 없으므로 이벤트 루프 없이 차례로 진행한다
+        results = [
+            env.step_sync(
+                int(actions[i]),
+                enemy_action=enemy_actions[i] if enemy_actions is not None else 7,
+                is_always_hit=is_always_hit,
+                test=test,
+            )
+            for i, env in enumerate(self.envs)
+        ]
+
+        observations = np.zeros((self.num_envs, self.state_dim), dtype=np.float32)
+        rewards = np.zeros(self.num_envs, dtype=np.float32)
+        dones = np.zeros(self.num_envs, dtype=bool)
+        infos: List[Dict] = []
+        for i, (next_state, reward, done, info) in enumerate(results):
+            info = dict(info)
+            rewards[i] = reward
+            dones[i] = done
+            if done:
+                info["terminal_observation"] = np.asarray(next_state, dtype=np.float32)
+                observations[i] = self._reset_env(i)
+            else:
+                observations[i] = next_state
+            infos.append(info)
+
+        return observations, self.get_action_masks(), rewards, dones, infos
+
+    async def step(
+        self,
+        actions: np.ndarray,
+        enemy_actions: Optional[Sequence] = None,
+        is_always_hit: bool = False,
+        test: bool = False,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[Dict]]:
+        """기존 async API. step_sync()와 동일"""
+        return self.step_sync(actions, enemy_actions=enemy_actions, is_always_hit=is_always_hit, test=test)
+
+    def close(self) -> None:
+        self.envs = []
@@ -0,0 +1,118 @@
+#%% [markdown]
+# 오프라인 학습용 self-play 데이터셋 생성
+# 사용법: python generate_dataset.py --out datasets/base_ai --episodes 100000 --workers 4
+# YakemonEnv에서 내 쪽은 --policy, 상대는 --enemy 정책으로 배틀을 돌려
+# transition(상태, 행동 마스크, 행동, 보상, done, 에피소드 id)을 샤드 파일로 저장한다 (utils/transition_shards.py 참고).
+
+#%%
+import argparse
+import multiprocessing as mp
+import random
+from typing import Callable, Dict, Optional, Union
+
+import numpy as np
+
+from context.battle_context import BattleContext
+from env.battle_env import YakemonEnv
+from p_data.mock_pokemon import create_mock_pokemon_list
+from RL.policies import POLICIES
+from RL.state_encoder import STATE_DIM
+from training_distributed import sample_team
+from utils.battle_logger import set_silent
+from utils.transition_shards import ShardWriter, write_index
+
+
+def run_episode(env: YakemonEnv, all_pokemon: list, policy: Callable[[YakemonEnv], int], random_enemy: bool, max_steps: int) -> Dict[str, list]:
+    """배틀 한 판. max_steps에서 끊으면 마지막 done은 False로 남는다"""
+    state = env.reset(my_team=sample_team(all_pokemon), enemy_team=sample_team(all_pokemon))
+    episode = {"observations": [state], "action_masks": [], "actions": [], "rewards": [], "dones": []}
+    done = False
+    while not done and len(episode["actions"]) < max_steps:
+        mask = env.get_action_mask()
+        action = policy(env)
+        state, reward, done, _ = env.step_sync(action, test=random_enemy)
+        episode["observations"].append(state)
+        episode["action_masks"].append(mask)
+        episode["actions"].append(action)
+        episode["rewards"].append(reward)
+        episode["dones"].append(done)
+    return episode
+
+
+def _generate_worker(worker: int, out_dir: str, episodes: int, workers: int, policy: Union[str, Callable],
+                     random_enemy: bool, shard_size: int, packed: bool, seed: int, max_steps: int, quiet: bool) -> list:
+    random.seed(seed + worker)
+    np.random.seed(seed + worker)
+    if quiet:
+        set_silent()
+    policy_fn = POLICIES[policy] if isinstance(policy, str) else policy
+    env = YakemonEnv(context=BattleContext())
+    all_pokemon = create_mock_pokemon_list()
+    writer = ShardWriter(out_dir, shard_size=shard_size, prefix=f"shard_w{worker:02d}", packed=packed)
+    # 에피소드 id는 워커끼리 겹치지 않게 worker, worker + workers, ... 를 사용
+    for episode_id in range(worker, episodes, workers):
+        writer.add_episode(episode_id, **run_episode(env, all_pokemon, policy_fn, random_enemy, max_steps))
+    return writer.close()
+
+
+def generate(
+    out_dir: str,
+    episodes: int,
+    policy: Union[str, Callable[[YakemonEnv], int]] = "base_ai",
+    enemy: str = "base_ai",
+    workers: int = 1,
+    shard_size: int = 100_000,
+    packed: bool = False,
+    seed: int = 0,
+    max_steps: int = 200,
+    quiet: bool = True,
+) -> Dict:
+    """
+    배틀을 episodes판 돌려 out_dir에 샤드와 index.json을 쓰고 index를 반환
+
+    policy는 POLICIES의 이름이나 env -> 행동 번호 함수 (workers > 1이면 pickle 가능한 최상위 함수),
+    enemy는 "base_ai"(env 기본 상대) 또는 "random"(env.step의 test 모드).
+    """
+    if enemy not in ("base_ai", "random"):
+        raise ValueError(f"Unknown enemy policy: {enemy}")
+    job_args = [
+        (worker, out_dir, episodes, workers, policy, enemy == "random", shard_size, packed, seed, max_steps, quiet)
+        for worker in range(workers)
+    ]
+    if workers == 1:
+        shard_lists = [_generate_worker(*job_args[0])]
+    else:
+        with mp.Pool(workers) as pool:
+            shard_lists = pool.starmap(_generate_worker, job_args)
+    shards = [shard for shard_list in shard_lists for shard in shard_list]
+    return write_index(
+        out_dir, shards, STATE_DIM, packed=packed,
+        policy=policy if isinstance(policy, str) else getattr(policy, "__name__", "custom"),
+        enemy=enemy, seed=seed, max_steps=max_steps,
+    )
+
+
+def main(argv: Optional[list] = None):
+    parser = argparse.ArgumentParser(description="self-play 배틀로 오프라인 학습용 transition 샤드 생성")
+    parser.add_argument("--out", required=True, help="샤드와 index.json을 쓸 디렉터리")
+    parser.add_argument("--episodes", type=int, default=1000)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="base_ai", help="내 쪽 정책")
+    parser.add_argument("--enemy", choices=["base_ai", "random"], default="base_ai", help="상대 정책")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--shard-size", type=int, default=100_000, help="샤드당 transition 수 (에피소드 단위로 끊음)")
+    parser.add_argument("--packed", action="store_true", help="상태를 비트 압축해서 저장 (RL/state_codec.py)")
+    parser.add_argument("--max-steps", type=int, default=200, help="에피소드당 최대 스텝")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--verbose", action="store_true", help="배틀 로그 출력")
+    args = parser.parse_args(argv)
+
+    index = generate(
+        args.out, args.episodes, policy=args.policy, enemy=args.enemy, workers=args.workers,
+        shard_size=args.shard_size, packed=args.packed, seed=args.seed, max_steps=args.max_steps,
+        quiet=not args.verbose,
+    )
+    print(f"{index['episodes']:,} episodes / {index['transitions']:,} transitions / {len(index['shards'])} shards -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 import random
-from typing import List, Dict, Union
+from typing import List, Dict, Sequence, Tuple, Union
 from typing import Optional
 from p_models.ability_info import AbilityInfo
 
@@ -128,17 +128,32 @@ available_abilities: List[AbilityInfo] = [
     AbilityInfo(120, '저주받은바디', defensive=['status_change'])
 ]
 
-# abilityData 함수 변환
-def ability_data(abilities: List[str]) -> AbilityInfo:
-    selected = [
-        ability for ability in available_abilities
-        if ability.name in abilities
-    ]
+# 이름 / id -> AbilityInfo 인덱스 (import 시 한 번만 만든다)
+# 같은 이름이 여러 개면(예: 변환자재) ABILITIES_BY_NAME에는 첫 번째가 들어가고,
+# resolve_abilities()는 기존처럼 모두 후보로 넣는다.
+ABILITIES_BY_ID: Dict[int, AbilityInfo] = {ability.id: ability for ability in available_abilities}
+ABILITIES_BY_NAME: Dict[str, AbilityInfo] = {}
+_ABILITY_POSITIONS: Dict[str, List[int]] = {}
+for _position, _ability in enumerate(available_abilities):
+    ABILITIES_BY_NAME.setdefault(_ability.name, _ability)
+    _ABILITY_POSITIONS.setdefault(_ability.name, []).append(_position)
 
-    invalid_names = [name for name in abilities if not any(ability.name == name for ability in available_abilities)]
+def resolve_abilities(abilities: List[str]) -> Tuple[AbilityInfo, ...]:
+    """특성 이름 목록 -> 후보 특성 (available_abilities 순서). 유효하지 않은 이름이 있으면 빈 튜플"""
+    invalid_names = [name for name in abilities if name not in _ABILITY_POSITIONS]
 
     if invalid_names:
         print(f"[abilityData] 유효하지 않은 특성 이름{'들' if len(invalid_names) > 1 else ''} 감지됨:\n- " + "\n- ".join(invalid_names))
+        return ()
+
+    positions = sorted({position for name in abilities for position in _ABILITY_POSITIONS[name]})
+    return tuple(available_abilities[position] for position in positions)
+
+def choose_ability(selected: Sequence[AbilityInfo]) -> AbilityInfo:
+    if not selected:
         return available_abilities[0]  # fallback: '없음' 리턴
+    return random.choice(selected)
 
-    return random.choice(selected)
\ No newline at end of file
+# abilityData 함수 변환
+def ability_data(abilities: List[str]) -> AbilityInfo:
+    return choose_ability(resolve_abilities(abilities))
@@ -1,7 +1,7 @@
 # move_data.py
 
 import random
-from typing import List, Dict
+from typing import List, Dict, Sequence, Tuple
 from utils.shuffle_array import shuffle_array
 from p_models.move_info import MoveInfo, MoveEffect, StatChange
 
@@ -3866,29 +3866,32 @@ move_datas = [
     )
 ]
 
-def move_data(move_names: List[str], types: List[str]) -> List[MoveInfo]:
-    # 1. moveDatas에서 name 일치하는 MoveInfo 찾기
-    selected = [m for name in move_names for m in move_datas if m.name == name]
-    
+# 이름 / id -> MoveInfo 인덱스 (import 시 한 번만 만든다)
+MOVES_BY_NAME: Dict[str, MoveInfo] = {m.name: m for m in move_datas}
+MOVES_BY_ID: Dict[int, MoveInfo] = {m.id: m for m in move_datas}
+
+def resolve_moves(move_names: List[str]) -> Tuple[MoveInfo, ...]:
+    # moveDatas에서 name 일치하는 MoveInfo 찾기
+    selected = tuple(MOVES_BY_NAME[name] for name in move_names if name in MOVES_BY_NAME)
+
     if len(selected) != len(move_names):
         for m_name in move_names:
-            if not any(m.name == m_name for m in move_datas):
+            if m_name not in MOVES_BY_NAME:
                 print(f"Warning: moveData - moveNames에 없는 기술: {m_name}")
-    
-    # 2. 자속 기술 골라내기 (type 일치 && power ≥ 10)
-    preferred = [move for move in selected if move.type in types and move.power >= 10]
+    return selected
 
-    # 3. 나머지 기술 (비자속)
-    non_preferred = [move for move in selected if move not in preferred]
+def choose_moves(selected: Sequence[MoveInfo], types: Sequence[str]) -> List[MoveInfo]:
+    # 1. 자속 기술 골라내기 (type 일치 && power ≥ 10)
+    preferred = [move for move in selected if move.type in types and move.power >= 10]
 
     chosen = []
 
-    # 4. 자속 기술 하나 강제 포함
+    # 2. 자속 기술 하나 강제 포함
     if preferred:
         random_preferred = random.choice(preferred)
         chosen.append(random_preferred)
 
-    # 5. 남은 기술 중에서 나머지 선택
+    # 3. 남은 기술 중에서 나머지 선택
     remaining_pool = shuffle_array([m for m in selected if m not in chosen])
 
     for move in remaining_pool:
@@ -3903,4 +3906,7 @@ def move_data(move_names: List[str], types: List[str]) -> List[MoveInfo]:
 
         chosen.append(move)
 
-    return shuffle_array(chosen)
\ No newline at end of file
+    return shuffle_array(chosen)
+
+def move_data(move_names: List[str], types: List[str]) -> List[MoveInfo]:
+    return choose_moves(resolve_moves(move_names), types)
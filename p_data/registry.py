@@ -0,0 +1,38 @@
+# p_data/registry.py
+"""
+기술 / 특성 / 포켓몬 종족 레지스트리
+
+모든 인덱스는 각 데이터 모듈 import 시 한 번만 만들어지며, 이름이나 id로 O(1) 조회한다.
+반환되는 MoveInfo / AbilityInfo / SpeciesRecord는 공유 객체이므로 수정하지 않는다.
+"""
+from typing import Union
+
+from p_data.ability_data import ABILITIES_BY_ID, ABILITIES_BY_NAME
+from p_data.mock_pokemon import POKEMON_SPECIES, SPECIES_BY_ID, SPECIES_BY_NAME, SpeciesRecord
+from p_data.move_data import MOVES_BY_ID, MOVES_BY_NAME
+from p_models.ability_info import AbilityInfo
+from p_models.move_info import MoveInfo
+
+Key = Union[str, int]
+
+
+def get_move(key: Key) -> MoveInfo:
+    """기술 이름 또는 id로 MoveInfo 조회 (없으면 KeyError)"""
+    return MOVES_BY_ID[key] if isinstance(key, int) else MOVES_BY_NAME[key]
+
+
+def get_ability(key: Key) -> AbilityInfo:
+    """특성 이름 또는 id로 AbilityInfo 조회 (없으면 KeyError)"""
+    return ABILITIES_BY_ID[key] if isinstance(key, int) else ABILITIES_BY_NAME[key]
+
+
+def get_species(key: Key) -> SpeciesRecord:
+    """포켓몬 이름 또는 도감 번호로 SpeciesRecord 조회 (없으면 KeyError)"""
+    return SPECIES_BY_ID[key] if isinstance(key, int) else SPECIES_BY_NAME[key]
+
+
+__all__ = [
+    "ABILITIES_BY_ID", "ABILITIES_BY_NAME", "MOVES_BY_ID", "MOVES_BY_NAME",
+    "POKEMON_SPECIES", "SPECIES_BY_ID", "SPECIES_BY_NAME", "SpeciesRecord",
+    "get_ability", "get_move", "get_species",
+]
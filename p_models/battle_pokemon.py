@@ -1,10 +1,37 @@
+from operator import attrgetter
 from typing import Optional, List, Dict, Callable, TYPE_CHECKING
 from p_models.pokemon_info import PokemonInfo
 from p_models.rank_state import RankState
+from p_models.status import StatusList, as_status_list
 if TYPE_CHECKING:
     from p_models.move_info import MoveInfo
 
+_FIELDS = (
+    "base", "current_hp", "pp", "rank", "status", "position", "is_active", "locked_move", "locked_move_turn",
+    "is_protecting", "used_move", "had_missed", "had_rank_up", "is_charging", "charging_move", "received_damage",
+    "dealt_damage", "is_first_turn", "cannot_move", "form_num", "form_condition", "un_usable_move", "lost_type",
+    "temp_type", "substitute",
+)
+_FIELD_SET = frozenset(_FIELDS)
+_get_fields = attrgetter(*_FIELDS)
+_new_pokemon = object.__new__
+
+
+def _set_fields(pokemon: 'BattlePokemon', values) -> None:
+    """_FIELDS 순서의 값을 슬롯에 한 번에 대입"""
+    (
+        pokemon.base, pokemon.current_hp, pokemon.pp, pokemon.rank, pokemon.status, pokemon.position,
+        pokemon.is_active, pokemon.locked_move, pokemon.locked_move_turn, pokemon.is_protecting, pokemon.used_move,
+        pokemon.had_missed, pokemon.had_rank_up, pokemon.is_charging, pokemon.charging_move, pokemon.received_damage,
+        pokemon.dealt_damage, pokemon.is_first_turn, pokemon.cannot_move, pokemon.form_num, pokemon.form_condition,
+        pokemon.un_usable_move, pokemon.lost_type, pokemon.temp_type, pokemon.substitute,
+    ) = values
+
+
 class BattlePokemon:
+    # 속성 dict 없이 슬롯에만 저장 (객체가 작아지고 속성 접근 / 복사 / 스냅샷이 빨라진다)
+    __slots__ = _FIELDS
+
     def __init__(
         self,
         base: PokemonInfo,  
@@ -37,7 +64,7 @@ class BattlePokemon:
         self.current_hp = current_hp
         self.pp = pp
         self.rank = rank
-        self.status = status
+        self.status: StatusList = as_status_list(status)
         self.position = position
         self.is_active = is_active
         self.locked_move = locked_move
@@ -60,30 +87,45 @@ class BattlePokemon:
         self.substitute = substitute
         
     def copy_with(self, **overrides) -> 'BattlePokemon':
-        return BattlePokemon(
-            base=overrides.get("base", self.base),
-            current_hp=overrides.get("current_hp", self.current_hp),
-            pp=overrides.get("pp", self.pp.copy()),
-            rank=overrides.get("rank", self.rank.copy()),
-            status=overrides.get("status", self.status.copy()),
-            position=overrides.get("position", self.position),
-            is_active=overrides.get("is_active", self.is_active),
-            locked_move=overrides.get("locked_move", self.locked_move),
-            locked_move_turn=overrides.get("locked_move_turn", self.locked_move_turn),
-            is_protecting=overrides.get("is_protecting", self.is_protecting),
-            used_move=overrides.get("used_move", self.used_move),
-            had_missed=overrides.get("had_missed", self.had_missed),
-            had_rank_up=overrides.get("had_rank_up", self.had_rank_up),
-            is_charging=overrides.get("is_charging", self.is_charging),
-            charging_move=overrides.get("charging_move", self.charging_move),
-            received_damage=overrides.get("received_damage", self.received_damage),
-            dealt_damage=overrides.get("dealt_damage", self.dealt_damage),
-            is_first_turn=overrides.get("is_first_turn", self.is_first_turn),
-            cannot_move=overrides.get("cannot_move", self.cannot_move),
-            form_num=overrides.get("form_num", self.form_num),
-            form_condition=overrides.get("form_condition", self.form_condition),
-            un_usable_move=overrides.get("un_usable_move", self.un_usable_move),
-            lost_type=overrides.get("lost_type", self.lost_type),
-            temp_type=overrides.get("temp_type", self.temp_type.copy() if self.temp_type else None),
-            substitute=overrides.get("substitute", self.substitute),
-        )
\ No newline at end of file
+        # __init__을 거치지 않고 슬롯 값을 그대로 옮긴다.
+        # pp / rank / status / temp_type 컨테이너는 공유하므로 (copy-on-write), 바꿀 때는 제자리 수정 대신 새 컨테이너를 대입한다
+        # (update_battle_pokemon의 헬퍼들이 그렇게 동작한다)
+        new = _new_pokemon(BattlePokemon)
+        _set_fields(new, _get_fields(self))
+        for name, value in overrides.items():
+            if name not in _FIELD_SET:
+                raise TypeError(f"copy_with()에 알 수 없는 필드: {name!r}")
+            setattr(new, name, value)
+        if "status" in overrides:
+            new.status = as_status_list(new.status)
+        return new
+
+    def snapshot(self) -> tuple:
+        """
+        배틀 중에 바뀌는 값만 복사한 스냅샷.
+        PokemonInfo / MoveInfo 객체는 참조로 공유하고, 배틀 로직이 덮어쓰는 속성(types, ability, 기술의 priority/pp)만 따로 기억한다.
+        """
+        state = dict(zip(_FIELDS, _get_fields(self)))
+        state["pp"] = self.pp.copy()
+        state["rank"] = self.rank.copy()
+        state["status"] = self.status.copy()
+        if self.temp_type is not None:
+            state["temp_type"] = self.temp_type.copy()
+        base = self.base
+        return state, base.types, base.ability, [(move.priority, move.pp) for move in base.moves]
+
+    def restore(self, snapshot: tuple) -> None:
+        """snapshot() 시점으로 되돌린다. 같은 스냅샷으로 여러 번 복원할 수 있다."""
+        state, types, ability, move_state = snapshot
+        _set_fields(self, state.values())
+        self.pp = state["pp"].copy()
+        self.rank = state["rank"].copy()
+        self.status = state["status"].copy()
+        if state["temp_type"] is not None:
+            self.temp_type = state["temp_type"].copy()
+        base = self.base
+        base.types = types
+        base.ability = ability
+        for move, (priority, pp) in zip(base.moves, move_state):
+            move.priority = priority
+            move.pp = pp
@@ -1,6 +1,9 @@
 # rank_status.py
 
 from typing import Dict, Literal
+from utils.battle_logger import get_logger
+
+logger = get_logger(__name__)
 
 # 타입 정의
 RankStat = Literal['attack', 'sp_attack', 'defense', 'sp_defense', 'speed', 'accuracy', 'dodge', 'critical']
@@ -30,7 +33,7 @@ class RankManager:
             'dodge': 0,
             'critical': 0,
         }
-        print("랭크가 리셋됐다!")
+        logger.debug("랭크가 리셋됐다!")
         self.state = self.clamp_state(reset)
         return self.state
 
@@ -41,13 +44,13 @@ class RankManager:
     def increase_state(self, which_state: RankStat, rank: int) -> None:
         if which_state in self.state:
             self.state[which_state] = self.state.get(which_state, 0) + rank
-            print(f"RankManager: {which_state}이/가 {rank}만큼 올랐다!")
+            logger.debug("RankManager: %s이/가 %s만큼 올랐다!", which_state, rank)
             self.state = self.clamp_state(self.state)
 
     def decrease_state(self, which_state: RankStat, rank: int) -> None:
         if which_state in self.state:
             self.state[which_state] = self.state.get(which_state, 0) - rank
-            print(f"RankManager: {which_state}이/가 {rank}만큼 내려갔다!")
+            logger.debug("RankManager: %s이/가 %s만큼 내려갔다!", which_state, rank)
             self.state = self.clamp_state(self.state)
 
     def clamp_state(self, state: RankState) -> RankState:
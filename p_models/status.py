@@ -1,4 +1,7 @@
-from typing import List, Literal, Union
+from typing import Dict, Iterable, List, Literal, Tuple, Union, get_args
+from utils.battle_logger import get_logger
+
+logger = get_logger(__name__)
 
 # StatusState 타입 정의
 StatusState = Union[Literal[
@@ -8,17 +11,107 @@ StatusState = Union[Literal[
     '하품', '교체불가', '조이기', '멸망의노래'
 ], None]
 
+# 상태이상 비트 번호 = StatusState에 적힌 순서
+STATUS_NAMES: Tuple[str, ...] = get_args(get_args(StatusState)[0])
+STATUS_BIT: Dict[str, int] = {name: 1 << i for i, name in enumerate(STATUS_NAMES)}
+
+
+def status_mask(statuses: Iterable[StatusState]) -> int:
+    """상태이상 이름들 -> 비트마스크 (StatusState에 없는 값은 무시)"""
+    bits = 0
+    for status in statuses:
+        bits |= STATUS_BIT.get(status, 0)
+    return bits
+
+
+EXCLUSIVE_MASK = status_mask(['마비', '독', '맹독', '얼음', '잠듦', '화상'])
+
+
+class StatusList(list):
+    """
+    상태이상 이름 리스트 + 비트마스크(bits).
+    기존처럼 문자열 리스트로 쓰면서 여러 상태를 한 번에 검사할 때는 bits & mask로 O(1)에 확인한다.
+    리스트를 바꾸는 메서드는 모두 bits를 같이 갱신한다.
+    """
+    __slots__ = ("bits",)
+
+    def __init__(self, statuses: Iterable[StatusState] = ()):
+        super().__init__(statuses)
+        self.bits = status_mask(self)
+
+    def has(self, status: StatusState) -> bool:
+        return bool(self.bits & STATUS_BIT.get(status, 0))
+
+    def has_any(self, mask: int) -> bool:
+        return bool(self.bits & mask)
+
+    def copy(self) -> 'StatusList':
+        new = list.__new__(StatusList)
+        list.extend(new, self)
+        new.bits = self.bits
+        return new
+
+    def _sync(self) -> None:
+        self.bits = status_mask(self)
+
+    def append(self, status: StatusState) -> None:
+        super().append(status)
+        self.bits |= STATUS_BIT.get(status, 0)
+
+    def extend(self, statuses: Iterable[StatusState]) -> None:
+        super().extend(statuses)
+        self._sync()
+
+    def insert(self, index: int, status: StatusState) -> None:
+        super().insert(index, status)
+        self.bits |= STATUS_BIT.get(status, 0)
+
+    def remove(self, status: StatusState) -> None:
+        super().remove(status)
+        self._sync()
+
+    def pop(self, index: int = -1) -> StatusState:
+        status = super().pop(index)
+        self._sync()
+        return status
+
+    def clear(self) -> None:
+        super().clear()
+        self.bits = 0
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self._sync()
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._sync()
+
+    def __iadd__(self, statuses: Iterable[StatusState]) -> 'StatusList':
+        self.extend(statuses)
+        return self
+
+    def __imul__(self, n: int) -> 'StatusList':
+        super().__imul__(n)
+        self._sync()
+        return self
+
+
+def as_status_list(statuses: Iterable[StatusState]) -> StatusList:
+    """StatusList는 그대로, 그 밖의 리스트는 StatusList로 감싼다"""
+    return statuses if type(statuses) is StatusList else StatusList(statuses)
+
+
 class StatusManager:
     def __init__(self, initial_status: List[StatusState] = []):
-        self.status: List[StatusState] = initial_status.copy()
+        self.status: StatusList = StatusList(initial_status)
 
     def add_status(self, status: StatusState) -> None:
         if not status or self.has_status(status):
             return
 
-        exclusive = ['마비', '독', '맹독', '얼음', '잠듦', '화상']
-        if any(s in self.status for s in exclusive) and status in exclusive:
-            print('중복 상태이상!')
+        if self.status.bits & EXCLUSIVE_MASK and STATUS_BIT.get(status, 0) & EXCLUSIVE_MASK:
+            logger.debug("중복 상태이상!")
             return
 
         self.status.append(status)
@@ -26,11 +119,10 @@ class StatusManager:
     def remove_status(self, status: StatusState) -> None:
         if status not in self.status:
             return
-        new_status = [s for s in self.status if s != status]
-        self.status = new_status
+        self.status = StatusList(s for s in self.status if s != status)
 
     def clear_status(self) -> None:
-        self.status = []
+        self.status = StatusList()
 
     def has_status(self, status: StatusState) -> bool:
         return status in self.status
@@ -38,4 +130,4 @@ class StatusManager:
     def get_status(self) -> List[StatusState]:
         return self.status
 
-__all__ = ['StatusState', 'StatusManager']
\ No newline at end of file
+__all__ = ['StatusState', 'StatusManager', 'StatusList', 'STATUS_NAMES', 'STATUS_BIT', 'status_mask', 'as_status_list']
\ No newline at end of file
@@ -0,0 +1,100 @@
+#%% [markdown]
+# 오프라인 사전학습: generate_dataset.py로 만든 샤드로 시뮬레이터 없이 학습
+# 사용법: python pretrain_offline.py --data datasets/base_ai --agent dddqn --epochs 3 --save models/pretrained_ddqn.pth
+
+#%%
+import argparse
+import os
+import time
+
+import torch
+
+from context.battle_context import BattleContext
+from env.battle_env import YakemonEnv
+from agent.dddqn_agent import DDDQNAgent
+from agent.rainbow_agent import DQNAgent
+from utils.offline_loader import ShardStreamLoader
+
+
+def build_agent(agent_type: str, batch_size: int):
+    """각 학습 스크립트(training_dqn.py / rainbow.py)의 하이퍼파라미터로 에이전트 생성"""
+    if agent_type == "dddqn":
+        from training_dqn import hyperparams
+        return DDDQNAgent(
+            state_dim=hyperparams["state_dim"],
+            action_dim=hyperparams["action_dim"],
+            learning_rate=hyperparams["learning_rate"],
+            gamma=hyperparams["gamma"],
+            epsilon_start=hyperparams["epsilon_start"],
+            epsilon_end=hyperparams["epsilon_end"],
+            epsilon_decay=hyperparams["epsilon_decay"],
+            target_update=hyperparams["target_update"],
+            memory_size=batch_size,  # 오프라인 학습에서는 리플레이 버퍼를 쓰지 않음
+            batch_size=batch_size
+        )
+    if agent_type == "rainbow":
+        from rainbow import HYPERPARAMS
+        return DQNAgent(
+            env=YakemonEnv(context=BattleContext()),
+            memory_size=batch_size,
+            batch_size=batch_size,
+            target_update=HYPERPARAMS["target_update"],
+            seed=42,
+            gamma=HYPERPARAMS["gamma"],
+            alpha=HYPERPARAMS["alpha"],
+            beta=HYPERPARAMS["beta"],
+            prior_eps=HYPERPARAMS["prior_eps"],
+            v_min=HYPERPARAMS["v_min"],
+            v_max=HYPERPARAMS["v_max"],
+            atom_size=HYPERPARAMS["atom_size"],
+            n_step=HYPERPARAMS["n_step"],
+            learning_rate=HYPERPARAMS["learning_rate"]
+        )
+    raise ValueError(f"Unknown agent_type: {agent_type}")
+
+
+def pretrain(agent, agent_type: str, loader: ShardStreamLoader, log_interval: int = 100) -> list:
+    """loader의 배치를 모두 한 번씩 학습하고 배치별 손실을 반환"""
+    update = agent.train if agent_type == "dddqn" else agent.update_model
+    losses = []
+    start = time.perf_counter()
+    for step, batch in enumerate(loader, 1):
+        losses.append(update(batch))
+        if step % log_interval == 0:
+            recent = losses[-log_interval:]
+            elapsed = time.perf_counter() - start
+            print(f"[pretrain] batch {step}/{len(loader)} loss {sum(recent) / len(recent):.4f} ({step / elapsed:.1f} batch/s)")
+    return losses
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="transition 샤드로 DDDQN / rainbow 네트워크 오프라인 사전학습")
+    parser.add_argument("--data", required=True, help="generate_dataset.py의 --out 디렉터리")
+    parser.add_argument("--agent", choices=["dddqn", "rainbow"], default="dddqn")
+    parser.add_argument("--epochs", type=int, default=1)
+    parser.add_argument("--batch-size", type=int, default=1024)
+    parser.add_argument("--shuffle-window", type=int, default=65536)
+    parser.add_argument("--prefetch", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", default=None, help="학습한 모델 저장 경로 (.pth)")
+    args = parser.parse_args(argv)
+
+    torch.manual_seed(args.seed)
+    agent = build_agent(args.agent, args.batch_size)
+    loader = ShardStreamLoader(
+        args.data, args.batch_size, shuffle_window=args.shuffle_window, prefetch=args.prefetch,
+        epochs=args.epochs, seed=args.seed,
+    )
+    losses = pretrain(agent, args.agent, loader)
+    print(f"[pretrain] {len(losses)} batches, final loss {losses[-1] if losses else 0.0:.4f}")
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.save) or ".", exist_ok=True)
+        if args.agent == "dddqn":
+            agent.save(args.save)
+        else:
+            torch.save(agent.dqn.state_dict(), args.save)
+
+
+if __name__ == "__main__":
+    main()
@@ -61,6 +61,10 @@ HYPERPARAMS = {
     "state_dim": 1165,  # get_state_vector의 출력 차원
     "action_dim": 6,   # 4개의 기술 + 2개의 교체
     "learning_rate": 0.0003,  # 학습률 추가
+    "replay_dir": None,  # 리플레이 버퍼 memmap 디렉터리. 지정하면 재시작 후 모델 저장 시점의 버퍼를 이어서 사용
+    # obs를 한 번씩만 저장하고 memory / memory_n이 프레임을 공유 (replay_dir과 함께 쓸 수 없음).
+    # 켜면 1-step memory가 n-step 창 대신 실제 1-step transition을 저장하므로 학습 목표가 기본 설정과 달라진다
+    "dedup_frames": False,
 }
 
 #%% [markdown]
@@ -203,6 +207,7 @@ async def train_agent(
         # 주기적으로 모델 저장
         if (episode + 1) % HYPERPARAMS["save_interval"] == 0:
             torch.save(agent.dqn.state_dict(), os.path.join(save_path, f'{agent_name}_episode_{episode+1}.pth'))
+            agent.flush_memory()
         
         # 학습 진행 상황 출력
         print(f'Episode {episode+1}/{num_episodes}')
@@ -379,7 +384,9 @@ if __name__ == "__main__":
         v_max=HYPERPARAMS["v_max"],
         atom_size=HYPERPARAMS["atom_size"],
         n_step=HYPERPARAMS["n_step"],
-        learning_rate=HYPERPARAMS["learning_rate"]
+        learning_rate=HYPERPARAMS["learning_rate"],
+        replay_dir=HYPERPARAMS["replay_dir"],
+        dedup_frames=HYPERPARAMS["dedup_frames"],
     )
     
     print("Starting Rainbow DQN training...")
@@ -0,0 +1,44 @@
+import unittest
+from copy import copy
+
+from battle_test_case import BattleTestCase
+from p_data.ability_data import available_abilities
+from utils.battle_logics.apply_appearance import apply_appearance
+
+
+def _ability(name):
+    return next(a for a in available_abilities if a.name == name)
+
+
+class TestTraceAppearance(BattleTestCase):
+    seed = 19
+
+    def _set_active_ability(self, side, name):
+        index = self.store.get_active_index(side)
+        base = copy(self.store.get_team(side)[index].base)
+        base.ability = _ability(name)
+        self.store.update_pokemon(side, index, lambda p: p.copy_with(base=base))
+        return self.store.get_team(side)[index]
+
+    def test_trace_copies_opponent_ability(self):
+        opponent = self._set_active_ability("my", "위협")
+        opponent_base = opponent.base
+        tracer = self._set_active_ability("enemy", "트레이스")
+        apply_appearance(tracer, "enemy", battle_store=self.store, duration_store=self.env.duration_store)
+
+        traced = self.store.get_team("enemy")[self.store.get_active_index("enemy")]
+        self.assertEqual(traced.base.ability.name, "위협")
+        self.assertIsNot(traced.base, tracer.base)
+        self.assertEqual(tracer.base.ability.name, "트레이스")
+        self.assertIs(opponent.base, opponent_base)
+        # 복사한 위협도 등장 효과가 발동한다
+        self.assertEqual(self.store.get_team("my")[self.store.get_active_index("my")].rank["attack"], -1)
+
+    def test_copy_with_rejects_unknown_field(self):
+        pokemon = self.store.get_team("my")[0]
+        with self.assertRaises(TypeError):
+            pokemon.copy_with(ability=None)
+
+
+if __name__ == "__main__":
+    unittest.main()
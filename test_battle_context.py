@@ -0,0 +1,44 @@
+import asyncio
+import contextlib
+import io
+import random
+import unittest
+
+from context.battle_context import BattleContext
+from context.battle_store import store
+from context.duration_store import duration_store
+from env.battle_env import YakemonEnv
+
+
+class TestBattleContext(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.env_a = YakemonEnv(context=BattleContext())
+            self.env_b = YakemonEnv(context=BattleContext())
+
+    def test_contexts_are_independent(self):
+        self.assertIsNot(self.env_a.battle_store, self.env_b.battle_store)
+        self.assertIsNot(self.env_a.battle_store, store)
+        self.assertIs(self.env_a.duration_store.battle_store, self.env_a.battle_store)
+
+    def test_step_does_not_touch_other_context(self):
+        hp_before = [p.current_hp for p in self.env_b.enemy_team + self.env_b.my_team]
+        global_logs = list(store.get_state()["logs"])
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(3):
+                asyncio.run(self.env_a.step(0, test=True, is_always_hit=True))
+        self.assertEqual(hp_before, [p.current_hp for p in self.env_b.enemy_team + self.env_b.my_team])
+        self.assertEqual(self.env_b.battle_store.get_state()["logs"], [])
+        self.assertEqual(global_logs, store.get_state()["logs"])
+        self.assertGreater(len(self.env_a.battle_store.get_state()["logs"]), 0)
+
+    def test_copy_keeps_stores_linked(self):
+        copied = self.env_a.context.copy()
+        self.assertIsNot(copied.battle_store, self.env_a.battle_store)
+        self.assertIs(copied.duration_store.battle_store, copied.battle_store)
+        self.assertIsNot(duration_store.battle_store, copied.battle_store)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import asyncio
+import contextlib
+import io
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from context.battle_context import BattleContext
+from env.battle_env import YakemonEnv
+from utils.battle_logger import (
+    EventSink, JsonlEventSink, ListEventSink, get_logger, set_event_sink, set_level, set_silent
+)
+
+
+class TestBattleLogger(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.env = YakemonEnv(context=BattleContext())
+
+    def tearDown(self):
+        set_silent(False)
+        set_level("NOTSET", "utils.battle_logics.damage_calculator")
+        set_event_sink(None)
+
+    def _step(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            asyncio.run(self.env.step(0, test=True, is_always_hit=True))
+        return out.getvalue()
+
+    def test_default_prints_to_stdout(self):
+        self.assertIn("Reward in this step", self._step())
+
+    def test_silent_mode(self):
+        set_silent()
+        self.assertEqual(self._step(), "")
+
+    def test_module_level(self):
+        set_level("WARNING", "utils.battle_logics.damage_calculator")
+        self.assertFalse(get_logger("utils.battle_logics.damage_calculator").isEnabledFor(20))
+        self.assertTrue(get_logger("utils.battle_logics.battle_sequence").isEnabledFor(10))
+
+    def test_event_sink(self):
+        set_silent()
+        sink = ListEventSink()
+        set_event_sink(sink)
+        self._step()
+        events = [record["event"] for record in sink.records]
+        self.assertIn("move", events)
+        self.assertEqual(events[-1], "step")
+
+    def test_sink_without_write_fails_at_construction(self):
+        class NoWriteSink(EventSink):
+            pass
+
+        with self.assertRaises(TypeError):
+            NoWriteSink()
+        with self.assertRaises(TypeError):
+            EventSink()
+
+    def test_jsonl_sink(self):
+        set_silent()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "events.jsonl")
+            sink = JsonlEventSink(path)
+            set_event_sink(sink)
+            self._step()
+            sink.close()
+            with open(path, encoding="utf-8") as f:
+                records = [json.loads(line) for line in f]
+        self.assertTrue(records)
+        self.assertTrue(all("event" in record for record in records))
+
+
+if __name__ == "__main__":
+    unittest.main()
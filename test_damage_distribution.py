@@ -0,0 +1,66 @@
+import random
+import unittest
+
+import numpy as np
+
+from battle_test_case import BattleTestCase
+from RL.rollout_evaluator import analytic_scores
+from utils.battle_logics.battle_sequence import handle_move_sync
+from utils.battle_logics.damage_distribution import (
+    MULTI_HIT_COUNTS,
+    damage_distribution,
+    hit_count_distribution,
+    move_distributions,
+)
+
+
+class TestDamageDistribution(BattleTestCase):
+    seed = 6
+
+    def _active(self, side):
+        return self.store.get_team(side)[self.store.get_active_index(side)]
+
+    def test_distributions_are_normalized_and_side_effect_free(self):
+        random_state = random.getstate()
+        attacker = self._active("my")
+        ranks = dict(attacker.rank)
+        for dist in move_distributions("my", battle_store=self.store, duration_store=self.durations):
+            self.assertAlmostEqual(dist.probs.sum(), 1.0)
+            self.assertTrue(np.all(dist.damages <= dist.hp))
+            self.assertTrue(0.0 <= dist.ko_probability <= 1.0)
+        self.assertEqual(random.getstate(), random_state)
+        self.assertEqual(attacker.rank, ranks)
+        np.testing.assert_array_equal(self.env._get_state(), self.state)
+
+    def test_sure_hit_and_sure_crit_matches_simulator(self):
+        attacker, defender = self._active("my"), self._active("enemy")
+        attacker.rank["critical"] = 3  # 급소 확률 1
+        move = next(
+            m for m in attacker.base.moves
+            if m.category != "변화" and not any(e.multi_hit or e.double_hit for e in m.effects or [])
+            and m.name not in ("트리플킥", "트리플악셀")
+        )
+        dist = damage_distribution(move, "my", is_always_hit=True, battle_store=self.store, duration_store=self.durations)
+        self.assertEqual(len(dist.damages), 1)
+
+        hp = defender.current_hp
+        handle_move_sync("my", move, self.store.get_active_index("my"), is_always_hit=True,
+                         battle_store=self.store, duration_store=self.durations)
+        self.assertEqual(hp - self._active("enemy").current_hp, dist.expected)
+
+    def test_hit_count_distribution(self):
+        move = self._active("my").base.moves[0]
+        single = move.copy(effects=[])
+        self.assertEqual(hit_count_distribution(single), list(MULTI_HIT_COUNTS))
+        self.assertAlmostEqual(sum(p for _, p in MULTI_HIT_COUNTS), 1.0)
+
+    def test_analytic_scores_cover_legal_moves(self):
+        scores = analytic_scores(self.env)
+        mask = self.env.get_action_mask()
+        np.testing.assert_array_equal(scores.actions, [a for a in range(4) if mask[a]])
+        self.assertEqual(scores.count, 0)
+        self.assertTrue(np.all(scores.mean >= 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
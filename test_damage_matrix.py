@@ -0,0 +1,64 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from battle_test_case import BattleTestCase
+from utils.battle_logics import damage_matrix as dm
+from utils.battle_logics.pre_damage_calculator import pre_calculate_move_damage
+from utils.battle_logics.update_battle_pokemon import change_hp
+from utils.battle_logics.update_environment import set_weather
+
+
+class TestDamageMatrix(BattleTestCase):
+    seed = 5
+
+    def _active(self, side):
+        return self.store.get_team(side)[self.store.get_active_index(side)]
+
+    def _count_calls(self):
+        return mock.patch.object(dm, "pre_calculate_move_damage", wraps=pre_calculate_move_damage)
+
+    def test_matches_direct_calculation(self):
+        for _ in range(3):
+            self.env.reset()
+            done = False
+            while not done:
+                attacker, defender = self._active("my"), self._active("enemy")
+                moves = attacker.base.moves
+                if all(dm.damage_key(m, "my", attacker, defender, self.store, self.durations) for m in moves):
+                    expected = [
+                        pre_calculate_move_damage(m.name, "my", 0, attacker=attacker, defender=defender,
+                                                  battle_store=self.store, duration_store=self.durations)
+                        for m in moves
+                    ]
+                    damages = [d for d, _, _ in dm.pre_damage_list("my", self.store, self.durations)]
+                    self.assertEqual(damages, expected)
+                _, _, done, _ = self.env.step_sync(0, test=True)
+
+    def test_memo_reused_until_inputs_change(self):
+        dm.pre_damage_list("my", self.store, self.durations)
+        with self._count_calls() as calls:
+            dm.pre_damage_list("my", self.store, self.durations)
+            self.assertEqual(calls.call_count, 0)
+
+            active_enemy = self.store.get_active_index("enemy")
+            self.store.update_pokemon("enemy", active_enemy, lambda p: change_hp(p, -10, battle_store=self.store))
+            dm.pre_damage_list("my", self.store, self.durations)
+            self.assertEqual(calls.call_count, len(self._active("my").base.moves))
+
+            set_weather("비", battle_store=self.store, duration_store=self.durations)
+            dm.pre_damage_list("my", self.store, self.durations)
+            self.assertEqual(calls.call_count, 2 * len(self._active("my").base.moves))
+
+    def test_matrix_covers_opposing_team(self):
+        abilities = [p.base.ability for p in self.store.get_team("enemy")]
+        matrix = dm.damage_matrix("my", self.store, self.durations)
+        self.assertEqual(matrix.shape, (len(self._active("my").base.moves), len(self.store.get_team("enemy"))))
+        damages = [d for d, _, _ in dm.pre_damage_list("my", self.store, self.durations)]
+        np.testing.assert_array_equal(matrix[:, self.store.get_active_index("enemy")], damages)
+        self.assertEqual([p.base.ability for p in self.store.get_team("enemy")], abilities)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+from battle_test_case import SilentTestCase
+from context.battle_context import BattleContext
+from context.battle_store import BattleStore
+from context.duration_store import EFFECT_SIDES, DurationStore
+from env.battle_env import YakemonEnv
+from RL.policies import random_policy
+
+
+def _rebuilt_index(durations: DurationStore) -> dict:
+    index = {}
+    for side in EFFECT_SIDES:
+        for effect in durations.get_effects(side):
+            index.setdefault((side, effect["name"]), []).append(effect)
+    return index
+
+
+class TestDurationIndex(SilentTestCase):
+    seed = 8
+
+    def setUp(self):
+        super().setUp()
+        self.durations = DurationStore(BattleStore())
+
+    def _assert_index(self, durations):
+        index = _rebuilt_index(durations)
+        self.assertEqual(durations._index.keys(), index.keys())
+        for key, effects in index.items():
+            self.assertEqual([id(e) for e in durations._index[key]], [id(e) for e in effects])
+
+    def test_find_effect_matches_first_in_list(self):
+        durations = self.durations
+        durations.add_effect({"name": "혼란", "remaining_turn": 3, "owner_index": 0}, "my")
+        durations.add_effect({"name": "혼란", "remaining_turn": 2, "owner_index": 1}, "my")
+        durations.add_effect({"name": "리플렉터", "remaining_turn": 5}, "my_env")
+        self.assertEqual(durations.find_effect("my", "혼란")["owner_index"], 0)
+        self.assertEqual(durations.find_effect("my", "혼란", owner_index=1)["remaining_turn"], 2)
+        self.assertIsNone(durations.find_effect("enemy", "혼란"))
+        self.assertEqual(durations.remaining_turn("my_env", "리플렉터"), 5)
+
+        # dict로 지울 때는 내용이 같아도 다른 객체면 지우지 않는다
+        durations.remove_effect({"name": "혼란", "remaining_turn": 3, "owner_index": 0}, "my")
+        self.assertEqual(len(durations.get_effects("my")), 2)
+        durations.remove_effect("혼란", "my")
+        self.assertEqual(durations.find_effect("my", "혼란")["owner_index"], 1)
+        durations.transfer_effects("my", 1, 2)
+        self.assertEqual(durations.find_effect("my", "혼란")["owner_index"], 2)
+        durations.decrement_turns()
+        self.assertEqual(durations.remaining_turn("my_env", "리플렉터"), 4)
+        self._assert_index(durations)
+
+        snapshot = durations.snapshot()
+        durations.clear_effects()
+        self.assertIsNone(durations.find_effect("my_env", "리플렉터"))
+        durations.restore(snapshot)
+        self.assertEqual(durations.remaining_turn("my_env", "리플렉터"), 4)
+        self._assert_index(durations)
+        self._assert_index(durations.copy())
+
+    def test_index_tracks_effect_lists_through_battles(self):
+        env = YakemonEnv(context=BattleContext())
+        for _ in range(3):
+            env.reset()
+            done = False
+            while not done:
+                _, _, done, _ = env.step_sync(random_policy(env), test=True)
+                self._assert_index(env.duration_store)
+
+
+if __name__ == "__main__":
+    unittest.main()
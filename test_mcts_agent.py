@@ -0,0 +1,45 @@
+import random
+import unittest
+
+import numpy as np
+
+from agent.dddqn_agent import DuelingDQN
+from agent.mcts_agent import MCTSAgent
+from battle_test_case import BattleTestCase
+
+
+class TestMCTSAgent(BattleTestCase):
+    seed = 2
+
+    def test_search_keeps_env_and_returns_legal_action(self):
+        random_state = random.getstate()
+        agent = MCTSAgent(network=DuelingDQN(1237, 6).eval(), num_playouts=40, leaf_batch=8)
+        result = agent.search(self.env)
+        self.assertEqual(result.playouts, 40)
+        self.assertEqual(result.my_visits.sum(), 40)
+        self.assertEqual(result.enemy_visits.sum(), 40)
+        self.assertTrue(self.env.get_action_mask()[result.my_action])
+        np.testing.assert_array_equal(self.env._get_state(), self.state)
+        self.assertEqual(random.getstate(), random_state)
+        self.assertGreater(len(agent.table), 1)
+
+    def test_transposition_table_is_reused(self):
+        agent = MCTSAgent(num_playouts=24, leaf_batch=4)
+        agent.search(self.env)
+        nodes = len(agent.table)
+        second = agent.search(self.env)
+        # 같은 루트를 다시 탐색하면 이전 방문 수에 이어서 쌓인다
+        self.assertEqual(second.my_visits.sum(), 48)
+        self.assertGreaterEqual(len(agent.table), nodes)
+
+    def test_time_budget(self):
+        result = MCTSAgent(num_playouts=None, time_budget=0.05, leaf_batch=4).search(self.env)
+        self.assertGreater(result.playouts, 0)
+
+    def test_requires_budget(self):
+        with self.assertRaises(ValueError):
+            MCTSAgent(num_playouts=None, time_budget=None)
+
+
+if __name__ == "__main__":
+    unittest.main()
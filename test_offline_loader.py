@@ -0,0 +1,61 @@
+import contextlib
+import io
+import tempfile
+import unittest
+
+import numpy as np
+import torch
+
+from agent.dddqn_agent import DDDQNAgent
+from utils.offline_loader import ShardStreamLoader
+from utils.transition_shards import ShardWriter, write_index
+
+
+class TestShardStreamLoader(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        writer = ShardWriter(cls.tmp.name, shard_size=20)
+        for episode_id, length in enumerate([7, 9, 12, 5, 8]):
+            # 관측 첫 칸에 (에피소드, 스텝)을 넣어 state / next_state 짝을 확인
+            observations = np.zeros((length + 1, 1237), dtype=np.float32)
+            observations[:, 0] = episode_id * 100 + np.arange(length + 1)
+            writer.add_episode(
+                episode_id, observations, np.ones((length, 6)), np.arange(length) % 6,
+                np.arange(length, dtype=np.float32), [False] * (length - 1) + [True],
+            )
+        write_index(cls.tmp.name, writer.close(), 1237)
+        cls.total = 41
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_each_transition_once_per_epoch(self):
+        loader = ShardStreamLoader(self.tmp.name, batch_size=8, shuffle_window=10, epochs=2, drop_last=False, seed=0)
+        batches = list(loader)
+        self.assertEqual(len(batches), len(loader))
+        states = torch.cat([b["states"][:, 0] for b in batches])
+        next_states = torch.cat([b["next_states"][:, 0] for b in batches])
+        self.assertEqual(len(states), 2 * self.total)
+        torch.testing.assert_close(next_states, states + 1)
+        # 두 에포크 합쳐 모든 transition이 정확히 두 번씩
+        values, counts = torch.unique(states, return_counts=True)
+        self.assertEqual(len(values), self.total)
+        self.assertTrue((counts == 2).all())
+        self.assertEqual(batches[0]["actions"].dtype, torch.int64)
+        self.assertEqual(batches[0]["dones"].dtype, torch.float32)
+
+    def test_early_stop_and_agent_update(self):
+        loader = ShardStreamLoader(self.tmp.name, batch_size=8, prefetch=1, epochs=100)
+        with contextlib.redirect_stdout(io.StringIO()):
+            agent = DDDQNAgent(1237, 6, 0.001, 0.9, 1.0, 0.01, 0.99, 10, 8, 8)
+            for step, batch in enumerate(loader):
+                self.assertGreater(agent.train(batch), 0.0)
+                if step == 2:
+                    break
+        self.assertEqual(agent.updates, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import random
+import unittest
+
+from p_data.ability_data import ability_data, available_abilities
+from p_data.mock_pokemon import POKEMON_SPECIES, create_mock_pokemon_list
+from p_data.move_data import move_datas
+from p_data.registry import get_ability, get_move, get_species
+
+
+class TestRegistry(unittest.TestCase):
+    def test_lookup_by_name_and_id(self):
+        for move in move_datas:
+            self.assertIs(get_move(move.name), move)
+            self.assertIs(get_move(move.id), move)
+        self.assertIs(get_ability(0), available_abilities[0])
+        self.assertEqual(get_species('리자몽').id, 6)
+        self.assertIs(get_species(6), get_species('리자몽'))
+        with self.assertRaises(KeyError):
+            get_move('없는기술')
+
+    def test_duplicate_ability_names_stay_candidates(self):
+        random.seed(0)
+        picked = {ability_data(['변환자재']).id for _ in range(50)}
+        self.assertEqual(picked, {a.id for a in available_abilities if a.name == '변환자재'})
+
+    def test_created_pokemon_are_fresh(self):
+        random.seed(1)
+        first, second = create_mock_pokemon_list(), create_mock_pokemon_list()
+        self.assertEqual(len(first), len(POKEMON_SPECIES))
+        for a, b, record in zip(first, second, POKEMON_SPECIES):
+            self.assertIsNot(a, b)
+            self.assertIsNot(a.types, b.types)
+            self.assertEqual(tuple(a.types), record.types)
+            self.assertLessEqual(len(a.moves), 4)
+            self.assertTrue(all(move in record.move_pool for move in a.moves))
+            self.assertIn(a.ability, record.ability_pool)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+import contextlib
+import io
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+from utils.replay_buffer import ReplayBuffer
+
+
+class TestReplayBuffer(unittest.TestCase):
+    def test_ring_overwrites_oldest(self):
+        buffer = ReplayBuffer(4)
+        for i in range(6):
+            buffer.push((np.full(3, i, dtype=np.float32), i % 6, float(i), np.full(3, i + 1, dtype=np.float32), i == 5))
+        self.assertEqual(len(buffer), 4)
+        self.assertEqual(sorted(buffer.rewards.tolist()), [2.0, 3.0, 4.0, 5.0])
+
+        random.seed(0)
+        states, actions, rewards, next_states, dones = buffer.sample(4)
+        self.assertEqual(states.shape, (4, 3))
+        self.assertEqual(states.dtype, np.float32)
+        self.assertEqual(actions.dtype, np.int64)
+        for state, action, reward, next_state, done in zip(states, actions, rewards, next_states, dones):
+            # 같은 transition의 열끼리 짝이 맞아야 한다
+            self.assertTrue((state == reward).all())
+            self.assertTrue((next_state == reward + 1).all())
+            self.assertEqual(action, int(reward) % 6)
+            self.assertEqual(bool(done), reward == 5.0)
+
+    def test_sample_without_replacement(self):
+        buffer = ReplayBuffer(10)
+        for i in range(10):
+            buffer.push((np.array([i], dtype=np.float32), 0, 0.0, np.array([i], dtype=np.float32), False))
+        states = buffer.sample(10)[0]
+        self.assertEqual(sorted(states[:, 0].tolist()), list(range(10)))
+
+    def test_dedup_frames_matches_plain_buffer(self):
+        # 에피소드 경계(done)와 덮어쓰기가 섞여도 일반 버퍼와 같은 값을 돌려줘야 한다
+        plain, dedup = ReplayBuffer(8), ReplayBuffer(8, dedup_frames=True)
+        rng = np.random.default_rng(0)
+        state = rng.random(5, dtype=np.float32)
+        for step in range(30):
+            next_state = rng.random(5, dtype=np.float32)
+            done = step % 7 == 6
+            for buffer in (plain, dedup):
+                buffer.push((state, step % 6, float(step), next_state, done))
+            # 에피소드가 끝나면 새 상태에서 시작
+            state = rng.random(5, dtype=np.float32) if done else next_state.copy()
+
+            size = len(plain)
+            random.seed(step)
+            expected = plain.sample(size)
+            random.seed(step)
+            actual = dedup.sample(size)
+            for left, right in zip(expected, actual):
+                np.testing.assert_array_equal(left, right)
+        self.assertIsNone(dedup.states)
+        # 상태 프레임은 칸당 하나 + 에피소드 경계에서만 추가로 저장
+        self.assertLess(dedup.frame_store.terminal_position, 8)
+
+    def test_rainbow_n_step_dedup_matches_plain(self):
+        try:
+            from agent.rainbow_agent import ReplayBuffer as NStepReplayBuffer
+        except ImportError as e:
+            self.skipTest(f"rainbow 의존성 없음: {e}")
+        plain = NStepReplayBuffer(4, 6, 6, n_step=3, gamma=0.9)
+        dedup = NStepReplayBuffer(4, 6, 6, n_step=3, gamma=0.9, dedup_frames=True)
+        rng = np.random.default_rng(1)
+        obs = rng.random(4, dtype=np.float32)
+        for step in range(25):
+            next_obs = rng.random(4, dtype=np.float32)
+            done = step % 5 == 4
+            for buffer in (plain, dedup):
+                buffer.store(obs, step % 6, 1.0, next_obs, done)
+            obs = rng.random(4, dtype=np.float32) if done else next_obs.copy()
+            if not len(plain):
+                continue
+
+            idxs = np.arange(len(plain))
+            expected = plain.sample_batch_from_idxs(idxs)
+            actual = dedup.sample_batch_from_idxs(idxs)
+            for key in expected:
+                np.testing.assert_array_equal(expected[key], actual[key])
+
+    def test_terminal_frames_are_reused_after_wrapping(self):
+        # 짧은 에피소드로 버퍼를 여러 바퀴 돌아도 terminal 칸은 살아 있는 에피소드 경계 수만큼만 쓴다
+        plain, dedup = ReplayBuffer(8), ReplayBuffer(8, dedup_frames=True)
+        rng = np.random.default_rng(2)
+        state = rng.random(5, dtype=np.float32)
+        for step in range(200):
+            next_state = rng.random(5, dtype=np.float32)
+            done = step % 2 == 1
+            for buffer in (plain, dedup):
+                buffer.push((state, 0, float(step), next_state, done))
+            state = rng.random(5, dtype=np.float32) if done else next_state.copy()
+
+        random.seed(0)
+        expected = plain.sample(8)
+        random.seed(0)
+        actual = dedup.sample(8)
+        for left, right in zip(expected, actual):
+            np.testing.assert_array_equal(left, right)
+        frame_store = dedup.frame_store
+        self.assertLessEqual(frame_store.terminal_position, 5)
+        self.assertEqual(len(frame_store.terminal_chunks), 1)
+        self.assertEqual(len(frame_store.terminal_chunks[0]), 8)
+
+    def test_rainbow_buffers_share_frames(self):
+        try:
+            from agent.rainbow_agent import PrioritizedReplayBuffer, ReplayBuffer as NStepReplayBuffer
+        except ImportError as e:
+            self.skipTest(f"rainbow 의존성 없음: {e}")
+
+        def make(dedup_frames):
+            memory = PrioritizedReplayBuffer(
+                4, 6, 6, alpha=0.6, n_step=1, gamma=0.9, prior_eps=1e-6, dedup_frames=dedup_frames
+            )
+            memory_n = NStepReplayBuffer(
+                4, 6, 6, n_step=3, gamma=0.9, dedup_frames=dedup_frames,
+                shared_frames=memory.frame_store,
+            )
+            return memory, memory_n
+
+        plain, shared = make(False), make(True)
+        rng = np.random.default_rng(3)
+        obs = rng.random(4, dtype=np.float32)
+        for step in range(25):
+            next_obs = rng.random(4, dtype=np.float32)
+            done = step % 5 == 4
+            for memory, memory_n in (plain, shared):
+                # DQNAgent와 같은 순서: memory_n이 돌려준 transition을 바로 memory에 쓴다
+                one_step_transition = memory_n.store(obs, step % 6, 1.0, next_obs, done)
+                if one_step_transition:
+                    memory.store(*one_step_transition)
+            obs = rng.random(4, dtype=np.float32) if done else next_obs.copy()
+            if not len(plain[0]):
+                continue
+
+            idxs = np.arange(len(plain[0]))
+            for expected_buffer, actual_buffer in zip(plain, shared):
+                expected = expected_buffer.sample_batch_from_idxs(idxs)
+                actual = actual_buffer.sample_batch_from_idxs(idxs)
+                for key in expected:
+                    np.testing.assert_array_equal(expected[key], actual[key])
+        self.assertIs(shared[0].frame_store.frames, shared[1].frame_store.frames)
+
+    def test_rainbow_agent_shares_frames_only_with_dedup(self):
+        try:
+            from agent.rainbow_agent import DQNAgent
+            from context.battle_context import BattleContext
+            from env.battle_env import YakemonEnv
+        except ImportError as e:
+            self.skipTest(f"rainbow 의존성 없음: {e}")
+
+        def make(dedup_frames):
+            with contextlib.redirect_stdout(io.StringIO()):
+                return DQNAgent(
+                    env=YakemonEnv(context=BattleContext()), memory_size=16, batch_size=4, target_update=10, seed=0,
+                    gamma=0.9, alpha=0.2, beta=0.6, prior_eps=1e-6, v_min=-10.0, v_max=10.0, atom_size=11, n_step=3,
+                    learning_rate=0.001, dedup_frames=dedup_frames,
+                )
+
+        # 기본 설정은 memory도 n-step 창을 쓰고, dedup_frames일 때만 1-step으로 바꿔 프레임을 공유한다
+        default = make(False)
+        self.assertEqual(default.memory.n_step, 3)
+        shared = make(True)
+        self.assertEqual(shared.memory.n_step, 1)
+        self.assertIs(shared.memory_n.frame_store.shared_frames, shared.memory.frame_store)
+
+    def test_memmap_buffer_resumes_from_flush(self):
+        with tempfile.TemporaryDirectory() as directory:
+            buffer = ReplayBuffer(4, storage_dir=directory)
+            for i in range(6):
+                buffer.push((np.full(3, i, dtype=np.float32), i % 6, float(i), np.full(3, i + 1, dtype=np.float32), False))
+            buffer.flush()
+            del buffer
+
+            resumed = ReplayBuffer(4, storage_dir=directory)
+            self.assertEqual((len(resumed), resumed.position), (4, 2))
+            self.assertEqual(sorted(resumed.rewards.tolist()), [2.0, 3.0, 4.0, 5.0])
+            states, _, rewards, next_states, _ = resumed.sample(4)
+            np.testing.assert_array_equal(states[:, 0], rewards)
+            np.testing.assert_array_equal(next_states[:, 0], rewards + 1)
+            with self.assertRaises(ValueError):
+                ReplayBuffer(8, storage_dir=directory)
+
+    def test_rainbow_per_memmap_restores_priorities(self):
+        try:
+            from agent.rainbow_agent import PrioritizedReplayBuffer
+        except ImportError as e:
+            self.skipTest(f"rainbow 의존성 없음: {e}")
+        with tempfile.TemporaryDirectory() as directory:
+            def make():
+                return PrioritizedReplayBuffer(3, 8, 4, alpha=0.5, n_step=1, gamma=0.9, prior_eps=1e-6, storage_dir=directory)
+            buffer = make()
+            for i in range(6):
+                buffer.store(np.full(3, i, dtype=np.float32), i, 1.0, np.full(3, i + 1, dtype=np.float32), False)
+            buffer.update_priorities([1, 4], np.array([4.0, 9.0]))
+            buffer.flush()
+            expected_tree = buffer.sum_tree.tree.copy()
+            del buffer
+
+            resumed = make()
+            self.assertEqual((len(resumed), resumed.ptr, resumed.tree_ptr, resumed.max_priority), (6, 6, 6, 9.0))
+            np.testing.assert_allclose(resumed.sum_tree.tree, expected_tree)
+            np.testing.assert_array_equal(resumed.sample_batch_from_idxs(np.arange(6))["obs"][:, 0], np.arange(6))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import random
+import unittest
+
+import numpy as np
+
+from battle_test_case import BattleTestCase
+from RL.rollout_evaluator import RolloutEvaluator
+
+
+class TestRolloutEvaluator(BattleTestCase):
+    seed = 1
+
+    def test_scores_legal_actions_without_changing_env(self):
+        random_state = random.getstate()
+        scores = RolloutEvaluator(num_rollouts=4, depth=2, seed=0).evaluate(self.env)
+        np.testing.assert_array_equal(scores.actions, np.flatnonzero(self.env.get_action_mask()))
+        self.assertEqual(scores.mean.shape, scores.actions.shape)
+        self.assertEqual(scores.var.shape, scores.actions.shape)
+        self.assertEqual(scores.count, 4)
+        self.assertIn(scores.best_action(), list(scores.actions))
+        np.testing.assert_array_equal(self.env._get_state(), self.state)
+        self.assertEqual(random.getstate(), random_state)
+
+    def test_same_seed_is_reproducible(self):
+        a = RolloutEvaluator(num_rollouts=3, depth=2, seed=5).evaluate(self.env, actions=[0, 1, 1])
+        b = RolloutEvaluator(num_rollouts=3, depth=2, seed=5).evaluate(self.env, actions=[0, 1])
+        np.testing.assert_array_equal(a.actions, [0, 1])
+        np.testing.assert_allclose(a.mean, b.mean)
+        np.testing.assert_allclose(a.var, b.var)
+
+    def test_process_pool_matches_in_process(self):
+        local = RolloutEvaluator(num_rollouts=4, depth=2, seed=7).evaluate(self.env)
+        with RolloutEvaluator(num_rollouts=4, depth=2, seed=7, workers=2) as evaluator:
+            pooled = evaluator.evaluate(self.env)
+        np.testing.assert_allclose(local.mean, pooled.mean)
+        np.testing.assert_allclose(local.var, pooled.var)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+
+import numpy as np
+
+from agent.segment_tree import MinSegmentTree, SumSegmentTree
+
+
+class TestSegmentTree(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.values = rng.random(13)
+        self.sum_tree, self.min_tree = SumSegmentTree(16), MinSegmentTree(16)
+        self.sum_tree.update_batch(np.arange(13), self.values)
+        self.min_tree.update_batch(np.arange(13), self.values)
+
+    def test_batch_update_matches_setitem(self):
+        tree = SumSegmentTree(16)
+        for i, value in enumerate(self.values):
+            tree[i] = value
+        np.testing.assert_allclose(tree.tree, self.sum_tree.tree)
+        # 같은 인덱스가 여러 번이면 마지막 값
+        self.sum_tree.update_batch([2, 5, 2], [1.0, 2.0, 3.0])
+        self.assertEqual(self.sum_tree[2], 3.0)
+        self.assertAlmostEqual(self.sum_tree.sum(), self.values.sum() - self.values[2] - self.values[5] + 5.0)
+
+    def test_range_queries(self):
+        # end는 baselines와 같이 끝을 포함하지 않는다 (0이면 끝까지)
+        self.assertAlmostEqual(self.sum_tree.sum(), self.values.sum())
+        self.assertAlmostEqual(self.sum_tree.sum(3, 9), self.values[3:9].sum())
+        self.assertAlmostEqual(self.min_tree.min(), self.values.min())
+        self.assertAlmostEqual(self.min_tree.min(4, 11), self.values[4:11].min())
+
+    def test_retrieve_batch_matches_prefix_search(self):
+        upperbounds = np.random.default_rng(1).uniform(0, self.values.sum(), 100)
+        expected = np.searchsorted(np.cumsum(self.values), upperbounds, side="right")
+        np.testing.assert_array_equal(self.sum_tree.retrieve_batch(upperbounds), expected)
+        self.assertEqual(self.sum_tree.retrieve(upperbounds[0]), expected[0])
+        # 음수 / nan은 0, 전체 합 이상이면 마지막 잎 (기존 retrieve와 같은 동작)
+        np.testing.assert_array_equal(self.sum_tree.retrieve_batch([-1.0, np.nan]), [0, 0])
+        self.assertEqual(self.sum_tree.retrieve(1e9), 15)
+
+
+if __name__ == "__main__":
+    unittest.main()
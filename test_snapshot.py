@@ -0,0 +1,65 @@
+import asyncio
+import contextlib
+import io
+import random
+import unittest
+
+import numpy as np
+
+from context.battle_context import BattleContext
+from env.battle_env import YakemonEnv
+
+
+class TestSnapshotRestore(unittest.TestCase):
+    def setUp(self):
+        random.seed(3)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.env = YakemonEnv(context=BattleContext())
+            asyncio.run(self.env.step(0, test=True, is_always_hit=True))
+
+    def _battle_state(self):
+        env = self.env
+        return (
+            env._get_state().copy(),
+            [(p.current_hp, dict(p.pp), dict(p.rank), list(p.status)) for p in env.my_team + env.enemy_team],
+            [[dict(e) for e in effects] for effects in env.duration_store._effect_lists()],
+            len(env.battle_store.get_state()["logs"]),
+            env.turn,
+        )
+
+    def _play(self, steps):
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(steps):
+                asyncio.run(self.env.step(1, test=True, is_always_hit=True))
+
+    def test_restore_returns_to_snapshot(self):
+        before = self._battle_state()
+        snapshot = self.env.snapshot()
+        self._play(3)
+        self.assertNotEqual(before[4], self.env.turn)
+        self.env.restore(snapshot)
+        after = self._battle_state()
+        np.testing.assert_array_equal(before[0], after[0])
+        self.assertEqual(before[1:], after[1:])
+
+    def test_snapshot_can_be_restored_twice(self):
+        snapshot = self.env.snapshot()
+        self._play(2)
+        self.env.restore(snapshot)
+        first = self._battle_state()
+        self._play(2)
+        self.env.restore(snapshot)
+        np.testing.assert_array_equal(first[0], self._battle_state()[0])
+        self.assertEqual(first[1:], self._battle_state()[1:])
+
+    def test_species_data_is_shared(self):
+        snapshot = self.env.snapshot()
+        self._play(1)
+        self.env.restore(snapshot)
+        team_snapshot = snapshot["context"][0]["teams"][0]
+        for pokemon, pokemon_snapshot in zip(team_snapshot[1], team_snapshot[2]):
+            self.assertIs(pokemon_snapshot[0]["base"], pokemon.base)
+
+
+if __name__ == "__main__":
+    unittest.main()
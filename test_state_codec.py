@@ -0,0 +1,69 @@
+import contextlib
+import io
+import random
+import unittest
+
+import numpy as np
+
+from context.battle_context import BattleContext
+from env.battle_env import YakemonEnv
+from RL.state_codec import StateCodec
+from RL.state_encoder import STATE_DIM
+from utils.replay_buffer import ReplayBuffer
+
+
+def collect_states(episodes):
+    states = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        env = YakemonEnv(context=BattleContext())
+        for _ in range(episodes):
+            state = env.reset()
+            done = False
+            while not done:
+                states.append(np.array(state, dtype=np.float32))
+                state, _, done, _ = env.step_sync(random.randrange(6), test=True)
+    return np.stack(states)
+
+
+class TestStateCodec(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        random.seed(3)
+        cls.states = collect_states(3)
+
+    def test_roundtrip_is_lossless(self):
+        codec = StateCodec()
+        bits, scalars = codec.encode(self.states)
+        self.assertEqual(bits.dtype, np.uint8)
+        self.assertEqual(bits.shape[1] + 4 * scalars.shape[1], codec.bytes_per_state)
+        restored = codec.decode(bits, scalars)
+        self.assertEqual(restored.dtype, np.float32)
+        self.assertEqual(restored.tobytes(), self.states.tobytes())
+
+    def test_rejects_non_binary_values(self):
+        codec = StateCodec()
+        state = self.states[0].copy()
+        state[codec.binary_indices[0]] = 0.5
+        with self.assertRaises(ValueError):
+            codec.encode(state)
+        with self.assertRaises(ValueError):
+            codec.encode(np.zeros(STATE_DIM - 1, dtype=np.float32))
+
+    def test_packed_replay_buffer_matches_plain(self):
+        plain = ReplayBuffer(16)
+        packed = ReplayBuffer(16, state_codec=StateCodec())
+        packed_dedup = ReplayBuffer(16, dedup_frames=True, state_codec=StateCodec())
+        for i in range(len(self.states) - 1):
+            transition = (self.states[i], i % 6, float(i), self.states[i + 1], False)
+            for buffer in (plain, packed, packed_dedup):
+                buffer.push(transition)
+        for buffer in (packed, packed_dedup):
+            random.seed(1)
+            expected = plain.sample(16)
+            random.seed(1)
+            for left, right in zip(expected, buffer.sample(16)):
+                np.testing.assert_array_equal(left, right)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import contextlib
+import io
+import random
+import unittest
+
+import numpy as np
+
+from context.battle_context import BattleContext
+from env.battle_env import YakemonEnv
+from RL.get_state_vector import get_state
+from RL.state_encoder import STATE_DIM, StateEncoder, get_state_batch
+from env.vec_battle_env import YakemonVecEnv
+from utils.battle_logics.update_environment import set_field, set_weather
+
+
+def reference_state(env):
+    return get_state(
+        store=env.battle_store,
+        my_team=env.my_team,
+        enemy_team=env.enemy_team,
+        active_my=env.battle_store.get_active_index("my"),
+        active_enemy=env.battle_store.get_active_index("enemy"),
+        public_env=env.public_env,
+        my_env=env.my_env,
+        enemy_env=env.enemy_env,
+        turn=env.turn,
+        my_effects=env.duration_store.my_effects,
+        enemy_effects=env.duration_store.enemy_effects,
+        duration_store=env.duration_store,
+    )
+
+
+class TestStateEncoder(unittest.TestCase):
+    def test_matches_get_state_bitwise(self):
+        random.seed(5)
+        checked = 0
+        with contextlib.redirect_stdout(io.StringIO()):
+            env = YakemonEnv(context=BattleContext())
+            for _ in range(5):
+                env.reset()
+                done = False
+                while not done:
+                    expected = reference_state(env)
+                    actual = env._get_state()
+                    self.assertEqual(actual.shape, (STATE_DIM,))
+                    self.assertEqual(actual.tobytes(), expected.tobytes())
+                    checked += 1
+                    _, _, done, _ = env.step_sync(random.randrange(6), test=True)
+        self.assertGreater(checked, 5)
+
+    def test_encode_reuses_buffer(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            env = YakemonEnv(context=BattleContext())
+        encoder = StateEncoder()
+        kwargs = dict(
+            store=env.battle_store, my_team=env.my_team, enemy_team=env.enemy_team,
+            active_my=0, active_enemy=0, public_env=env.public_env, my_env=env.my_env, enemy_env=env.enemy_env,
+            turn=1, my_effects=[], enemy_effects=[], duration_store=env.duration_store,
+        )
+        first = encoder.encode(**kwargs)
+        self.assertTrue(np.shares_memory(first, encoder.encode(**kwargs)))
+        env.my_team[0].current_hp = 0
+        self.assertEqual(encoder.encode(**kwargs).tobytes(), reference_state(env).tobytes())
+
+    def test_batch_matches_get_state(self):
+        random.seed(9)
+        with contextlib.redirect_stdout(io.StringIO()):
+            envs = [YakemonEnv(context=BattleContext()) for _ in range(4)]
+            for step in range(6):
+                batch = get_state_batch([env.context for env in envs], turns=[env.turn for env in envs])
+                self.assertEqual(batch.shape, (len(envs), STATE_DIM))
+                expected = np.stack([reference_state(env) for env in envs])
+                self.assertEqual(batch.tobytes(), expected.tobytes())
+                for env in envs:
+                    _, _, done, _ = env.step_sync(random.randrange(6), test=True)
+                    if done:
+                        env.reset()
+        self.assertEqual(get_state_batch([], []).shape, (0, STATE_DIM))
+
+    def test_batch_matches_env_with_weather_and_field(self):
+        random.seed(11)
+        with contextlib.redirect_stdout(io.StringIO()):
+            vec_env = YakemonVecEnv(2)
+            vec_env.reset()
+            for env in vec_env.envs:
+                set_weather("비", battle_store=env.battle_store, duration_store=env.duration_store)
+                set_field("그래스필드", battle_store=env.battle_store, duration_store=env.duration_store)
+            for _ in range(2):
+                for env in vec_env.envs:
+                    env.step_sync(0, test=True, is_always_hit=True)
+        for env in vec_env.envs:
+            self.assertGreater(env.turn, 1)
+            self.assertEqual(env.public_env.field, "그래스필드")
+        batch = vec_env.get_observations()
+        expected = np.stack([env._get_state() for env in vec_env.envs])
+        self.assertEqual(batch.tobytes(), expected.tobytes())
+        self.assertEqual(batch.tobytes(), np.stack([reference_state(env) for env in vec_env.envs]).tobytes())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+from copy import copy
+import unittest
+
+import numpy as np
+
+from battle_test_case import BattleTestCase
+from context.state_key import KEY_LENGTH, RANK_STATS, STATUSES, TYPES, full_key_array, zobrist
+from RL.policies import random_policy
+from utils.battle_logics.update_battle_pokemon import (
+    add_status, change_hp, change_rank, set_protecting, use_move_pp
+)
+from utils.battle_logics.update_environment import set_weather
+
+
+class TestStateKey(BattleTestCase):
+    seed = 4
+
+    def _assert_matches_full(self):
+        context = self.env.context
+        full = full_key_array(context.battle_store, context.duration_store)
+        np.testing.assert_array_equal(np.frombuffer(context.state_key(), dtype=np.int16), full)
+        self.assertEqual(context.state_hash(), zobrist(np.arange(KEY_LENGTH), full))
+
+    def test_incremental_key_matches_full_recompute(self):
+        for _ in range(3):
+            self.env.reset()
+            done = False
+            while not done:
+                _, _, done, _ = self.env.step_sync(random_policy(self.env), test=True)
+                self._assert_matches_full()
+
+    def test_key_is_fixed_width_and_tracks_changes(self):
+        store = self.env.battle_store
+        key, hash_value = self.env.state_key(), self.env.state_hash()
+        self.assertEqual(len(key), (KEY_LENGTH + 2) * 2)
+
+        store.update_pokemon("enemy", 0, lambda p: change_hp(p, -10, battle_store=store))
+        self.assertNotEqual(self.env.state_hash(), hash_value)
+        store.update_pokemon("enemy", 0, lambda p: change_hp(p, 10, battle_store=store))
+        self.assertEqual(self.env.state_key(), key)
+        self.assertEqual(self.env.state_hash(), hash_value)
+
+        set_weather("비", battle_store=store, duration_store=self.env.duration_store)
+        self.assertNotEqual(self.env.state_key(), key)
+        self._assert_matches_full()
+
+    def test_snapshot_restore_restores_key(self):
+        snapshot = self.env.snapshot()
+        key, hash_value = self.env.state_key(), self.env.state_hash()
+        for _ in range(3):
+            self.env.step_sync(0, test=True)
+        self.assertNotEqual(self.env.state_key(), key)
+        self.env.restore(snapshot)
+        self.assertEqual(self.env.state_key(), key)
+        self.assertEqual(self.env.state_hash(), hash_value)
+        self._assert_matches_full()
+
+    def test_turn_is_not_part_of_key(self):
+        key = self.env.state_key()
+        self.env.turn += 5
+        self.assertEqual(self.env.state_key(), key)
+
+    def test_team_arrays_are_views_of_key(self):
+        context = self.env.context
+        store = context.battle_store
+        arrays = context.team_arrays("my")
+        index = store.get_active_index("my")
+        team = store.get_team("my")
+        np.testing.assert_array_equal(arrays.hp, [p.current_hp for p in team])
+
+        store.update_pokemon("my", index, lambda p: change_hp(p, -7, battle_store=store))
+        store.update_pokemon("my", index, lambda p: change_rank(p, "speed", 2))
+        store.update_pokemon("my", index, lambda p: set_protecting(p, True))
+        arrays = context.team_arrays("my")
+        pokemon = store.get_team("my")[index]
+        self.assertEqual(arrays.hp[index], pokemon.current_hp)
+        self.assertEqual(arrays.rank[index, RANK_STATS.index("speed")], 2)
+        self.assertEqual(arrays.flag("is_protecting")[index], 1)
+        self.assertEqual(arrays.status[index], sum(1 << STATUSES.index(s) for s in pokemon.status))
+        moves = pokemon.base.moves
+        np.testing.assert_array_equal(arrays.pp[index, :len(moves)], [pokemon.pp[m.name] for m in moves])
+        self.assertTrue(np.shares_memory(arrays.rows, store.key_tracker.values))
+
+        # 뷰에 쓰면 키와 해시가 어긋나므로 쓰기 금지
+        with self.assertRaises(ValueError):
+            arrays.hp[:] = 0
+        self._assert_matches_full()
+
+    def test_copy_with_shares_containers_until_replaced(self):
+        store = self.env.context.battle_store
+        pokemon = store.get_team("my")[store.get_active_index("my")]
+        copied = pokemon.copy_with(cannot_move=True)
+        self.assertIs(copied.pp, pokemon.pp)
+        self.assertIs(copied.rank, pokemon.rank)
+        self.assertIs(copied.status, pokemon.status)
+
+        pp, rank, status = dict(pokemon.pp), dict(pokemon.rank), list(pokemon.status)
+        move = pokemon.base.moves[0].name
+        use_move_pp(copied, move)
+        change_rank(copied, "speed", 2)
+        add_status(copied, "혼란", "my", battle_store=store, duration_store=self.env.context.duration_store)
+        self.assertEqual((pokemon.pp, pokemon.rank, pokemon.status), (pp, rank, status))
+        self.assertEqual(copied.pp[move], max(pp[move] - 1, 0))
+        self.assertEqual(copied.rank["speed"], 2)
+        self.assertIn("혼란", copied.status)
+
+    def test_status_and_type_bits_do_not_saturate(self):
+        context = self.env.context
+        store = context.battle_store
+        index = store.get_active_index("my")
+        low_statuses = STATUSES[:15]
+        self.assertEqual(STATUSES[15], "길동무")
+
+        def key_with(statuses, types):
+            base = copy(store.get_team("my")[index].base)
+            base.types = list(types)
+            store.update_pokemon("my", index, lambda p: p.copy_with(base=base, status=list(statuses)))
+            return context.state_key(), context.state_hash(), context.team_arrays("my").status[index]
+
+        key_a, hash_a, status_a = key_with(["길동무"], ["악"])
+        key_b, hash_b, status_b = key_with(low_statuses, TYPES[:15])
+        self.assertNotEqual(key_a, key_b)
+        self.assertNotEqual(hash_a, hash_b)
+        self.assertEqual(status_a, 1 << 15)
+        self.assertEqual(status_b, (1 << 15) - 1)
+        key_c, _, status_c = key_with(STATUSES, TYPES)
+        self.assertEqual(status_c, (1 << len(STATUSES)) - 1)
+        self._assert_matches_full()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import copy
+import pickle
+import unittest
+
+from battle_test_case import BattleTestCase
+from p_models.status import STATUS_BIT, STATUS_NAMES, StatusList, StatusManager, status_mask
+from utils.battle_logics.update_battle_pokemon import add_status, remove_status
+
+
+class TestStatusList(unittest.TestCase):
+    def test_bits_follow_list_changes(self):
+        status = StatusList(["마비", "혼란"])
+        self.assertEqual(status.bits, STATUS_BIT["마비"] | STATUS_BIT["혼란"])
+        status.append("씨뿌리기")
+        status.remove("마비")
+        self.assertEqual(status.bits, status_mask(["혼란", "씨뿌리기"]))
+        self.assertTrue(status.has("씨뿌리기"))
+        self.assertFalse(status.has("마비"))
+        status += ["독"]
+        del status[0]
+        self.assertEqual(status, ["씨뿌리기", "독"])
+        self.assertEqual(status.bits, status_mask(status))
+        status.clear()
+        self.assertEqual(status.bits, 0)
+
+    def test_copies_keep_bits(self):
+        status = StatusList(["화상", "하품"])
+        for other in (status.copy(), copy.copy(status), copy.deepcopy(status), pickle.loads(pickle.dumps(status))):
+            self.assertIsInstance(other, StatusList)
+            self.assertEqual(other, status)
+            self.assertEqual(other.bits, status.bits)
+        self.assertEqual(len(STATUS_NAMES), len(STATUS_BIT))
+
+    def test_manager_keeps_main_status_exclusive(self):
+        manager = StatusManager(["독"])
+        manager.add_status("마비")
+        manager.add_status("혼란")
+        self.assertEqual(manager.get_status(), ["독", "혼란"])
+        manager.remove_status("독")
+        self.assertEqual(manager.get_status().bits, STATUS_BIT["혼란"])
+
+
+class TestPokemonStatusBits(BattleTestCase):
+    seed = 7
+
+    def test_pokemon_status_stays_in_sync_through_battle(self):
+        store = self.env.battle_store
+        for _ in range(3):
+            self.env.reset()
+            done = False
+            while not done:
+                for side in ("my", "enemy"):
+                    for pokemon in store.get_team(side):
+                        self.assertIsInstance(pokemon.status, StatusList)
+                        self.assertEqual(pokemon.status.bits, status_mask(pokemon.status))
+                _, _, done, _ = self.env.step_sync(0, test=True)
+
+    def test_status_helpers_update_bits(self):
+        store, durations = self.env.battle_store, self.env.duration_store
+        index = store.get_active_index("my")
+        pokemon = store.get_team("my")[index]
+        pokemon = pokemon.copy_with(status=["혼란"])
+        self.assertEqual(pokemon.status.bits, STATUS_BIT["혼란"])
+        add_status(pokemon, "씨뿌리기", "my", battle_store=store, duration_store=durations)
+        self.assertTrue(pokemon.status.has("씨뿌리기"))
+        remove_status(pokemon, "혼란")
+        self.assertEqual(pokemon.status.bits, STATUS_BIT["씨뿌리기"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import asyncio
+import contextlib
+import inspect
+import io
+import random
+import unittest
+
+import numpy as np
+
+from context.battle_context import BattleContext
+from env.battle_env import YakemonEnv
+from utils.battle_logics.battle_sequence import battle_sequence, battle_sequence_sync, remove_fainted_pokemon
+from utils.battle_logics.switch_pokemon import switch_pokemon
+
+
+class TestSyncCore(unittest.TestCase):
+    def _play(self, use_sync):
+        random.seed(11)
+        np.random.seed(11)
+        trajectory = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            env = YakemonEnv(context=BattleContext())
+            for step in range(8):
+                action = step % 4
+                if use_sync:
+                    result = env.step_sync(action, test=True)
+                else:
+                    result = asyncio.run(env.step(action, test=True))
+                next_state, reward, done, _ = result
+                trajectory.append((np.asarray(next_state).copy(), reward, done))
+                if done:
+                    break
+        return trajectory
+
+    def test_sync_step_matches_async_step(self):
+        sync_trajectory = self._play(use_sync=True)
+        async_trajectory = self._play(use_sync=False)
+        self.assertEqual(len(sync_trajectory), len(async_trajectory))
+        for (s1, r1, d1), (s2, r2, d2) in zip(sync_trajectory, async_trajectory):
+            np.testing.assert_array_equal(s1, s2)
+            self.assertEqual(r1, r2)
+            self.assertEqual(d1, d2)
+
+    def test_async_entry_points_kept(self):
+        self.assertFalse(inspect.iscoroutinefunction(battle_sequence_sync))
+        self.assertFalse(inspect.iscoroutinefunction(YakemonEnv.step_sync))
+        for fn in (battle_sequence, remove_fainted_pokemon, switch_pokemon, YakemonEnv.step):
+            self.assertTrue(inspect.iscoroutinefunction(fn))
+        self.assertEqual(battle_sequence.__name__, "battle_sequence")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import contextlib
+import io
+import multiprocessing as mp
+import queue
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+import training_distributed as td
+from agent.dddqn_agent import DDDQNAgent
+from battle_test_case import SilentTestCase
+from context.battle_context import BattleContext
+from env.battle_env import YakemonEnv
+
+
+def _wait_until(condition, timeout=20.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def _config(**overrides):
+    config = dict(td.hyperparams)
+    config.update(queue_size=4, send_batch_size=4, weight_sync_interval=5, save_interval=1000, quiet=True)
+    config.update(overrides)
+    return config
+
+
+class TestActor(SilentTestCase):
+    def test_actor_loads_weights_and_waits_on_full_queue(self):
+        network_kwargs = {"state_dim": 1237, "action_dim": 6}
+        network = td.build_network("dddqn", network_kwargs)
+        ctx = mp.get_context("spawn")
+        transition_queue, weight_queue = ctx.Queue(maxsize=1), ctx.Queue(maxsize=1)
+        stop_event = ctx.Event()
+
+        def weights(marker):
+            state = td.state_dict_to_numpy(network)
+            next(iter(state.values())).flat[0] = marker
+            return state
+
+        loaded = []
+        original_load = td.load_numpy_state_dict
+
+        def record_load(net, state):
+            loaded.append(float(next(iter(state.values())).flat[0]))
+            original_load(net, state)
+
+        weight_queue.put((1, weights(1.0), 0.0))
+        config = {"send_batch_size": 1, "use_random_enemy": True}
+        with mock.patch.object(td, "load_numpy_state_dict", record_load):
+            actor = threading.Thread(
+                target=td._run_actor,
+                args=(0, "dddqn", network_kwargs, transition_queue, weight_queue, stop_event, config),
+                daemon=True,
+            )
+            actor.start()
+            self.assertTrue(_wait_until(transition_queue.full))
+            self.assertEqual(loaded, [1.0])
+
+            # 큐가 가득 찬 동안 actor는 다음 transition을 넣지 못하고 기다린다
+            time.sleep(0.5)
+            self.assertTrue(actor.is_alive())
+            self.assertTrue(transition_queue.full())
+
+            # 새 가중치는 actor 전용 큐로 전달되고, 큐를 비우면 actor가 다시 진행하며 반영한다
+            weight_queue.put((2, weights(2.0), 0.0))
+            received = []
+
+            def drain_until_loaded():
+                try:
+                    received.append(transition_queue.get(timeout=0.1))
+                except queue.Empty:
+                    pass
+                return 2.0 in loaded
+
+            self.assertTrue(_wait_until(drain_until_loaded))
+            self.assertTrue(all(kind in ("transitions", "episode") for kind, _, _ in received))
+
+            stop_event.set()
+            actor.join(timeout=5.0)
+            self.assertFalse(actor.is_alive())
+        transition_queue.close()
+        weight_queue.close()
+
+
+class TestTrainDistributed(unittest.TestCase):
+    def _train(self, agent, agent_type):
+        export = mock.patch.object(td, "state_dict_to_numpy", wraps=td.state_dict_to_numpy)
+        with tempfile.TemporaryDirectory() as save_path, contextlib.redirect_stdout(io.StringIO()), export as exported:
+            rewards, losses, victories = td.train_distributed(
+                agent, agent_type=agent_type, num_episodes=3, num_actors=2,
+                save_path=save_path, HYPERPARAMS=_config(),
+            )
+        # 시작 가중치 + weight_sync_interval마다 다시 보낸 가중치
+        self.assertGreaterEqual(exported.call_count, 2)
+        self.assertEqual(len(rewards), 3)
+        self.assertEqual(len(losses), 3)
+        self.assertEqual(len(victories), 3)
+        # 모든 actor 프로세스가 종료(join)되어 남은 자식 프로세스가 없다
+        self.assertTrue(_wait_until(lambda: not mp.active_children(), timeout=10.0))
+
+    def test_dddqn_smoke(self):
+        agent = DDDQNAgent(1237, 6, 0.001, 0.9, 1.0, 0.01, 0.99, 10, 64, 8)
+        self._train(agent, "dddqn")
+
+    def test_rainbow_smoke(self):
+        from agent.rainbow_agent import DQNAgent
+        with contextlib.redirect_stdout(io.StringIO()):
+            agent = DQNAgent(
+                env=YakemonEnv(context=BattleContext()), memory_size=64, batch_size=8, target_update=10, seed=0,
+                gamma=0.9, alpha=0.2, beta=0.6, prior_eps=1e-6, v_min=-10.0, v_max=10.0, atom_size=11, n_step=3,
+                learning_rate=0.001,
+            )
+        self._train(agent, "rainbow")
+
+
+if __name__ == "__main__":
+    unittest.main()
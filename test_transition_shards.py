@@ -0,0 +1,63 @@
+import tempfile
+import unittest
+
+import numpy as np
+
+from generate_dataset import generate
+from RL.state_codec import StateCodec
+from utils.transition_shards import ShardWriter, open_shards, read_index, write_index
+
+
+def make_episode(rng, length, dim):
+    # StateCodec의 비트 칸은 0/1이어야 하므로 0/1 관측을 만든다
+    observations = rng.integers(0, 2, (length + 1, dim)).astype(np.float32)
+    return dict(
+        observations=observations,
+        action_masks=np.ones((length, 6), dtype=np.int8),
+        actions=rng.integers(0, 6, length),
+        rewards=rng.random(length),
+        dones=[False] * (length - 1) + [True],
+    )
+
+
+class TestTransitionShards(unittest.TestCase):
+    def test_writer_roundtrip_with_next_states(self):
+        rng = np.random.default_rng(0)
+        episodes = [make_episode(rng, length, 1237) for length in (3, 5, 2, 4)]
+        for packed in (False, True):
+            with tempfile.TemporaryDirectory() as directory:
+                writer = ShardWriter(directory, shard_size=6, packed=packed)
+                for episode_id, episode in enumerate(episodes):
+                    writer.add_episode(episode_id, **episode)
+                write_index(directory, writer.close(), 1237, packed=packed)
+                index = read_index(directory)
+                self.assertEqual((index["transitions"], index["episodes"], len(index["shards"])), (14, 4, 2))
+
+                shards = open_shards(directory)
+                batches = [shard.transitions(np.arange(len(shard))) for shard in shards]
+                states = np.concatenate([b["states"] for b in batches])
+                next_states = np.concatenate([b["next_states"] for b in batches])
+                episode_ids = np.concatenate([b["episode_ids"] for b in batches])
+                expected_states = np.concatenate([e["observations"][:-1] for e in episodes])
+                expected_next = np.concatenate([e["observations"][1:] for e in episodes])
+                np.testing.assert_array_equal(states, expected_states)
+                np.testing.assert_array_equal(next_states, expected_next)
+                np.testing.assert_array_equal(episode_ids, np.repeat(np.arange(4), [3, 5, 2, 4]))
+
+    def test_generate_self_play(self):
+        with tempfile.TemporaryDirectory() as directory:
+            index = generate(directory, 3, policy="base_ai", enemy="random", shard_size=10)
+            self.assertEqual(index["episodes"], 3)
+            for shard in open_shards(directory):
+                batch = shard.transitions(np.arange(len(shard)))
+                self.assertEqual(batch["states"].shape[1], 1237)
+                # 고른 행동은 항상 마스크상 가능한 행동
+                self.assertTrue(batch["action_masks"][np.arange(len(shard)), batch["actions"]].all())
+                # 에피소드 마지막 transition만 done (max_steps에 걸리지 않은 경우)
+                last = np.r_[batch["episode_ids"][1:] != batch["episode_ids"][:-1], True]
+                np.testing.assert_array_equal(batch["dones"].astype(bool), last)
+                StateCodec().encode(batch["states"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+import numpy as np
+
+from p_models.ability_info import AbilityInfo
+from p_models.move_info import MoveInfo
+from p_models.pokemon_info import PokemonInfo
+from utils.battle_logics.calculate_type_effectiveness import (
+    calculate_type_effectiveness_with_ability, move_effectiveness_matrix
+)
+from utils.type_relation import (
+    ATTACK_TYPE_NAMES, TYPE_MATRIX, TYPE_NAMES, calculate_type_effectiveness, effectiveness_matrix
+)
+
+
+def make_move(move_id, move_type):
+    return MoveInfo(id=move_id, name=f"기술{move_id}", type=move_type, power=50, pp=10, accuracy=100, category="물리", target="opponent")
+
+
+class TestTypeRelation(unittest.TestCase):
+    def test_matrix_matches_chart(self):
+        self.assertEqual(TYPE_MATRIX.shape, (19, 18))
+        defender_types_list = [[t] for t in TYPE_NAMES] + [[a, b] for a in TYPE_NAMES for b in TYPE_NAMES if a != b] + [[], ["없는타입"]]
+        move_types = ATTACK_TYPE_NAMES + ["없는타입"]
+        matrix = effectiveness_matrix(move_types, defender_types_list)
+        expected = np.array([
+            [calculate_type_effectiveness(m, types) for types in defender_types_list] for m in move_types
+        ])
+        np.testing.assert_array_equal(matrix, expected)
+
+    def test_move_effectiveness_matrix_with_ability(self):
+        moves = [make_move(1, "노말"), make_move(2, "땅"), make_move(3, "물"), make_move(4, "격투")]
+        defenders = [
+            PokemonInfo(id=10, name="고스트", types=["고스트", "독"], moves=[]),
+            PokemonInfo(id=11, name="비행", types=["비행", "강철"], moves=[]),
+            PokemonInfo(id=12, name="물", types=["물"], moves=[]),
+        ]
+        for ability_name in ["없음", "배짱"]:
+            attacker = PokemonInfo(id=1, name="공격", types=["노말"], moves=moves, ability=AbilityInfo(1, ability_name))
+            expected = np.array([
+                [calculate_type_effectiveness_with_ability(attacker, defender, move) for defender in defenders]
+                for move in moves
+            ])
+            np.testing.assert_array_equal(move_effectiveness_matrix(attacker, defenders), expected)
+        self.assertEqual(move_effectiveness_matrix(attacker, defenders)[0, 0], 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
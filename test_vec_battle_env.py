@@ -0,0 +1,46 @@
+import asyncio
+import contextlib
+import io
+import random
+import unittest
+
+import numpy as np
+
+from env.vec_battle_env import YakemonVecEnv
+
+
+class TestYakemonVecEnv(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.vec_env = YakemonVecEnv(3)
+            self.observations, self.masks = self.vec_env.reset()
+
+    def test_reset_shapes(self):
+        self.assertEqual(self.observations.shape, (3, 1237))
+        self.assertEqual(self.masks.shape, (3, 6))
+        self.assertTrue(self.masks[:, :4].all())
+        np.testing.assert_array_equal(self.vec_env.get_observations(), self.observations)
+
+    def test_step_and_auto_reset(self):
+        saw_done = False
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(60):
+                actions = np.array([np.flatnonzero(m)[0] for m in self.masks])
+                self.observations, self.masks, rewards, dones, infos = asyncio.run(
+                    self.vec_env.step(actions, test=True, is_always_hit=True)
+                )
+                self.assertEqual(rewards.shape, (3,))
+                for i in np.flatnonzero(dones):
+                    saw_done = True
+                    self.assertIn("terminal_observation", infos[i])
+                    self.assertEqual(self.vec_env.envs[i].turn, 1)
+        self.assertTrue(saw_done)
+
+    def test_step_rejects_wrong_batch_size(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(self.vec_env.step(np.zeros(2, dtype=int)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,393 @@
+#%% [markdown]
+# Yakemon 분산 학습 (actor / learner)
+# K개의 actor 프로세스가 배틀을 시뮬레이션해 transition을 보내고,
+# 하나의 learner가 리플레이 버퍼와 옵티마이저를 소유하며 학습한다.
+
+#%% [markdown]
+# 필요한 라이브러리 임포트
+import multiprocessing as mp
+import os
+import queue
+import random
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+# 환경 관련 import
+from env.battle_env import YakemonEnv
+from context.battle_context import BattleContext
+
+# 에이전트 관련 import
+from agent.dddqn_agent import DDDQNAgent, DuelingDQN
+from agent.rainbow_agent import Network
+
+# 유틸리티 관련 import
+from utils.battle_logics.create_battle_pokemon import create_battle_pokemon
+from utils.visualization import plot_training_results
+from utils.battle_logger import set_silent
+
+# 데이터 관련 import
+from p_data.mock_pokemon import create_mock_pokemon_list
+
+# 하이퍼파라미터 설정
+hyperparams = {
+    "agent_type": "dddqn",  # "dddqn" 또는 "rainbow"
+    "num_actors": max(1, (os.cpu_count() or 2) - 1),  # actor 프로세스 수 (learner용 코어 1개 제외)
+    "weight_sync_interval": 100,  # learner 업데이트 몇 번마다 actor에게 가중치를 보낼지
+    "queue_size": 64,  # transition 큐에 쌓일 수 있는 최대 묶음 수 (가득 차면 actor가 대기 = back-pressure)
+    "send_batch_size": 16,  # actor가 한 번에 묶어서 보내는 transition 수
+    "updates_per_transition": 1,  # 받은 transition 하나당 learner 업데이트 횟수 (train_agent와 동일하게 1)
+    "use_random_enemy": False,  # True면 상대가 랜덤 기술 선택 (env.step의 test 모드)
+    "num_episodes": 50000,
+    "save_interval": 10000,
+    "seed": 0,
+    "state_dim": 1237,
+    "action_dim": 6,
+    # DDDQN
+    "learning_rate": 0.0005,
+    "gamma": 0.95,
+    "epsilon_start": 1.0,
+    "epsilon_end": 0.01,
+    "epsilon_decay": 0.997,
+    "batch_size": 1024,
+    "memory_size": 500000,
+    "target_update": 20,
+}
+
+#%% [markdown]
+# actor / learner 공용 함수
+def sample_team(all_pokemon: list) -> list:
+    """training_dqn.train_agent와 같은 규칙으로 타입이 겹치지 않는 3마리 팀 구성"""
+    team = [random.choice(all_pokemon)]
+    used_types = set(team[0].types)
+    for _ in range(2):
+        candidates = [p for p in all_pokemon if not any(t in used_types for t in p.types)]
+        team.append(random.choice(candidates))
+        used_types |= set(team[-1].types)
+    return [create_battle_pokemon(poke) for poke in team]
+
+
+def build_network(agent_type: str, network_kwargs: Dict) -> nn.Module:
+    """actor 쪽에서 learner와 같은 구조의 정책 네트워크 생성"""
+    if agent_type == "dddqn":
+        return DuelingDQN(network_kwargs["state_dim"], network_kwargs["action_dim"])
+    if agent_type == "rainbow":
+        support = torch.linspace(network_kwargs["v_min"], network_kwargs["v_max"], network_kwargs["atom_size"])
+        return Network(network_kwargs["state_dim"], network_kwargs["action_dim"], network_kwargs["atom_size"], support)
+    raise ValueError(f"Unknown agent_type: {agent_type}")
+
+
+def get_network_kwargs(agent, agent_type: str) -> Dict:
+    if agent_type == "dddqn":
+        return {"state_dim": agent.state_dim, "action_dim": agent.action_dim}
+    return {
+        "state_dim": agent.dqn.feature_layer[0].in_features,
+        "action_dim": agent.action_dim,
+        "v_min": agent.v_min,
+        "v_max": agent.v_max,
+        "atom_size": agent.atom_size,
+    }
+
+
+def get_policy_net(agent, agent_type: str) -> nn.Module:
+    return agent.policy_net if agent_type == "dddqn" else agent.dqn
+
+
+def state_dict_to_numpy(network: nn.Module) -> Dict[str, np.ndarray]:
+    # 프로세스 간 전송은 numpy로 (torch 텐서의 공유 메모리 핸들을 주고받지 않도록)
+    return {k: v.detach().cpu().numpy() for k, v in network.state_dict().items()}
+
+
+def load_numpy_state_dict(network: nn.Module, weights: Dict[str, np.ndarray]) -> None:
+    network.load_state_dict({k: torch.from_numpy(v) for k, v in weights.items()})
+
+
+#%% [markdown]
+# actor 프로세스
+def actor_process(
+    actor_id: int,
+    agent_type: str,
+    network_kwargs: Dict,
+    transition_queue: mp.Queue,
+    weight_queue: mp.Queue,
+    stop_event,
+    config: Dict,
+) -> None:
+    """actor 프로세스 진입점. quiet이면 배틀 로그를 끈다."""
+    random.seed(config["seed"] + actor_id)
+    np.random.seed(config["seed"] + actor_id)
+    torch.manual_seed(config["seed"] + actor_id)
+    torch.set_num_threads(1)
+    if config.get("quiet", True):
+        set_silent()
+    _run_actor(actor_id, agent_type, network_kwargs, transition_queue, weight_queue, stop_event, config)
+
+
+def _run_actor(actor_id, agent_type, network_kwargs, transition_queue, weight_queue, stop_event, config):
+    network = build_network(agent_type, network_kwargs)
+    network.eval()
+    # 첫 가중치는 반드시 받고 시작
+    version, weights, epsilon = weight_queue.get()
+    load_numpy_state_dict(network, weights)
+
+    # learner가 먼저 끝나 큐를 더 읽지 않아도 actor 프로세스가 종료될 수 있도록
+    transition_queue.cancel_join_thread()
+
+    env = YakemonEnv(context=BattleContext())
+    all_pokemon = create_mock_pokemon_list()
+    pending: List[tuple] = []
+
+    def send(message) -> bool:
+        # 큐가 가득 차면 learner가 따라올 때까지 대기 (back-pressure)
+        while not stop_event.is_set():
+            try:
+                transition_queue.put(message, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    while not stop_event.is_set():
+        state = env.reset(my_team=sample_team(all_pokemon), enemy_team=sample_team(all_pokemon))
+        total_reward, steps, done = 0.0, 0, False
+        while not done and not stop_event.is_set():
+            # 최신 가중치가 있으면 반영 (가장 마지막 것만 사용)
+            try:
+                while True:
+                    version, weights, epsilon = weight_queue.get_nowait()
+                    load_numpy_state_dict(network, weights)
+            except queue.Empty:
+                pass
+
+            mask = env.get_action_mask()
+            if agent_type == "dddqn" and random.random() < epsilon:
+                action = int(np.random.choice(np.flatnonzero(mask)))
+            else:
+                with torch.no_grad():
+                    q_values = network(torch.as_tensor(state, dtype=torch.float32).unsqueeze(0))[0].numpy()
+                q_values[mask == 0] = -np.inf
+                action = int(q_values.argmax())
+
+            next_state, reward, done, _ = env.step_sync(action, test=config["use_random_enemy"])
+            pending.append((
+                np.asarray(state, dtype=np.float32), action, float(reward),
+                np.asarray(next_state, dtype=np.float32), bool(done),
+            ))
+            state = next_state
+            total_reward += reward
+            steps += 1
+
+            if len(pending) >= config["send_batch_size"] or done:
+                if not send(("transitions", actor_id, pending)):
+                    return
+                pending = []
+
+        if done:
+            my_alive = any(p.current_hp > 0 for p in env.my_team)
+            enemy_alive = any(p.current_hp > 0 for p in env.enemy_team)
+            victory = 1 if my_alive and not enemy_alive else 0
+            if not send(("episode", actor_id, (total_reward / max(steps, 1), steps, victory))):
+                return
+
+
+#%% [markdown]
+# learner
+class _LearnerAdapter:
+    """DDDQNAgent / rainbow DQNAgent의 저장·학습 인터페이스 차이를 흡수"""
+
+    def __init__(self, agent, agent_type: str):
+        self.agent = agent
+        self.agent_type = agent_type
+        # rainbow의 n-step 버퍼는 연속된 transition을 가정하므로 actor마다 따로 둔다
+        self.n_step_buffers: Dict[int, tuple] = {}
+
+    def store(self, actor_id: int, transition: tuple) -> None:
+        if self.agent_type == "dddqn":
+            self.agent.store_transition(*transition)
+            return
+
+        agent = self.agent
+        if actor_id not in self.n_step_buffers:
+            self.n_step_buffers[actor_id] = (
+                deque(maxlen=agent.memory.n_step),
+                deque(maxlen=agent.n_step) if agent.use_n_step else None,
+            )
+        agent.memory.n_step_buffer, n_step_buffer = self.n_step_buffers[actor_id]
+        if agent.use_n_step:
+            agent.memory_n.n_step_buffer = n_step_buffer
+            one_step_transition = agent.memory_n.store(*transition)
+        else:
+            one_step_transition = transition
+        if one_step_transition:
+            agent.memory.store(*one_step_transition)
+
+    def learn(self) -> float:
+        if self.agent_type == "dddqn":
+            return self.agent.update()
+        if len(self.agent.memory) >= self.agent.batch_size:
+            return self.agent.update_model()
+        return 0.0
+
+    @property
+    def epsilon(self) -> float:
+        return getattr(self.agent, "epsilon", 0.0)
+
+
+def train_distributed(
+    agent,
+    agent_type: str = "dddqn",
+    num_episodes: int = hyperparams["num_episodes"],
+    num_actors: int = hyperparams["num_actors"],
+    save_path: str = 'models',
+    agent_name: Optional[str] = None,
+    HYPERPARAMS: dict = hyperparams,
+) -> tuple:
+    """
+    actor/learner 분산 학습
+
+    Args:
+        agent: 학습할 에이전트 (DDDQNAgent 또는 rainbow DQNAgent). 리플레이 버퍼와 옵티마이저는 learner(현재 프로세스)에만 있다
+        agent_type: "dddqn" 또는 "rainbow"
+        num_episodes: actor 전체가 끝낸 에피소드 수가 이 값에 도달하면 종료
+        num_actors: actor 프로세스 수
+
+    Returns:
+        tuple: (rewards_history, losses_history, victories_history)
+    """
+    agent_name = agent_name or agent_type
+    os.makedirs(save_path, exist_ok=True)
+    learner = _LearnerAdapter(agent, agent_type)
+    policy_net = get_policy_net(agent, agent_type)
+    network_kwargs = get_network_kwargs(agent, agent_type)
+
+    ctx = mp.get_context("spawn")
+    transition_queue = ctx.Queue(maxsize=HYPERPARAMS["queue_size"])
+    weight_queues = [ctx.Queue(maxsize=1) for _ in range(num_actors)]
+    stop_event = ctx.Event()
+    actor_config = {
+        "seed": HYPERPARAMS["seed"],
+        "send_batch_size": HYPERPARAMS["send_batch_size"],
+        "use_random_enemy": HYPERPARAMS["use_random_enemy"],
+        "quiet": HYPERPARAMS.get("quiet", True),
+    }
+
+    version = 0
+
+    def broadcast_weights() -> None:
+        payload = (version, state_dict_to_numpy(policy_net), learner.epsilon)
+        for weight_queue in weight_queues:
+            # 아직 안 가져간 이전 가중치는 버리고 최신 것만 남긴다
+            try:
+                weight_queue.get_nowait()
+            except queue.Empty:
+                pass
+            weight_queue.put(payload)
+
+    broadcast_weights()
+    actors = [
+        ctx.Process(
+            target=actor_process,
+            args=(i, agent_type, network_kwargs, transition_queue, weight_queues[i], stop_event, actor_config),
+            daemon=True,
+        )
+        for i in range(num_actors)
+    ]
+    for actor in actors:
+        actor.start()
+
+    rewards_history: List[float] = []
+    losses_history: List[float] = []
+    victories_history: List[int] = []
+    total_loss, loss_steps, updates = 0.0, 0, 0
+
+    try:
+        while len(rewards_history) < num_episodes:
+            try:
+                kind, actor_id, payload = transition_queue.get(timeout=1.0)
+            except queue.Empty:
+                if not any(actor.is_alive() for actor in actors):
+                    raise RuntimeError("모든 actor 프로세스가 종료되었습니다.")
+                continue
+
+            if kind == "episode":
+                avg_reward, steps, victory = payload
+                rewards_history.append(avg_reward)
+                losses_history.append(total_loss / loss_steps if loss_steps else 0)
+                victories_history.append(victory)
+                total_loss, loss_steps = 0.0, 0
+                episode = len(rewards_history)
+                if episode % HYPERPARAMS["save_interval"] == 0:
+                    agent.save(os.path.join(save_path, f'{agent_name}_episode_{episode}.pth'))
+                print(f'Episode {episode}/{num_episodes} (actor {actor_id}) '
+                      f'Average Reward: {avg_reward:.2f} Steps: {steps} Victory: {"Yes" if victory else "No"} '
+                      f'Cumulative Victories: {sum(victories_history)}/{episode}')
+                continue
+
+            for transition in payload:
+                learner.store(actor_id, transition)
+                for _ in range(HYPERPARAMS["updates_per_transition"]):
+                    total_loss += learner.learn()
+                    loss_steps += 1
+                    updates += 1
+                    if updates % HYPERPARAMS["weight_sync_interval"] == 0:
+                        version += 1
+                        broadcast_weights()
+    finally:
+        stop_event.set()
+        # 대기 중인 actor가 put에서 빠져나올 수 있도록 큐를 비운다
+        try:
+            while True:
+                transition_queue.get_nowait()
+        except queue.Empty:
+            pass
+        for actor in actors:
+            actor.join(timeout=5)
+            if actor.is_alive():
+                actor.terminate()
+        # 아무도 읽지 않을 가중치가 파이프에 남아 있어도 종료가 막히지 않도록
+        for q in [transition_queue, *weight_queues]:
+            q.cancel_join_thread()
+            q.close()
+
+    return rewards_history, losses_history, victories_history
+
+
+if __name__ == "__main__":
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    results_dir = os.path.join('results', f'distributed_{timestamp}')
+    models_dir = os.path.join('models', f'distributed_{timestamp}')
+
+    agent = DDDQNAgent(
+        state_dim=hyperparams["state_dim"],
+        action_dim=hyperparams["action_dim"],
+        learning_rate=hyperparams["learning_rate"],
+        gamma=hyperparams["gamma"],
+        epsilon_start=hyperparams["epsilon_start"],
+        epsilon_end=hyperparams["epsilon_end"],
+        epsilon_decay=hyperparams["epsilon_decay"],
+        target_update=hyperparams["target_update"],
+        memory_size=hyperparams["memory_size"],
+        batch_size=hyperparams["batch_size"]
+    )
+
+    print(f"Starting distributed DDDQN training with {hyperparams['num_actors']} actors...")
+    rewards, losses, victories = train_distributed(
+        agent=agent,
+        agent_type="dddqn",
+        num_episodes=hyperparams["num_episodes"],
+        num_actors=hyperparams["num_actors"],
+        save_path=models_dir,
+        agent_name='ddqn',
+    )
+    plot_training_results(
+        rewards_history=rewards,
+        losses_history=losses,
+        agent_name='DDDQN (distributed)',
+        save_path=results_dir,
+        victories_history=victories,
+    )
+    print(f"Results saved in: {results_dir}")
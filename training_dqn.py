@@ -15,6 +15,7 @@ import random
 
 # 환경 관련 import
 from RL.base_ai_choose_action import base_ai_choose_action
+from RL.rollout_evaluator import RolloutEvaluator
 from env.battle_env import YakemonEnv
 
 # 모델 관련 import
@@ -29,7 +30,6 @@ from utils.visualization import plot_training_results
 from agent.dddqn_agent import DDDQNAgent
 
 # RL 관련 import
-from RL.get_state_vector import get_state
 
 # 데이터 관련 import
 from p_data.mock_pokemon import create_mock_pokemon_list
@@ -37,6 +37,7 @@ from p_data.mock_pokemon import create_mock_pokemon_list
 # 컨텍스트 관련 import
 from context.battle_store import BattleStoreState, store
 from context.duration_store import duration_store
+from utils.battle_logger import set_level
 
 
 # 전역 변수 초기화
@@ -60,6 +61,12 @@ hyperparams = {
     "action_dim": 6,   # 4개의 기술 + 2개의 교체
     "load_best_model": False,  # 최고 성능 모델 로드 여부
     "load_last_model": False,  # 마지막 모델 로드 여부
+    "replay_dir": None,  # 리플레이 버퍼 memmap 디렉터리. 지정하면 재시작 후 모델 저장 시점의 버퍼를 이어서 사용
+    "mc_rollouts": 8,  # 미니 몬테카를로에서 행동당 rollout 수
+    "mc_depth": 1,  # rollout 깊이 (스텝 수). 첫 스텝 이후는 base AI끼리 진행
+    "mc_workers": 0,  # rollout 프로세스 수. 0이면 학습 프로세스에서 직접 실행
+    "mc_always_hit": False,  # True면 rollout에서 명중률을 무시 (이전 방식)
+    "log_level": "DEBUG",  # 배틀 로그 레벨. "INFO"면 보상 로그만 남아 통계 그래프는 유지되고, "WARNING" 이상이면 거의 출력하지 않음
 }
 
 #%% [markdown]
@@ -175,6 +182,15 @@ async def train_agent(
     
     # 모델 저장 디렉토리 생성
     os.makedirs(save_path, exist_ok=True)
+
+    # 미니 몬테카를로 평가용 rollout 평가기 (mc_workers > 0이면 프로세스 풀 사용)
+    evaluator = RolloutEvaluator(
+        num_rollouts=HYPERPARAMS["mc_rollouts"],
+        depth=HYPERPARAMS["mc_depth"],
+        gamma=HYPERPARAMS["gamma"],
+        workers=HYPERPARAMS["mc_workers"],
+        is_always_hit=HYPERPARAMS["mc_always_hit"],
+    )
     
     # 하이퍼파라미터 저장
     with open(os.path.join(save_path, f'{agent_name}_hyperparams.json'), 'w') as f:
@@ -250,19 +266,7 @@ async def train_agent(
         while True:
             print(f"Episode {episode+1} / {HYPERPARAMS['num_episodes']}")
             # 현재 상태 벡터 생성
-            state_vector = get_state(
-                store=env.battle_store,
-                my_team=my_team,
-                enemy_team=enemy_team,
-                active_my=env.battle_store.get_active_index("my"),
-                active_enemy=env.battle_store.get_active_index("enemy"),
-                public_env=env.public_env,
-                my_env=env.my_env,
-                enemy_env=env.enemy_env,
-                turn=env.turn,
-                my_effects=env.duration_store.my_effects,
-                enemy_effects=env.duration_store.enemy_effects
-            )
+            state_vector = env._get_state()
             
             # 행동 선택
             # 초반 학습 중에는 base ai와 DQN을 혼합하여 사용
@@ -291,10 +295,6 @@ async def train_agent(
                 agent.store_transition(state_vector, action, reward, next_state, done)
             else:
                 # 미니 몬테카를로 평가 시스템 적용
-                # 0. 현재 상태 복사 저장
-                temp_1_env = env.copy()
-                temp_2_env = env.copy()
-                
                 # 1. Base AI의 행동 선택
                 base_temp_action = base_ai_choose_action(
                     side="my",
@@ -329,17 +329,17 @@ async def train_agent(
                 # 4. 행동이 다른 경우에만 평가 수행
                 if base_action != agent_action:
                     print("@@@@@ Start Monte Carlo Evaluation @@@@@")
-                    
-                    # Base AI 행동 임시 실행 및 리워드 계산
-                    print("Start checking reward of Base AI's action")
-                    base_next_state, base_reward, base_done, _ = await temp_1_env.step(base_action, enemy_action=enemy_base_action, is_always_hit=True, is_monte_carlo=True)
-                    
-                    # 에이전트 행동 임시 실행 및 리워드 계산
-                    print("Start checking reward of Agent's action")
-                    agent_next_state, agent_reward, agent_done, _ = await temp_2_env.step(agent_action, enemy_action=enemy_base_action, is_always_hit=True, is_monte_carlo=True)
+                    # 가능한 모든 행동(+ Base AI / 에이전트 행동)을 rollout으로 평가. env 상태는 그대로 유지됨
+                    scores = evaluator.evaluate(
+                        env,
+                        actions=list(np.flatnonzero(env.get_action_mask())) + [base_action, agent_action],
+                        enemy_action=enemy_base_action
+                    )
+                    for a, mean, var in zip(scores.actions, scores.mean, scores.var):
+                        print(f"action {a}: mean {mean:.3f}, var {var:.3f}")
+                    base_reward = scores.score(base_action)
+                    agent_reward = scores.score(agent_action)
                     print("@@@@@ End checking reward of Agent and Base AI's action @@@@@")
-                    del temp_1_env
-                    del temp_2_env
                     # 리워드 비교 및 조정
                     if agent_reward > base_reward:
                         # 에이전트의 선택이 더 좋았을 경우 실제 스텝 진행 후 추가 보상
@@ -406,6 +406,7 @@ async def train_agent(
         print(f'Cumulative Victories: {sum(victories_history)}/{len(victories_history)}')
         print('-' * 50)
     
+    evaluator.close()
     return rewards_history, losses_history, victories_history
 
 #%% [markdown]
@@ -467,19 +468,7 @@ async def test_agent(
         # 3. 배틀 루프
         while True:
             # 현재 상태 벡터 생성
-            state_vector = get_state(
-                store=env.battle_store,
-                my_team=my_team,
-                enemy_team=enemy_team,
-                active_my=env.battle_store.get_active_index("my"),
-                active_enemy=env.battle_store.get_active_index("enemy"),
-                public_env=env.public_env,
-                my_env=env.my_env,
-                enemy_env=env.enemy_env,
-                turn=env.turn,
-                my_effects=env.duration_store.my_effects,
-                enemy_effects=env.duration_store.enemy_effects
-            )
+            state_vector = env._get_state()
             
             # 행동 선택 (기술 4개 + 교체 가능한 포켓몬 수)
             # 테스트 시에는 target network를 사용
@@ -534,6 +523,9 @@ if __name__ == "__main__":
     results_dir = os.path.join('results', f'training_{timestamp}')
     models_dir = os.path.join('models', f'training_{timestamp}')
     
+    # 배틀 로그 레벨 설정
+    set_level(hyperparams["log_level"])
+    
     # 환경 초기화
     env = YakemonEnv()  # 실제 게임 환경
     state_dim = hyperparams["state_dim"]
@@ -550,7 +542,8 @@ if __name__ == "__main__":
         epsilon_decay=hyperparams["epsilon_decay"],
         target_update=hyperparams["target_update"],
         memory_size=hyperparams["memory_size"],
-        batch_size=hyperparams["batch_size"]
+        batch_size=hyperparams["batch_size"],
+        replay_dir=hyperparams["replay_dir"]
     )
     
     print("Starting DDDQN training...")
@@ -0,0 +1,145 @@
+# utils/battle_logger.py
+"""
+배틀 시뮬레이터 로깅
+
+- 모든 시뮬레이터 모듈은 get_logger(__name__)로 "yakemon.<모듈 경로>" 로거를 얻어 사용한다.
+- 기본값은 기존 print와 동일하게 모든 메시지를 현재 sys.stdout에 메시지만 출력한다
+  (utils.visualization.capture_output으로 캡처한 로그 분석도 그대로 동작).
+- 학습 중에는 set_silent()로 끄면 로그 호출은 레벨 확인만 하고 바로 반환한다.
+  메시지는 "%s" 지연 포매팅이므로 꺼진 상태에서는 문자열도 만들지 않는다.
+- set_event_sink()로 싱크를 연결하면 emit_event()가 배틀 이벤트를 타입이 있는 레코드로 기록한다.
+"""
+import json
+import logging
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Union
+
+ROOT_LOGGER_NAME = "yakemon"
+SILENT = logging.CRITICAL + 1
+
+LevelType = Union[int, str]
+
+
+class _CurrentStdoutHandler(logging.StreamHandler):
+    """기록 시점의 sys.stdout에 출력 (capture_output / redirect_stdout과 함께 쓰기 위함)"""
+
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+_root_logger = logging.getLogger(ROOT_LOGGER_NAME)
+if not _root_logger.handlers:
+    _handler = _CurrentStdoutHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    _root_logger.addHandler(_handler)
+    _root_logger.setLevel(logging.DEBUG)
+    _root_logger.propagate = False
+
+
+def _logger_name(module: Optional[str]) -> str:
+    return f"{ROOT_LOGGER_NAME}.{module}" if module else ROOT_LOGGER_NAME
+
+
+def get_logger(module: str) -> logging.Logger:
+    """모듈별 로거 반환. 보통 get_logger(__name__)으로 사용"""
+    return logging.getLogger(_logger_name(module))
+
+
+def set_level(level: LevelType, module: Optional[str] = None) -> None:
+    """
+    로그 레벨 설정
+
+    Args:
+        level: logging 레벨 (예: "DEBUG", "INFO", logging.WARNING)
+        module: 생략하면 시뮬레이터 전체, 지정하면 해당 모듈(하위 모듈 포함)만 설정.
+            예) set_level("WARNING", "utils.battle_logics.damage_calculator")
+    """
+    logging.getLogger(_logger_name(module)).setLevel(level.upper() if isinstance(level, str) else level)
+
+
+def set_silent(silent: bool = True) -> None:
+    """학습용 무출력 모드. False면 기본값(DEBUG)으로 되돌린다"""
+    set_level(SILENT if silent else logging.DEBUG)
+
+
+# ---------------------------------------------------------------------------
+# 구조화된 이벤트 기록
+
+class EventSink(ABC):
+    """emit_event()로 들어오는 이벤트 레코드를 받는 싱크의 기본 클래스 (write를 구현해야 생성 가능)"""
+
+    @abstractmethod
+    def write(self, record: Dict[str, Any]) -> None:
+        ...
+
+    def close(self) -> None:
+        pass
+
+
+class ListEventSink(EventSink):
+    """메모리에 레코드를 모아두는 싱크 (테스트 / 노트북 분석용)"""
+
+    def __init__(self):
+        self.records: List[Dict[str, Any]] = []
+
+    def write(self, record: Dict[str, Any]) -> None:
+        self.records.append(record)
+
+
+class JsonlEventSink(EventSink):
+    """레코드를 한 줄에 하나씩 JSON으로 기록"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+
+    def write(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str))
+        self._file.write("\n")
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+
+_event_sink: Optional[EventSink] = None
+
+
+def set_event_sink(sink: Optional[EventSink]) -> Optional[EventSink]:
+    """이벤트 싱크 설정 (None이면 해제). 이전 싱크를 반환한다"""
+    global _event_sink
+    previous = _event_sink
+    _event_sink = sink
+    return previous
+
+
+def get_event_sink() -> Optional[EventSink]:
+    return _event_sink
+
+
+def emit_event(event: str, **fields: Any) -> None:
+    """
+    배틀 이벤트 기록. 싱크가 없으면 아무 일도 하지 않는다.
+
+    이벤트 종류:
+        step: turn, action, reward, done (YakemonEnv.step)
+        move: side, pokemon, move, success, is_hit, damage, was_effective, was_null, is_critical
+        hp_change: pokemon, amount, hp
+        switch: side, from_index, to_index, pokemon
+        status_added: side, pokemon, status
+        effect_added: side, effect, remaining_turn
+        effect_removed: side, effect
+    """
+    if _event_sink is None:
+        return
+    fields["event"] = event
+    _event_sink.write(fields)
@@ -2,26 +2,30 @@ from context.duration_store import DurationStore, duration_store
 from p_models.battle_pokemon import BattlePokemon
 from context.battle_store import BattleStore, BattleStoreState, store
 from p_models.move_info import MoveInfo
+from utils.battle_logics.helpers import async_entry
 from utils.battle_logics.update_battle_pokemon import add_status, change_hp, change_rank, set_types
 from p_models.rank_state import RankState
-from utils.battle_logics.switch_pokemon import switch_pokemon
+from utils.battle_logics.switch_pokemon import switch_pokemon_sync
 from utils.battle_logics.get_best_switch_index import get_best_switch_index
 from utils.battle_logics.rank_effect import calculate_rank_effect
 from utils.battle_logics.apply_none_move_damage import apply_recoil_damage
 from utils.battle_logics.update_environment import set_weather
-import asyncio
 from context.battle_store import SideType
 from typing import Literal, Optional, List, Dict
 import random
+from utils.battle_logger import get_logger
 
-async def apply_defensive_ability_effect_after_multi_damage(
+logger = get_logger(__name__)
+
+def apply_defensive_ability_effect_after_multi_damage_sync(
     side: Literal["my", "enemy"],
     attacker: BattlePokemon,
     defender: BattlePokemon,
     used_move: MoveInfo,
     applied_damage: Optional[int] = None,
     multi_hit: Optional[bool] = False,
-    battle_store: Optional[BattleStore] = store
+    battle_store: Optional[BattleStore] = store,
+    duration_store: Optional[DurationStore] = duration_store
 ) -> None:
     """다중 데미지 후 방어 특성 효과 적용"""
     opponent_side = "enemy" if side == "my" else "my"
@@ -35,7 +39,7 @@ async def apply_defensive_ability_effect_after_multi_damage(
     for category in ability.defensive:
         if category == "weather_change":
             if ability.name == "모래뿜기":
-                set_weather("모래바람")
+                set_weather("모래바람", battle_store=battle_store, duration_store=duration_store)
                 battle_store.add_log(f"🏜️ {defender.base.name}의 특성으로 날씨가 모래바람이 되었다!")
         elif category == "rank_change":
             if ability.name == "증기기관" and used_move.type in ["물", "불"]:
@@ -61,7 +65,7 @@ async def apply_defensive_ability_effect_after_multi_damage(
                     battle_store.update_pokemon(opponent_side, active_opponent,
                                           lambda p: change_rank(p, "defense", 1))
 
-async def apply_after_damage(side: str, attacker: BattlePokemon, defender: BattlePokemon,
+def apply_after_damage_sync(side: str, attacker: BattlePokemon, defender: BattlePokemon,
                             used_move: MoveInfo, applied_damage: int = 0,
                             multi_hit: bool = False,
                             battle_store: Optional[BattleStore] = store,
@@ -69,23 +73,23 @@ async def apply_after_damage(side: str, attacker: BattlePokemon, defender: Battl
 
     opponent_side = "enemy" if side == "my" else "my"
 
-    await apply_defensive_ability_effect_after_multi_damage(
-        side, attacker, defender, used_move, applied_damage, multi_hit, battle_store
+    apply_defensive_ability_effect_after_multi_damage_sync(
+        side, attacker, defender, used_move, applied_damage, multi_hit, battle_store, duration_store
     )
 
-    await apply_offensive_ability_effect_after_damage(
+    apply_offensive_ability_effect_after_damage_sync(
         side, attacker, defender, used_move, applied_damage, multi_hit, battle_store, duration_store
     )
 
-    await apply_move_effect_after_damage(
+    apply_move_effect_after_damage_sync(
         side, attacker, defender, used_move, applied_damage, multi_hit, battle_store, duration_store
     )
 
-    await apply_panic_uturn(
+    apply_panic_uturn_sync(
         opponent_side, attacker, defender, used_move, applied_damage, multi_hit, battle_store, duration_store
     )
 
-async def apply_panic_uturn(side: str, attacker: BattlePokemon, defender: BattlePokemon,
+def apply_panic_uturn_sync(side: str, attacker: BattlePokemon, defender: BattlePokemon,
                             used_move: MoveInfo, applied_damage: int = 0,
                             multi_hit: bool = False,
                             battle_store: Optional[BattleStore] = store,
@@ -102,7 +106,7 @@ async def apply_panic_uturn(side: str, attacker: BattlePokemon, defender: Battle
         and defender.current_hp > 0
         and defender.current_hp <= defender.base.hp / 2):
 
-        print(f"🛡️ {defender.base.name}의 특성 '위기회피' 발동!")
+        logger.debug("🛡️ %s의 특성 '위기회피' 발동!", defender.base.name)
 
         available_indexes = [
             i for i, p in enumerate(team)
@@ -110,13 +114,13 @@ async def apply_panic_uturn(side: str, attacker: BattlePokemon, defender: Battle
         ]
 
         if not available_indexes:
-            print("⚠️ 위기회피 가능 포켓몬 없음 (교체 생략)")
+            logger.debug("⚠️ 위기회피 가능 포켓몬 없음 (교체 생략)")
             return
 
-        switch_index = get_best_switch_index(side)
-        await switch_pokemon(side, switch_index, battle_store=battle_store, duration_store=duration_store)
+        switch_index = get_best_switch_index(side, battle_store=battle_store)
+        switch_pokemon_sync(side, switch_index, battle_store=battle_store, duration_store=duration_store)
         
-async def apply_move_effect_after_multi_damage(
+def apply_move_effect_after_multi_damage_sync(
     side: SideType,
     attacker: BattlePokemon,
     defender: BattlePokemon,
@@ -144,7 +148,7 @@ async def apply_move_effect_after_multi_damage(
     if used_move.cannot_move:
         battle_store.update_pokemon(side, active_mine, lambda p: p.copy_with(cannot_move=True))
         battle_store.add_log(f"💥 {attacker.base.name}은 피로로 인해 다음 턴 움직일 수 없다!")
-        print(f"피로 효과 적용: {attacker.base.name}은 피로로 인해 다음 턴 움직일 수 없다!")
+        logger.debug("피로 효과 적용: %s은 피로로 인해 다음 턴 움직일 수 없다!", attacker.base.name)
 
     # 유턴 처리
     if used_move.u_turn and "교체불가" not in attacker.status:
@@ -152,23 +156,23 @@ async def apply_move_effect_after_multi_damage(
             i for i, p in enumerate(mine_team) if i != active_mine and p.current_hp > 0
         ]
         if available_indexes:
-            best_index = get_best_switch_index(side)
-            await switch_pokemon(side, best_index, baton_touch, battle_store=battle_store, duration_store=duration_store)
+            best_index = get_best_switch_index(side, battle_store=battle_store)
+            switch_pokemon_sync(side, best_index, baton_touch, battle_store=battle_store, duration_store=duration_store)
             battle_store.add_log(f"💨 {attacker.base.name}이(가) 교체되었습니다!")
-            print(f"유턴 효과 적용: {attacker.base.name}이(가) 교체되었습니다!")
+            logger.debug("유턴 효과 적용: %s이(가) 교체되었습니다!", attacker.base.name)
 
     # 자폭류 처리
     if used_move.self_kill:
-        battle_store.update_pokemon(side, active_mine, lambda p: change_hp(p, -p.base.hp))
+        battle_store.update_pokemon(side, active_mine, lambda p: change_hp(p, -p.base.hp, battle_store=battle_store))
         battle_store.add_log(f"🤕 {attacker.base.name}은/는 반동으로 기절했다...!")
-        print(f"자폭 효과 적용: {attacker.base.name}은/는 반동으로 기절했다...!")
+        logger.debug("자폭 효과 적용: %s은/는 반동으로 기절했다...!", attacker.base.name)
 
     # 디메리트 효과
     if demerit_effects:
         for demerit in demerit_effects:
             if demerit and random.random() < demerit.chance:
                 if demerit.recoil and applied_damage:
-                    result = apply_recoil_damage(attacker, demerit.recoil, applied_damage)
+                    result = apply_recoil_damage(attacker, demerit.recoil, applied_damage, battle_store=battle_store)
                     battle_store.update_pokemon(side, active_mine, lambda _: result)
                     recoil_damage = int(applied_damage * demerit.recoil)
                 for sc in demerit.stat_change:
@@ -177,34 +181,34 @@ async def apply_move_effect_after_multi_damage(
                         lambda p: change_rank(p, sc.stat, sc.change)
                     )
                     battle_store.add_log(f"🔃 {attacker.base.name}의 {sc.stat}이(가) {sc.change}랭크 변했다!")
-                    print(f"디메리트 효과 적용: {attacker.base.name}의 {sc.stat}이(가) {sc.change}랭크 변했다!")
+                    logger.debug("디메리트 효과 적용: %s의 %s이(가) %s랭크 변했다!", attacker.base.name, sc.stat, sc.change)
 
     # 부가효과
     if used_move.target == "opponent" and (attacker.base.ability is not None and attacker.base.ability.name != "우격다짐"):
         roll = random.random() * 2 if (attacker.base.ability and attacker.base.ability.name == "하늘의은총") else random.random()
         for eff in effect or []:
             if roll < (eff.chance if eff.chance is not None else 0):
-                print(f"연속 기술 부가효과 적용: {used_move.name}의 효과 발동!")
+                logger.debug("연속 기술 부가효과 적용: %s의 효과 발동!", used_move.name)
                 if eff.heal and not applied_damage:
                     heal = attacker.base.hp * eff.heal if eff.heal < 1 else calculate_rank_effect(defender.rank['attack']) * defender.base.attack
-                    battle_store.update_pokemon(side, active_mine, lambda p: change_hp(p, heal))
+                    battle_store.update_pokemon(side, active_mine, lambda p: change_hp(p, heal, battle_store=battle_store))
                     battle_store.add_log(f"➕ {attacker.base.name}은 체력을 회복했다!")
-                    print(f"체력 회복 효과 적용: {attacker.base.name}이(가) 체력을 회복했다!")
+                    logger.debug("체력 회복 효과 적용: %s이(가) 체력을 회복했다!", attacker.base.name)
                 for sc in eff.stat_change:
                     target_side = (
                         side if sc.target == "self"
                         else opponent_side
                     )
-                    print(f"target_side: {target_side}")
+                    logger.debug("target_side: %s", target_side)
                     target_team = battle_store.get_team(target_side)
                     index = battle_store.get_active_index(target_side)
                     battle_store.update_pokemon(target_side, index, lambda p: change_rank(p, sc.stat, sc.change))
                     battle_store.add_log(f"🔃 {target_team[index].base.name}의 {sc.stat}이(가) {sc.change}랭크 변했다!")
-                    print(f"부가효과 적용: {target_team[index].base.name}의 {sc.stat}이(가) {sc.change}랭크 변했다!")
+                    logger.debug("부가효과 적용: %s의 %s이(가) %s랭크 변했다!", target_team[index].base.name, sc.stat, sc.change)
                 if eff.status and eff.status not in defender.status:
                     battle_store.update_pokemon(opponent_side, active_opponent, lambda p: add_status(p, eff.status, opponent_side, nullification, battle_store=battle_store, duration_store=duration_store))
                     battle_store.add_log(f"{defender.base.name}은 {eff.status} 상태가 되었다!")
-                    print(f"상태이상 효과 적용: {defender.base.name}이(가) {eff.status} 상태가 되었다!")
+                    logger.debug("상태이상 효과 적용: %s이(가) %s 상태가 되었다!", defender.base.name, eff.status)
 
     # 강제 교체
     if used_move.exile:
@@ -213,11 +217,11 @@ async def apply_move_effect_after_multi_damage(
         ]
         if alive_opponents:
             new_index = random.choice(alive_opponents)
-            await switch_pokemon(opponent_side, new_index, baton_touch, battle_store=battle_store, duration_store=duration_store)
+            switch_pokemon_sync(opponent_side, new_index, baton_touch, battle_store=battle_store, duration_store=duration_store)
             battle_store.add_log(f"💨 {defender.base.name}은(는) 강제 교체되었다!")
-            print(f"강제 교체 효과 적용: {defender.base.name}이(가) 강제 교체되었다!")
+            logger.debug("강제 교체 효과 적용: %s이(가) 강제 교체되었다!", defender.base.name)
 
-async def apply_offensive_ability_effect_after_damage(
+def apply_offensive_ability_effect_after_damage_sync(
     side: Literal["my", "enemy"],
     attacker,
     defender,
@@ -240,9 +244,9 @@ async def apply_offensive_ability_effect_after_damage(
                 if random.random() < 0.3:
                     battle_store.update_pokemon(opponent_side, active_opponent, lambda p: add_status(p, "독", opponent_side, battle_store=battle_store, duration_store=duration_store))
                     battle_store.add_log(f"🦂 {defender.base.name}은(는) 독수 특성으로 독 상태가 되었다!")
-                    print(f"특성 효과 적용: {defender.base.name}이(가) 독수 특성으로 독 상태가 되었다!")
+                    logger.debug("특성 효과 적용: %s이(가) 독수 특성으로 독 상태가 되었다!", defender.base.name)
 
-async def apply_move_effect_after_damage(
+def apply_move_effect_after_damage_sync(
     side: Literal["my", "enemy"],
     attacker: BattlePokemon,
     defender: BattlePokemon,
@@ -263,11 +267,11 @@ async def apply_move_effect_after_damage(
     enemy_pokemon = my_team[state["active_my"]] if side == "enemy" else enemy_team[state["active_enemy"]]
     baton_touch = used_move.name == "배턴터치"
     nullification = attacker.base.ability and attacker.base.ability.name == "부식"
-    print("apply_move_effect_after_damage 호출 시작")
+    logger.debug("apply_move_effect_after_damage 호출 시작")
     if used_move.cannot_move:
         battle_store.update_pokemon(side, active_mine, lambda p: p.copy_with(cannot_move=True))
         battle_store.add_log(f"💥 {attacker.base.name}은 피로로 인해 다음 턴 움직일 수 없다!")
-        print(f"피로 효과 적용: {attacker.base.name}은 피로로 인해 다음 턴 움직일 수 없다!")
+        logger.debug("피로 효과 적용: %s은 피로로 인해 다음 턴 움직일 수 없다!", attacker.base.name)
 
     # 유턴: UI 없이 자동 교체
     if used_move.u_turn and "교체불가" not in attacker.status:
@@ -279,23 +283,23 @@ async def apply_move_effect_after_damage(
 
         available = [i for i, p in enumerate(mine_team) if p.current_hp > 0 and i != active_mine]
         if available:
-            switch_index = get_best_switch_index(side)
-            await switch_pokemon(side, switch_index, baton_touch, battle_store=battle_store, duration_store=duration_store)
-            print(f"유턴 효과 적용: {attacker.base.name}이(가) 교체되었습니다!")
+            switch_index = get_best_switch_index(side, battle_store=battle_store)
+            switch_pokemon_sync(side, switch_index, baton_touch, battle_store=battle_store, duration_store=duration_store)
+            logger.debug("유턴 효과 적용: %s이(가) 교체되었습니다!", attacker.base.name)
 
     # 자폭류 처리
     if used_move.self_kill:
-        battle_store.update_pokemon(side, active_mine, lambda p: change_hp(p, -p.base.hp))
+        battle_store.update_pokemon(side, active_mine, lambda p: change_hp(p, -p.base.hp, battle_store=battle_store))
         battle_store.add_log(f"🤕 {attacker.base.name}은/는 반동으로 기절했다...!")
-        print(f"자폭 효과 적용: {attacker.base.name}은/는 반동으로 기절했다...!")
+        logger.debug("자폭 효과 적용: %s은/는 반동으로 기절했다...!", attacker.base.name)
 
     # 디메리트 효과
     if used_move.demerit_effects:
         for demerit in used_move.demerit_effects:
             if demerit and random.random() < demerit.chance:
                 if demerit.recoil and applied_damage:
-                    print(f"디메리트 효과 적용: {used_move.name}의 효과 발동!")
-                    result = apply_recoil_damage(attacker, demerit.recoil, applied_damage)
+                    logger.debug("디메리트 효과 적용: %s의 효과 발동!", used_move.name)
+                    result = apply_recoil_damage(attacker, demerit.recoil, applied_damage, battle_store=battle_store)
                     battle_store.update_pokemon(side, active_mine, lambda _: result)
                     recoil_damage = int(applied_damage * demerit.recoil)
                     battle_store.add_log(f"🤕 {attacker.base.name}이(가) 반동 데미지 {recoil_damage}를 입었다!")
@@ -306,7 +310,7 @@ async def apply_move_effect_after_damage(
                             lambda p: change_rank(p, sc.stat, sc.change)
                         )
                         battle_store.add_log(f"🔃 {attacker.base.name}의 {sc.stat}이(가) {sc.change}랭크 변했다!")
-                        print(f"디메리트 효과 적용: {attacker.base.name}의 {sc.stat}이(가) {sc.change}랭크 변했다!")
+                        logger.debug("디메리트 효과 적용: %s의 %s이(가) %s랭크 변했다!", attacker.base.name, sc.stat, sc.change)
 
     # 부가효과
     if attacker.base.ability and attacker.base.ability.name != "우격다짐" and used_move.target == "opponent" and not multi_hit:
@@ -316,30 +320,30 @@ async def apply_move_effect_after_damage(
                 if effect.status:
                     battle_store.update_pokemon(side, active_mine, lambda p: add_status(p, effect.status, side, battle_store=battle_store, duration_store=duration_store))
                     battle_store.add_log(f"🪞 {attacker.base.name}은/는 {effect.status} 상태가 되었다!")
-                    print(f"상태이상 효과 적용: {defender.base.name}이(가) {effect.status} 상태가 되었다!")
+                    logger.debug("상태이상 효과 적용: %s이(가) %s 상태가 되었다!", defender.base.name, effect.status)
                 if effect.stat_change:
                     for sc in effect.stat_change:
                         target_side = (
                             side if sc.target == "self"
                             else opponent_side
                         )
-                        print(f"target_side: {target_side}")
+                        logger.debug("target_side: %s", target_side)
                         target_team = battle_store.get_team(target_side)
                         index = battle_store.get_active_index(target_side)
                         battle_store.update_pokemon(target_side, index, lambda p: change_rank(p, sc.stat, sc.change))
                         battle_store.add_log(f"🔃 {target_team[index].base.name}의 {sc.stat}이(가) {sc.change}랭크 변했다!")
-                        print(f"부가효과 적용: {target_team[index].base.name}의 {sc.stat}이(가) {sc.change}랭크 변했다!")
+                        logger.debug("부가효과 적용: %s의 %s이(가) %s랭크 변했다!", target_team[index].base.name, sc.stat, sc.change)
                 continue
             
             elif roll < (effect.chance if effect.chance else 0):
-                print(f"부가효과 적용: {used_move.name}의 효과 발동!")
+                logger.debug("부가효과 적용: %s의 효과 발동!", used_move.name)
                 if effect.type_change:
                     battle_store.update_pokemon(opponent_side, active_opp, lambda p: set_types(p, [effect.type_change]))
                 if effect.heal and applied_damage is None:
                     heal_amt = attacker.base.hp * effect.heal if effect.heal < 1 else calculate_rank_effect(defender.rank['attack']) * defender.base.attack
-                    battle_store.update_pokemon(side, active_mine, lambda p: change_hp(p, heal_amt))
+                    battle_store.update_pokemon(side, active_mine, lambda p: change_hp(p, heal_amt, battle_store=battle_store))
                     battle_store.add_log(f"➕ {attacker.base.name}은/는 체력을 회복했다!")
-                    print(f"체력 회복 효과 적용: {attacker.base.name}이(가) 체력을 회복했다!")
+                    logger.debug("체력 회복 효과 적용: %s이(가) 체력을 회복했다!", attacker.base.name)
                 if effect.stat_change:
                     for sc in effect.stat_change:
                         target_side = opponent_side if sc.target == "opponent" else side
@@ -354,7 +358,7 @@ async def apply_move_effect_after_damage(
 
                         battle_store.update_pokemon(target_side, active_idx, lambda p: change_rank(p, sc.stat, sc.change))
                         battle_store.add_log(f"🔃 {target_team[active_idx].base.name}의 {sc.stat}이/가 {sc.change}랭크 변했다!")
-                        print(f"부가효과 적용: {target_team[active_idx].base.name}의 {sc.stat}이(가) {sc.change}랭크 변했다!")
+                        logger.debug("부가효과 적용: %s의 %s이(가) %s랭크 변했다!", target_team[active_idx].base.name, sc.stat, sc.change)
                 if effect.status:
                     skip = False
                     status = effect.status
@@ -375,18 +379,27 @@ async def apply_move_effect_after_damage(
 
                     if not skip:
                         battle_store.update_pokemon(opponent_side, active_opp, lambda p: add_status(p, status, opponent_side, nullification, battle_store=battle_store, duration_store=duration_store))
-                        print(f"상태이상 효과 적용: {defender.base.name}이(가) {status} 상태가 되었다!")
+                        logger.debug("상태이상 효과 적용: %s이(가) %s 상태가 되었다!", defender.base.name, status)
 
                 if effect.heal and applied_damage and applied_damage > 0:
-                    battle_store.update_pokemon(side, active_mine, lambda p: change_hp(p, applied_damage * effect.heal))
+                    battle_store.update_pokemon(side, active_mine, lambda p: change_hp(p, applied_damage * effect.heal, battle_store=battle_store))
                     battle_store.add_log(f"➕ {attacker.base.name}은/는 체력을 회복했다!")
-                    print(f"체력 회복 효과 적용: {attacker.base.name}이(가) 체력을 회복했다!")
+                    logger.debug("체력 회복 효과 적용: %s이(가) 체력을 회복했다!", attacker.base.name)
 
     # 강제 교체
     if used_move.exile and defender.current_hp > 0:
         available = [i for i, p in enumerate(opp_team) if p.current_hp > 0 and i != active_opp]
         if available:
             idx = random.choice(available)
-            await switch_pokemon(opponent_side, idx, baton_touch, battle_store=battle_store, duration_store=duration_store)
+            switch_pokemon_sync(opponent_side, idx, baton_touch, battle_store=battle_store, duration_store=duration_store)
             battle_store.add_log(f"💨 {opp_team[active_opp].base.name}은/는 강제 교체되었다!")
-            print(f"강제 교체 효과 적용: {opp_team[active_opp].base.name}이(가) 강제 교체되었다!")
\ No newline at end of file
+            logger.debug("강제 교체 효과 적용: %s이(가) 강제 교체되었다!", opp_team[active_opp].base.name)
+
+
+# 기존 async API 호환 (await로 호출하던 코드용)
+apply_defensive_ability_effect_after_multi_damage = async_entry(apply_defensive_ability_effect_after_multi_damage_sync)
+apply_after_damage = async_entry(apply_after_damage_sync)
+apply_panic_uturn = async_entry(apply_panic_uturn_sync)
+apply_move_effect_after_multi_damage = async_entry(apply_move_effect_after_multi_damage_sync)
+apply_offensive_ability_effect_after_damage = async_entry(apply_offensive_ability_effect_after_damage_sync)
+apply_move_effect_after_damage = async_entry(apply_move_effect_after_damage_sync)
@@ -1,3 +1,4 @@
+from copy import copy
 from typing import List, Literal, Optional
 from context.battle_store import BattleStore, BattleStoreState, store
 from context.duration_store import DurationStore, duration_store
@@ -69,7 +70,7 @@ def apply_appearance(pokemon: BattlePokemon, side: SideType, depth: int = 0, bat
                 add_log(f"😈 {pokemon.base.name}의 특성으로 다크오라가 생겼다!")
 
         elif effect == "disaster":
-            add_disaster(ability.name)
+            add_disaster(ability.name, battle_store=battle_store)
             add_log(f"🌋 {pokemon.base.name}의 특성으로 {ability.name} 효과가 발동했다!")
 
         elif effect == "rank_change":
@@ -117,10 +118,16 @@ def apply_appearance(pokemon: BattlePokemon, side: SideType, depth: int = 0, bat
 
         elif effect == "ability_change":
             new_ability = opp_pokemon.base.ability
-            update(side, my_index, lambda p: p.copy_with(ability=new_ability))
+            # 특성은 base에 있으므로 base를 복사해 바꾼다 (같은 종족 데이터를 공유하는 다른 포켓몬은 그대로)
+            def trace(p: BattlePokemon) -> BattlePokemon:
+                base = copy(p.base)
+                base.ability = new_ability
+                return p.copy_with(base=base)
+            update(side, my_index, trace)
             add_log(f"➕ {pokemon.base.name}의 특성이 {new_ability.name if new_ability else '???'}으로 변화했다!")
             if new_ability and new_ability.appear:
-                apply_appearance(my_pokemon, side, depth + 1, battle_store=battle_store, duration_store=duration_store)
+                traced = battle_store.get_team(side)[my_index]
+                apply_appearance(traced, side, depth + 1, battle_store=battle_store, duration_store=duration_store)
 
     update(side, my_index, lambda p: p.copy_with(is_first_turn=True))
     return logs
\ No newline at end of file
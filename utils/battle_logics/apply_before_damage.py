@@ -1,16 +1,22 @@
 from typing import Optional
 from p_models.move_info import MoveInfo
+from p_models.battle_pokemon import BattlePokemon
 from context.battle_store import BattleStore, BattleStoreState, SideType, store
 from utils.battle_logics.update_battle_pokemon import change_hp, change_rank
+from utils.battle_logger import get_logger
 
-def apply_defensive_ability_effect_before_damage(used_move: MoveInfo, side: SideType, was_effective=None, pre_damage=False, battle_store: Optional[BattleStore] = store):
+logger = get_logger(__name__)
+
+def apply_defensive_ability_effect_before_damage(used_move: MoveInfo, side: SideType, was_effective=None, pre_damage=False, battle_store: Optional[BattleStore] = store, defender: Optional[BattlePokemon] = None):
     state: BattleStoreState = battle_store.get_state()
     enemy_team = state["enemy_team"]
     active_enemy = state["active_enemy"]
     my_team = state["my_team"]
     active_my = state["active_my"]
 
-    defender = enemy_team[active_enemy] if side == "my" else my_team[active_my]
+    # defender를 주면(pre_damage에서 교체 대기 포켓몬을 상대로 계산할 때) 그 포켓몬의 특성을 본다
+    if defender is None:
+        defender = enemy_team[active_enemy] if side == "my" else my_team[active_my]
 
     ability = defender.base.ability
     opponent_side = "enemy" if side == "my" else "my"
@@ -25,32 +31,32 @@ def apply_defensive_ability_effect_before_damage(used_move: MoveInfo, side: Side
                     rate = 0
                     if name in ["저수", "건조피부"]:
                         if not pre_damage:
-                            store.update_pokemon(opponent_side, active_opponent, lambda p: change_hp(p, round(p.base.hp / 4)))
+                            battle_store.update_pokemon(opponent_side, active_opponent, lambda p: change_hp(p, round(p.base.hp / 4), battle_store=battle_store))
                     elif name == "마중물":
                         if not pre_damage:
-                            store.update_pokemon(opponent_side, active_opponent, lambda p: change_rank(p, "sp_attack", 1))
+                            battle_store.update_pokemon(opponent_side, active_opponent, lambda p: change_rank(p, "sp_attack", 1))
                 elif name == "흙먹기" and used_move.type == "땅":
                     rate = 0
                     if not pre_damage:
-                        store.update_pokemon(opponent_side, active_opponent, lambda p: change_hp(p, round(p.base.hp / 4)))
+                        battle_store.update_pokemon(opponent_side, active_opponent, lambda p: change_hp(p, round(p.base.hp / 4), battle_store=battle_store))
                 elif name == "건조피부" and used_move.type == "불":
                     rate *= 1.25
                 elif name == "타오르는불꽃" and used_move.type == "불":
                     rate = 0
                     stat = "attack" if defender.base.attack > defender.base.sp_attack else "sp_attack"
                     if not pre_damage:
-                        store.update_pokemon(opponent_side, active_opponent, lambda p: change_rank(p, stat, 1))
+                        battle_store.update_pokemon(opponent_side, active_opponent, lambda p: change_rank(p, stat, 1))
                 elif name == "피뢰침" and used_move.type == "전기":
                     rate = 0
                     if not pre_damage:
-                        store.update_pokemon(opponent_side, active_opponent, lambda p: change_rank(p, "sp_attack", 1))
-                        store.add_log(f"⚡ {defender.base.name}의 피뢰침 특성 발동!")
+                        battle_store.update_pokemon(opponent_side, active_opponent, lambda p: change_rank(p, "sp_attack", 1))
+                        battle_store.add_log(f"⚡ {defender.base.name}의 피뢰침 특성 발동!")
                 elif name == "부유" and used_move.type == "땅":
                     rate = 0
                 elif name == "초식" and used_move.type == "풀":
                     rate = 0
                     if not pre_damage:
-                        store.update_pokemon(opponent_side, active_opponent, lambda p: change_rank(p, "attack", 1))
+                        battle_store.update_pokemon(opponent_side, active_opponent, lambda p: change_rank(p, "attack", 1))
             elif category == "damage_nullification":
                 if name == "방진" and used_move.affiliation == "가루":
                     rate = 0
@@ -73,7 +79,7 @@ def apply_defensive_ability_effect_before_damage(used_move: MoveInfo, side: Side
                     rate = 0.5
 
     if rate < 1:
-        print("방어적 특성이 적용되었다!")
+        logger.debug("방어적 특성이 적용되었다!")
     return rate
 
 
@@ -132,5 +138,5 @@ def apply_offensive_ability_effect_before_damage(used_move: MoveInfo, side: Side
                     rate *= 1.5
 
     if rate > 1:
-        print("공격적 특성이 적용되었다!")
+        logger.debug("공격적 특성이 적용되었다!")
     return rate
\ No newline at end of file
@@ -1,8 +1,11 @@
 from typing import Tuple, Optional, List
 from p_models.battle_pokemon import BattlePokemon
-from context.battle_store import store
+from context.battle_store import BattleStore, store
 from utils.type_relation import calculate_type_effectiveness
 from p_models.types import WeatherType
+from utils.battle_logger import get_logger
+
+logger = get_logger(__name__)
 
 def apply_trap_damage(pokemon: BattlePokemon, trap: List[str]) -> Tuple[Optional[int], Optional[str], Optional[str]]:
     if not pokemon or not pokemon.base:
@@ -65,11 +68,11 @@ def apply_trap_damage(pokemon: BattlePokemon, trap: List[str]) -> Tuple[Optional
     return damage, log, status_condition
 
 
-def apply_weather_damage(pokemon: BattlePokemon, weather: WeatherType) -> BattlePokemon:
+def apply_weather_damage(pokemon: BattlePokemon, weather: WeatherType, battle_store: Optional[BattleStore] = store) -> BattlePokemon:
     if not pokemon or not pokemon.base:
         return pokemon
 
-    add_log = store.add_log
+    add_log = battle_store.add_log
     damage = 0
     types = pokemon.base.types
     ability_name = pokemon.base.ability.name if pokemon.base.ability else None
@@ -83,42 +86,41 @@ def apply_weather_damage(pokemon: BattlePokemon, weather: WeatherType) -> Battle
     return pokemon.copy_with(current_hp=max(0, pokemon.current_hp - damage))
 
 
-def apply_recoil_damage(pokemon: BattlePokemon, recoil: float, applied_damage: int) -> BattlePokemon:
+def apply_recoil_damage(pokemon: BattlePokemon, recoil: float, applied_damage: int, battle_store: Optional[BattleStore] = store) -> BattlePokemon:
     if not pokemon or not pokemon.base:
         return pokemon
 
-    add_log = store.add_log
+    add_log = battle_store.add_log
     ability_name = pokemon.base.ability.name if pokemon.base.ability else None
     damage = 0
 
     if ability_name not in ["매직가드", "돌머리"]:
         damage = int(applied_damage * recoil)
         add_log(f"{pokemon.base.name}은 반동으로 피해를 입었다!")
-    print(f"반동 데미지 적용: {pokemon.base.name}이(가) 반동 데미지 {damage}를 입었다!\
-        {pokemon.current_hp}에서 {max(0, pokemon.current_hp - damage)}로 변경")
+    logger.debug("반동 데미지 적용: %s이(가) 반동 데미지 %s를 입었다!        %s에서 %s로 변경", pokemon.base.name, damage, pokemon.current_hp, max(0, pokemon.current_hp - damage))
     return pokemon.copy_with(current_hp=max(0, pokemon.current_hp - damage))
 
 
-def apply_thorn_damage(pokemon: BattlePokemon) -> BattlePokemon:
+def apply_thorn_damage(pokemon: BattlePokemon, battle_store: Optional[BattleStore] = store) -> BattlePokemon:
     if not pokemon or not pokemon.base:
         return pokemon
 
-    add_log = store.add_log
+    add_log = battle_store.add_log
     ability_name = pokemon.base.ability.name if pokemon.base.ability else None
     damage = 0
-    print(f"apply_thorn_damage 호출: {pokemon.base.name}")
+    logger.debug("apply_thorn_damage 호출: %s", pokemon.base.name)
     if ability_name != "매직가드":
         damage = int(pokemon.base.hp * 0.125)
         add_log(f"{pokemon.base.name}은 가시에 의해 피해를 입었다!")
-        print(f"{pokemon.base.name}은 가시에 의해 피해를 입었다!\n {pokemon.current_hp}에서 {max(0, pokemon.current_hp - damage)}로 변경")
+        logger.debug("%s은 가시에 의해 피해를 입었다!\n %s에서 %s로 변경", pokemon.base.name, pokemon.current_hp, max(0, pokemon.current_hp - damage))
     return pokemon.copy_with(current_hp=max(0, pokemon.current_hp - damage))
 
 
-def apply_status_condition_damage(pokemon: BattlePokemon, status: str) -> BattlePokemon:
+def apply_status_condition_damage(pokemon: BattlePokemon, status: str, battle_store: Optional[BattleStore] = store) -> BattlePokemon:
     if not pokemon or not pokemon.base:
         return pokemon
 
-    add_log = store.add_log
+    add_log = battle_store.add_log
     ability_name = pokemon.base.ability.name if pokemon.base.ability else None
     damage = 0
 
@@ -127,20 +129,20 @@ def apply_status_condition_damage(pokemon: BattlePokemon, status: str) -> Battle
             damage = int(pokemon.base.hp * 0.0625)
             new_hp = max(0, pokemon.current_hp - damage)
             add_log(f"🔥 {pokemon.base.name}은 화상으로 {damage}피해를 입었다!")
-            print(f"🔥 {pokemon.base.name}은 화상으로 {damage}피해를 입었다!\n {pokemon.current_hp}에서 {new_hp}로 변경")
+            logger.debug("🔥 %s은 화상으로 %s피해를 입었다!\n %s에서 %s로 변경", pokemon.base.name, damage, pokemon.current_hp, new_hp)
         elif status == "독":
             damage = int(pokemon.base.hp * 0.125)
             new_hp = max(0, pokemon.current_hp - damage)
             add_log(f"🍄 {pokemon.base.name}은 독으로 {damage}피해를 입었다!")
-            print(f"🍄 {pokemon.base.name}은 독으로 {damage}피해를 입었다!\n {pokemon.current_hp}에서 {new_hp}로 변경")
+            logger.debug("🍄 %s은 독으로 %s피해를 입었다!\n %s에서 %s로 변경", pokemon.base.name, damage, pokemon.current_hp, new_hp)
         elif status == "조이기":
             damage = int(pokemon.base.hp * 0.125)
             new_hp = max(0, pokemon.current_hp - damage)
             add_log(f"🪢 {pokemon.base.name}은 {damage} 조임 피해를 입었다!")
-            print(f"🪢 {pokemon.base.name}은 {damage} 조임 피해를 입었다!\n {pokemon.current_hp}에서 {new_hp}로 변경")
+            logger.debug("🪢 %s은 %s 조임 피해를 입었다!\n %s에서 %s로 변경", pokemon.base.name, damage, pokemon.current_hp, new_hp)
         elif status == "맹독":
             damage = int(pokemon.base.hp * (1 / 6))
             new_hp = max(0, pokemon.current_hp - damage)
             add_log(f"🍄 {pokemon.base.name}은 맹독으로 {damage}피해를 입었다!")
-            print(f"🍄 {pokemon.base.name}은 맹독으로 {damage}피해를 입었다!\n {pokemon.current_hp}에서 {new_hp}로 변경")
+            logger.debug("🍄 %s은 맹독으로 %s피해를 입었다!\n %s에서 %s로 변경", pokemon.base.name, damage, pokemon.current_hp, new_hp)
     return pokemon.copy_with(current_hp=max(0, pokemon.current_hp - damage))
\ No newline at end of file
@@ -5,16 +5,16 @@ from p_models.move_info import MoveInfo
 from p_models.battle_pokemon import BattlePokemon
 from context.battle_store import BattleStore, BattleStoreState, store
 from utils.battle_logics.apply_after_damage import (
-    apply_after_damage,
-    apply_defensive_ability_effect_after_multi_damage,
-    apply_move_effect_after_multi_damage
+    apply_after_damage_sync,
+    apply_defensive_ability_effect_after_multi_damage_sync,
+    apply_move_effect_after_multi_damage_sync
 )
-from utils.battle_logics.apply_end_turn import apply_end_turn_effects
-from utils.battle_logics.calculate_order import calculate_order
-from utils.battle_logics.damage_calculator import calculate_move_damage
+from utils.battle_logics.apply_end_turn import apply_end_turn_effects_sync
+from utils.battle_logics.calculate_order import calculate_order_sync
+from utils.battle_logics.damage_calculator import calculate_move_damage_sync
 from utils.battle_logics.get_best_switch_index import get_best_switch_index
-from utils.battle_logics.switch_pokemon import switch_pokemon
-from utils.battle_logics.helpers import has_ability
+from utils.battle_logics.switch_pokemon import switch_pokemon_sync
+from utils.battle_logics.helpers import has_ability, async_entry
 from utils.battle_logics.update_battle_pokemon import (
     set_ability,
     set_cannot_move,
@@ -23,12 +23,15 @@ from utils.battle_logics.update_battle_pokemon import (
     set_types,
     use_move_pp
 )
-from utils.battle_logics.pre_damage_calculator import pre_calculate_move_damage
+from utils.battle_logics.damage_matrix import pre_damage_list as calculate_pre_damage_list
 import random
+from utils.battle_logger import emit_event, get_logger
+
+logger = get_logger(__name__)
 
 BattleAction = Union[MoveInfo, dict[Literal["type", "index"], Union[str, int]], None]
 
-async def battle_sequence(
+def battle_sequence_sync(
     my_action: BattleAction,
     enemy_action: BattleAction,
     is_always_hit: Optional[bool] = False,
@@ -45,18 +48,11 @@ async def battle_sequence(
     # 현재 활성화된 포켓몬
     current_pokemon = my_team[active_my]
     target_pokemon = enemy_team[active_enemy]
-    move_list: List[MoveInfo] = [move for move in current_pokemon.base.moves]
-    pre_damage_list: List[tuple] = [
-        (
-            pre_calculate_move_damage(move.name, "my", active_my, attacker=current_pokemon, defender=target_pokemon, battle_store=battle_store, duration_store=duration_store),
-            1 if move.demerit_effects else 0,
-            1 if move.effects else 0
-        )
-        for move in move_list
-    ]
+    # 입력이 같으면 이전 턴 계산을 재사용 (utils/battle_logics/damage_matrix.py)
+    pre_damage_list: List[tuple] = calculate_pre_damage_list("my", battle_store=battle_store, duration_store=duration_store)
     # pre_damage_list를 battle_store에 저장
     battle_store.set_pre_damage_list(pre_damage_list)
-    print(f"pre_damage_list (before actions): {pre_damage_list}")
+    logger.debug("pre_damage_list (before actions): %s", pre_damage_list)
     
     def is_move_action(action: BattleAction) -> bool:
         return isinstance(action, MoveInfo)
@@ -71,57 +67,57 @@ async def battle_sequence(
     # === 속이기, 만나자마자 ===
     if is_move_action(my_action) and my_action.first_turn_only and current_pokemon.is_first_turn is False:
         battle_store.add_log("🙅‍♂️ 내 포켓몬은 속이기/만나자마자를 사용할 수 없다...")
-        print("🙅‍♂️ 내 포켓몬은 속이기/만나자마자를 사용할 수 없다...")
+        logger.debug("🙅\u200d♂️ 내 포켓몬은 속이기/만나자마자를 사용할 수 없다...")
         my_action = None
         pass
     if is_move_action(enemy_action) and enemy_action.first_turn_only and target_pokemon.is_first_turn is False:
         battle_store.add_log("🙅‍♂️ 상대 포켓몬은 속이기/만나자마자를 사용할 수 없다...")
-        print("🙅‍♂️ 상대 포켓몬은 속이기/만나자마자를 사용할 수 없다...")
+        logger.debug("🙅\u200d♂️ 상대 포켓몬은 속이기/만나자마자를 사용할 수 없다...")
         enemy_action = None
         pass
     
     # === 0. 한 쪽만 null ===
     if my_action is None and enemy_action is not None:
         battle_store.add_log("🙅‍♂️ 내 포켓몬은 행동할 수 없었다...")
-        print("🙅‍♂️ 내 포켓몬은 행동할 수 없었다...")
+        logger.debug("🙅\u200d♂️ 내 포켓몬은 행동할 수 없었다...")
         battle_store.update_pokemon("my", active_my, lambda p: set_cannot_move(p, False))
         battle_store.update_pokemon("my", active_my, lambda p: set_dealt_damage(p, 0))
         if is_move_action(enemy_action):
-            result: dict[str, Union[bool, int]] = await handle_move("enemy", enemy_action, active_enemy, is_monte_carlo, is_always_hit, battle_store=battle_store, duration_store=duration_store)
+            result: dict[str, Union[bool, int]] = handle_move_sync("enemy", enemy_action, active_enemy, is_monte_carlo, is_always_hit, battle_store=battle_store, duration_store=duration_store)
         elif is_switch_action(enemy_action):
-            await switch_pokemon("enemy", enemy_action["index"])
+            switch_pokemon_sync("enemy", enemy_action["index"], battle_store=battle_store, duration_store=duration_store)
         if not is_monte_carlo:
-            await apply_end_turn_effects()
+            apply_end_turn_effects_sync(battle_store=battle_store, duration_store=duration_store)
         return {"result": result if result else {"was_null": False, "was_effective": 0}, "outcome": {"was_null": False, "was_effective": 0, "no_attack": True}}
 
     if enemy_action is None and my_action is not None:
         battle_store.add_log("🙅‍♀️ 상대 포켓몬은 행동할 수 없었다...")
-        print("🙅‍♀️ 상대 포켓몬은 행동할 수 없었다...")
+        logger.debug("🙅\u200d♀️ 상대 포켓몬은 행동할 수 없었다...")
         battle_store.update_pokemon("enemy", active_enemy, lambda p: set_cannot_move(p, False))
         battle_store.update_pokemon("enemy", active_enemy, lambda p: set_dealt_damage(p, 0))
         if is_move_action(my_action):
-            outcome: dict[str, Union[bool, int]] = await handle_move("my", my_action, active_my, is_monte_carlo, is_always_hit, battle_store=battle_store, duration_store=duration_store)
+            outcome: dict[str, Union[bool, int]] = handle_move_sync("my", my_action, active_my, is_monte_carlo, is_always_hit, battle_store=battle_store, duration_store=duration_store)
         elif is_switch_action(my_action):
-            await switch_pokemon("my", my_action["index"])
+            switch_pokemon_sync("my", my_action["index"], battle_store=battle_store, duration_store=duration_store)
         if not is_monte_carlo:
-            await apply_end_turn_effects()
+            apply_end_turn_effects_sync(battle_store=battle_store, duration_store=duration_store)
         return {"result": {"was_null": False, "was_effective": 0}, "outcome": outcome if outcome else {"was_null": False, "was_effective": 0}}
 
     if enemy_action is None and my_action is None:
         battle_store.add_log("😴 양측 모두 행동할 수 없었다...")
-        print("😴 양측 모두 행동할 수 없었다...")
+        logger.debug("😴 양측 모두 행동할 수 없었다...")
         battle_store.update_pokemon("my", active_my, lambda p: set_cannot_move(p, False))
         battle_store.update_pokemon("enemy", active_enemy, lambda p: set_cannot_move(p, False))
         battle_store.update_pokemon("my", active_my, lambda p: set_dealt_damage(p, 0))
         battle_store.update_pokemon("enemy", active_enemy, lambda p: set_dealt_damage(p, 0))
         if not is_monte_carlo:
-            await apply_end_turn_effects()
+            apply_end_turn_effects_sync(battle_store=battle_store, duration_store=duration_store)
         return {"result": {"was_null": False, "was_effective": 0}, "outcome": {"was_null": False, "was_effective": 0, "no_attack": True}}
 
     battle_store.add_log("우선도 및 스피드 계산중...")
-    print("우선도 및 스피드 계산중...")
+    logger.debug("우선도 및 스피드 계산중...")
 
-    who_is_first = await calculate_order(
+    who_is_first = calculate_order_sync(
         my_action if is_move_action(my_action) else None,
         enemy_action if is_move_action(enemy_action) else None,
         battle_store=battle_store
@@ -130,40 +126,40 @@ async def battle_sequence(
     # === 1. 둘 다 교체 ===
     if is_switch_action(my_action) and is_switch_action(enemy_action):
         if who_is_first == "my":
-            await switch_pokemon("my", my_action["index"], battle_store=battle_store, duration_store=duration_store)
-            await switch_pokemon("enemy", enemy_action["index"], battle_store=battle_store, duration_store=duration_store)
+            switch_pokemon_sync("my", my_action["index"], battle_store=battle_store, duration_store=duration_store)
+            switch_pokemon_sync("enemy", enemy_action["index"], battle_store=battle_store, duration_store=duration_store)
         else:
-            await switch_pokemon("enemy", enemy_action["index"], battle_store=battle_store, duration_store=duration_store)
-            await switch_pokemon("my", my_action["index"], battle_store=battle_store, duration_store=duration_store)
+            switch_pokemon_sync("enemy", enemy_action["index"], battle_store=battle_store, duration_store=duration_store)
+            switch_pokemon_sync("my", my_action["index"], battle_store=battle_store, duration_store=duration_store)
         if not is_monte_carlo:
-            await apply_end_turn_effects()
+            apply_end_turn_effects_sync(battle_store=battle_store, duration_store=duration_store)
         return {"result": {"was_null": False, "was_effective": 0}, "outcome": {"was_null": False, "was_effective": 0, "no_attack": True}}
 
     # === 2. 한 쪽만 교체 ===
     if is_switch_action(my_action):
-        await switch_pokemon("my", my_action["index"], battle_store=battle_store, duration_store=duration_store)
+        switch_pokemon_sync("my", my_action["index"], battle_store=battle_store, duration_store=duration_store)
         if is_move_action(enemy_action):
             if enemy_action.name == "기습":
                 battle_store.add_log("enemy의 기습은 실패했다...")
-                print("enemy의 기습은 실패했다...")
+                logger.debug("enemy의 기습은 실패했다...")
             else:
-                print('나는 교체, 상대는 공격!')
-                result: dict[str, Union[bool, int]] = await handle_move("enemy", enemy_action, store.get_active_index("enemy"), is_monte_carlo, is_always_hit, was_late=True, battle_store=battle_store, duration_store=duration_store)
+                logger.debug("나는 교체, 상대는 공격!")
+                result: dict[str, Union[bool, int]] = handle_move_sync("enemy", enemy_action, battle_store.get_active_index("enemy"), is_monte_carlo, is_always_hit, was_late=True, battle_store=battle_store, duration_store=duration_store)
         if not is_monte_carlo:
-            await apply_end_turn_effects()
+            apply_end_turn_effects_sync(battle_store=battle_store, duration_store=duration_store)
         return {"result": result if result else {"was_null": False, "was_effective": 0}, "outcome": {"was_null": False, "was_effective": 0, "no_attack": True}}
 
     if is_switch_action(enemy_action):
-        await switch_pokemon("enemy", enemy_action["index"], battle_store=battle_store, duration_store=duration_store)
+        switch_pokemon_sync("enemy", enemy_action["index"], battle_store=battle_store, duration_store=duration_store)
         if is_move_action(my_action):
             if my_action.name == "기습":
                 battle_store.add_log("my의 기습은 실패했다...")
-                print("my의 기습은 실패했다...")
+                logger.debug("my의 기습은 실패했다...")
             else:
-                print('상대는 교체, 나는 공격!')
-                outcome: dict[str, Union[bool, int]] = await handle_move("my", my_action, store.get_active_index("my"), is_monte_carlo, is_always_hit, was_late=True, battle_store=battle_store, duration_store=duration_store)
+                logger.debug("상대는 교체, 나는 공격!")
+                outcome: dict[str, Union[bool, int]] = handle_move_sync("my", my_action, battle_store.get_active_index("my"), is_monte_carlo, is_always_hit, was_late=True, battle_store=battle_store, duration_store=duration_store)
         if not is_monte_carlo:
-            await apply_end_turn_effects()
+            apply_end_turn_effects_sync(battle_store=battle_store, duration_store=duration_store)
         return {"result": {"was_null": False, "was_effective": 0}, "outcome": outcome if outcome else {"was_null": False, "was_effective": 0, "no_attack": False, "used_move": my_action}}
 
     # === 3. 둘 다 기술 ===
@@ -172,51 +168,67 @@ async def battle_sequence(
             if my_action.name == "기습" and enemy_action.category == "변화":
                 # 내 기습 실패 -> 상대만 공격함
                 battle_store.add_log("my의 기습은 실패했다...")
-                print("my의 기습은 실패했다...")
-                result: dict[str, Union[bool, int]] = await handle_move("enemy", enemy_action, store.get_active_index("enemy"), is_monte_carlo, is_always_hit, was_late=True, battle_store=battle_store, duration_store=duration_store)
+                logger.debug("my의 기습은 실패했다...")
+                result: dict[str, Union[bool, int]] = handle_move_sync("enemy", enemy_action, battle_store.get_active_index("enemy"), is_monte_carlo, is_always_hit, was_late=True, battle_store=battle_store, duration_store=duration_store)
             elif enemy_action.name == "기습":
                 # 상대 기습보다 내 선공기가 먼저였으면 실패 -> 나만 공격함
                 battle_store.add_log("enemy의 기습은 실패했다...")
-                print("enemy의 기습은 실패했다...")
-                outcome: dict[str, Union[bool, int]] = await handle_move("my", my_action, store.get_active_index("my"), is_monte_carlo, is_always_hit, was_late=True, battle_store=battle_store, duration_store=duration_store)
+                logger.debug("enemy의 기습은 실패했다...")
+                outcome: dict[str, Union[bool, int]] = handle_move_sync("my", my_action, battle_store.get_active_index("my"), is_monte_carlo, is_always_hit, was_late=True, battle_store=battle_store, duration_store=duration_store)
             else:  # 그 외의 일반적인 경우들
-                print('내 선공!')
-                outcome: dict[str, Union[bool, int]] = await handle_move("my", my_action, store.get_active_index("my"), is_monte_carlo, is_always_hit, battle_store=battle_store, duration_store=duration_store)
+                logger.debug("내 선공!")
+                outcome: dict[str, Union[bool, int]] = handle_move_sync("my", my_action, battle_store.get_active_index("my"), is_monte_carlo, is_always_hit, battle_store=battle_store, duration_store=duration_store)
                 # 상대가 쓰러졌는지 확인
                 opponent_pokemon = battle_store.get_team("enemy")
                 current_defender = opponent_pokemon[battle_store.get_active_index("enemy")]
                 if current_defender and current_defender.current_hp <= 0:
                     if not is_monte_carlo:
-                        await apply_end_turn_effects()
+                        apply_end_turn_effects_sync(battle_store=battle_store, duration_store=duration_store)
                     return {"result": {"was_null": False, "was_effective": 0}, "outcome": outcome if outcome else {"was_null": False, "was_effective": 0, "no_attack": False, "used_move": my_action}}
-                result: dict[str, Union[bool, int]] = await handle_move("enemy", enemy_action, active_enemy, is_monte_carlo, is_always_hit, was_late=True, battle_store=battle_store, duration_store=duration_store)
+                result: dict[str, Union[bool, int]] = handle_move_sync("enemy", enemy_action, active_enemy, is_monte_carlo, is_always_hit, was_late=True, battle_store=battle_store, duration_store=duration_store)
         else:  # 상대가 선공일 경우
             if enemy_action.name == "기습" and my_action.category == "변화":
                 # 상대 기습 실패, 내 기술만 작동
                 battle_store.add_log("enemy의 기습은 실패했다...")
-                print("enemy의 기습은 실패했다...")
-                outcome: dict[str, Union[bool, int]] = await handle_move("my", my_action, battle_store.get_active_index("my"), is_monte_carlo, is_always_hit, was_late=True, battle_store=battle_store, duration_store=duration_store)
+                logger.debug("enemy의 기습은 실패했다...")
+                outcome: dict[str, Union[bool, int]] = handle_move_sync("my", my_action, battle_store.get_active_index("my"), is_monte_carlo, is_always_hit, was_late=True, battle_store=battle_store, duration_store=duration_store)
             elif my_action.name == "기습":  # 내 기습이 상대보다 느림 -> 상대 기습만 작동
                 battle_store.add_log("my의 기습은 실패했다...")
-                print("my의 기습은 실패했다...")
-                result: dict[str, Union[bool, int]] = await handle_move("enemy", enemy_action, battle_store.get_active_index("enemy"), is_monte_carlo, is_always_hit, was_late=True, battle_store=battle_store, duration_store=duration_store)
+                logger.debug("my의 기습은 실패했다...")
+                result: dict[str, Union[bool, int]] = handle_move_sync("enemy", enemy_action, battle_store.get_active_index("enemy"), is_monte_carlo, is_always_hit, was_late=True, battle_store=battle_store, duration_store=duration_store)
             else: # 일반적인 경우 
-                print('상대의 선공!')
-                result: dict[str, Union[bool, int]] = await handle_move("enemy", enemy_action, store.get_active_index("enemy"), is_monte_carlo, is_always_hit, battle_store=battle_store, duration_store=duration_store)
+                logger.debug("상대의 선공!")
+                result: dict[str, Union[bool, int]] = handle_move_sync("enemy", enemy_action, battle_store.get_active_index("enemy"), is_monte_carlo, is_always_hit, battle_store=battle_store, duration_store=duration_store)
 
                 # 내가 쓰러졌는지 확인
                 opponent_pokemon = battle_store.get_team("my")
                 current_defender = opponent_pokemon[battle_store.get_active_index("my")]
                 if current_defender and current_defender.current_hp <= 0:
                     if not is_monte_carlo:
-                        await apply_end_turn_effects()
+                        apply_end_turn_effects_sync(battle_store=battle_store, duration_store=duration_store)
                     return {"result": result if result else {"was_null": False, "was_effective": 0}, "outcome": {"was_null": False, "was_effective": 0, "no_attack": True}}
-                outcome: dict[str, Union[bool, int]] = await handle_move("my", my_action, active_my, is_monte_carlo, is_always_hit, was_late=True, battle_store=battle_store, duration_store=duration_store)
+                outcome: dict[str, Union[bool, int]] = handle_move_sync("my", my_action, active_my, is_monte_carlo, is_always_hit, was_late=True, battle_store=battle_store, duration_store=duration_store)
     if not is_monte_carlo:
-        await apply_end_turn_effects()
+        apply_end_turn_effects_sync(battle_store=battle_store, duration_store=duration_store)
     return {"result": result if result else {"was_null": False, "was_effective": 0}, "outcome": outcome if outcome else {"was_null": False, "was_effective": 0, "no_attack": False, "used_move": my_action}}
 
-async def handle_move(
+def _emit_move_event(side: Literal["my", "enemy"], attacker: BattlePokemon, move: MoveInfo, result: Optional[dict]) -> None:
+    # 구조화된 이벤트 싱크용 기술 사용 기록
+    result = result or {}
+    emit_event(
+        "move",
+        side=side,
+        pokemon=attacker.base.name,
+        move=move.name,
+        success=result.get("success", False),
+        is_hit=result.get("is_hit", True),
+        damage=result.get("damage", 0),
+        was_effective=result.get("was_effective", 0),
+        was_null=result.get("was_null", False),
+        is_critical=result.get("is_critical", False),
+    )
+
+def handle_move_sync(
     side: Literal["my", "enemy"],
     move: MoveInfo,
     current_index: int,
@@ -241,11 +253,11 @@ async def handle_move(
     active_index = active_my if side == "my" else active_enemy
 
     if attacker and attacker.current_hp > 0:
-        print(f"{side}의 {attacker.base.name}이 {move.name}을 사용하려 한다!")
+        logger.debug("%s의 %s이 %s을 사용하려 한다!", side, attacker.base.name, move.name)
     # 현재 활성화된 포켓몬이 아닌 경우 실행하지 않음
     if current_index != active_index:
         battle_store.add_log(f"⚠️ {attacker.base.name}는 현재 활성화된 포켓몬이 아닙니다!")
-        print(f"⚠️ {attacker.base.name}는 현재 활성화된 포켓몬이 아닙니다!")
+        logger.debug("⚠️ %s는 현재 활성화된 포켓몬이 아닙니다!", attacker.base.name)
         return {"was_null": False, "was_effective": 0, "no_attack": True}
 
     opponent_side = "enemy" if side == "my" else "my"
@@ -258,7 +270,7 @@ async def handle_move(
             battle_store.update_pokemon(side, active_index, lambda p: set_types(p, [move.type]))
             battle_store.update_pokemon(side, active_index, lambda p: set_ability(p, AbilityInfo(0, '없음')))
             battle_store.add_log(f"🔃 {attacker.base.name}의 타입은 {move.type}타입으로 변했다!")
-            print(f"{attacker.base.name}의 타입은 {move.type}타입으로 변했다!")
+            logger.debug("%s의 타입은 %s타입으로 변했다!", attacker.base.name, move.type)
 
         for i in range(hit_count):
             # 매 턴마다 최신 defender 상태 확인
@@ -272,7 +284,7 @@ async def handle_move(
                 return result
 
             current_power = move.power + (10 * i if move.name == "트리플킥" else 20 * i)
-            result: dict[Literal["success", "damage", "was_null", "was_effective"], Union[bool, int]] = await calculate_move_damage(
+            result: dict[Literal["success", "damage", "was_null", "was_effective"], Union[bool, int]] = calculate_move_damage_sync(
                 move_name=move.name,
                 side=side,
                 current_index=current_index,
@@ -284,6 +296,7 @@ async def handle_move(
                 battle_store=battle_store,
                 duration_store=duration_store
             )
+            _emit_move_event(side, attacker, move, result)
 
             battle_store.update_pokemon(
                 side,
@@ -299,8 +312,8 @@ async def handle_move(
                 current_defender1: BattlePokemon = opponent_pokemon[
                     active_enemy if side == "my" else active_my
                 ]
-                await apply_after_damage(side, attacker, current_defender1, move, result["damage"] if "damage" in result else 0, True, battle_store=battle_store, duration_store=duration_store)
-                await apply_defensive_ability_effect_after_multi_damage(side, attacker, defender, move, result["damage"] if "damage" in result else 0, battle_store=battle_store)
+                apply_after_damage_sync(side, attacker, current_defender1, move, result["damage"] if "damage" in result else 0, True, battle_store=battle_store, duration_store=duration_store)
+                apply_defensive_ability_effect_after_multi_damage_sync(side, attacker, defender, move, result["damage"] if "damage" in result else 0, battle_store=battle_store, duration_store=duration_store)
             else:
                 break
 
@@ -312,10 +325,11 @@ async def handle_move(
             battle_store.update_pokemon(side, active_index, lambda p: set_types(p, [move.type]))
             battle_store.update_pokemon(side, active_index, lambda p: set_ability(p, None))
             battle_store.add_log(f"{attacker.base.name}의 타입은 {move.type}타입으로 변했다!")
-            print(f"{attacker.base.name}의 타입은 {move.type}타입으로 변했다!")
+            logger.debug("%s의 타입은 %s타입으로 변했다!", attacker.base.name, move.type)
 
-        result: dict[Literal["success", "damage", "was_null", "was_effective"], Union[bool, int]] = await calculate_move_damage(move_name=move.name, side=side, current_index=current_index, is_always_hit=is_always_hit, was_late=was_late, is_monte_carlo=is_monte_carlo, battle_store=battle_store, duration_store=duration_store)
-        print("1번째 타격!")
+        result: dict[Literal["success", "damage", "was_null", "was_effective"], Union[bool, int]] = calculate_move_damage_sync(move_name=move.name, side=side, current_index=current_index, is_always_hit=is_always_hit, was_late=was_late, is_monte_carlo=is_monte_carlo, battle_store=battle_store, duration_store=duration_store)
+        _emit_move_event(side, attacker, move, result)
+        logger.debug("1번째 타격!")
         if result and result["success"]:
             if result.get("is_protecting"):
                 return {"was_null": result.get("was_null", False), "was_effective": result.get("was_effective", 0), "no_attack": False, "used_move": move}
@@ -324,7 +338,7 @@ async def handle_move(
 
             if not result.get("is_hit", True):  # is_hit이 False면 빗나간 것
                 battle_store.add_log(f"🚫 {attacker.base.name}의 공격은 빗나갔다!")
-                print(f"{attacker.base.name}의 공격은 빗나갔다!")
+                logger.debug("%s의 공격은 빗나갔다!", attacker.base.name)
                 return {"was_null": result.get("was_null", False), "was_effective": result.get("was_effective", 0), "no_attack": False, "used_move": move}
                 
             state: BattleStoreState = battle_store.get_state()
@@ -332,9 +346,9 @@ async def handle_move(
             current_defender: BattlePokemon = opponent_pokemon[
                 active_enemy if side == "my" else active_my
             ]   
-            await apply_after_damage(side, attacker, current_defender, move, result["damage"] if "damage" in result else 0, True, battle_store=battle_store, duration_store=duration_store)
+            apply_after_damage_sync(side, attacker, current_defender, move, result["damage"] if "damage" in result else 0, True, battle_store=battle_store, duration_store=duration_store)
             hit_count = get_hit_count(move)
-            print(hit_count)
+            logger.debug("%s", hit_count)
             for i in range(hit_count - 1):
                 # 매 턴마다 최신 defender 상태 확인
                 opponent_pokemon: list[BattlePokemon] = state[f"{opponent_side}_team"]
@@ -343,8 +357,8 @@ async def handle_move(
                 ]
                 if current_defender.current_hp <= 0:
                     break
-                print(f"{i + 2}번째 타격!")
-                result: dict[Literal["success", "damage", "was_null", "was_effective"], Union[bool, int]] = await calculate_move_damage(
+                logger.debug("%s번째 타격!", i + 2)
+                result: dict[Literal["success", "damage", "was_null", "was_effective"], Union[bool, int]] = calculate_move_damage_sync(
                     move_name=move.name,
                     side=side,
                     current_index=current_index,
@@ -355,6 +369,7 @@ async def handle_move(
                     battle_store=battle_store,
                     duration_store=duration_store
                 )
+                _emit_move_event(side, attacker, move, result)
 
                 if result and result["success"]:
                     if result.get("was_null"):
@@ -363,17 +378,17 @@ async def handle_move(
                     current_defender = battle_store.get_state()[f"{opponent_side}_team"][
                         active_enemy if side == "my" else active_my
                     ]
-                    await apply_after_damage(side, attacker, current_defender, move, result["damage"] if "damage" in result else 0, True, battle_store=battle_store, duration_store=duration_store)
-                    await apply_defensive_ability_effect_after_multi_damage(side, attacker, defender, move, result["damage"] if "damage" in result else 0, battle_store=battle_store)
+                    apply_after_damage_sync(side, attacker, current_defender, move, result["damage"] if "damage" in result else 0, True, battle_store=battle_store, duration_store=duration_store)
+                    apply_defensive_ability_effect_after_multi_damage_sync(side, attacker, defender, move, result["damage"] if "damage" in result else 0, battle_store=battle_store, duration_store=duration_store)
                 else:
                     break
 
             current_defender1 = battle_store.get_state()[f"{opponent_side}_team"][
                 active_enemy if side == "my" else active_my
             ]
-            await apply_move_effect_after_multi_damage(side, attacker, current_defender1, move, result["damage"] if "damage" in result else 0, battle_store=battle_store, duration_store=duration_store)
+            apply_move_effect_after_multi_damage_sync(side, attacker, current_defender1, move, result["damage"] if "damage" in result else 0, battle_store=battle_store, duration_store=duration_store)
             battle_store.add_log(f"📊 총 {hit_count}번 맞았다!")
-            print(f"총 {hit_count}번 맞았다!")
+            logger.debug("총 %s번 맞았다!", hit_count)
 
         return {"was_null": result.get("was_null", False), "was_effective": result.get("was_effective", 0), "no_attack": result.get('success', True)}
 
@@ -383,9 +398,10 @@ async def handle_move(
             battle_store.update_pokemon(side, active_index, lambda p: set_types(p, [move.type]))
             battle_store.update_pokemon(side, active_index, lambda p: set_ability(p, None))
             battle_store.add_log(f"🔃 {attacker.base.name}의 타입은 {move.type}타입으로 변했다!")
-            print(f"{attacker.base.name}의 타입은 {move.type}타입으로 변했다!")
+            logger.debug("%s의 타입은 %s타입으로 변했다!", attacker.base.name, move.type)
 
-        result: dict[Literal["success", "damage", "was_null", "was_effective"], Union[bool, int]] = await calculate_move_damage(move_name=move.name, side=side, current_index=current_index, is_always_hit=is_always_hit, was_late=was_late, is_monte_carlo=is_monte_carlo, battle_store=battle_store, duration_store=duration_store)
+        result: dict[Literal["success", "damage", "was_null", "was_effective"], Union[bool, int]] = calculate_move_damage_sync(move_name=move.name, side=side, current_index=current_index, is_always_hit=is_always_hit, was_late=was_late, is_monte_carlo=is_monte_carlo, battle_store=battle_store, duration_store=duration_store)
+        _emit_move_event(side, attacker, move, result)
         if result and result["success"]:
             if result.get("is_protecting"):
                 return {"was_null": result.get("was_null", False), "was_effective": result.get("was_effective", 0), "no_attack": False, "used_move": move}
@@ -394,39 +410,39 @@ async def handle_move(
             
             if not result.get("is_hit", True):  # is_hit이 False면 빗나간 것
                 battle_store.add_log(f"🚫 {attacker.base.name}의 공격은 빗나갔다!")
-                print(f"{attacker.base.name}의 공격은 빗나갔다!")
+                logger.debug("%s의 공격은 빗나갔다!", attacker.base.name)
                 return {"was_null": result.get("was_null", False), "was_effective": result.get("was_effective", 0), "no_attack": False, "used_move": move}
             
             if defender and defender.base.ability and defender.base.ability.name == "매직가드" and move.category == "변화":
                 battle_store.add_log(f"{defender.base.name}은 매직가드로 피해를 입지 않았다!")
-                print(f"{defender.base.name}은 매직가드로 피해를 입지 않았다!")
-                await apply_after_damage(side, attacker, defender, move, result["damage"] if "damage" in result else 0, battle_store=battle_store, duration_store=duration_store)
+                logger.debug("%s은 매직가드로 피해를 입지 않았다!", defender.base.name)
+                apply_after_damage_sync(side, attacker, defender, move, result["damage"] if "damage" in result else 0, battle_store=battle_store, duration_store=duration_store)
                 return {"was_null": result.get("was_null", False), "was_effective": result.get("was_effective", 0), "no_attack": False, "used_move": move}
 
             current_defender = battle_store.get_state()[f"{opponent_side}_team"][
                 active_enemy if side == "my" else active_my
             ]   
-            await apply_after_damage(side, attacker, current_defender, move, result["damage"] if "damage" in result else 0, battle_store=battle_store, duration_store=duration_store)
+            apply_after_damage_sync(side, attacker, current_defender, move, result["damage"] if "damage" in result else 0, battle_store=battle_store, duration_store=duration_store)
 
         return {"was_null": result.get("was_null", False), "was_effective": result.get("was_effective", 0), "no_attack": result.get('success', True), "used_move": move}
 
-async def remove_fainted_pokemon(side: Literal["my", "enemy"], battle_store: Optional[BattleStore] = store, duration_store: Optional[DurationStore] = duration_store) -> None:
+def remove_fainted_pokemon_sync(side: Literal["my", "enemy"], battle_store: Optional[BattleStore] = store, duration_store: Optional[DurationStore] = duration_store) -> None:
     next_index = get_best_switch_index(side, battle_store=battle_store)
     if next_index != -1:
-        print(f"{side}의 포켓몬이 쓰러졌다! 교체 중...")
-        await switch_pokemon(side, next_index, battle_store=battle_store, duration_store=duration_store)
+        logger.debug("%s의 포켓몬이 쓰러졌다! 교체 중...", side)
+        switch_pokemon_sync(side, next_index, battle_store=battle_store, duration_store=duration_store)
 
 def get_hit_count(move: MoveInfo) -> int:
     hit_count = 0
     for effect in (move.effects or []):
         if effect.double_hit:
-            print("2회 공격 시도")
+            logger.debug("2회 공격 시도")
             hit_count = 2
         if effect.triple_hit:
-            print("3회 공격 시도")
+            logger.debug("3회 공격 시도")
             hit_count = 3
         if effect.multi_hit:
-            print("다회 공격 시도")
+            logger.debug("다회 공격 시도")
 
     if hit_count > 0:
         return hit_count
@@ -442,3 +458,9 @@ def get_hit_count(move: MoveInfo) -> int:
     if rand < 0.65:
         return 3
     return 2
+
+
+# 기존 async API 호환 (await로 호출하던 코드용)
+battle_sequence = async_entry(battle_sequence_sync)
+handle_move = async_entry(handle_move_sync)
+remove_fainted_pokemon = async_entry(remove_fainted_pokemon_sync)
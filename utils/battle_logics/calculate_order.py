@@ -5,16 +5,21 @@ from context.battle_store import BattleStore, BattleStoreState
 from context.battle_store import store
 from p_models.battle_pokemon import BattlePokemon
 from p_models.move_info import MoveInfo
+from p_models.status import STATUS_BIT
+from utils.battle_logics.helpers import async_entry
 from utils.battle_logics.rank_effect import calculate_rank_effect
+from utils.battle_logger import get_logger
 
-def calculate_speed(pokemon: BattlePokemon):
-    state: BattleStoreState = store.get_state()
+logger = get_logger(__name__)
+
+def calculate_speed(pokemon: BattlePokemon, battle_store: Optional[BattleStore] = store):
+    state: BattleStoreState = battle_store.get_state()
     public_env = state["public_env"]
     speed = pokemon.base.speed * calculate_rank_effect(pokemon.rank['speed'])
     
-    if "마비" in pokemon.status:
+    if pokemon.status.bits & STATUS_BIT["마비"]:
         speed *= 0.5
-        print(f"{pokemon.base.name}가 마비로 인해 스피드가 절반으로 감소: {speed}")
+        logger.debug("%s가 마비로 인해 스피드가 절반으로 감소: %s", pokemon.base.name, speed)
         
     ability = pokemon.base.ability.name if pokemon.base.ability else ""
     if ability in ['곡예', '엽록소', '쓱쓱', '눈치우기', '모래헤치기']:
@@ -22,14 +27,14 @@ def calculate_speed(pokemon: BattlePokemon):
             (ability == '쓱쓱' and public_env.weather != '비') or \
             (ability == '눈치우기' and public_env.weather != '싸라기눈') or \
             (ability == '모래헤치기' and public_env.weather != '모래바람'):
-            print(f"{pokemon.base.name}의 {ability} 특성이 발동되지 않음")
+            logger.debug("%s의 %s 특성이 발동되지 않음", pokemon.base.name, ability)
             return speed
         speed *= 2
-        print(f"{pokemon.base.name}의 {ability} 특성으로 인해 스피드가 2배로 증가: {speed}")
+        logger.debug("%s의 %s 특성으로 인해 스피드가 2배로 증가: %s", pokemon.base.name, ability, speed)
         
     return speed
 
-async def calculate_order(player_move: Optional[MoveInfo], ai_move: Optional[MoveInfo], battle_store: Optional[BattleStore] = store) -> Literal["my", "enemy"]:
+def calculate_order_sync(player_move: Optional[MoveInfo], ai_move: Optional[MoveInfo], battle_store: Optional[BattleStore] = store) -> Literal["my", "enemy"]:
     state: BattleStoreState = battle_store.get_state()
     public_env = state["public_env"]
     my_team = state["my_team"]
@@ -54,34 +59,34 @@ async def calculate_order(player_move: Optional[MoveInfo], ai_move: Optional[Mov
 
     # 스피드 계산
 
-    my_speed = calculate_speed(my_pokemon)
-    opponent_speed = calculate_speed(opponent_pokemon)
+    my_speed = calculate_speed(my_pokemon, battle_store=battle_store)
+    opponent_speed = calculate_speed(opponent_pokemon, battle_store=battle_store)
 
-    print(f"내 포켓몬({my_pokemon.base.name})의 최종 스피드: {my_speed}")
-    print(f"상대 포켓몬({opponent_pokemon.base.name})의 최종 스피드: {opponent_speed}")
+    logger.debug("내 포켓몬(%s)의 최종 스피드: %s", my_pokemon.base.name, my_speed)
+    logger.debug("상대 포켓몬(%s)의 최종 스피드: %s", opponent_pokemon.base.name, opponent_speed)
 
     if public_env.room == "트릭룸":
         my_speed *= -1
         opponent_speed *= -1
-        print("트릭룸 효과로 스피드가 반전되었습니다!")
-        print(f"내 포켓몬({my_pokemon.base.name})의 트릭룸 적용 후 스피드: {my_speed}")
-        print(f"상대 포켓몬({opponent_pokemon.base.name})의 트릭룸 적용 후 스피드: {opponent_speed}")
+        logger.debug("트릭룸 효과로 스피드가 반전되었습니다!")
+        logger.debug("내 포켓몬(%s)의 트릭룸 적용 후 스피드: %s", my_pokemon.base.name, my_speed)
+        logger.debug("상대 포켓몬(%s)의 트릭룸 적용 후 스피드: %s", opponent_pokemon.base.name, opponent_speed)
 
     # 기본 선공 판단
     speed_diff = my_speed - opponent_speed
     if speed_diff == 0:
         speed_diff = random.random() - 0.5
-        print("스피드가 같아 랜덤으로 결정됩니다!")
+        logger.debug("스피드가 같아 랜덤으로 결정됩니다!")
     who_is_first = "my" if speed_diff >= 0 else "enemy"
-    print(f"스피드 차이: {speed_diff}, 선공: {who_is_first}")
+    logger.debug("스피드 차이: %s, 선공: %s", speed_diff, who_is_first)
 
     # 그래스슬라이더 예외
     if player_move and player_move.name == "그래스슬라이더" and public_env.field != "그래스필드":
         player_move.priority = 0
-        print("그래스슬라이더의 우선도가 0으로 변경되었습니다!")
+        logger.debug("그래스슬라이더의 우선도가 0으로 변경되었습니다!")
     if ai_move and ai_move.name == "그래스슬라이더" and public_env.field != "그래스필드":
         ai_move.priority = 0
-        print("그래스슬라이더의 우선도가 0으로 변경되었습니다!")
+        logger.debug("그래스슬라이더의 우선도가 0으로 변경되었습니다!")
 
     # 우선도 비교
     def priority(move: MoveInfo): return move.priority if move else 0
@@ -89,23 +94,27 @@ async def calculate_order(player_move: Optional[MoveInfo], ai_move: Optional[Mov
     if player_move and ai_move:
         player_priority = priority(player_move)
         ai_priority = priority(ai_move)
-        print(f"내 기술({player_move.name})의 우선도: {player_priority}")
-        print(f"상대 기술({ai_move.name})의 우선도: {ai_priority}")
+        logger.debug("내 기술(%s)의 우선도: %s", player_move.name, player_priority)
+        logger.debug("상대 기술(%s)의 우선도: %s", ai_move.name, ai_priority)
         
         if player_priority > ai_priority:
             who_is_first = "my"
-            print("우선도로 인해 내가 선공합니다!")
+            logger.debug("우선도로 인해 내가 선공합니다!")
         elif player_priority < ai_priority:
             who_is_first = "enemy"
-            print("우선도로 인해 상대가 선공합니다!")
+            logger.debug("우선도로 인해 상대가 선공합니다!")
         else:
             who_is_first = "my" if speed_diff >= 0 else "enemy"
-            print("우선도가 같아 스피드로 결정됩니다!")
+            logger.debug("우선도가 같아 스피드로 결정됩니다!")
     elif ai_move:
         who_is_first = "my" if priority(ai_move) < 0 else "enemy"
     elif player_move:
         who_is_first = "enemy" if priority(player_move) < 0 else "my"
 
-    store.add_log(f"🦅 {who_is_first}의 선공!")
-    print(f"{who_is_first}의 선공!")
-    return who_is_first
\ No newline at end of file
+    battle_store.add_log(f"🦅 {who_is_first}의 선공!")
+    logger.debug("%s의 선공!", who_is_first)
+    return who_is_first
+
+
+# 기존 async API 호환 (await로 호출하던 코드용)
+calculate_order = async_entry(calculate_order_sync)
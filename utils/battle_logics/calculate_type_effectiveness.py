@@ -1,23 +1,39 @@
-from typing import List, Dict
+from typing import List, Dict, Sequence
+
+import numpy as np
+
 from p_models.pokemon_info import PokemonInfo
 from p_models.move_info import MoveInfo
 from .helpers import has_ability
-from utils.type_relation import calculate_type_effectiveness as base_type_effect
+from utils.type_relation import (
+    ATTACK_TYPE_INDEX, DEFENSE_TYPE_INDEX, PADDED_TYPE_MATRIX, effectiveness_matrix,
+    calculate_type_effectiveness as base_type_effect
+)
 
 # 타입 무효 특성을 무시하는 특성 목록
 IGNORE_IMMUNITY_ABILITIES = ['배짱', '심안']
 
+# 기술 타입 -> 그 기술이 무효인 방어 타입
+IMMUNITY_MAP: Dict[str, List[str]] = {
+    '노말': ['고스트'],
+    '격투': ['고스트'],
+    '독': ['강철'],
+    '전기': ['땅'],
+    '땅': ['비행'],
+    '고스트': ['노말'],
+    '드래곤': ['페어리'],
+}
+
+# IMMUNITY_MAP을 상성 행렬 모양의 마스크로 만든 것. 배짱/심안이면 마스크 칸을 1배로 본다
+IMMUNITY_MASK = np.zeros(PADDED_TYPE_MATRIX.shape, dtype=bool)
+for _move_type, _target_types in IMMUNITY_MAP.items():
+    for _target_type in _target_types:
+        IMMUNITY_MASK[ATTACK_TYPE_INDEX[_move_type], DEFENSE_TYPE_INDEX[_target_type]] = True
+IGNORE_IMMUNITY_TYPE_MATRIX = np.where(IMMUNITY_MASK, 1.0, PADDED_TYPE_MATRIX)
+IGNORE_IMMUNITY_TYPE_MATRIX.flags.writeable = False
+
 def is_type_immune(target_type: str, move_type: str) -> bool:
-    immunity_map: Dict[str, List[str]] = {
-        '노말': ['고스트'],
-        '격투': ['고스트'],
-        '독': ['강철'],
-        '전기': ['땅'],
-        '땅': ['비행'],
-        '고스트': ['노말'],
-        '드래곤': ['페어리'],
-    }
-    return target_type in immunity_map.get(move_type, [])
+    return target_type in IMMUNITY_MAP.get(move_type, [])
 
 def calculate_type_effectiveness_with_ability(
     attacker: PokemonInfo,
@@ -30,4 +46,16 @@ def calculate_type_effectiveness_with_ability(
     if attacker.ability and has_ability(attacker.ability, IGNORE_IMMUNITY_ABILITIES):
         defender_types = [t for t in defender_types if not is_type_immune(t, move_type)]
 
-    return base_type_effect(move_type, defender_types)
\ No newline at end of file
+    return base_type_effect(move_type, defender_types)
+
+def move_effectiveness_matrix(attacker: PokemonInfo, defenders: Sequence[PokemonInfo]) -> np.ndarray:
+    """
+    attacker의 기술 전부 x defenders 전부의 상성 배율 (기술 수, D)
+    각 값은 calculate_type_effectiveness_with_ability(attacker, defender, move)와 같다.
+    """
+    ignore_immunity = attacker.ability and has_ability(attacker.ability, IGNORE_IMMUNITY_ABILITIES)
+    return effectiveness_matrix(
+        [move.type for move in attacker.moves],
+        [defender.types for defender in defenders],
+        matrix=IGNORE_IMMUNITY_TYPE_MATRIX if ignore_immunity else PADDED_TYPE_MATRIX
+    )
@@ -4,6 +4,9 @@ from typing import Dict, Callable
 from p_models.pokemon_info import PokemonInfo
 from p_models.battle_pokemon import BattlePokemon
 from p_models.rank_state import RankState
+from utils.battle_logger import get_logger
+
+logger = get_logger(__name__)
 
 # 기본 랭크 상태
 default_rank: RankState = {
@@ -31,7 +34,7 @@ def create_battle_pokemon(base: PokemonInfo, exchange: bool = False) -> BattlePo
         raise ValueError(f"create_battle_pokemon: 유효하지 않은 포켓몬 데이터: {base}")
 
     reset_pp: Dict[str, int] = {move.name: move.pp_max for move in copy.deepcopy(base.moves)}
-    print(f"reset_pp: {reset_pp}")
+    logger.debug("reset_pp: %s", reset_pp)
     if exchange: # 상대 포켓몬 가져올 때 인데... 시뮬레이터에서는 이거 쓰지 않음
         if base.memorized_base:
             effective_base = base.memorized_base
@@ -9,7 +9,7 @@ from context.duration_store import DurationStore, duration_store
 from utils.battle_logics.rank_effect import calculate_accuracy, calculate_critical, calculate_rank_effect
 from utils.battle_logics.status_effect import apply_status_effect_before
 from utils.battle_logics.calculate_type_effectiveness import calculate_type_effectiveness_with_ability, is_type_immune
-from utils.battle_logics.helpers import has_ability
+from utils.battle_logics.helpers import has_ability, async_entry
 from utils.battle_logics.apply_before_damage import apply_defensive_ability_effect_before_damage, apply_offensive_ability_effect_before_damage
 from utils.battle_logics.update_battle_pokemon import (
     add_status, change_hp, change_position, change_rank,
@@ -21,10 +21,13 @@ from utils.battle_logics.apply_none_move_damage import apply_thorn_damage
 from utils.apply_skin_type_effect import apply_skin_type_effect
 from context.battle_environment import PublicBattleEnvironment
 import random
+from utils.battle_logger import get_logger
+
+logger = get_logger(__name__)
 
 SideType = Literal["my", "enemy"]
 
-async def calculate_move_damage(
+def calculate_move_damage_sync(
     move_name: str,
     side: SideType,
     current_index: int,
@@ -37,7 +40,7 @@ async def calculate_move_damage(
     battle_store: Optional[BattleStore] = store,
     duration_store: Optional[DurationStore] = duration_store
 ) -> Dict:
-    print("calculate_move_damage 호출 시작")
+    logger.debug("calculate_move_damage 호출 시작")
     # Get battle state
     state = battle_store.get_state()
     my_team: List[BattlePokemon] = state["my_team"]
@@ -68,14 +71,14 @@ async def calculate_move_damage(
     # Initialize variables
     types = 1.0  # Type effectiveness multiplier
     base_power = override_power if override_power is not None else move_info.power  # Base power
-    print(f"base_power in damage_calculator: {base_power}")
+    logger.debug("base_power in damage_calculator: %s", base_power)
     # Apply Technician ability
     if attacker.base.ability and attacker.base.ability.name == "테크니션" and base_power <= 60:
         base_power *= 1.5
     # Calculate power
     additional_damage = 0
     additional_damage += base_power if attacker.base.ability and attacker.base.ability.name == "테크니션" and base_power is not None else 0
-    print(f"additional_damage in damage_calculator: {additional_damage}")
+    logger.debug("additional_damage in damage_calculator: %s", additional_damage)
     power = (move_info.get_power(team, side, base_power) + (additional_damage or 0)
                 if move_info.get_power else base_power + (additional_damage or 0))
     # Calculate accuracy
@@ -95,7 +98,7 @@ async def calculate_move_damage(
     cri_rate = 0
     rate = 1.0
     if was_late and attacker.base.ability and attacker.base.ability.name == "애널라이즈":
-        print("애널라이즈로 강화됐다!")
+        logger.debug("애널라이즈로 강화됐다!")
         rate *= 1.3
     is_hit = True
     is_critical = False
@@ -110,16 +113,16 @@ async def calculate_move_damage(
     attack_stat = my_pokemon.attack if move_info.category == "물리" else my_pokemon.sp_attack
     if move_name == "바디프레스":
         attack_stat = my_pokemon.defense
-        print(f"{move_name} 효과 발동!")
+        logger.debug("%s 효과 발동!", move_name)
     if move_name == "속임수":
         attack_stat = opponent_pokemon.attack
-        print(f"{move_name} 효과 발동!")
+        logger.debug("%s 효과 발동!", move_name)
     if attacker.base.ability and attacker.base.ability.name == "무기력" and attacker.current_hp <= (attacker.base.hp / 2):
         attack_stat *= 0.5
     defense_stat = opponent_pokemon.defense if move_info.category == "물리" else opponent_pokemon.sp_defense
     if move_name == "사이코쇼크":
         defense_stat = opponent_pokemon.defense
-        print(f"{move_name} 효과 발동!")
+        logger.debug("%s 효과 발동!", move_name)
     # Handle No Guard ability
     if (attacker.base.ability and attacker.base.ability.name == "노가드") or \
         (defender.base.ability and defender.base.ability.name == "노가드"):
@@ -135,32 +138,32 @@ async def calculate_move_damage(
     # 0-0. Check if defender is protecting
     if defender.is_protecting:
         battle_store.add_log(f"{defender.base.name}는 방어중이여서 {attacker.base.name}의 공격은 실패했다!")
-        print(f"{defender.base.name}는 방어중이여서 {attacker.base.name}의 공격은 실패했다!")
+        logger.debug("%s는 방어중이여서 %s의 공격은 실패했다!", defender.base.name, attacker.base.name)
         
         if defender.used_move and defender.used_move.name == "니들가드" and move_info.is_touch:
-            battle_store.update_pokemon(side, active_my if side == "my" else active_enemy, lambda p: apply_thorn_damage(p))
+            battle_store.update_pokemon(side, active_my if side == "my" else active_enemy, lambda p: apply_thorn_damage(p, battle_store=battle_store))
             
         elif defender.used_move and defender.used_move.name == "토치카" and move_info.is_touch:
             battle_store.update_pokemon(side, active_my if side == "my" else active_enemy, lambda p: add_status(p, "독", opponent_side, battle_store=battle_store, duration_store=duration_store))
             if not (attacker.base.ability and attacker.base.ability.name == "면역" or 
                     "독" in attacker.base.types or "강철" in attacker.base.types):
-                print(f"{attacker.base.name}는 가시에 찔려 독 상태가 되었다!")
+                logger.debug("%s는 가시에 찔려 독 상태가 되었다!", attacker.base.name)
                 battle_store.add_log(f"{attacker.base.name}는 가시에 찔려 독 상태가 되었다!")
                 
         elif defender.used_move and defender.used_move.name == "블로킹" and move_info.is_touch:
             battle_store.update_pokemon(side, active_my if side == "my" else active_enemy, lambda p: change_rank(p, "defense", -2))
-            print(f"{attacker.base.name}는 방어가 크게 떨어졌다!!")
+            logger.debug("%s는 방어가 크게 떨어졌다!!", attacker.base.name)
             battle_store.add_log(f"{attacker.base.name}는 방어가 크게 떨어졌다!")
             
         return {"success": True, "used_move": move_info, "is_protecting": True}
     
     # 0-1. Check status effects
     if attacker.status:
-        status_result = apply_status_effect_before(attacker.status, rate, move_info, side)
+        status_result = apply_status_effect_before(attacker.status, rate, move_info, side, battle_store=battle_store, duration_store=duration_store)
         rate = status_result["rate"]
         if not status_result["is_hit"]:
             battle_store.add_log(f"🚫 {attacker.base.name}의 기술은 실패했다!")
-            print(f"{attacker.base.name}의 기술은 실패했다!")
+            logger.debug("%s의 기술은 실패했다!", attacker.base.name)
             if (attacker.locked_move_turn or 0) > 0: # 기술 실패시 고정 해제처리
                 battle_store.update_pokemon(side, active_my if side == "my" else active_enemy, 
                                     lambda p: p.copy_with(locked_move_turn=0))
@@ -181,7 +184,7 @@ async def calculate_move_damage(
                                         setattr(p, 'position', move_info.position or None) or
                                         p)
             battle_store.add_log(f"{attacker.base.name}은(는) 힘을 모으기 시작했다!")
-            print(f"{attacker.base.name}은(는) 힘을 모으기 시작했다!")
+            logger.debug("%s은(는) 힘을 모으기 시작했다!", attacker.base.name)
             return {"success": True, "used_move": move_info}
     
     # 0-4. Check position
@@ -190,7 +193,7 @@ async def calculate_move_damage(
         if (position == "땅" and move_info.name in ["지진", "땅고르기", "땅가르기"]) or \
         (position == "하늘" and move_info.name in ["번개", "땅고르기"]):
             battle_store.add_log(f"{attacker.base.name}은/는 {position}에 있는 상대를 공격하려 한다!")
-            print(f"{attacker.base.name}은/는 {position}에 있는 상대를 공격하려 한다!")
+            logger.debug("%s은/는 %s에 있는 상대를 공격하려 한다!", attacker.base.name, position)
         else:
             is_hit = False
     
@@ -204,7 +207,7 @@ async def calculate_move_damage(
     # 3. Handle ability ignoring abilities
     if my_pokemon.ability and has_ability(my_pokemon.ability, ["틀깨기", "터보블레이즈", "테라볼티지", "균사의힘"]):
         opponent_pokemon.ability = None  # 상대 특성 무효 처리. 실제 특성 메모리엔 영향 x.
-        print("틀깨기 발동!")
+        logger.debug("틀깨기 발동!")
         
     # 4. Calculate accuracy
     if not (is_always_hit or accuracy > 100):
@@ -219,7 +222,7 @@ async def calculate_move_damage(
             is_hit = False
             if attacker.base is not None:
                 battle_store.add_log(f"🚫 {attacker.base.name}의 공격은 빗나갔다!")
-                print(f"{attacker.base.name}의 공격은 빗나갔다!")
+                logger.debug("%s의 공격은 빗나갔다!", attacker.base.name)
             battle_store.update_pokemon(side, active_my if side == "my" else active_enemy, lambda p: set_had_missed(p, True))
             
             # Handle move demerit effects
@@ -229,7 +232,7 @@ async def calculate_move_damage(
                     if effect.fail:
                         dmg = effect.fail
                         battle_store.update_pokemon(side, active_my if side == "my" else active_enemy,
-                                          lambda p: change_hp(p, -(p.base.hp * dmg)))
+                                          lambda p: change_hp(p, -(p.base.hp * dmg), battle_store=battle_store))
                         battle_store.add_log(f"🤕 {attacker.base.name}은 반동으로 데미지를 입었다...")
             
             battle_store.update_pokemon(side, active_my if side == "my" else active_enemy, lambda p: set_used_move(p, move_info))
@@ -251,7 +254,7 @@ async def calculate_move_damage(
             if move_info.effects and any(effect.status in defender.status for effect in move_info.effects):
                 was_null = True
                 if not is_monte_carlo:
-                    print(f"{defender.base.name}은/는 이미 그 상태이상 걸려있어서 효과가 없었다!")
+                    logger.info("%s은/는 이미 그 상태이상 걸려있어서 효과가 없었다!", defender.base.name)
                     battle_store.add_log(f"🚫 {defender.base.name}은/는 이미 그 상태이상 걸려있어서 효과가 없었다!")
                 return {"success": True, "was_null": True, "used_move": move_info}
             if move_info.type == "풀" and "풀" in opponent_pokemon.types:
@@ -263,10 +266,10 @@ async def calculate_move_damage(
             if defender.base.ability and defender.base.ability.name == "미라클스킨":
                 was_null = True
                 battle_store.add_log(f"🥊 {attacker.base.name}은/는 {move_info.name}을/를 사용했다!")
-                print(f"{attacker.base.name}은/는 {move_info.name}을/를 사용했다!")
+                logger.debug("%s은/는 %s을/를 사용했다!", attacker.base.name, move_info.name)
                 if not is_monte_carlo:
                     battle_store.add_log(f"🚫 {attacker.base.name}의 공격은 효과가 없었다...")
-                    print(f"{side} {attacker.base.name}의 공격은 효과가 없었다...")
+                    logger.info("%s %s의 공격은 효과가 없었다...", side, attacker.base.name)
                 battle_store.update_pokemon(side, active_my if side == "my" else active_enemy, lambda p: set_used_move(p, move_info))
                 battle_store.update_pokemon(side, active_my if side == "my" else active_enemy, 
                                     lambda p: use_move_pp(p, move_name, defender.base.ability.name == "프레셔" if defender.base.ability else False, is_multi_hit))
@@ -281,7 +284,7 @@ async def calculate_move_damage(
                         move_info.type = "프리즈드라이"
                     # 노말스킨 있어도 프리즈드라이, 플라잉프레스의 타입은 계속 적용됨
                     if move_info.name == "플라잉프레스":
-                        print("플라잉프레스 타입상성 적용")
+                        logger.debug("플라잉프레스 타입상성 적용")
                         fighting_move = move_info.copy(type="격투")
                         flying_move = move_info.copy(type="비행")
                         fighting_effect = apply_defensive_ability_effect_before_damage(fighting_move, side, battle_store=battle_store)
@@ -295,7 +298,7 @@ async def calculate_move_damage(
             move_info.type = "프리즈드라이"
         # 노말스킨 있어도 프리즈드라이, 플라잉프레스의 타입은 계속 적용됨
         if move_info.name == "플라잉프레스":
-            print("플라잉프레스 타입상성 적용")
+            logger.debug("플라잉프레스 타입상성 적용")
             fighting_move = move_info.copy(type="격투")
             flying_move = move_info.copy(type="비행")
             fighting_effect = apply_defensive_ability_effect_before_damage(fighting_move, side, battle_store=battle_store)
@@ -310,26 +313,26 @@ async def calculate_move_damage(
             if types == 0:
                 was_null = True
                 battle_store.add_log(f"🥊 {attacker.base.name}은/는 {move_info.name}을/를 사용했다!")
-                print(f"{attacker.base.name}은/는 {move_info.name}을/를 사용했다!")
+                logger.debug("%s은/는 %s을/를 사용했다!", attacker.base.name, move_info.name)
                 if not is_monte_carlo:
                     battle_store.add_log(f"🚫 {attacker.base.name}의 공격은 효과가 없었다...")
-                    print(f"{side} {attacker.base.name}의 공격은 효과가 없었다...")
+                    logger.info("%s %s의 공격은 효과가 없었다...", side, attacker.base.name)
                 battle_store.update_pokemon(side, active_my if side == "my" else active_enemy, lambda p: set_used_move(p, move_info))
                 battle_store.update_pokemon(side, active_my if side == "my" else active_enemy, 
                                     lambda p: use_move_pp(p, move_name, defender.base.ability.name == "프레셔" if defender.base.ability else False, is_multi_hit))
                 battle_store.update_pokemon(side, active_my if side == "my" else active_enemy, lambda p: set_dealt_damage(p, 0))
                 return {"success": True, "was_null": was_null, "used_move": move_info}
             if move_info.name == "아픔나누기":
-                print("아픔나누기~~")
+                logger.debug("아픔나누기~~")
                 my_hp = attacker.current_hp
                 enemy_hp = defender.current_hp
                 total_hp = my_hp + enemy_hp
                 new_hp = total_hp // 2
-                battle_store.update_pokemon(side, active_my if side == "my" else active_enemy, lambda p: change_hp(p, new_hp - my_hp))
-                battle_store.update_pokemon(opponent_side, active_enemy if side == "my" else active_my, lambda p: change_hp(p, new_hp - enemy_hp))
+                battle_store.update_pokemon(side, active_my if side == "my" else active_enemy, lambda p: change_hp(p, new_hp - my_hp, battle_store=battle_store))
+                battle_store.update_pokemon(opponent_side, active_enemy if side == "my" else active_my, lambda p: change_hp(p, new_hp - enemy_hp, battle_store=battle_store))
             
             battle_store.add_log(f"🥊 {attacker.base.name}은/는 {move_info.name}을/를 사용했다!")
-            print(f"{attacker.base.name}은/는 {move_info.name}을/를 사용했다!")
+            logger.debug("%s은/는 %s을/를 사용했다!", attacker.base.name, move_info.name)
             battle_store.update_pokemon(side, active_my if side == "my" else active_enemy, lambda p: set_used_move(p, move_info))
             battle_store.update_pokemon(side, active_my if side == "my" else active_enemy, 
                                 lambda p: use_move_pp(p, move_name, defender.base.ability.name == "프레셔" if defender.base.ability else False, is_multi_hit))
@@ -339,32 +342,32 @@ async def calculate_move_damage(
             return {"success": True, "used_move": move_info}  # 변화기술은 성공으로 처리
         
         battle_store.add_log(f"🥊 {attacker.base.name}은/는 {move_name}을/를 사용했다!")
-        print(f"{attacker.base.name}은/는 {move_name}을/를 사용했다!")
+        logger.debug("%s은/는 %s을/를 사용했다!", attacker.base.name, move_name)
         if types >= 4:
             was_effective = 2
             if not is_monte_carlo:
                 battle_store.add_log(f"👍 {side} {attacker.base.name}의 공격은 효과가 매우 굉장했다!")
-                print(f"{side} {attacker.base.name}의 공격은 효과가 매우 굉장했다!")
+                logger.info("%s %s의 공격은 효과가 매우 굉장했다!", side, attacker.base.name)
         if 2 <= types < 4:
             was_effective = 1
             if not is_monte_carlo:
                 battle_store.add_log(f"👍 {side} {attacker.base.name}의 공격은 효과가 굉장했다!")
-                print(f"{side} {attacker.base.name}의 공격은 효과가 굉장했다!")
+                logger.info("%s %s의 공격은 효과가 굉장했다!", side, attacker.base.name)
         if 0 < types <= 0.25:
             was_effective = -2
             if not is_monte_carlo:
                 battle_store.add_log(f"👎 {attacker.base.name}의 공격은 효과가 매우 별로였다...")
-                print(f"{side} {attacker.base.name}의 공격은 효과가 매우 별로였다...")
+                logger.info("%s %s의 공격은 효과가 매우 별로였다...", side, attacker.base.name)
         if 0.25 < types <= 0.5:
             was_effective = -1
             if not is_monte_carlo:
                 battle_store.add_log(f"👎 {attacker.base.name}의 공격은 효과가 별로였다...")
-                print(f"{side} {attacker.base.name}의 공격은 효과가 별로였다...")
+                logger.info("%s %s의 공격은 효과가 별로였다...", side, attacker.base.name)
         if types == 0:
             was_null = True
             if not is_monte_carlo:
                 battle_store.add_log(f"🚫 {attacker.base.name}의 공격은 효과가 없었다...")
-                print(f"{side} {attacker.base.name}의 공격은 효과가 없었다...")
+                logger.info("%s %s의 공격은 효과가 없었다...", side, attacker.base.name)
             battle_store.update_pokemon(side, active_my if side == "my" else active_enemy, lambda p: set_used_move(p, move_info))
             battle_store.update_pokemon(side, active_my if side == "my" else active_enemy, 
                                 lambda p: use_move_pp(p, move_name, defender.base.ability.name == "프레셔" if defender.base.ability else False, is_multi_hit))
@@ -382,11 +385,11 @@ async def calculate_move_damage(
                                 lambda p: use_move_pp(p, move_name, defender.base.ability.name == "프레셔" if defender.base.ability else False, is_multi_hit))
             if not is_monte_carlo:
                 battle_store.add_log(f"🚫 {attacker.base.name}의 공격은 상대의 옹골참으로 인해 효과가 없었다!")
-                print(f"{attacker.base.name}의 공격은 상대의 옹골참으로 인해 효과가 없었다!")
+                logger.info("%s의 공격은 상대의 옹골참으로 인해 효과가 없었다!", attacker.base.name)
             battle_store.update_pokemon(side, active_my if side == "my" else active_enemy, lambda p: set_dealt_damage(p, 0))
             return {"success": True, "damage": 0, "was_null": was_null, "used_move": move_info}  # 일격필살기 무효화
             
-        battle_store.update_pokemon(opponent_side, active_opponent, lambda p: change_hp(p, -p.base.hp))
+        battle_store.update_pokemon(opponent_side, active_opponent, lambda p: change_hp(p, -p.base.hp, battle_store=battle_store))
         battle_store.update_pokemon(opponent_side, active_opponent, lambda p: set_received_damage(p, p.base.hp))
         battle_store.update_pokemon(side, active_mine, 
                             lambda p: use_move_pp(p, move_name, defender.base.ability.name == "프레셔" if defender.base.ability else False, is_multi_hit))
@@ -412,18 +415,18 @@ async def calculate_move_damage(
     # 6-1. 날씨 효과 적용
     if weather_effect:  # 날씨 있을 때만
         if weather_effect == "쾌청" and move_info.type == "물":
-            print("해가 쨍쨍해서 물 기술이 약해졌다!")
+            logger.debug("해가 쨍쨍해서 물 기술이 약해졌다!")
             rate *= 0.5
         if weather_effect == "비" and move_info.type == "불":
-            print("비가 와서 불 기술이 약해졌다!")
+            logger.debug("비가 와서 불 기술이 약해졌다!")
             rate *= 0.5
         if weather_effect == "모래바람":
             if "바위" in opponent_pokemon.types and move_info.category == "특수":  # 날씨가 모래바람이고 상대가 바위타입일 경우
-                print("상대의 특수방어가 강화됐다!")
+                logger.debug("상대의 특수방어가 강화됐다!")
                 rate *= 2 / 3
         elif weather_effect == "싸라기눈":
             if "얼음" in opponent_pokemon.types and move_info.category == "물리":  # 날씨가 싸라기눈이고 상대가 얼음타입일 경우
-                print("상대의 방어가 강화됐다!")
+                logger.debug("상대의 방어가 강화됐다!")
                 rate *= 2 / 3
 
     # 6-2. 필드 효과 적용
@@ -431,7 +434,7 @@ async def calculate_move_damage(
         # 필드가 깔려있고, 내 포켓몬이 땅에 있는 포켓몬일 때
         if field_effect == "그래스필드":
             if move_info.type == "풀":
-                print("그래스필드에서 기술이 강화됐다!")
+                logger.debug("그래스필드에서 기술이 강화됐다!")
                 rate *= 1.3
             elif move_info.name in ["지진", "땅고르기"]:
                 rate *= 0.5
@@ -454,12 +457,10 @@ async def calculate_move_damage(
             attack_stat *= 0.75
 
     # 6-4. 빛의장막, 리플렉터, 오로라베일 적용
-    enemy_env_effects = duration_store.get_effects("enemy_env")
-    my_env_effects = duration_store.get_effects("my_env")
-    env_effects = enemy_env_effects if side == "my" else my_env_effects
+    env_side = "enemy_env" if side == "my" else "my_env"
 
     def has_active_screen(name: str) -> bool:
-        return any(effect["name"] == name for effect in env_effects)
+        return duration_store.find_effect(env_side, name) is not None
 
     # 깨트리기, 사이코팽 등 스크린 파괴 기술
     if move_info.effects and any(effect.break_screen for effect in move_info.effects):
@@ -475,13 +476,13 @@ async def calculate_move_damage(
         if move_info.category == "물리" and (has_active_screen("리플렉터") or has_active_screen("오로라베일")):
             rate *= 0.5
             battle_store.add_log("🧱 장막 효과로 데미지가 줄었다!")
-            print("장막효과 적용됨")
+            logger.debug("장막효과 적용됨")
 
         # 특수 기술이면 라이트스크린이나 오로라베일 적용
         if move_info.category == "특수" and (has_active_screen("빛의장막") or has_active_screen("오로라베일")):
             rate *= 0.5
             battle_store.add_log("🧱 장막 효과로 데미지가 줄었다!")
-            print("장막효과 적용됨")
+            logger.debug("장막효과 적용됨")
 
     # 7. 공격 관련 특성 적용 (배율)
     rate *= apply_offensive_ability_effect_before_damage(move_info, side, was_effective, battle_store=battle_store)
@@ -511,13 +512,13 @@ async def calculate_move_damage(
             my_poke_rank['sp_attack'] = max(0, my_poke_rank['sp_attack'])
             # 급소 맞출 시에는 내 공격 랭크 다운 무효
             battle_store.add_log(f"👍 {move_name}은/는 급소에 맞았다!")
-            print(f"{move_name}은/는 급소에 맞았다!")
+            logger.debug("%s은/는 급소에 맞았다!", move_name)
         else:
             rate *= 1.5  # 그 외에는 1.5배
             my_poke_rank['attack'] = max(0, my_poke_rank['attack'])
             my_poke_rank['sp_attack'] = max(0, my_poke_rank['sp_attack'])
             battle_store.add_log(f"👍 {move_name}은/는 급소에 맞았다!")
-            print(f"{move_name}은/는 급소에 맞았다!")
+            logger.debug("%s은/는 급소에 맞았다!", move_name)
 
     # 10. 데미지 계산
     # 공격자가 천진일 때: 상대 방어 랭크 무시
@@ -528,11 +529,11 @@ async def calculate_move_damage(
             if move_name == "바디프레스":
                 attack_stat *= calculate_rank_effect(my_poke_rank['defense'])
                 battle_store.add_log(f"{attacker.base.name}의 방어 랭크 변화가 적용되었다!")
-                print(f"{attacker.base.name}의 방어 랭크 변화가 적용되었다!")
+                logger.debug("%s의 방어 랭크 변화가 적용되었다!", attacker.base.name)
             else:
                 attack_stat *= calculate_rank_effect(my_poke_rank['attack'])
                 battle_store.add_log(f"{attacker.base.name}의 공격 랭크 변화가 적용되었다!")
-                print(f"{attacker.base.name}의 공격 랭크 변화가 적용되었다!")
+                logger.debug("%s의 공격 랭크 변화가 적용되었다!", attacker.base.name)
 
     if my_poke_rank['sp_attack'] and move_info.category == "특수":
         if not (defender.base.ability and defender.base.ability.name == "천진") and \
@@ -540,7 +541,7 @@ async def calculate_move_damage(
             # 공격자가 천진도 아니고, 기술이 랭크업 무시하는 기술도 아닐 경우에만 업데이트
             defense_stat *= calculate_rank_effect(op_poke_rank['defense'])
             battle_store.add_log(f"{defender.base.name}의 방어 랭크 변화가 적용되었다!")
-            print(f"{defender.base.name}의 방어 랭크 변화가 적용되었다!")
+            logger.debug("%s의 방어 랭크 변화가 적용되었다!", defender.base.name)
 
     if op_poke_rank['defense'] and move_info.category == "물리":
         if not (attacker.base.ability and attacker.base.ability.name == "천진") and \
@@ -548,22 +549,22 @@ async def calculate_move_damage(
             # 공격자가 천진도 아니고, 기술이 랭크업 무시하는 기술도 아닐 경우에만 업데이트
             defense_stat *= calculate_rank_effect(op_poke_rank['defense'])
             battle_store.add_log(f"{defender.base.name}의 방어 랭크 변화가 적용되었다!")
-            print(f"{defender.base.name}의 방어 랭크 변화가 적용되었다!")
+            logger.debug("%s의 방어 랭크 변화가 적용되었다!", defender.base.name)
 
     if op_poke_rank['sp_defense'] and move_info.category == "특수":
         if not (attacker.base.ability and attacker.base.ability.name == "천진") and \
             not (move_info.effects and any(effect.rank_nullification for effect in move_info.effects)):
             defense_stat *= calculate_rank_effect(op_poke_rank['sp_defense'])
             battle_store.add_log(f"{defender.base.name}의 특수방어 랭크 변화가 적용되었다!")
-            print(f"{defender.base.name}의 특수방어 랭크 변화가 적용되었다!")
+            logger.debug("%s의 특수방어 랭크 변화가 적용되었다!", defender.base.name)
 
     # 11. 내구력 계산
     durability = (defense_stat * opponent_pokemon.hp) / 0.411
-    print(f"{defender.base.name}의 내구력: {durability}")
+    logger.debug("%s의 내구력: %s", defender.base.name, durability)
 
     # 12. 결정력 계산
     effectiveness = attack_stat * power * rate * types
-    print(f"{attacker.base.name}의 결정력: {effectiveness}")
+    logger.debug("%s의 결정력: %s", attacker.base.name, effectiveness)
 
     # 13. 최종 데미지 계산 (내구력 비율 기반)
     damage = min(defender.current_hp, 
@@ -572,13 +573,13 @@ async def calculate_move_damage(
     if move_info.counter:
         if move_info.name == "미러코트" and defender.used_move and defender.used_move.category == "특수":
             damage = (attacker.received_damage or 0) * 2
-            print("반사데미지:", damage)
+            logger.debug("반사데미지: %s", damage)
         if move_info.name == "카운터" and defender.used_move and defender.used_move.category == "물리":
             damage = (attacker.received_damage or 0) * 2
-            print("반사데미지:", damage)
+            logger.debug("반사데미지: %s", damage)
         if move_info.name == "메탈버스트" and (attacker.received_damage or 0) > 0:
             damage = (attacker.received_damage or 0) * 1.5
-            print("반사데미지:", damage)
+            logger.debug("반사데미지: %s", damage)
 
     if move_info.name == "목숨걸기":
         damage = attacker.current_hp
@@ -588,10 +589,10 @@ async def calculate_move_damage(
         # 데미지 적용
         if (defender.base.ability and defender.base.ability.name == "옹골참" and 
             defender.current_hp == defender.base.hp and damage >= defender.current_hp):
-            print(f"{defender.base.name}의 옹골참 발동!")
+            logger.debug("%s의 옹골참 발동!", defender.base.name)
             battle_store.add_log(f"🔃 {defender.base.name}의 옹골참 발동!")
             battle_store.update_pokemon(opponent_side, active_opponent, 
-                                lambda p: change_hp(p, 1 - p.current_hp))
+                                lambda p: change_hp(p, 1 - p.current_hp, battle_store=battle_store))
             battle_store.update_pokemon(opponent_side, active_opponent,
                                 lambda p: set_received_damage(p, p.base.hp - 1))
             battle_store.update_pokemon(side, active_mine, lambda p: set_dealt_damage(p, defender.base.hp - 1))
@@ -603,18 +604,18 @@ async def calculate_move_damage(
             battle_store.update_pokemon(side, active_mine, lambda p: set_used_move(p, move_info))
             battle_store.update_pokemon(side, active_mine, lambda p: set_charging(p, False, None))
             battle_store.update_pokemon(side, active_mine, lambda p: change_position(p, None))
-            return {"success": True, "damage": defender.current_hp - 1, "was_effective": was_effective, "was_null": was_null, "used_move": move_info}
+            return {"success": True, "damage": defender.current_hp - 1, "was_effective": was_effective, "was_null": was_null, "used_move": move_info, "is_critical": is_critical}
 
         if damage >= defender.current_hp:  # 쓰러뜨렸을 경우
             if move_info.name == "마지막일침":
-                print(f"{move_info.name}의 부가효과 발동!")
+                logger.debug("%s의 부가효과 발동!", move_info.name)
                 battle_store.update_pokemon(side, active_mine, 
                                     lambda p: change_rank(p, "attack", 3))
-                print(f"{attacker.base.name}의 공격이 3랭크 변했다!")
+                logger.debug("%s의 공격이 3랭크 변했다!", attacker.base.name)
                 battle_store.add_log(f"🔃 {attacker.base.name}의 공격이 3랭크 변했다!")
 
             if attacker.base.ability and attacker.base.ability.name in ["자기과신", "백의울음"]:
-                print("자기과신 발동!")
+                logger.debug("자기과신 발동!")
                 battle_store.add_log("자기과신 발동!")
                 battle_store.update_pokemon(side, active_mine, 
                                     lambda p: change_rank(p, "attack", 1))
@@ -623,13 +624,13 @@ async def calculate_move_damage(
                                     lambda p: change_rank(p, "sp_attack", 1))
 
             if "길동무" in defender.status:
-                print(f"{side} 포켓몬은 상대에게 길동무로 끌려갔다...!")
+                logger.debug("%s 포켓몬은 상대에게 길동무로 끌려갔다...!", side)
                 battle_store.add_log(f"👻 {side} 포켓몬은 상대에게 길동무로 끌려갔다...!")
                 battle_store.update_pokemon(side, active_mine, 
-                                    lambda p: change_hp(p, -p.base.hp))
+                                    lambda p: change_hp(p, -p.base.hp, battle_store=battle_store))
 
         battle_store.update_pokemon(opponent_side, active_opponent, 
-                            lambda p: change_hp(p, -damage))
+                            lambda p: change_hp(p, -damage, battle_store=battle_store))
         battle_store.update_pokemon(opponent_side, active_opponent,
                             lambda p: set_received_damage(p, damage))
         battle_store.update_pokemon(side, active_mine, lambda p: set_dealt_damage(p, damage))
@@ -646,7 +647,7 @@ async def calculate_move_damage(
             battle_store.update_pokemon(side, active_mine, 
                                 lambda p: p.copy_with(locked_move_turn=3 if random.random() < 0.5 else 2))
 
-        return {"success": True, "damage": damage, "was_effective": was_effective, "was_null": was_null, "used_move": move_info}
+        return {"success": True, "damage": damage, "was_effective": was_effective, "was_null": was_null, "used_move": move_info, "is_critical": is_critical}
 
     return {"success": False, "was_null": False, "used_move": move_info}
 
@@ -658,8 +659,8 @@ def apply_change_effect(
     battle_store: Optional[BattleStore] = store,
     duration_store: Optional[DurationStore] = duration_store
 ) -> None:
-    print("apply_change_effect 호출")
-    state = store.get_state()
+    logger.debug("apply_change_effect 호출")
+    state = battle_store.get_state()
     my_team = state["my_team"]
     enemy_team = state["enemy_team"]
     active_my = state["active_my"]
@@ -673,11 +674,11 @@ def apply_change_effect(
     if move_info.category == "변화":
         if move_info.target == "self":  # 자신에게 거는 기술일 경우
             battle_store.add_log(f"🥊 {side}는 {move_info.name}을/를 사용했다!")
-            print(f"{side}는 {move_info.name}을/를 사용했다!")
+            logger.debug("%s는 %s을/를 사용했다!", side, move_info.name)
             
             if move_info.name == "길동무":
                 if active_team[active_mine].used_move and active_team[active_mine].used_move.name == "길동무":
-                    print("연속으로 발동 실패...!")
+                    logger.debug("연속으로 발동 실패...!")
                     battle_store.add_log("연속으로 발동 실패...!")
                     # update_pokemon(side, active_mine, lambda p: set_used_move(p, None))  # 다음턴에 다시 길동무 사용 가능하도록
                     battle_store.update_pokemon(side, active_mine, 
@@ -686,17 +687,17 @@ def apply_change_effect(
                     return
                 else:
                     battle_store.add_log(f"👻 {side}는 {move_info.name}을/를 사용했다!")
-                    print(f"{side}는 {move_info.name}을/를 사용했다!")
+                    logger.debug("%s는 %s을/를 사용했다!", side, move_info.name)
                     battle_store.update_pokemon(side, active_mine, lambda p: set_used_move(p, move_info))
                     battle_store.update_pokemon(side, active_mine, lambda p: use_move_pp(p, move_info.name, defender.ability.name == "프레셔" if defender and defender.ability else False, is_multi_hit))
                     battle_store.update_pokemon(side, active_mine, lambda p: add_status(p, "길동무", side, battle_store=battle_store, duration_store=duration_store))
             
             if move_info.protect:
                 if active_team[active_mine].used_move and active_team[active_mine].used_move.protect:
-                    print("연속으로 방어 시도!")
+                    logger.debug("연속으로 방어 시도!")
                     battle_store.add_log("연속으로 방어 시도!")
                     if random.random() < 0.5:
-                        print("연속으로 방어 성공!")
+                        logger.debug("연속으로 방어 성공!")
                         battle_store.add_log("연속으로 방어 성공!")
                         battle_store.update_pokemon(side, active_mine, lambda p: set_used_move(p, move_info))
                         battle_store.update_pokemon(side, active_mine, lambda p: use_move_pp(p, move_info.name, defender.ability.name == "프레셔" if defender and defender.ability else False, is_multi_hit))
@@ -704,7 +705,7 @@ def apply_change_effect(
                         battle_store.update_pokemon(side, active_mine, lambda p: set_dealt_damage(p, 0))
                         
                     else:
-                        print("연속으로 방어 실패...!")
+                        logger.debug("연속으로 방어 실패...!")
                         battle_store.add_log("연속으로 방어 실패...!")
                         battle_store.update_pokemon(side, active_mine, lambda p: set_used_move(p, None))
                         battle_store.update_pokemon(side, active_mine, 
@@ -726,7 +727,7 @@ def apply_change_effect(
                         for stat_change in effect.stat_change:
                             battle_store.update_pokemon(side, active_mine, 
                                             lambda p: change_rank(p, stat_change.stat, stat_change.change))
-                            print(f"{active_team[active_mine].base.name}의 {stat_change.stat}이/가 {stat_change.change}랭크 변했다!")
+                            logger.debug("%s의 %s이/가 %s랭크 변했다!", active_team[active_mine].base.name, stat_change.stat, stat_change.change)
                             battle_store.add_log(f"🔃 {active_team[active_mine].base.name}의 {stat_change.stat}이/가 {stat_change.change}랭크 변했다!")
                     
                     if effect.heal and effect.heal > 0:
@@ -735,8 +736,8 @@ def apply_change_effect(
                         battle_store.update_pokemon(side, active_mine, lambda p: use_move_pp(p, move_info.name, defender.ability.name == "프레셔" if defender and defender.ability else False, is_multi_hit))
                         battle_store.update_pokemon(side, active_mine, lambda p: set_dealt_damage(p, 0))
                         battle_store.update_pokemon(side, active_mine, 
-                                          lambda p: change_hp(p, p.base.hp * heal))
-                        print("damage_calculator.py") # 맞은 포켓몬의 체력이 회복되는 오류 확인 위한 디버깅
+                                          lambda p: change_hp(p, p.base.hp * heal, battle_store=battle_store))
+                        logger.debug("damage_calculator.py") # 맞은 포켓몬의 체력이 회복되는 오류 확인 위한 디버깅
                     
                     if effect.status:
                         if effect.status == "잠듦" and not (
@@ -753,20 +754,20 @@ def apply_change_effect(
             if move_info.trap:  # 독압정, 스텔스록 등
                 add_trap(opponent_side, move_info.trap, battle_store=battle_store)
                 battle_store.add_log(f"🥊 {side}는 {move_info.name}을/를 사용했다!")
-                print(f"{side}는 {move_info.name}을/를 사용했다!")
+                logger.debug("%s는 %s을/를 사용했다!", side, move_info.name)
             
             if move_info.field:
                 set_field(move_info.field, battle_store=battle_store, duration_store=duration_store)
                 battle_store.add_log(f"⛰️ {side}는 필드를 {move_info.name}로 바꿨다!")
-                print(f"{side}는 필드를 {move_info.name}로 바꿨다!")
+                logger.debug("%s는 필드를 %s로 바꿨다!", side, move_info.name)
             
             if move_info.weather:
                 set_weather(move_info.name, battle_store=battle_store, duration_store=duration_store)
-                print(f"{side}는 날씨를 {move_info.weather}로 바꿨다!")
+                logger.debug("%s는 날씨를 %s로 바꿨다!", side, move_info.weather)
             
             if move_info.room:
                 set_room(move_info.room, battle_store=battle_store, duration_store=duration_store)
-                print(f"{side}는 방을 {move_info.room}로 바꿨다!")
+                logger.debug("%s는 방을 %s로 바꿨다!", side, move_info.room)
             
             if move_info.screen:
                 set_screen(side, move_info.screen, battle_store=battle_store, duration_store=duration_store)
@@ -777,7 +778,7 @@ def apply_change_effect(
     battle_store.update_pokemon(side, active_mine, lambda p: set_dealt_damage(p, 0))
 
 def get_move_info(my_pokemon: PokemonInfo, move_name: str, battle_store: Optional[BattleStore] = store) -> MoveInfo:
-    print(f"pokemon: {my_pokemon.name}")
+    logger.debug("pokemon: %s", my_pokemon.name)
     state = battle_store.get_state()
     my_team = state["my_team"]
     enemy_team = state["enemy_team"]
@@ -798,9 +799,13 @@ def get_move_info(my_pokemon: PokemonInfo, move_name: str, battle_store: Optiona
         current_pp = move.pp
         if battle_pokemon and move.name in battle_pokemon.pp:
             current_pp = battle_pokemon.pp[move.name]
-            print(f"- {move.name} (PP: {current_pp})")
+            logger.debug("- %s (PP: %s)", move.name, current_pp)
         if move.name == move_name:
             if battle_pokemon and move_name in battle_pokemon.pp:
                 move.pp = battle_pokemon.pp[move_name]
             return move
-    raise ValueError(f"{my_pokemon.name}의 {move_name} 기술을 찾을 수 없습니다.") 
\ No newline at end of file
+    raise ValueError(f"{my_pokemon.name}의 {move_name} 기술을 찾을 수 없습니다.") 
+
+
+# 기존 async API 호환 (await로 호출하던 코드용)
+calculate_move_damage = async_entry(calculate_move_damage_sync)
@@ -0,0 +1,203 @@
+# utils/battle_logics/damage_distribution.py
+"""
+기술 한 번의 데미지 분포를 난수 없이 계산한다 (명중 x 급소 x 타격 횟수)
+
+calculate_move_damage_sync가 뽑는 난수를 그대로 확률로 펼친다:
+- 명중: calculate_accuracy와 같은 식 (hit_probability). 노가드 / 명중 100 초과 / is_always_hit면 1, 일격필살기는 0.3
+- 급소: 타격마다 calculate_critical과 같은 확률 (critical_probability)
+- 타격 횟수: get_hit_count와 같은 분포. 연속기는 첫 타가 맞으면 나머지도 맞고, 트리플킥 / 트리플악셀은 타마다 명중을 따로 뽑는다
+이 시뮬레이터의 데미지 식에는 난수 보정(0.85~1.0)이 없으므로 타마다 데미지는 급소 여부로만 갈린다.
+타마다 데미지는 pre_calculate_move_damage(critical=...)로 계산하고, 합은 상대 현재 체력에서 자른다.
+
+상태이상(마비, 잠듦 등)으로 기술을 못 쓰는 경우와 연타 중 체력 변화로 바뀌는 특성 효과는 넣지 않는다 (기술을 쓴다는 조건부 분포).
+"""
+from collections import defaultdict
+from copy import copy
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from context.battle_store import BattleStore, SideType, store
+from context.duration_store import DurationStore, duration_store
+from p_models.battle_pokemon import BattlePokemon
+from p_models.move_info import MoveInfo
+from utils.battle_logics.pre_damage_calculator import pre_calculate_move_damage
+from utils.battle_logics.rank_effect import critical_probability, hit_probability
+
+TRIPLE_HIT_MOVES = {"트리플킥": 10, "트리플악셀": 20}  # 타마다 늘어나는 위력
+MULTI_HIT_COUNTS = ((2, 0.35), (3, 0.35), (4, 0.15), (5, 0.15))
+
+
+class DamageDistribution(NamedTuple):
+    damages: np.ndarray  # 가능한 총 데미지 (오름차순)
+    probs: np.ndarray    # 각 데미지의 확률 (합 1)
+    hp: int              # 상대 현재 체력
+
+    @property
+    def expected(self) -> float:
+        return float(self.damages @ self.probs)
+
+    @property
+    def variance(self) -> float:
+        return float(((self.damages - self.expected) ** 2) @ self.probs)
+
+    @property
+    def ko_probability(self) -> float:
+        return float(self.probs[self.damages >= self.hp].sum()) if self.hp > 0 else 1.0
+
+
+def hit_count_distribution(move: MoveInfo) -> List[Tuple[int, float]]:
+    """get_hit_count(move)의 (타격 횟수, 확률) 목록"""
+    hit_count = 0
+    for effect in (move.effects or []):
+        if effect.double_hit:
+            hit_count = 2
+        if effect.triple_hit:
+            hit_count = 3
+    if hit_count > 0:
+        return [(hit_count, 1.0)]
+    if move.name == "스킬링크":
+        return [(5, 1.0)]
+    return list(MULTI_HIT_COUNTS)
+
+
+def move_hit_probability(
+    move: MoveInfo,
+    side: SideType,
+    attacker: BattlePokemon,
+    defender: BattlePokemon,
+    is_always_hit: bool = False,
+    battle_store: Optional[BattleStore] = store,
+) -> float:
+    """calculate_move_damage_sync의 명중 판정(4. Calculate accuracy)이 성공할 확률"""
+    public_env = battle_store.get_state()["public_env"]
+    weather = public_env.weather
+    attacker_ability = attacker.base.ability.name if attacker.base.ability else None
+    defender_ability = defender.base.ability.name if defender.base.ability else None
+    accuracy = move.get_accuracy(public_env, side) if move.get_accuracy else move.accuracy
+
+    if is_always_hit or "노가드" in (attacker_ability, defender_ability) or accuracy is None or accuracy > 100:
+        return 1.0
+    if move.one_hit_ko:
+        return 0.3
+
+    acc_rate = 1.0
+    if defender_ability == "눈숨기" and weather == "싸라기눈":
+        acc_rate *= 0.8
+    if defender_ability == "모래숨기" and weather == "모래바람":
+        acc_rate *= 0.8
+    if attacker_ability == "복안":
+        acc_rate *= 1.3
+    if attacker_ability == "승리의별":
+        acc_rate *= 1.1
+    if attacker_ability == "의욕" and move.category == "물리":
+        accuracy *= 0.8
+    return hit_probability(acc_rate, accuracy, attacker.rank["accuracy"] or 0, defender.rank["dodge"] or 0)
+
+
+def _hit_damages(
+    move: MoveInfo,
+    side: SideType,
+    attacker: BattlePokemon,
+    defender: BattlePokemon,
+    override_power: Optional[int],
+    battle_store: BattleStore,
+    duration_store: DurationStore,
+) -> Tuple[float, float]:
+    """한 타의 (급소 아님, 급소) 데미지"""
+    return tuple(
+        pre_calculate_move_damage(
+            move.name, side, battle_store.get_active_index(side), override_power=override_power,
+            attacker=attacker, defender=defender, battle_store=battle_store, duration_store=duration_store,
+            critical=critical,
+        )
+        for critical in (False, True)
+    )
+
+
+def _add_hit(support: Dict[float, float], hit: Tuple[float, float], crit_prob: float, hp: int) -> Dict[float, float]:
+    """지금까지의 총 데미지 분포에 한 타(급소 확률 crit_prob)를 더한다. 이미 쓰러진 경우는 그대로 둔다"""
+    result: Dict[float, float] = defaultdict(float)
+    normal, critical = hit
+    for total, prob in support.items():
+        if total >= hp:
+            result[total] += prob
+            continue
+        result[min(hp, total + normal)] += prob * (1 - crit_prob)
+        result[min(hp, total + critical)] += prob * crit_prob
+    return result
+
+
+def damage_distribution(
+    move: MoveInfo,
+    side: SideType,
+    attacker: Optional[BattlePokemon] = None,
+    defender: Optional[BattlePokemon] = None,
+    is_always_hit: bool = False,
+    battle_store: Optional[BattleStore] = store,
+    duration_store: Optional[DurationStore] = duration_store,
+) -> DamageDistribution:
+    """
+    side 포켓몬이 move를 썼을 때 defender가 받는 총 데미지 분포
+    attacker / defender를 주지 않으면 양쪽 현재 포켓몬. 스토어와 포켓몬은 바뀌지 않는다.
+    """
+    opponent_side = "enemy" if side == "my" else "my"
+    if attacker is None:
+        attacker = battle_store.get_team(side)[battle_store.get_active_index(side)]
+    if defender is None:
+        defender = battle_store.get_team(opponent_side)[battle_store.get_active_index(opponent_side)]
+    # 틀깨기류 특성은 계산 중 상대 특성을 지우므로 복사본으로 계산
+    defender = defender.copy_with(base=copy(defender.base))
+    hp = defender.current_hp
+
+    hit_prob = move_hit_probability(move, side, attacker, defender, is_always_hit, battle_store)
+    crit_prob = min(1.0, max(0.0, critical_probability(
+        move.critical_rate, attacker.base.ability, attacker.rank["critical"] if attacker.rank else 0
+    )))
+    support: Dict[float, float] = defaultdict(float)
+
+    if move.one_hit_ko:
+        sturdy = defender.base.ability and defender.base.ability.name == "옹골참"
+        support[0 if sturdy else hp] += hit_prob
+        support[0] += 1 - hit_prob
+    elif move.name in TRIPLE_HIT_MOVES:
+        # 타마다 명중을 따로 뽑는다 (handle_move_sync는 빗나가도 다음 타를 계속 친다)
+        support[0] = 1.0
+        for i in range(hit_count_distribution(move)[0][0]):
+            hit = _hit_damages(
+                move, side, attacker, defender, move.power + TRIPLE_HIT_MOVES[move.name] * i, battle_store, duration_store
+            )
+            landed = _add_hit({total: prob * hit_prob for total, prob in support.items()}, hit, crit_prob, hp)
+            for total, prob in support.items():
+                landed[total] += prob * (1 - hit_prob)
+            support = landed
+    else:
+        hit = _hit_damages(move, side, attacker, defender, None, battle_store, duration_store)
+        is_multi = any(effect.multi_hit or effect.double_hit for effect in (move.effects or []))
+        counts = hit_count_distribution(move) if is_multi else [(1, 1.0)]
+        for hit_count, count_prob in counts:
+            totals = {0: hit_prob * count_prob}
+            for _ in range(hit_count):
+                totals = _add_hit(totals, hit, crit_prob, hp)
+            for total, prob in totals.items():
+                support[total] += prob
+        support[0] += 1 - hit_prob
+
+    support = {damage: prob for damage, prob in support.items() if prob > 0}
+    damages = np.array(sorted(support), dtype=np.float64)
+    probs = np.array([support[d] for d in sorted(support)], dtype=np.float64)
+    return DamageDistribution(damages, probs, hp)
+
+
+def move_distributions(
+    side: SideType = "my",
+    is_always_hit: bool = False,
+    battle_store: Optional[BattleStore] = store,
+    duration_store: Optional[DurationStore] = duration_store,
+) -> List[DamageDistribution]:
+    """side 현재 포켓몬의 기술 순서(= env 행동 0~3)대로 상대 현재 포켓몬에 대한 데미지 분포"""
+    attacker = battle_store.get_team(side)[battle_store.get_active_index(side)]
+    return [
+        damage_distribution(move, side, attacker, None, is_always_hit, battle_store, duration_store)
+        for move in attacker.base.moves
+    ]
@@ -0,0 +1,137 @@
+# utils/battle_logics/damage_matrix.py
+"""
+내 기술 전부 x 상대 팀 전부의 예상 데미지 (pre_calculate_move_damage 결과)를 한 번에 구하고 memo해 두는 서비스
+
+- memo 키는 pre_calculate_move_damage가 읽는 값만으로 만든다:
+  기술(이름 / 타입 / pp 남았는지), 공격자 스탯 / 랭크 / 특성 / 타입 / 체력, 방어자 스탯 / 랭크 / 특성 / 타입 / 체력 / 위치,
+  날씨 / 필드 / 재앙, 방어 쪽 벽. 이 값이 바뀌지 않으면 다시 계산하지 않는다.
+- 급소 확률이 1/2 이상인 경우(계산 안에서 급소 난수를 뽑음)와 공격자가 틀깨기류 특성인 경우(계산 중 상대 특성을 지움)는
+  memo하지 않고 매번 계산해 기존 동작을 그대로 따른다.
+- memo는 battle_store.damage_cache에 두므로 배틀(BattleContext)마다 따로 쓰고, 배틀 진행 / AI / 보상 / 교체 로직이 같이 쓴다.
+"""
+from copy import copy
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from context.battle_store import BattleStore, SideType, store
+from context.duration_store import DurationStore, duration_store
+from p_models.battle_pokemon import BattlePokemon
+from p_models.move_info import MoveInfo
+from utils.battle_logics.pre_damage_calculator import pre_calculate_move_damage
+
+SCREENS = ("리플렉터", "빛의장막", "오로라베일")
+MOLD_BREAKERS = ("틀깨기", "터보블레이즈", "테라볼티지", "균사의힘")
+MAX_CACHE_ENTRIES = 100_000
+
+
+def _ability_name(pokemon: BattlePokemon) -> Optional[str]:
+    return pokemon.base.ability.name if pokemon.base.ability else None
+
+
+def damage_key(
+    move: MoveInfo,
+    side: SideType,
+    attacker: BattlePokemon,
+    defender: BattlePokemon,
+    battle_store: Optional[BattleStore] = store,
+    duration_store: Optional[DurationStore] = duration_store,
+) -> Optional[tuple]:
+    """pre_calculate_move_damage(move.name, side, ...)의 memo 키. 결과에 난수나 부수효과가 섞이면 None"""
+    attacker_base, defender_base = attacker.base, defender.base
+    attacker_ability = _ability_name(attacker)
+    rank = attacker.rank
+    if attacker_ability in MOLD_BREAKERS:
+        return None
+    if (rank["critical"] if rank else 0) + move.critical_rate + (1 if attacker_ability == "대운" else 0) >= 2:
+        return None
+    public_env = battle_store.get_state()["public_env"]
+    env_side = "enemy_env" if side == "my" else "my_env"
+    op_rank = defender.rank
+    return (
+        side,
+        move.name, move.type, attacker.pp.get(move.name, 0) > 0,
+        attacker_base.name, attacker_base.hp, attacker_base.attack, attacker_base.sp_attack, attacker_base.defense,
+        tuple(attacker_base.types), attacker_ability,
+        rank["attack"], rank["sp_attack"], rank["defense"], attacker.current_hp, attacker.had_missed,
+        defender_base.name, defender_base.hp, defender_base.attack, defender_base.defense, defender_base.sp_defense,
+        tuple(defender_base.types), _ability_name(defender),
+        op_rank["defense"], op_rank["sp_defense"], defender.current_hp, defender.position, bool(defender.status),
+        public_env.weather, public_env.field, tuple(public_env.disaster or ()),
+        tuple(name for name in SCREENS if duration_store.find_effect(env_side, name) is not None),
+    )
+
+
+def cached_move_damage(
+    move: MoveInfo,
+    side: SideType,
+    attacker: BattlePokemon,
+    defender: BattlePokemon,
+    battle_store: Optional[BattleStore] = store,
+    duration_store: Optional[DurationStore] = duration_store,
+    copy_defender: bool = False,
+) -> float:
+    """
+    memo를 거치는 pre_calculate_move_damage. attacker는 side의 현재 포켓몬이어야 한다
+    copy_defender면 계산 중 방어자가 바뀌지 않도록(틀깨기의 특성 무효화) 복사본으로 계산한다.
+    """
+    key = damage_key(move, side, attacker, defender, battle_store, duration_store)
+    cache = battle_store.damage_cache
+    if key is not None and key in cache:
+        return cache[key]
+    active_index = battle_store.get_active_index(side)
+    if copy_defender:
+        defender = defender.copy_with(base=copy(defender.base))
+    damage = pre_calculate_move_damage(
+        move.name, side, active_index, attacker=attacker, defender=defender,
+        battle_store=battle_store, duration_store=duration_store,
+    )
+    if key is not None:
+        if len(cache) >= MAX_CACHE_ENTRIES:
+            cache.clear()
+        cache[key] = damage
+    return damage
+
+
+def damage_matrix(
+    side: SideType,
+    battle_store: Optional[BattleStore] = store,
+    duration_store: Optional[DurationStore] = duration_store,
+    moves: Optional[Sequence[MoveInfo]] = None,
+) -> np.ndarray:
+    """
+    side 현재 포켓몬의 기술 x 상대 팀 전부의 예상 데미지 (기술 수, 상대 팀 크기)
+    moves를 주지 않으면 현재 포켓몬의 기술 전부. 상대 현재 포켓몬 열은 실제 포켓몬으로, 나머지는 복사본으로 계산한다.
+    """
+    attacker = battle_store.get_team(side)[battle_store.get_active_index(side)]
+    opponent_side = "enemy" if side == "my" else "my"
+    opponents = battle_store.get_team(opponent_side)
+    active_opponent = battle_store.get_active_index(opponent_side)
+    moves = attacker.base.moves if moves is None else moves
+
+    matrix = np.zeros((len(moves), len(opponents)), dtype=np.float64)
+    for j, defender in enumerate(opponents):
+        for i, move in enumerate(moves):
+            matrix[i, j] = cached_move_damage(
+                move, side, attacker, defender, battle_store, duration_store, copy_defender=j != active_opponent
+            )
+    return matrix
+
+
+def pre_damage_list(
+    side: SideType = "my",
+    battle_store: Optional[BattleStore] = store,
+    duration_store: Optional[DurationStore] = duration_store,
+) -> List[tuple]:
+    """battle_store.set_pre_damage_list 형식: 현재 포켓몬 기술마다 (상대 현재 포켓몬에 대한 데미지, 디메리트 여부, 부가효과 여부)"""
+    attacker = battle_store.get_team(side)[battle_store.get_active_index(side)]
+    opponent_side = "enemy" if side == "my" else "my"
+    defender = battle_store.get_team(opponent_side)[battle_store.get_active_index(opponent_side)]
+    return [
+        (
+            cached_move_damage(move, side, attacker, defender, battle_store, duration_store),
+            1 if move.demerit_effects else 0,
+            1 if move.effects else 0,
+        )
+        for move in attacker.base.moves
+    ]
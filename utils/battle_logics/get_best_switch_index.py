@@ -3,6 +3,9 @@
 from typing import List, Optional
 from context.battle_store import BattleStore, BattleStoreState, store
 from utils.type_relation import calculate_type_effectiveness
+from utils.battle_logger import get_logger
+
+logger = get_logger(__name__)
 
 
 def get_max_effectiveness(attacker_types: List[str], defender_types: List[str]) -> float:
@@ -28,7 +31,7 @@ def get_best_switch_index(side: str, battle_store: Optional[BattleStore] = store
     
     # 교체 가능한 포켓몬이 없는 경우
     if not available_pokemon:
-        print("get_best_switch_index: 교체 가능한 포켓몬이 없는 경우")
+        logger.debug("get_best_switch_index: 교체 가능한 포켓몬이 없는 경우")
         return -1
     
     # 각 포켓몬의 점수 계산
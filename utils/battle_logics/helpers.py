@@ -1,5 +1,20 @@
-from typing import List
+from functools import wraps
+from typing import Awaitable, Callable, List, TypeVar
 from p_models.ability_info import AbilityInfo
 
+T = TypeVar("T")
+
 def has_ability(ability: AbilityInfo, targets: List[str]) -> bool:
-    return ability.name in targets
\ No newline at end of file
+    return ability.name in targets
+
+def async_entry(sync_fn: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """
+    동기 배틀 로직(xxx_sync)을 기존 async API(xxx)로 감싼다.
+    배틀 로직은 실제로 기다리는 I/O가 없으므로 코어는 동기로 두고 await 호출부 호환만 유지한다.
+    """
+    @wraps(sync_fn)
+    async def wrapper(*args, **kwargs) -> T:
+        return sync_fn(*args, **kwargs)
+
+    wrapper.__name__ = wrapper.__qualname__ = sync_fn.__name__.removesuffix("_sync")
+    return wrapper
@@ -10,6 +10,9 @@ from utils.battle_logics.helpers import has_ability
 from utils.battle_logics.apply_before_damage import apply_defensive_ability_effect_before_damage, apply_offensive_ability_effect_before_damage
 from utils.apply_skin_type_effect import apply_skin_type_effect
 from context.battle_environment import PublicBattleEnvironment
+from utils.battle_logger import get_logger
+
+logger = get_logger(__name__)
 
 SideType = Literal["my", "enemy"]
 
@@ -29,7 +32,9 @@ def pre_calculate_move_damage( # 배틀을 실행하기 전에 만약 다른 기
     heal_check: bool = False,
     battle_store: Optional[BattleStore] = store,
     duration_store: Optional[DurationStore] = duration_store,
+    critical: Optional[bool] = None,
 ) -> float:
+    # critical을 주면 급소 여부를 난수 없이 고정해서 계산 (utils/battle_logics/damage_distribution.py)
     # 일격기는 여기서 처리 안함 
     # Get battle state
     state = battle_store.get_state()
@@ -144,11 +149,11 @@ def pre_calculate_move_damage( # 배틀을 실행하기 전에 만약 다른 기
                     if move_info.name == "플라잉프레스":
                         fighting_move = move_info.copy(type="격투")
                         flying_move = move_info.copy(type="비행")
-                        fighting_effect = apply_defensive_ability_effect_before_damage(fighting_move, side, pre_damage=True, battle_store=battle_store)
-                        flying_effect = apply_defensive_ability_effect_before_damage(flying_move, side, pre_damage=True, battle_store=battle_store)
+                        fighting_effect = apply_defensive_ability_effect_before_damage(fighting_move, side, pre_damage=True, battle_store=battle_store, defender=defender)
+                        flying_effect = apply_defensive_ability_effect_before_damage(flying_move, side, pre_damage=True, battle_store=battle_store, defender=defender)
                         types *= fighting_effect * flying_effect
                     else:  # 일반적인 경우
-                        types *= apply_defensive_ability_effect_before_damage(move_info, side, pre_damage=True, battle_store=battle_store)
+                        types *= apply_defensive_ability_effect_before_damage(move_info, side, pre_damage=True, battle_store=battle_store, defender=defender)
         
         # 방어적 특성이 없는 경우
         if move_info.name == "프리즈드라이" and move_info.type == "노말":
@@ -157,8 +162,8 @@ def pre_calculate_move_damage( # 배틀을 실행하기 전에 만약 다른 기
         if move_info.name == "플라잉프레스":
             fighting_move = move_info.copy(type="격투")
             flying_move = move_info.copy(type="비행")
-            fighting_effect = apply_defensive_ability_effect_before_damage(fighting_move, side, pre_damage=True, battle_store=battle_store)
-            flying_effect = apply_defensive_ability_effect_before_damage(flying_move, side, pre_damage=True, battle_store=battle_store)
+            fighting_effect = apply_defensive_ability_effect_before_damage(fighting_move, side, pre_damage=True, battle_store=battle_store, defender=defender)
+            flying_effect = apply_defensive_ability_effect_before_damage(flying_move, side, pre_damage=True, battle_store=battle_store, defender=defender)
             types *= fighting_effect * flying_effect
         else:
             types *= calculate_type_effectiveness_with_ability(my_pokemon, opponent_pokemon, move_info)
@@ -170,7 +175,7 @@ def pre_calculate_move_damage( # 배틀을 실행하기 전에 만약 다른 기
             if types == 0:
                 return 0.0
             if move_info.name == "아픔나누기":
-                print("pre_calc: 아픔나누기~~")
+                logger.debug("pre_calc: 아픔나누기~~")
                 my_hp = attacker.current_hp
                 enemy_hp = defender.current_hp
                 total_hp = my_hp + enemy_hp
@@ -233,12 +238,10 @@ def pre_calculate_move_damage( # 배틀을 실행하기 전에 만약 다른 기
             attack_stat *= 0.75
 
     # 6-4. 빛의장막, 리플렉터, 오로라베일 적용
-    enemy_env_effects = duration_store.get_effects("enemy_env")
-    my_env_effects = duration_store.get_effects("my_env")
-    env_effects = enemy_env_effects if side == "my" else my_env_effects
+    env_side = "enemy_env" if side == "my" else "my_env"
 
     def has_active_screen(name: str) -> bool:
-        return any(effect["name"] == name for effect in env_effects)
+        return duration_store.find_effect(env_side, name) is not None
 
 
     # 벽 통과하는 기술이나 틈새포착이 아닐 경우
@@ -252,18 +255,18 @@ def pre_calculate_move_damage( # 배틀을 실행하기 전에 만약 다른 기
             rate *= 0.5
 
     # 7. 공격 관련 특성 적용 (배율)
-    rate *= apply_offensive_ability_effect_before_damage(move_info, side, was_effective)
+    rate *= apply_offensive_ability_effect_before_damage(move_info, side, was_effective, battle_store=battle_store)
 
     # 8. 상대 방어 특성 적용 (배율)
     # 만약 위에서 이미 types가 0이더라도, 나중에 곱하면 어차피 0 돼서 상관없음.
-    rate *= apply_defensive_ability_effect_before_damage(move_info, side, was_effective, pre_damage=True)
+    rate *= apply_defensive_ability_effect_before_damage(move_info, side, was_effective, pre_damage=True, battle_store=battle_store, defender=defender)
 
     # 9. 급소 적용
     # 급소 맞을 확률이 1/2 이상일 경우에만 작용하도록. 
-    if ((my_poke_rank['critical'] if my_poke_rank else 0) + move_info.critical_rate + 
+    if critical is not None or ((my_poke_rank['critical'] if my_poke_rank else 0) + move_info.critical_rate + 
         (1 if my_pokemon.ability and my_pokemon.ability.name == "대운" else 0) 
         >= 2):
-        print(f"pre_calc: 급소 적용")
+        logger.debug("pre_calc: 급소 적용")
         if (my_pokemon.ability and my_pokemon.ability.name == "무모한행동" and 
             any(status in ["독", "맹독"] for status in my_poke_status)):
             is_critical = True
@@ -273,9 +276,13 @@ def pre_calculate_move_damage( # 배틀을 실행하기 전에 만약 다른 기
             cri_rate = 0
             is_critical = False  # 무조건 급소 안 맞음
             
-        is_critical = calculate_critical(move_info.critical_rate + cri_rate, 
-                                        my_pokemon.ability, 
-                                        my_poke_rank['critical'] if my_poke_rank else 0)
+        if critical is not None:
+            is_critical = critical
+            my_poke_rank = dict(my_poke_rank)  # 고정 계산에서는 실제 랭크를 바꾸지 않는다
+        else:
+            is_critical = calculate_critical(move_info.critical_rate + cri_rate, 
+                                            my_pokemon.ability, 
+                                            my_poke_rank['critical'] if my_poke_rank else 0)
 
         if is_critical:
             if my_pokemon.ability and my_pokemon.ability.name == "스나이퍼":
@@ -332,7 +339,7 @@ def pre_calculate_move_damage( # 배틀을 실행하기 전에 만약 다른 기
     # 옹골참 처리
     if (defender.base.ability and defender.base.ability.name == "옹골참" and 
         defender.current_hp == defender.base.hp and damage >= defender.current_hp):
-        print(f"pre_calc: {defender.base.name}의 옹골참 발동!")
+        logger.debug("pre_calc: %s의 옹골참 발동!", defender.base.name)
         damage = defender.current_hp - 1
 
     return damage
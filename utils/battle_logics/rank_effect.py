@@ -16,9 +16,9 @@ def calculate_rank_effect(rank: int) -> float:
         return 2 / (abs(rank) + 2)
 
 
-def calculate_accuracy(acc_rate: float, move_accuracy: float, acc_rank: int, dodge_rank: int) -> bool:
+def hit_probability(acc_rate: float, move_accuracy: float, acc_rank: int, dodge_rank: int) -> float:
     """
-    명중 여부 계산
+    명중 확률 계산
     """
     hit_prob = acc_rate
 
@@ -34,14 +34,19 @@ def calculate_accuracy(acc_rate: float, move_accuracy: float, acc_rank: int, dod
         hit_prob *= 1 / 3
 
     hit_prob *= (move_accuracy / 100)
-    hit_prob = min(1.0, hit_prob)
+    return min(1.0, hit_prob)
 
-    return random.random() < hit_prob
+
+def calculate_accuracy(acc_rate: float, move_accuracy: float, acc_rank: int, dodge_rank: int) -> bool:
+    """
+    명중 여부 계산
+    """
+    return random.random() < hit_probability(acc_rate, move_accuracy, acc_rank, dodge_rank)
 
 
-def calculate_critical(base_critical: int, ability: Optional[AbilityInfo], cri_rank: int) -> bool:
+def critical_probability(base_critical: int, ability: Optional[AbilityInfo], cri_rank: int) -> float:
     """
-    급소 여부 계산
+    급소 확률 계산
     """
     cri_prob = 0
     if ability and ability.name == "대운":
@@ -55,4 +60,11 @@ def calculate_critical(base_critical: int, ability: Optional[AbilityInfo], cri_r
     else:
         cri_rate = (cri_prob ** 2) * 2 / 16
 
-    return random.random() < cri_rate
\ No newline at end of file
+    return cri_rate
+
+
+def calculate_critical(base_critical: int, ability: Optional[AbilityInfo], cri_rank: int) -> bool:
+    """
+    급소 여부 계산
+    """
+    return random.random() < critical_probability(base_critical, ability, cri_rank)
\ No newline at end of file
@@ -5,6 +5,9 @@ from context.battle_store import BattleStore, store
 from context.duration_store import DurationStore, duration_store
 from utils.battle_logics.update_battle_pokemon import change_hp, remove_status
 import random
+from utils.battle_logger import get_logger
+
+logger = get_logger(__name__)
 
 SideType = Literal["my", "enemy"]
 
@@ -31,19 +34,18 @@ def apply_status_effect_before(
             if not can_act:
                 break
             battle_store.add_log(f"{active_team[active_index].base.name}은/는 풀이 죽어서 기술 사용에 실패했다!")
-            print(f"{active_team[active_index].base.name}은/는 풀이 죽어서 기술 사용에 실패했다!")
+            logger.debug("%s은/는 풀이 죽어서 기술 사용에 실패했다!", active_team[active_index].base.name)
             can_act = False
             
         elif s == "잠듦":
-            print(f"잠듦 체크")
-            sleep_list = duration_store.get_effects(side)
-            sleep_effect = next((e for e in sleep_list if e['name'] == "잠듦"), None)
+            logger.debug("잠듦 체크")
+            sleep_effect = duration_store.find_effect(side, "잠듦")
             
             if not sleep_effect or not sleep_effect['remaining_turn']:
                 duration_store.remove_effect("잠듦", side)
                 battle_store.update_pokemon(side, active_index, lambda p: remove_status(p, "잠듦"))
                 battle_store.add_log(f"🏋️‍♂️ {active_team[active_index].base.name}은/는 잠에서 깼다!")
-                print(f"🏋️‍♂️ {active_team[active_index].base.name}은/는 잠에서 깼다!")
+                logger.debug("🏋️\u200d♂️ %s은/는 잠에서 깼다!", active_team[active_index].base.name)
             else:
                 remaining = sleep_effect['remaining_turn']
                 recovery_chance = 0
@@ -59,7 +61,7 @@ def apply_status_effect_before(
                     duration_store.remove_effect("잠듦", side)
                     battle_store.update_pokemon(side, active_index, lambda p: remove_status(p, "잠듦"))
                     battle_store.add_log(f"🏋️‍♂️ {active_team[active_index].base.name}은/는 잠에서 깼다!")
-                    print(f"🏋️‍♂️ {active_team[active_index].base.name}은/는 잠에서 깼다!")
+                    logger.debug("🏋️\u200d♂️ %s은/는 잠에서 깼다!", active_team[active_index].base.name)
                 else:
                     can_act = False
                     duration_store.add_effect({
@@ -69,38 +71,38 @@ def apply_status_effect_before(
                     }, side)
                     
         elif s == "마비":
-            print(f"마비 체크")
+            logger.debug("마비 체크")
             if not can_act:
                 break
             if random.random() < 0.25:
                 can_act = False
                 battle_store.add_log(f"{active_team[active_index].base.name}은/는 몸이 저렸다!")
-                print(f"{active_team[active_index].base.name}은/는 몸이 저렸다!")
+                logger.debug("%s은/는 몸이 저렸다!", active_team[active_index].base.name)
             else:
                 can_act = True
                 
         elif s == "얼음":
-            print(f"얼음 체크")
+            logger.debug("얼음 체크")
             if random.random() < 0.2 or move.type == "불":
                 battle_store.update_pokemon(side, active_index, lambda p: remove_status(p, "얼음"))
                 battle_store.add_log(f"🏋️‍♂️ {active_team[active_index].base.name}의 얼음이 녹았다!")
-                print(f"{active_team[active_index].base.name}의 얼음이 녹았다!")
+                logger.debug("%s의 얼음이 녹았다!", active_team[active_index].base.name)
                 can_act = True
             else:
                 battle_store.add_log(f"☃️ {active_team[active_index].base.name}은/는 얼어있다!")
-                print(f"{active_team[active_index].base.name}은/는 얼어있다!")
+                logger.debug("%s은/는 얼어있다!", active_team[active_index].base.name)
                 can_act = False
                 
         elif s == "혼란":
-            print(f"혼란 체크")
+            logger.debug("혼란 체크")
             recovered = duration_store.decrement_confusion_turn(side, active_index)
             if recovered:
                 can_act = True
                 battle_store.add_log(f"🏋️‍♂️ {active_team[active_index].base.name}은/는 혼란에서 깼다!")
-                print(f"{active_team[active_index].base.name}은/는 혼란에서 깼다!")
+                logger.debug("%s은/는 혼란에서 깼다!", active_team[active_index].base.name)
             else:
                 battle_store.add_log(f"😵‍💫 {active_team[active_index].base.name}은/는 혼란에 빠져있다!")
-                print(f"{active_team[active_index].base.name}은/는 혼란에 빠져있다!")
+                logger.debug("%s은/는 혼란에 빠져있다!", active_team[active_index].base.name)
                 if random.random() < 0.33:
                     can_act = False
                     self_damage = 40 * active_team[active_index].base.attack
@@ -109,9 +111,9 @@ def apply_status_effect_before(
                         active_team[active_index].current_hp,
                         round((self_damage / durability) * active_team[active_index].base.hp)
                     )
-                    battle_store.update_pokemon(side, active_index, lambda p: change_hp(p, -final_damage))
+                    battle_store.update_pokemon(side, active_index, lambda p: change_hp(p, -final_damage, battle_store=battle_store))
                     battle_store.add_log(f"😵‍💫 {active_team[active_index].base.name}은/는 스스로를 공격했다!")
-                    print(f"{active_team[active_index].base.name}은/는 스스로를 공격했다!")
+                    logger.debug("%s은/는 스스로를 공격했다!", active_team[active_index].base.name)
                 else:
                     can_act = True
                     
@@ -126,7 +128,7 @@ def apply_status_effect_before(
                 break
             if move.affiliation == "소리":
                 battle_store.add_log(f"{active_team[active_index].base.name}은/는 소리기술 사용에 실패했다!")
-                print(f"{active_team[active_index].base.name}은/는 소리기술 사용에 실패했다!")
+                logger.debug("%s은/는 소리기술 사용에 실패했다!", active_team[active_index].base.name)
                 can_act = False
     return {
         "rate": current_rate,
@@ -1,6 +1,8 @@
 from typing import Literal, Optional
 from context.battle_store import BattleStore, BattleStoreState, store
 from context.duration_store import DurationStore, duration_store
+from p_models.status import STATUS_BIT, status_mask
+from utils.battle_logics.helpers import async_entry
 from utils.battle_logics.apply_appearance import apply_appearance
 from utils.battle_logics.apply_none_move_damage import apply_trap_damage
 from utils.battle_logics.get_best_switch_index import get_best_switch_index
@@ -8,6 +10,9 @@ from utils.battle_logics.update_battle_pokemon import (
     add_status, change_hp, change_rank, remove_status, reset_rank, reset_state, set_active, set_used_move
 )
 from utils.battle_logics.update_environment import remove_aura, remove_disaster, remove_trap
+from utils.battle_logger import emit_event, get_logger
+
+logger = get_logger(__name__)
 
 SideType = Literal["my", "enemy"]
 
@@ -18,9 +23,11 @@ UNMAIN_STATUS_CONDITION_WITH_DURATION = [
     '조이기', '멸망의노래', '풀죽음'
 ]
 MAIN_STATUS_CONDITION = ['화상', '마비', '잠듦', '얼음', '독', '맹독']
+UNMAIN_STATUS_MASK = status_mask(UNMAIN_STATUS_CONDITION + UNMAIN_STATUS_CONDITION_WITH_DURATION)
+MAIN_STATUS_MASK = status_mask(MAIN_STATUS_CONDITION)
 
 
-async def switch_pokemon(side: SideType, new_index: int, baton_touch: bool = False, battle_store: Optional[BattleStore] = store, duration_store: Optional[DurationStore] = duration_store) -> None:
+def switch_pokemon_sync(side: SideType, new_index: int, baton_touch: bool = False, battle_store: Optional[BattleStore] = store, duration_store: Optional[DurationStore] = duration_store) -> None:
     """
     포켓몬 교체 함수
     
@@ -43,24 +50,26 @@ async def switch_pokemon(side: SideType, new_index: int, baton_touch: bool = Fal
 
     if new_index == -1:
         battle_store.add_log(f"{side}는 더 이상 낼 포켓몬이 없음")
-        print(f"{side}는 더 이상 낼 포켓몬이 없음")
+        logger.debug("%s는 더 이상 낼 포켓몬이 없음", side)
         return
 
     if team[new_index].current_hp <= 0:
         battle_store.add_log(f"쓰러진 포켓몬으로 교체할 수 없습니다.")
-        print(f"쓰러진 포켓몬으로 교체할 수 없습니다.")
+        logger.debug("쓰러진 포켓몬으로 교체할 수 없습니다.")
         return
 
+    emit_event("switch", side=side, from_index=current_index, to_index=new_index, pokemon=next_pokemon.base.name)
+
     if switching_pokemon.base.ability and switching_pokemon.base.ability.name == "재생력" and switching_pokemon.current_hp > 0:
         battle_store.update_pokemon(side, current_index,
-                             lambda p: change_hp(p, switching_pokemon.base.hp // 3))
+                             lambda p: change_hp(p, switching_pokemon.base.hp // 3, battle_store=battle_store))
 
     if baton_touch:
         battle_store.update_pokemon(side, new_index, lambda p: p.copy_with(
             rank=team[current_index].rank,
             substitute=team[current_index].substitute,
             status=[
-                s for s in team[current_index].status if s in UNMAIN_STATUS_CONDITION or s in UNMAIN_STATUS_CONDITION_WITH_DURATION
+                s for s in team[current_index].status if STATUS_BIT.get(s, 0) & UNMAIN_STATUS_MASK
             ]
         ))
         duration_store.transfer_effects(side, current_index, new_index)
@@ -69,14 +78,17 @@ async def switch_pokemon(side: SideType, new_index: int, baton_touch: bool = Fal
     battle_store.update_pokemon(side, current_index, lambda p: reset_rank(p))
     battle_store.update_pokemon(side, current_index, lambda p: p.copy_with(is_first_turn=False))
 
-    for status in UNMAIN_STATUS_CONDITION + UNMAIN_STATUS_CONDITION_WITH_DURATION:
+    # 해당 상태가 하나도 없으면 목록을 돌지 않는다
+    for status in (UNMAIN_STATUS_CONDITION + UNMAIN_STATUS_CONDITION_WITH_DURATION
+                   if switching_pokemon.status.bits & UNMAIN_STATUS_MASK else ()):
         if status in switching_pokemon.status:
             if status in UNMAIN_STATUS_CONDITION_WITH_DURATION:
                 duration_store.remove_effect(status, side)
             battle_store.update_pokemon(side, current_index,
                                 lambda p: remove_status(p, status))
 
-    if switching_pokemon.base.ability and switching_pokemon.base.ability.name == "자연회복":
+    if switching_pokemon.base.ability and switching_pokemon.base.ability.name == "자연회복" \
+            and switching_pokemon.status.bits & (UNMAIN_STATUS_MASK | MAIN_STATUS_MASK):
         for status in UNMAIN_STATUS_CONDITION + UNMAIN_STATUS_CONDITION_WITH_DURATION + MAIN_STATUS_CONDITION:
             if status in switching_pokemon.status:
                 if status in UNMAIN_STATUS_CONDITION_WITH_DURATION:
@@ -89,9 +101,9 @@ async def switch_pokemon(side: SideType, new_index: int, baton_touch: bool = Fal
     ability_name = switching_pokemon.base.ability.name if switching_pokemon.base.ability else None
     if ability_name and switching_pokemon.base.ability.appear:
         if "disaster" in switching_pokemon.base.ability.appear:
-            remove_disaster(ability_name)
+            remove_disaster(ability_name, battle_store=battle_store)
         if "aura_change" in switching_pokemon.base.ability.appear:
-            remove_aura(ability_name)
+            remove_aura(ability_name, battle_store=battle_store)
 
     battle_store.update_pokemon(side, new_index, lambda p: set_active(p, True))
     battle_store.update_pokemon(side, new_index, lambda p: p.copy_with(is_first_turn=True))
@@ -99,7 +111,7 @@ async def switch_pokemon(side: SideType, new_index: int, baton_touch: bool = Fal
         battle_store.set_active_my(new_index)
     else:
         battle_store.set_active_enemy(new_index)
-    print(f"교체 후 포켓몬: {next_pokemon.base.name}")
+    logger.debug("교체 후 포켓몬: %s", next_pokemon.base.name)
     if env.trap:
         damage, trap_log, trap_condition = apply_trap_damage(next_pokemon, env.trap)
         
@@ -109,15 +121,15 @@ async def switch_pokemon(side: SideType, new_index: int, baton_touch: bool = Fal
         
         if new_hp <= 0:
             battle_store.add_log(f"{next_pokemon.base.name}이(가) 쓰러졌다!")
-            switch_index = get_best_switch_index(side)
+            switch_index = get_best_switch_index(side, battle_store=battle_store)
             if switch_index != -1 and switch_index != new_index:
-                await switch_pokemon(side, switch_index)
+                switch_pokemon_sync(side, switch_index, battle_store=battle_store, duration_store=duration_store)
             return
 
         if trap_condition:
             if trap_condition == "독압정 제거":
-                remove_trap(side, "독압정")
-                remove_trap(side, "맹독압정")
+                remove_trap(side, "독압정", battle_store=battle_store)
+                remove_trap(side, "맹독압정", battle_store=battle_store)
             elif trap_condition == "끈적끈적네트":
                 battle_store.update_pokemon(side, new_index, lambda p: change_rank(p, "speed", -1))
             else:
@@ -126,14 +138,18 @@ async def switch_pokemon(side: SideType, new_index: int, baton_touch: bool = Fal
 
         if trap_log:
             battle_store.add_log(trap_log)
-            print(trap_log)
+            logger.debug("%s", trap_log)
 
     if team[new_index].current_hp <= 0 and side == "enemy":
-        switch_index = get_best_switch_index(side)
+        switch_index = get_best_switch_index(side, battle_store=battle_store)
         if switch_index != -1 and switch_index != new_index:  # 새로운 인덱스가 다를 때만 재귀 호출
-            await switch_pokemon(side, switch_index)
+            switch_pokemon_sync(side, switch_index, battle_store=battle_store, duration_store=duration_store)
         return
     else:
         wncp = "나" if side == "my" else "상대"
         battle_store.add_log(f"{wncp}는 {team[new_index].base.name}을/를 내보냈다!")
-        apply_appearance(team[new_index], side)
\ No newline at end of file
+        apply_appearance(team[new_index], side, battle_store=battle_store, duration_store=duration_store)
+
+
+# 기존 async API 호환 (await로 호출하던 코드용)
+switch_pokemon = async_entry(switch_pokemon_sync)
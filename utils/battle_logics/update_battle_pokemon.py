@@ -1,6 +1,5 @@
 import numpy as np
 from typing import Optional, List
-from copy import deepcopy
 from p_models.battle_pokemon import BattlePokemon
 from p_models.ability_info import AbilityInfo
 from p_models.move_info import MoveInfo
@@ -8,6 +7,10 @@ from p_models.rank_state import RankManager
 from p_models.status import StatusManager, StatusState
 from context.battle_store import BattleStore, store
 from context.duration_store import DurationStore, duration_store
+from utils.battle_logger import emit_event, get_logger
+
+logger = get_logger(__name__)
+
 unmain_status_with_duration: list[str] = [
     "도발", "트집", "사슬묶기", "회복봉인", "앵콜",
     "소리기술사용불가", "하품", "혼란", "교체불가",
@@ -15,15 +18,16 @@ unmain_status_with_duration: list[str] = [
 ]
 
 # 체력 변화
-def change_hp(pokemon: BattlePokemon, amount: int) -> BattlePokemon:
-    add_log = store.add_log
+def change_hp(pokemon: BattlePokemon, amount: int, battle_store: Optional[BattleStore] = store) -> BattlePokemon:
+    add_log = battle_store.add_log
     if amount > 0 and pokemon.current_hp >= pokemon.base.hp:
-        print(f"{pokemon.base.name}은(는) 이미 최대 체력이다!")
+        logger.debug("%s은(는) 이미 최대 체력이다!", pokemon.base.name)
         return pokemon
         
     new_hp = max(0, round(pokemon.current_hp + amount))
     new_hp = min(pokemon.base.hp, new_hp)
-    print(f"{pokemon.base.name}의 체력이 {pokemon.current_hp}에서 {new_hp}로 변경되었습니다.")
+    logger.debug("%s의 체력이 %s에서 %s로 변경되었습니다.", pokemon.base.name, pokemon.current_hp, new_hp)
+    emit_event("hp_change", pokemon=pokemon.base.name, amount=new_hp - pokemon.current_hp, hp=new_hp)
     pokemon.current_hp = new_hp
     if pokemon.current_hp <= 0:
         add_log(f"😭 {pokemon.base.name}은/는 쓰러졌다!")
@@ -32,7 +36,8 @@ def change_hp(pokemon: BattlePokemon, amount: int) -> BattlePokemon:
 
 # 랭크 변경
 def change_rank(pokemon: BattlePokemon, stat: str, amount: int) -> BattlePokemon:
-    manager = RankManager(deepcopy(pokemon.rank))
+    # RankManager가 rank를 복사해서 새 dict를 만든다 (원래 dict는 다른 포켓몬 사본과 공유될 수 있음)
+    manager = RankManager(pokemon.rank)
 
     if pokemon.base.ability and pokemon.base.ability.name in ['하얀연기', '클리어바디', '메탈프로텍트']:
         return pokemon
@@ -61,13 +66,13 @@ def change_rank(pokemon: BattlePokemon, stat: str, amount: int) -> BattlePokemon
             manager.decrease_state(stat, abs(amount))
 
     pokemon.rank = manager.get_state()
-    print(f"{pokemon.base.name}의 {stat}이(가) {pokemon.rank[stat]}랭크로 변경되었다!")
+    logger.debug("%s의 %s이(가) %s랭크로 변경되었다!", pokemon.base.name, stat, pokemon.rank[stat])
     return pokemon
 
 
 # 랭크 초기화
 def reset_rank(pokemon: BattlePokemon) -> BattlePokemon:
-    manager = RankManager(deepcopy(pokemon.rank))
+    manager = RankManager(pokemon.rank)
     manager.reset_state()
     pokemon.rank = manager.get_state()
     return pokemon
@@ -150,6 +155,7 @@ def add_status(pokemon: BattlePokemon, status: StatusState, side: str, nullifica
     manager.add_status(status)
     pokemon.status = manager.get_status()
     battle_store.update_pokemon(side, active_index, lambda p: p)
+    emit_event("status_added", side=side, pokemon=pokemon.base.name, status=status)
 
     # 싱크로
     if pokemon.base.ability and pokemon.base.ability.name == '싱크로':
@@ -183,11 +189,9 @@ def has_status(pokemon: BattlePokemon, status: StatusState) -> bool:
 
 # PP 차감
 def use_move_pp(pokemon: BattlePokemon, move_name: str, pressure: bool = False, is_multi_hit: bool = False) -> BattlePokemon:
-    pp = deepcopy(pokemon.pp)
-    if is_multi_hit: return pokemon
-    if move_name in pp:
-        pp[move_name] -= 2 if pressure else 1
-        pp[move_name] = max(pp[move_name], 0)
+    if is_multi_hit or move_name not in pokemon.pp: return pokemon
+    pp = dict(pokemon.pp)
+    pp[move_name] = max(pp[move_name] - (2 if pressure else 1), 0)
     pokemon.pp = pp
     return pokemon
 
@@ -1,6 +1,9 @@
 from context.battle_store import BattleStore, store
 from context.duration_store import DurationStore, duration_store
 from typing import Literal, Optional
+from utils.battle_logger import get_logger
+
+logger = get_logger(__name__)
 
 SideType = Literal["my", "enemy"]
 
@@ -25,7 +28,7 @@ def set_screen(side: SideType, screen: str, remove: bool = False, battle_store:
                 setter({"screen": screen})
                 add_effect({"name": screen, "remaining_turn": 5}, side)
                 battle_store.add_log(f"{screen}이 발동되었다!")
-                print(f"update_environment: {screen}이 발동되었다!")
+                logger.debug("update_environment: %s이 발동되었다!", screen)
 
 def set_weather(weather: str, battle_store: Optional[BattleStore] = store, duration_store: Optional[DurationStore] = duration_store):
     add_effect = duration_store.add_effect
@@ -33,13 +36,13 @@ def set_weather(weather: str, battle_store: Optional[BattleStore] = store, durat
     if weather and public_env.weather != weather:
         add_effect({"name": weather, "remaining_turn": 5}, "public")
     battle_store.set_public_env({"weather": weather})
-    print(f"update_environment: {weather}이 발동되었다!")
+    logger.debug("update_environment: %s이 발동되었다!", weather)
 
 def set_field(field: str, battle_store: Optional[BattleStore] = store, duration_store: Optional[DurationStore] = duration_store):
     if field:
         duration_store.add_effect({"name": field, "remaining_turn": 5}, "public")
     battle_store.set_public_env({"field": field})
-    print(f"update_environment: {field}이 발동되었다!")
+    logger.debug("update_environment: %s이 발동되었다!", field)
 
 def set_room(room: str, battle_store: Optional[BattleStore] = store, duration_store: Optional[DurationStore] = duration_store):
     public_env = battle_store.state["public_env"]
@@ -51,7 +54,7 @@ def set_room(room: str, battle_store: Optional[BattleStore] = store, duration_st
             battle_store.add_log(f"{room}이 발동됐다!")
             add_effect({"name": room, "remaining_turn": 5}, "public")
     battle_store.set_public_env({"room": room})
-    print(f"update_environment: {room}이 발동되었다!")
+    logger.debug("update_environment: %s이 발동되었다!", room)
 
 def set_aura(aura: str, battle_store: Optional[BattleStore] = store):
     public_env = battle_store.state["public_env"]
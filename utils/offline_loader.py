@@ -0,0 +1,128 @@
+# utils/offline_loader.py
+"""
+transition 샤드(utils/transition_shards.py)를 스트리밍으로 읽어 학습 배치를 만드는 로더
+
+- 샤드는 memmap으로 열고 shuffle_window개 transition씩 연속 구간을 읽는다 (데이터 전체를 RAM에 올리지 않음).
+- 샤드 순서와 샤드 안의 구간 순서를 섞고, 구간 안에서는 transition을 다시 섞어 배치로 자른다.
+- 배치 생성은 백그라운드 스레드에서 하고 prefetch개까지 미리 큐에 쌓아 둔다.
+  CUDA를 쓸 수 있으면 텐서를 pinned memory에 올려 .to(device, non_blocking=True)가 바로 되도록 한다.
+
+배치는 {"states", "actions", "rewards", "next_states", "dones", "action_masks", "episode_ids"} 텐서 dict이고
+DDDQNAgent.train(batch) / rainbow DQNAgent.update_model(batch)에 그대로 넘길 수 있다.
+"""
+import queue
+import threading
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import torch
+
+from utils.transition_shards import Shard, open_shards
+
+_DONE = object()
+
+
+class ShardStreamLoader:
+    def __init__(
+        self,
+        directory: str,
+        batch_size: int,
+        shuffle_window: int = 65536,
+        prefetch: int = 4,
+        epochs: int = 1,
+        drop_last: bool = True,
+        pin_memory: Optional[bool] = None,
+        seed: Optional[int] = None,
+    ):
+        self.shards: List[Shard] = open_shards(directory)
+        self.batch_size = batch_size
+        self.shuffle_window = max(shuffle_window, batch_size)
+        self.prefetch = prefetch
+        self.epochs = epochs
+        self.drop_last = drop_last
+        self.pin_memory = torch.cuda.is_available() if pin_memory is None else pin_memory
+        self.rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        """전체 배치 수 (남는 transition은 다음 에포크로 이어지므로 에포크 합계로 계산)"""
+        transitions = sum(len(shard) for shard in self.shards) * self.epochs
+        return transitions // self.batch_size if self.drop_last else -(-transitions // self.batch_size)
+
+    def _windows(self) -> Iterator[Dict[str, np.ndarray]]:
+        """(샤드, 구간) 순서를 섞어 구간 하나씩 읽는다"""
+        windows = [
+            (shard, start)
+            for shard in self.shards
+            for start in range(0, len(shard), self.shuffle_window)
+        ]
+        for i in self.rng.permutation(len(windows)):
+            shard, start = windows[i]
+            yield shard.transitions(slice(start, min(start + self.shuffle_window, len(shard))))
+
+    def _batches(self) -> Iterator[Dict[str, np.ndarray]]:
+        leftover: Optional[Dict[str, np.ndarray]] = None
+        for _ in range(self.epochs):
+            for window in self._windows():
+                if leftover is not None:
+                    window = {key: np.concatenate([leftover[key], window[key]]) for key in window}
+                order = self.rng.permutation(len(window["actions"]))
+                full = len(order) - len(order) % self.batch_size
+                for start in range(0, full, self.batch_size):
+                    rows = order[start:start + self.batch_size]
+                    yield {key: value[rows] for key, value in window.items()}
+                rest = order[full:]
+                leftover = {key: value[rest] for key, value in window.items()} if len(rest) else None
+        if leftover is not None and not self.drop_last:
+            yield leftover
+
+    def _to_tensors(self, batch: Dict[str, np.ndarray]) -> Dict[str, torch.Tensor]:
+        tensors = {
+            "states": torch.from_numpy(batch["states"]),
+            "actions": torch.from_numpy(batch["actions"].astype(np.int64)),
+            "rewards": torch.from_numpy(batch["rewards"].astype(np.float32)),
+            "next_states": torch.from_numpy(batch["next_states"]),
+            "dones": torch.from_numpy(batch["dones"].astype(np.float32)),
+            "action_masks": torch.from_numpy(batch["action_masks"].astype(np.bool_)),
+            "episode_ids": torch.from_numpy(batch["episode_ids"].astype(np.int64)),
+        }
+        if self.pin_memory:
+            tensors = {key: value.pin_memory() for key, value in tensors.items()}
+        return tensors
+
+    @staticmethod
+    def _put(out: queue.Queue, stop: threading.Event, item) -> bool:
+        # 소비 쪽이 멈추면(stop) 큐가 가득 차 있어도 바로 빠져나온다
+        while not stop.is_set():
+            try:
+                out.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self, out: queue.Queue, stop: threading.Event) -> None:
+        try:
+            for batch in self._batches():
+                if not self._put(out, stop, self._to_tensors(batch)):
+                    return
+            self._put(out, stop, _DONE)
+        except BaseException as e:  # 소비 쪽에서 다시 raise
+            self._put(out, stop, e)
+
+    def __iter__(self) -> Iterator[Dict[str, torch.Tensor]]:
+        out: queue.Queue = queue.Queue(maxsize=self.prefetch)
+        stop = threading.Event()
+        worker = threading.Thread(target=self._produce, args=(out, stop), daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = out.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            # 중간에 멈춰도 스레드가 put에서 막히지 않도록
+            stop.set()
+            worker.join(timeout=1.0)
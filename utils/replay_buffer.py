@@ -1,27 +1,276 @@
 # utils/replay_buffer.py
+import json
+import os
 import random
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
 import numpy as np
 
+
+def allocate_states(size: int, state, state_codec=None):
+    """(size, state 모양) float32 배열. state_codec(RL.state_codec.StateCodec)이 있으면 압축 저장소"""
+    if state_codec is not None:
+        return state_codec.allocate(size)
+    return np.zeros((size,) + np.shape(state), dtype=np.float32)
+
+
+class ReplayFiles:
+    """
+    리플레이 버퍼 배열을 directory 아래 .npy memmap 파일로 두고 ptr / size 등은 header.json에 기록한다.
+
+    같은 directory로 다시 열면 기존 파일을 그대로 붙이므로 재시작해도 버퍼를 다시 채울 필요가 없다.
+    배열 쓰기는 OS 페이지 캐시에 맡기고, save()가 배열을 flush한 뒤 헤더를 원자적으로 바꾼다.
+    (save 이후에 쓴 칸은 다음 실행에서 같은 ptr부터 다시 덮어쓴다)
+    """
+
+    HEADER = "header.json"
+
+    def __init__(self, directory: str, max_size: int):
+        self.directory = directory
+        self.max_size = max_size
+        self.arrays: Dict[str, np.memmap] = {}
+        os.makedirs(directory, exist_ok=True)
+        header_path = os.path.join(directory, self.HEADER)
+        self.header = {"max_size": max_size}
+        if os.path.exists(header_path):
+            with open(header_path) as f:
+                self.header = json.load(f)
+            if self.header["max_size"] != max_size:
+                raise ValueError(f"{directory}의 버퍼 크기({self.header['max_size']})가 {max_size}와 다릅니다.")
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.npy")
+
+    def has(self, name: str) -> bool:
+        return os.path.exists(self._path(name))
+
+    def array(self, name: str, shape: Tuple[int, ...] = (), dtype=np.float32, fill=0) -> np.memmap:
+        """(max_size,) + shape 배열 파일을 연다. 없으면 fill 값으로 새로 만든다"""
+        path = self._path(name)
+        full_shape = (self.max_size,) + tuple(shape)
+        if os.path.exists(path):
+            arr = np.lib.format.open_memmap(path, mode="r+")
+            if arr.shape != full_shape or arr.dtype != np.dtype(dtype):
+                raise ValueError(f"{path}의 모양/타입({arr.shape}, {arr.dtype})이 {full_shape}, {np.dtype(dtype)}와 다릅니다.")
+        else:
+            arr = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=full_shape)
+            if fill:
+                arr[:] = fill
+        self.arrays[name] = arr
+        return arr
+
+    def get(self, key: str, default=None):
+        return self.header.get(key, default)
+
+    def save(self, **values) -> None:
+        for arr in self.arrays.values():
+            arr.flush()
+        self.header.update(values)
+        tmp_path = os.path.join(self.directory, self.HEADER + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.header, f)
+        os.replace(tmp_path, os.path.join(self.directory, self.HEADER))
+
+
+class FrameStore:
+    """
+    관측(state)을 transition 칸마다 한 번만 저장하는 프레임 저장소
+
+    slot i의 obs는 frames[i]에 쓰고, next_obs는 바로 저장하지 않고 대기시킨다.
+    이후 push된 obs 중 내용이 같은 것이 있으면 그 칸을 가리키게 하고 (연속된 transition / n-step 창),
+    horizon번 push가 지나도 짝이 없으면 (에피소드 경계) terminal 칸에 따로 복사한다.
+    slot (i + k)의 프레임은 slot i가 덮어써진 뒤에야 다시 덮어써지므로, horizon < size이면 참조가 항상 유효하다.
+
+    메모리: frames는 size개. terminal 칸은 TERMINAL_CHUNK개 단위로 필요할 때만 할당하고,
+    참조하던 칸이 덮어써지면 반납해 다시 쓴다. 연달아 나온 같은 terminal 프레임(n-step 창의 마지막 n개)은 한 칸을 함께 쓰므로
+    terminal 칸 수는 버퍼 안에 살아 있는 에피소드 경계 수 (대략 size / 평균 에피소드 길이)를 넘지 않는다.
+    shared_frames를 주면 그 FrameStore의 frames 배열을 같이 쓴다 (같은 slot에 같은 obs를 쓰는 버퍼끼리만).
+    """
+
+    PENDING = -1
+    TERMINAL_CHUNK = 256
+
+    def __init__(self, size: int, horizon: int = 1, state_codec=None, shared_frames: Optional["FrameStore"] = None):
+        if not 0 < horizon < size:
+            raise ValueError("horizon은 1 이상 size 미만이어야 합니다.")
+        if shared_frames is not None and shared_frames.max_size != size:
+            raise ValueError("frames를 공유하는 FrameStore는 크기가 같아야 합니다.")
+        self.max_size = size
+        self.horizon = horizon
+        self.state_codec = state_codec
+        self.shared_frames = shared_frames
+        self.frames: Optional[np.ndarray] = None
+        self.terminal_chunks: List = []
+        # next_obs 위치: [0, size)는 frames 칸, size + t는 terminal 칸 t, PENDING은 대기 중
+        self.next_index = np.full(size, self.PENDING, dtype=np.int64)
+        self.terminal_position = 0  # 지금까지 할당한 terminal 칸 수
+        self.terminal_refs: List[int] = []  # terminal 칸마다 가리키는 slot 수
+        self.free_terminals: List[int] = []
+        self.last_terminal: Optional[Tuple[int, np.ndarray]] = None
+        self.pending: Deque[Tuple[int, np.ndarray]] = deque()
+
+    def _allocate(self, obs) -> None:
+        if self.shared_frames is not None:
+            if self.shared_frames.frames is None:
+                self.shared_frames._allocate(obs)
+            self.frames = self.shared_frames.frames
+        else:
+            self.frames = allocate_states(self.max_size, obs, self.state_codec)
+
+    def _terminal_slot(self, obs: np.ndarray) -> int:
+        """obs를 담을 terminal 칸. 바로 전에 쓴 칸과 내용이 같으면 그 칸을 같이 쓴다"""
+        if self.last_terminal is not None:
+            last, last_obs = self.last_terminal
+            if self.terminal_refs[last] > 0 and np.array_equal(last_obs, obs):
+                self.terminal_refs[last] += 1
+                return last
+        if self.free_terminals:
+            terminal = self.free_terminals.pop()
+        else:
+            terminal = self.terminal_position
+            self.terminal_position += 1
+            self.terminal_refs.append(0)
+            if terminal // self.TERMINAL_CHUNK >= len(self.terminal_chunks):
+                chunk = min(self.TERMINAL_CHUNK, self.max_size)
+                self.terminal_chunks.append(allocate_states(chunk, obs, self.state_codec))
+        self.terminal_chunks[terminal // self.TERMINAL_CHUNK][terminal % self.TERMINAL_CHUNK] = obs
+        self.terminal_refs[terminal] = 1
+        self.last_terminal = (terminal, obs)
+        return terminal
+
+    def _release(self, slot: int) -> None:
+        # 덮어쓸 slot이 terminal 칸을 가리키고 있었다면 참조를 풀고, 아무도 안 쓰면 반납
+        index = self.next_index[slot]
+        if index >= self.max_size:
+            terminal = int(index) - self.max_size
+            self.terminal_refs[terminal] -= 1
+            if self.terminal_refs[terminal] == 0:
+                self.free_terminals.append(terminal)
+
+    def write(self, slot: int, obs, next_obs) -> None:
+        if self.frames is None:
+            self._allocate(obs)
+        obs = np.asarray(obs, dtype=np.float32)
+
+        # 대기 중인 next_obs 중 이번 obs와 같은 것은 이 칸을 참조
+        matched = [entry for entry in self.pending if np.array_equal(entry[1], obs)]
+        for entry in matched:
+            self.next_index[entry[0]] = slot
+            self.pending.remove(entry)
+
+        self._release(slot)
+        self.frames[slot] = obs
+        self.next_index[slot] = self.PENDING
+        self.pending.append((slot, np.array(next_obs, dtype=np.float32)))
+
+        # horizon 안에 짝이 없으면 에피소드 경계로 보고 따로 저장
+        while len(self.pending) > self.horizon:
+            pending_slot, pending_obs = self.pending.popleft()
+            self.next_index[pending_slot] = self.max_size + self._terminal_slot(pending_obs)
+
+    def terminal_frame(self, terminal: int) -> np.ndarray:
+        return self.terminal_chunks[terminal // self.TERMINAL_CHUNK][terminal % self.TERMINAL_CHUNK]
+
+    def obs(self, indices) -> np.ndarray:
+        return self.frames[indices]
+
+    def next_obs(self, indices) -> np.ndarray:
+        next_index = self.next_index[indices]
+        out = self.frames[np.clip(next_index, 0, self.max_size - 1)]
+        for row in np.flatnonzero(next_index >= self.max_size):
+            out[row] = self.terminal_frame(int(next_index[row]) - self.max_size)
+        pending = next_index == self.PENDING
+        if pending.any():
+            waiting = dict(self.pending)
+            for row in np.flatnonzero(pending):
+                out[row] = waiting[int(np.asarray(indices)[row])]
+        return out
+
+
 class ReplayBuffer:
-    def __init__(self, size):
-        self.buffer = []
+    """
+    열(column) 단위로 미리 할당한 원형 리플레이 버퍼
+
+    state / next_state는 (size, state_dim) float32, action / done은 int8, reward는 float32 배열에 저장한다.
+    가득 차면 가장 오래된 칸을 덮어쓰므로 push는 O(1)이고, sample은 인덱스 배열로 한 번에 뽑는다.
+    배열은 첫 push에서 state 모양을 보고 만든다 (np.zeros라 실제 메모리는 채워지는 만큼만 사용).
+    dedup_frames=True면 state를 FrameStore에 한 번씩만 저장해 상태 메모리를 약 절반으로 줄인다.
+    state_codec을 주면 state를 비트 압축해서 저장하고 sample 때 float32로 복원한다.
+    storage_dir을 주면 배열을 그 디렉터리의 memmap 파일에 두고, flush() 시점의 상태로 다시 열 수 있다.
+    """
+
+    def __init__(self, size, dedup_frames: bool = False, state_codec=None, storage_dir: Optional[str] = None):
+        if storage_dir is not None and (dedup_frames or state_codec is not None):
+            raise ValueError("storage_dir은 dedup_frames / state_codec과 함께 쓸 수 없습니다.")
         self.max_size = size
+        self.state_codec = state_codec
+        self.frame_store: Optional[FrameStore] = FrameStore(size, state_codec=state_codec) if dedup_frames else None
+        self.files = ReplayFiles(storage_dir, size) if storage_dir is not None else None
+        self.position = 0  # 다음에 쓸 칸
+        self.size = 0
+        self.states: Optional[np.ndarray] = None
+        self.next_states: Optional[np.ndarray] = None
+        if self.files is None:
+            self.actions = np.zeros(size, dtype=np.int8)
+            self.rewards = np.zeros(size, dtype=np.float32)
+            self.dones = np.zeros(size, dtype=np.int8)
+        else:
+            self.actions = self.files.array("actions", dtype=np.int8)
+            self.rewards = self.files.array("rewards", dtype=np.float32)
+            self.dones = self.files.array("dones", dtype=np.int8)
+            self.position = self.files.get("position", 0)
+            self.size = self.files.get("size", 0)
+            if self.files.get("state_shape") is not None:
+                self._allocate(np.zeros(self.files.get("state_shape")))
+
+    def _allocate(self, state) -> None:
+        if self.files is not None:
+            self.states = self.files.array("states", np.shape(state), np.float32)
+            self.next_states = self.files.array("next_states", np.shape(state), np.float32)
+            self.files.save(state_shape=list(np.shape(state)))
+            return
+        self.states = allocate_states(self.max_size, state, self.state_codec)
+        self.next_states = allocate_states(self.max_size, state, self.state_codec)
+
+    def flush(self) -> None:
+        """storage_dir을 쓰는 경우 배열과 position / size를 디스크에 기록"""
+        if self.files is not None:
+            self.files.save(position=self.position, size=self.size)
 
     def push(self, transition):
-        if len(self.buffer) >= self.max_size:
-            self.buffer.pop(0)
-        self.buffer.append(transition)
+        """transition: (state, action, reward, next_state, done)"""
+        state, action, reward, next_state, done = transition
+        i = self.position
+        if self.frame_store is not None:
+            self.frame_store.write(i, state, next_state)
+        else:
+            if self.states is None:
+                self._allocate(state)
+            self.states[i] = state
+            self.next_states[i] = next_state
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.dones[i] = done
+        self.position = (i + 1) % self.max_size
+        self.size = min(self.size + 1, self.max_size)
 
-    def sample(self, batch_size):
-        batch = random.sample(self.buffer, batch_size)
-        states, actions, rewards, next_states, dones = zip(*batch)
+    def sample(self, batch_size) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        # 기존과 같이 중복 없이 뽑는다
+        indices = np.fromiter(random.sample(range(self.size), batch_size), dtype=np.intp, count=batch_size)
+        if self.frame_store is not None:
+            states = self.frame_store.obs(indices)
+            next_states = self.frame_store.next_obs(indices)
+        else:
+            states = self.states[indices]
+            next_states = self.next_states[indices]
         return (
-            np.array(states),
-            np.array(actions),
-            np.array(rewards),
-            np.array(next_states),
-            np.array(dones)
+            states,
+            self.actions[indices].astype(np.int64),
+            self.rewards[indices],
+            next_states,
+            self.dones[indices]
         )
-    
+
     def __len__(self):
-        return len(self.buffer)
\ No newline at end of file
+        return self.size
@@ -0,0 +1,158 @@
+# utils/transition_shards.py
+"""
+오프라인 학습용 transition 샤드 파일
+
+디렉터리 구조:
+    index.json                  샤드 목록과 형식 정보
+    shard_00000/                샤드 하나 = 에피소드 여러 개 (에피소드는 샤드를 넘지 않음)
+        observations.npy        (관측 수, state_dim) float32  (packed 형식이면 observation_bits.npy + observation_scalars.npy)
+        obs_index.npy           transition마다 state가 있는 관측 행. next_state는 항상 그 다음 행
+        action_masks.npy        (transition 수, 6) int8
+        actions.npy / rewards.npy / dones.npy / episode_ids.npy
+
+에피소드 하나는 관측을 (길이 + 1)개 저장하므로 state / next_state를 따로 두지 않는다.
+배열은 .npy라 np.load(mmap_mode="r")로 샤드 전체를 읽지 않고 열 수 있다.
+"""
+import json
+import os
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from RL.state_codec import StateCodec
+
+INDEX_FILE = "index.json"
+TRANSITION_FIELDS = {
+    "obs_index": np.int64,
+    "action_masks": np.int8,
+    "actions": np.int8,
+    "rewards": np.float32,
+    "dones": np.int8,
+    "episode_ids": np.int64,
+}
+
+
+class ShardWriter:
+    """
+    에피소드 단위로 받아 shard_size개 transition이 모이면 샤드 하나를 쓴다
+
+    packed=True면 관측을 StateCodec으로 비트 압축해서 저장한다.
+    """
+
+    def __init__(self, directory: str, shard_size: int = 100_000, prefix: str = "shard", packed: bool = False):
+        self.directory = directory
+        self.shard_size = shard_size
+        self.prefix = prefix
+        self.codec: Optional[StateCodec] = StateCodec() if packed else None
+        self.shards: List[Dict] = []
+        self._episodes: List[Dict[str, np.ndarray]] = []
+        self._pending = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def add_episode(self, episode_id: int, observations, action_masks, actions, rewards, dones) -> None:
+        """observations는 (길이 + 1)개: 시작 상태부터 마지막 행동 후 상태까지"""
+        length = len(actions)
+        observations = np.asarray(observations, dtype=np.float32)
+        if len(observations) != length + 1:
+            raise ValueError(f"관측은 transition 수 + 1개여야 합니다: {len(observations)} != {length} + 1")
+        self._episodes.append({
+            "observations": observations,
+            "action_masks": np.asarray(action_masks, dtype=np.int8).reshape(length, -1),
+            "actions": np.asarray(actions, dtype=np.int8),
+            "rewards": np.asarray(rewards, dtype=np.float32),
+            "dones": np.asarray(dones, dtype=np.int8),
+            "episode_ids": np.full(length, episode_id, dtype=np.int64),
+        })
+        self._pending += length
+        if self._pending >= self.shard_size:
+            self._write_shard()
+
+    def close(self) -> List[Dict]:
+        """남은 에피소드를 쓰고 이 writer가 만든 샤드 목록을 반환"""
+        if self._episodes:
+            self._write_shard()
+        return self.shards
+
+    def _write_shard(self) -> None:
+        name = f"{self.prefix}_{len(self.shards):05d}"
+        path = os.path.join(self.directory, name)
+        os.makedirs(path, exist_ok=True)
+
+        observations = np.concatenate([e["observations"] for e in self._episodes])
+        # 에피소드마다 관측이 하나씩 더 있으므로 transition의 관측 행은 에피소드 시작 행 + 스텝
+        starts = np.cumsum([0] + [len(e["observations"]) for e in self._episodes[:-1]])
+        obs_index = np.concatenate([start + np.arange(len(e["actions"])) for start, e in zip(starts, self._episodes)])
+        if self.codec is not None:
+            bits, scalars = self.codec.encode(observations)
+            np.save(os.path.join(path, "observation_bits.npy"), bits)
+            np.save(os.path.join(path, "observation_scalars.npy"), scalars)
+        else:
+            np.save(os.path.join(path, "observations.npy"), observations)
+        np.save(os.path.join(path, "obs_index.npy"), obs_index.astype(np.int64))
+        for field in ("action_masks", "actions", "rewards", "dones", "episode_ids"):
+            np.save(os.path.join(path, f"{field}.npy"), np.concatenate([e[field] for e in self._episodes]))
+
+        self.shards.append({
+            "name": name,
+            "transitions": int(len(obs_index)),
+            "observations": int(len(observations)),
+            "episodes": len(self._episodes),
+        })
+        self._episodes = []
+        self._pending = 0
+
+
+def write_index(directory: str, shards: Sequence[Dict], state_dim: int, packed: bool = False, **metadata) -> Dict:
+    index = {
+        "state_dim": state_dim,
+        "state_format": "packed" if packed else "float32",
+        "transitions": sum(shard["transitions"] for shard in shards),
+        "episodes": sum(shard["episodes"] for shard in shards),
+        "shards": list(shards),
+        **metadata,
+    }
+    with open(os.path.join(directory, INDEX_FILE), "w") as f:
+        json.dump(index, f, indent=2)
+    return index
+
+
+def read_index(directory: str) -> Dict:
+    with open(os.path.join(directory, INDEX_FILE)) as f:
+        return json.load(f)
+
+
+class Shard:
+    """샤드 하나를 memmap으로 연 것. observations(rows)는 float32 (rows 수, state_dim)로 돌려준다"""
+
+    def __init__(self, directory: str, entry: Dict, state_format: str = "float32", mmap_mode: Optional[str] = "r"):
+        path = os.path.join(directory, entry["name"])
+        self.name = entry["name"]
+        self.arrays = {field: np.load(os.path.join(path, f"{field}.npy"), mmap_mode=mmap_mode) for field in TRANSITION_FIELDS}
+        self.codec: Optional[StateCodec] = None
+        if state_format == "packed":
+            self.codec = StateCodec()
+            self.bits = np.load(os.path.join(path, "observation_bits.npy"), mmap_mode=mmap_mode)
+            self.scalars = np.load(os.path.join(path, "observation_scalars.npy"), mmap_mode=mmap_mode)
+        else:
+            self.observation_array = np.load(os.path.join(path, "observations.npy"), mmap_mode=mmap_mode)
+
+    def __len__(self) -> int:
+        return len(self.arrays["actions"])
+
+    def observations(self, rows) -> np.ndarray:
+        if self.codec is not None:
+            return self.codec.decode(np.asarray(self.bits[rows]), np.asarray(self.scalars[rows]))
+        return np.asarray(self.observation_array[rows], dtype=np.float32)
+
+    def transitions(self, indices) -> Dict[str, np.ndarray]:
+        """indices 위치의 transition (state, next_state 포함)"""
+        obs_index = np.asarray(self.arrays["obs_index"][indices])
+        batch = {field: np.asarray(self.arrays[field][indices]) for field in TRANSITION_FIELDS if field != "obs_index"}
+        batch["states"] = self.observations(obs_index)
+        batch["next_states"] = self.observations(obs_index + 1)
+        return batch
+
+
+def open_shards(directory: str, mmap_mode: Optional[str] = "r") -> List[Shard]:
+    index = read_index(directory)
+    return [Shard(directory, entry, index["state_format"], mmap_mode) for entry in index["shards"]]
@@ -1,34 +1,87 @@
-from typing import List, Dict
+from typing import List, Dict, Sequence
+
+import numpy as np
+
+# 공격 기술 타입 -> 방어 타입 -> 배율 (없으면 1배)
+TYPE_CHART: Dict[str, Dict[str, float]] = {
+    "불": {"풀": 2, "얼음": 2, "벌레": 2, "강철": 2, "물": 0.5, "바위": 0.5, "불": 0.5, "드래곤": 0.5},
+    "물": {"불": 2, "땅": 2, "바위": 2, "물": 0.5, "풀": 0.5, "드래곤": 0.5},
+    "풀": {"물": 2, "땅": 2, "바위": 2, "불": 0.5, "풀": 0.5, "비행": 0.5, "벌레": 0.5, "독": 0.5, "드래곤": 0.5, "강철": 0.5},
+    "전기": {"물": 2, "비행": 2, "풀": 0.5, "전기": 0.5, "드래곤": 0.5, "땅": 0},
+    "얼음": {"풀": 2, "땅": 2, "비행": 2, "드래곤": 2, "불": 0.5, "물": 0.5, "강철": 0.5, "얼음": 0.5},
+    "프리즈드라이": {"풀": 2, "땅": 2, "비행": 2, "드래곤": 2, "물": 2, "불": 0.5, "강철": 0.5, "얼음": 0.5},
+    "격투": {"얼음": 2, "바위": 2, "악": 2, "노말": 2, "강철": 2, "벌레": 0.5, "독": 0.5, "비행": 0.5, "에스퍼": 0.5, "페어리": 0.5, "고스트": 0},
+    "독": {"풀": 2, "페어리": 2, "독": 0.5, "땅": 0.5, "바위": 0.5, "고스트": 0.5, "강철": 0},
+    "땅": {"불": 2, "전기": 2, "독": 2, "바위": 2, "강철": 2, "풀": 0.5, "벌레": 0.5, "비행": 0},
+    "비행": {"풀": 2, "격투": 2, "벌레": 2, "전기": 0.5, "바위": 0.5, "강철": 0.5},
+    "에스퍼": {"격투": 2, "독": 2, "에스퍼": 0.5, "악": 0, "강철": 0.5},
+    "벌레": {"풀": 2, "에스퍼": 2, "악": 2, "불": 0.5, "격투": 0.5, "독": 0.5, "비행": 0.5, "고스트": 0.5, "강철": 0.5, "페어리": 0.5},
+    "바위": {"불": 2, "얼음": 2, "비행": 2, "벌레": 2, "격투": 0.5, "땅": 0.5, "강철": 0.5},
+    "고스트": {"에스퍼": 2, "고스트": 2, "악": 0.5, "노말": 0},
+    "드래곤": {"드래곤": 2, "강철": 0.5, "페어리": 0},
+    "악": {"에스퍼": 2, "고스트": 2, "격투": 0.5, "악": 0.5, "페어리": 0.5},
+    "강철": {"얼음": 2, "바위": 2, "페어리": 2, "불": 0.5, "물": 0.5, "전기": 0.5, "강철": 0.5},
+    "페어리": {"격투": 2, "악": 2, "드래곤": 2, "불": 0.5, "독": 0.5, "강철": 0.5},
+    "노말": {"바위": 0.5, "강철": 0.5, "고스트": 0},
+}
+
+# 상성 행렬 인덱스: 방어 타입 18개, 공격 타입은 여기에 프리즈드라이를 더한 19개
+TYPE_NAMES = ["노말", "불", "물", "풀", "전기", "얼음", "격투", "독", "땅", "비행", "에스퍼", "벌레", "바위", "고스트", "드래곤", "악", "강철", "페어리"]
+ATTACK_TYPE_NAMES = TYPE_NAMES + ["프리즈드라이"]
+DEFENSE_TYPE_INDEX: Dict[str, int] = {name: i for i, name in enumerate(TYPE_NAMES)}
+ATTACK_TYPE_INDEX: Dict[str, int] = {name: i for i, name in enumerate(ATTACK_TYPE_NAMES)}
+
+# 표에 없는 타입(빈 칸 포함)은 마지막 행/열(모두 1배)로 보낸다
+UNKNOWN_ATTACK_INDEX = len(ATTACK_TYPE_NAMES)
+UNKNOWN_DEFENSE_INDEX = len(TYPE_NAMES)
+
+PADDED_TYPE_MATRIX = np.ones((len(ATTACK_TYPE_NAMES) + 1, len(TYPE_NAMES) + 1), dtype=np.float64)
+for _move_type, _row in TYPE_CHART.items():
+    for _target_type, _value in _row.items():
+        PADDED_TYPE_MATRIX[ATTACK_TYPE_INDEX[_move_type], DEFENSE_TYPE_INDEX[_target_type]] = _value
+PADDED_TYPE_MATRIX.flags.writeable = False
+
+# (19, 18) 상성 행렬 (행: 공격 기술 타입, 열: 방어 타입)
+TYPE_MATRIX = PADDED_TYPE_MATRIX[:len(ATTACK_TYPE_NAMES), :len(TYPE_NAMES)]
 
-def calculate_type_effectiveness(move_type: str, target_types: List[str]) -> float:
-    type_chart: Dict[str, Dict[str, float]] = {
-        "불": {"풀": 2, "얼음": 2, "벌레": 2, "강철": 2, "물": 0.5, "바위": 0.5, "불": 0.5, "드래곤": 0.5},
-        "물": {"불": 2, "땅": 2, "바위": 2, "물": 0.5, "풀": 0.5, "드래곤": 0.5},
-        "풀": {"물": 2, "땅": 2, "바위": 2, "불": 0.5, "풀": 0.5, "비행": 0.5, "벌레": 0.5, "독": 0.5, "드래곤": 0.5, "강철": 0.5},
-        "전기": {"물": 2, "비행": 2, "풀": 0.5, "전기": 0.5, "드래곤": 0.5, "땅": 0},
-        "얼음": {"풀": 2, "땅": 2, "비행": 2, "드래곤": 2, "불": 0.5, "물": 0.5, "강철": 0.5, "얼음": 0.5},
-        "프리즈드라이": {"풀": 2, "땅": 2, "비행": 2, "드래곤": 2, "물": 2, "불": 0.5, "강철": 0.5, "얼음": 0.5},
-        "격투": {"얼음": 2, "바위": 2, "악": 2, "노말": 2, "강철": 2, "벌레": 0.5, "독": 0.5, "비행": 0.5, "에스퍼": 0.5, "페어리": 0.5, "고스트": 0},
-        "독": {"풀": 2, "페어리": 2, "독": 0.5, "땅": 0.5, "바위": 0.5, "고스트": 0.5, "강철": 0},
-        "땅": {"불": 2, "전기": 2, "독": 2, "바위": 2, "강철": 2, "풀": 0.5, "벌레": 0.5, "비행": 0},
-        "비행": {"풀": 2, "격투": 2, "벌레": 2, "전기": 0.5, "바위": 0.5, "강철": 0.5},
-        "에스퍼": {"격투": 2, "독": 2, "에스퍼": 0.5, "악": 0, "강철": 0.5},
-        "벌레": {"풀": 2, "에스퍼": 2, "악": 2, "불": 0.5, "격투": 0.5, "독": 0.5, "비행": 0.5, "고스트": 0.5, "강철": 0.5, "페어리": 0.5},
-        "바위": {"불": 2, "얼음": 2, "비행": 2, "벌레": 2, "격투": 0.5, "땅": 0.5, "강철": 0.5},
-        "고스트": {"에스퍼": 2, "고스트": 2, "악": 0.5, "노말": 0},
-        "드래곤": {"드래곤": 2, "강철": 0.5, "페어리": 0},
-        "악": {"에스퍼": 2, "고스트": 2, "격투": 0.5, "악": 0.5, "페어리": 0.5},
-        "강철": {"얼음": 2, "바위": 2, "페어리": 2, "불": 0.5, "물": 0.5, "전기": 0.5, "강철": 0.5},
-        "페어리": {"격투": 2, "악": 2, "드래곤": 2, "불": 0.5, "독": 0.5, "강철": 0.5},
-        "노말": {"바위": 0.5, "강철": 0.5, "고스트": 0},
-    }
 
+def calculate_type_effectiveness(move_type: str, target_types: List[str]) -> float:
+    row = TYPE_CHART.get(move_type, {})
     modifier = 1.0
 
     for target_type in target_types:
-        effectiveness = type_chart.get(move_type, {}).get(target_type, 1.0)
+        effectiveness = row.get(target_type, 1.0)
         if effectiveness == 0:
             return 0.0
         modifier *= effectiveness
 
-    return modifier
\ No newline at end of file
+    return modifier
+
+
+def attack_type_indices(move_types: Sequence[str]) -> np.ndarray:
+    return np.array([ATTACK_TYPE_INDEX.get(t, UNKNOWN_ATTACK_INDEX) for t in move_types], dtype=np.intp)
+
+
+def defense_type_indices(types_list: Sequence[Sequence[str]]) -> np.ndarray:
+    """포켓몬별 타입 목록 -> (D, K) 인덱스 (K는 가장 많은 타입 수, 빈 칸은 1배 열)"""
+    width = max((len(types) for types in types_list), default=0)
+    indices = np.full((len(types_list), max(width, 1)), UNKNOWN_DEFENSE_INDEX, dtype=np.intp)
+    for d, types in enumerate(types_list):
+        for k, t in enumerate(types):
+            indices[d, k] = DEFENSE_TYPE_INDEX.get(t, UNKNOWN_DEFENSE_INDEX)
+    return indices
+
+
+def effectiveness_matrix(
+    move_types: Sequence[str],
+    defender_types_list: Sequence[Sequence[str]],
+    matrix: np.ndarray = PADDED_TYPE_MATRIX
+) -> np.ndarray:
+    """
+    기술 타입 M개 x 방어 포켓몬 D마리의 상성 배율 (M, D)을 한 번에 계산
+    값은 각각 calculate_type_effectiveness(move_type, defender_types)와 같다.
+    matrix로 특성 보정이 들어간 표(예: 배짱/심안용)를 넘길 수 있다.
+    """
+    rows = attack_type_indices(move_types)
+    cols = defense_type_indices(defender_types_list)
+    return matrix[rows[:, None, None], cols[None, :, :]].prod(axis=2)